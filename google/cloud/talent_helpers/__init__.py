@@ -0,0 +1,28 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Hand-written helpers layered on top of the generated Talent clients.
+
+Unlike ``google.cloud.talent_v4`` and ``google.cloud.talent_v4beta1``,
+nothing in this package is produced by the code generator, so it is safe
+to edit by hand and is excluded from ``synth.py`` regeneration.
+"""
+
+from .testing import FakeTalentServer
+
+
+__all__ = ("FakeTalentServer",)
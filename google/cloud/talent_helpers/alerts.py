@@ -0,0 +1,287 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Run many saved job alerts with one search per distinct query.
+
+Users who save the same search share a ``JobQuery``. :class:`AlertRunner`
+groups alerts by query, calls ``search_jobs_for_alert`` once per distinct
+query with bounded concurrency, and hands each subscriber only the jobs
+it has not been sent before::
+
+    runner = AlertRunner(client, {"parent": tenant, "max_page_size": 50})
+    for alert_id, job_query in saved_alerts:
+        runner.subscribe(alert_id, job_query)
+    runner.load("sent.bin")
+    for delivery in runner.run():
+        notify(delivery.alert_id, delivery.matching_jobs)
+    runner.save("sent.bin")
+
+The jobs already sent to each alert are kept as a sorted array of 64-bit
+job IDs, eight bytes per job, so membership is exact. Numeric job IDs are
+stored as is and other IDs as a 64-bit hash of the ID.
+"""
+
+import array
+import bisect
+import collections
+import concurrent.futures
+import hashlib
+import heapq
+import os
+import struct
+import sys
+from typing import Dict, Iterable, Iterator, List
+
+from google.cloud.talent_v4.types import job_service
+
+_MAGIC = b"TALR\x01"
+_ALERT_SIZE = struct.Struct("<H")
+_COUNT = struct.Struct("<I")
+
+
+def job_id(name: str) -> int:
+    """Return the 64-bit ID used to remember a job.
+
+    Args:
+        name (str): The job's resource name.
+    """
+    segment = name.rsplit("/", 1)[-1]
+    if segment.isdigit() and int(segment) < 2 ** 64:
+        return int(segment)
+    digest = hashlib.blake2b(segment.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+
+class SentJobs:
+    """The IDs of the jobs already sent to one alert.
+
+    Args:
+        ids (Iterable[int]): The initial IDs, in any order.
+    """
+
+    def __init__(self, ids: Iterable[int] = ()) -> None:
+        self._ids = array.array("Q", sorted(set(ids)))
+
+    def __contains__(self, value: int) -> bool:
+        index = bisect.bisect_left(self._ids, value)
+        return index < len(self._ids) and self._ids[index] == value
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._ids)
+
+    def update(self, ids: Iterable[int]) -> None:
+        """Add IDs, ignoring the ones already present."""
+        new = sorted({i for i in ids if i not in self})
+        if new:
+            self._ids = array.array("Q", heapq.merge(self._ids, new))
+
+
+AlertDelivery = collections.namedtuple(
+    "AlertDelivery", ["alert_id", "matching_jobs", "error"]
+)
+AlertDelivery.__doc__ = """The new jobs for one alert, or why its search failed.
+
+``matching_jobs`` holds the alert's unseen ``MatchingJob`` messages in rank
+order and is empty when ``error`` is set."""
+
+
+class AlertRunner:
+    """Runs saved alerts, searching once per distinct ``JobQuery``.
+
+    Args:
+        client (~.JobServiceClient): A v4 or v4beta1 job service client.
+        request (Union[~.job_service.SearchJobsRequest, dict]): The request
+            template, usually with ``parent`` and ``max_page_size`` set. The
+            ``job_query`` of each alert replaces the template's. A dict is
+            converted to the v4 request type.
+        max_concurrency (int): The most searches in flight at once.
+        kwargs: Passed to ``client.search_jobs_for_alert``, e.g.
+            ``timeout``.
+    """
+
+    def __init__(self, client, request, *, max_concurrency: int = 8, **kwargs):
+        if isinstance(request, dict):
+            request = job_service.SearchJobsRequest(**request)
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be positive.")
+        self._client = client
+        self._request = request
+        self._query_type = type(request).meta.fields["job_query"].message
+        self._max_concurrency = max_concurrency
+        self._kwargs = kwargs
+        self._alerts: Dict[str, bytes] = {}
+        self._queries: Dict[bytes, list] = collections.OrderedDict()
+        self._sent: Dict[str, SentJobs] = {}
+
+    def __len__(self) -> int:
+        return len(self._alerts)
+
+    @property
+    def queries(self) -> int:
+        """The number of distinct queries, i.e. searches per :meth:`run`."""
+        return len(self._queries)
+
+    def subscribe(self, alert_id: str, job_query) -> None:
+        """Add an alert, or change the query of an existing one.
+
+        Args:
+            alert_id (str): Identifies the alert in deliveries and saved
+                state.
+            job_query (Union[~.filters.JobQuery, dict]): The saved search.
+        """
+        if isinstance(job_query, dict):
+            job_query = self._query_type(**job_query)
+        pb = type(job_query).pb(job_query)
+        key = pb.SerializeToString(deterministic=True)
+        self.unsubscribe(alert_id, forget=False)
+        self._alerts[alert_id] = key
+        if key not in self._queries:
+            self._queries[key] = [pb, []]
+        self._queries[key][1].append(alert_id)
+
+    def unsubscribe(self, alert_id: str, *, forget: bool = True) -> None:
+        """Remove an alert.
+
+        Args:
+            alert_id (str): The alert to remove. Unknown alerts are ignored.
+            forget (bool): Also drop the jobs already sent to the alert.
+        """
+        key = self._alerts.pop(alert_id, None)
+        if key is not None:
+            subscribers = self._queries[key][1]
+            subscribers.remove(alert_id)
+            if not subscribers:
+                del self._queries[key]
+        if forget:
+            self._sent.pop(alert_id, None)
+
+    def sent(self, alert_id: str) -> SentJobs:
+        """Return the jobs already sent to an alert."""
+        return self._sent.setdefault(alert_id, SentJobs())
+
+    def _search(self, query_pb):
+        pb = type(self._request).pb(self._request)
+        request = type(pb)()
+        request.CopyFrom(pb)
+        request.job_query.CopyFrom(query_pb)
+        return self._client.search_jobs_for_alert(
+            request=type(self._request)(request), **self._kwargs
+        )
+
+    def _deliver(self, subscribers, future) -> Iterator[AlertDelivery]:
+        error = future.exception()
+        if error is not None:
+            for alert_id in subscribers:
+                yield AlertDelivery(alert_id, [], error)
+            return
+        matches = [(job_id(m.job.name), m) for m in future.result().matching_jobs]
+        for alert_id in subscribers:
+            sent = self.sent(alert_id)
+            new = [(i, m) for i, m in matches if i not in sent]
+            if new:
+                sent.update(i for i, _ in new)
+                yield AlertDelivery(alert_id, [m for _, m in new], None)
+
+    def run(self) -> Iterator[AlertDelivery]:
+        """Search every distinct query and yield the new jobs per alert.
+
+        Deliveries are yielded as searches complete, one per alert that has
+        new jobs, and one per alert whose search failed. Jobs are marked as
+        sent when their delivery is yielded.
+
+        Yields:
+            ~.AlertDelivery: The new jobs for one alert.
+        """
+        groups = iter([(pb, list(ids)) for pb, ids in self._queries.values()])
+        pending: Dict[concurrent.futures.Future, List[str]] = {}
+        with concurrent.futures.ThreadPoolExecutor(self._max_concurrency) as executor:
+            try:
+                while True:
+                    for query_pb, subscribers in groups:
+                        pending[executor.submit(self._search, query_pb)] = subscribers
+                        if len(pending) >= 2 * self._max_concurrency:
+                            break
+                    if not pending:
+                        return
+                    done, _ = concurrent.futures.wait(
+                        pending, return_when=concurrent.futures.FIRST_COMPLETED
+                    )
+                    for future in done:
+                        yield from self._deliver(pending.pop(future), future)
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    def save(self, path: str) -> None:
+        """Atomically write the sent jobs of every alert.
+
+        Each alert takes six bytes plus its ID and eight bytes per job, all
+        little-endian.
+        """
+        temporary = path + ".tmp"
+        with open(temporary, "wb") as stream:
+            stream.write(_MAGIC)
+            for alert_id, sent in self._sent.items():
+                key = alert_id.encode("utf-8")
+                stream.write(_ALERT_SIZE.pack(len(key)))
+                stream.write(key)
+                stream.write(_COUNT.pack(len(sent)))
+                ids = sent._ids
+                if sys.byteorder == "big":
+                    ids = array.array("Q", ids)
+                    ids.byteswap()
+                stream.write(ids.tobytes())
+        os.replace(temporary, path)
+
+    def load(self, path: str, *, missing_ok: bool = True) -> None:
+        """Add the sent jobs from a file written by :meth:`save`.
+
+        Alerts need not be subscribed yet; their state is kept for later.
+
+        Args:
+            path (str): The file.
+            missing_ok (bool): Do nothing if the file does not exist.
+
+        Raises:
+            ValueError: If the file is not an alert state file.
+        """
+        if missing_ok and not os.path.exists(path):
+            return
+        with open(path, "rb") as stream:
+            data = stream.read()
+        if not data.startswith(_MAGIC):
+            raise ValueError("{} is not an alert state file.".format(path))
+        offset = len(_MAGIC)
+        while offset < len(data):
+            (size,) = _ALERT_SIZE.unpack_from(data, offset)
+            offset += _ALERT_SIZE.size
+            alert_id = data[offset : offset + size].decode("utf-8")
+            offset += size
+            (count,) = _COUNT.unpack_from(data, offset)
+            offset += _COUNT.size
+            ids = array.array("Q")
+            ids.frombytes(data[offset : offset + 8 * count])
+            if sys.byteorder == "big":
+                ids.byteswap()
+            offset += 8 * count
+            self.sent(alert_id).update(ids)
+
+
+__all__ = ("AlertDelivery", "AlertRunner", "SentJobs", "job_id")
@@ -0,0 +1,571 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Load-generation benchmark for the Talent v4 clients.
+
+Drives a weighted mix of ``search_jobs``, ``list_jobs``,
+``create_client_event`` and ``complete_query`` calls through the sync,
+threaded and asyncio clients, and reports throughput, latency
+percentiles and a CPU breakdown as JSON::
+
+    python -m google.cloud.talent_helpers.benchmark \\
+        --modes sync,threaded,async --requests 5000 --concurrency 16 \\
+        --mix search_jobs=70,list_jobs=10,create_client_event=15,complete_query=5
+
+Unless ``--endpoint`` is given, a :class:`~.testing.FakeTalentServer` is
+started in a child process, so the CPU it spends does not count against
+the client being measured. ``--serve`` runs only that server, which lets
+several benchmark processes share one.
+"""
+
+import argparse
+import asyncio
+import collections
+import contextlib
+import json
+import multiprocessing
+import os
+import platform
+import random
+import sys
+import threading
+import time
+from concurrent import futures
+from typing import Dict, List, Optional, Sequence
+
+import pkg_resources
+import proto  # type: ignore
+
+from google.cloud.talent_helpers import filtering
+from google.cloud.talent_helpers.testing import FakeTalentServer
+from google.cloud.talent_v4.services.company_service import CompanyServiceClient
+from google.cloud.talent_v4.services.company_service import (
+    transports as company_transports,
+)
+from google.cloud.talent_v4.services.completion import CompletionAsyncClient
+from google.cloud.talent_v4.services.completion import CompletionClient
+from google.cloud.talent_v4.services.completion import (
+    transports as completion_transports,
+)
+from google.cloud.talent_v4.services.event_service import EventServiceAsyncClient
+from google.cloud.talent_v4.services.event_service import EventServiceClient
+from google.cloud.talent_v4.services.event_service import transports as event_transports
+from google.cloud.talent_v4.services.job_service import JobServiceAsyncClient
+from google.cloud.talent_v4.services.job_service import JobServiceClient
+from google.cloud.talent_v4.services.job_service import transports as job_transports
+from google.cloud.talent_v4.services.tenant_service import TenantServiceClient
+from google.cloud.talent_v4.services.tenant_service import (
+    transports as tenant_transports,
+)
+from google.cloud.talent_v4.types import completion_service
+from google.cloud.talent_v4.types import event_service
+from google.cloud.talent_v4.types import job_service
+
+
+MODES = ("sync", "threaded", "async")
+OPERATIONS = ("search_jobs", "list_jobs", "create_client_event", "complete_query")
+DEFAULT_MIX = "search_jobs=70,list_jobs=10,create_client_event=15,complete_query=5"
+
+_TITLES = ("Software Engineer", "Data Scientist", "Product Manager", "Designer")
+_CITIES = ("Mountain View, CA", "New York, NY", "London, UK", "Zurich, CH")
+
+
+def parse_mix(mix: str) -> Dict[str, float]:
+    """Parse ``name=weight,...`` into a mapping of operation weights.
+
+    Raises:
+        ValueError: If an operation is unknown or a weight is not positive.
+    """
+    weights: Dict[str, float] = collections.OrderedDict()
+    for item in filter(None, (part.strip() for part in mix.split(","))):
+        name, _, weight = item.partition("=")
+        if name not in OPERATIONS:
+            raise ValueError("Unknown operation {!r} in mix.".format(name))
+        weights[name] = float(weight or 1)
+        if weights[name] <= 0:
+            raise ValueError("Weight for {!r} must be positive.".format(name))
+    if not weights:
+        raise ValueError("The operation mix is empty.")
+    return weights
+
+
+def percentile(ordered: Sequence[float], fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted sequence."""
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, max(0, int(round(fraction * len(ordered))) - 1))
+    return ordered[index]
+
+
+class _ProtoPlusTimer:
+    """Accumulates CPU time spent inside proto-plus on the client side.
+
+    Patches :class:`proto.message.MessageMeta` so that every
+    ``serialize``/``deserialize`` call made by the transports' stubs is
+    timed. It must be installed before any transport is created, because
+    the stubs bind the serializers when they are first built.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.seconds = 0.0
+
+    def add(self, seconds: float) -> None:
+        with self._lock:
+            self.seconds += seconds
+
+    @contextlib.contextmanager
+    def measure(self):
+        start = time.thread_time()
+        try:
+            yield
+        finally:
+            self.add(time.thread_time() - start)
+
+    @contextlib.contextmanager
+    def installed(self):
+        meta = proto.message.MessageMeta
+        serialize, deserialize = meta.serialize, meta.deserialize
+
+        def timed(original):
+            def wrapper(cls, payload):
+                start = time.thread_time()
+                try:
+                    return original(cls, payload)
+                finally:
+                    self.add(time.thread_time() - start)
+
+            return wrapper
+
+        meta.serialize, meta.deserialize = timed(serialize), timed(deserialize)
+        try:
+            yield self
+        finally:
+            meta.serialize, meta.deserialize = serialize, deserialize
+
+
+class _Workload:
+    """Seeded request factory shared by every execution mode."""
+
+    def __init__(self, tenant: str, company: str, seed: int):
+        self.tenant = tenant
+        self.company = company
+        self._random = random.Random(seed)
+        self._events = iter(range(sys.maxsize))
+
+    def search_jobs(self) -> job_service.SearchJobsRequest:
+        return job_service.SearchJobsRequest(
+            parent=self.tenant,
+            request_metadata={"domain": "bench", "session_id": "s", "user_id": "u"},
+            job_query={
+                "query": self._random.choice(_TITLES).split()[0],
+                "location_filters": [{"address": self._random.choice(_CITIES)}],
+            },
+            max_page_size=20,
+        )
+
+    def list_jobs(self) -> job_service.ListJobsRequest:
+        return job_service.ListJobsRequest(
+            parent=self.tenant,
+            filter="companyName = {}".format(filtering.quote(self.company)),
+            page_size=100,
+        )
+
+    def create_client_event(self) -> event_service.CreateClientEventRequest:
+        return event_service.CreateClientEventRequest(
+            parent=self.tenant,
+            client_event={
+                "request_id": "bench",
+                "event_id": "event-{}".format(next(self._events)),
+                "job_event": {"type_": 1, "jobs": [self.company + "/jobs/1"]},
+            },
+        )
+
+    def complete_query(self) -> completion_service.CompleteQueryRequest:
+        return completion_service.CompleteQueryRequest(
+            tenant=self.tenant, query=self._random.choice(_TITLES)[:3], page_size=5,
+        )
+
+
+class _Recorder:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.latencies: Dict[str, List[float]] = collections.defaultdict(list)
+        self.errors: collections.Counter = collections.Counter()
+
+    def record(self, name: str, seconds: float, error: Optional[BaseException]):
+        with self._lock:
+            if error is None:
+                self.latencies[name].append(seconds)
+            else:
+                self.errors["{}:{}".format(name, type(error).__name__)] += 1
+
+
+def _summary(latencies: List[float]) -> Dict[str, float]:
+    ordered = sorted(latencies)
+    return {
+        "count": len(ordered),
+        "mean_ms": 1000.0 * sum(ordered) / len(ordered) if ordered else 0.0,
+        "p50_ms": 1000.0 * percentile(ordered, 0.50),
+        "p90_ms": 1000.0 * percentile(ordered, 0.90),
+        "p99_ms": 1000.0 * percentile(ordered, 0.99),
+        "max_ms": 1000.0 * (ordered[-1] if ordered else 0.0),
+    }
+
+
+def _seed_data(channel, jobs: int) -> Dict[str, str]:
+    tenants = TenantServiceClient(
+        transport=tenant_transports.TenantServiceGrpcTransport(channel=channel)
+    )
+    companies = CompanyServiceClient(
+        transport=company_transports.CompanyServiceGrpcTransport(channel=channel)
+    )
+    job_client = JobServiceClient(
+        transport=job_transports.JobServiceGrpcTransport(channel=channel)
+    )
+
+    suffix = "{}-{}".format(os.getpid(), time.time())
+    tenant = tenants.create_tenant(
+        parent="projects/benchmark", tenant={"external_id": "bench-" + suffix}
+    )
+    company = companies.create_company(
+        parent=tenant.name,
+        company={"display_name": "Benchmark Inc", "external_id": "bench-" + suffix},
+    )
+    batch = []
+    for index in range(jobs):
+        batch.append(
+            {
+                "company": company.name,
+                "requisition_id": "bench-{}".format(index),
+                "title": "{} {}".format(_TITLES[index % len(_TITLES)], index),
+                "description": "Benchmark job {}.".format(index),
+                "addresses": [_CITIES[index % len(_CITIES)]],
+            }
+        )
+        if len(batch) == 200 or index == jobs - 1:
+            job_client.batch_create_jobs(parent=tenant.name, jobs=batch).result()
+            batch = []
+    return {"tenant": tenant.name, "company": company.name}
+
+
+def _sync_clients(channel):
+    return {
+        "search_jobs": JobServiceClient(
+            transport=job_transports.JobServiceGrpcTransport(channel=channel)
+        ),
+        "create_client_event": EventServiceClient(
+            transport=event_transports.EventServiceGrpcTransport(channel=channel)
+        ),
+        "complete_query": CompletionClient(
+            transport=completion_transports.CompletionGrpcTransport(channel=channel)
+        ),
+    }
+
+
+def _sync_call(clients, name: str, request):
+    if name == "search_jobs":
+        return clients["search_jobs"].search_jobs(request=request)
+    if name == "list_jobs":
+        # Only the first page is fetched, so every call is a single RPC.
+        return clients["search_jobs"].list_jobs(request=request)
+    return getattr(clients[name], name)(request=request)
+
+
+def _run_sync(server, workload, schedule, timer, recorder, concurrency):
+    clients = _sync_clients(server.channel())
+    position = iter(range(len(schedule)))
+
+    def worker():
+        for index in position:
+            name = schedule[index]
+            with timer.measure():
+                request = getattr(workload, name)()
+            start = time.perf_counter()
+            error = None
+            try:
+                _sync_call(clients, name, request)
+            except Exception as exc:  # pragma: NO COVER
+                error = exc
+            recorder.record(name, time.perf_counter() - start, error)
+
+    if concurrency <= 1:
+        worker()
+        return
+    with futures.ThreadPoolExecutor(max_workers=concurrency) as executor:
+        for pending in [executor.submit(worker) for _ in range(concurrency)]:
+            pending.result()
+
+
+def _run_async(server, workload, schedule, timer, recorder, concurrency):
+    async def run():
+        channel = server.channel(asyncio=True)
+        jobs = JobServiceAsyncClient(
+            transport=job_transports.JobServiceGrpcAsyncIOTransport(channel=channel)
+        )
+        clients = {
+            "search_jobs": jobs.search_jobs,
+            "list_jobs": jobs.list_jobs,
+            "create_client_event": EventServiceAsyncClient(
+                transport=event_transports.EventServiceGrpcAsyncIOTransport(
+                    channel=channel
+                )
+            ).create_client_event,
+            "complete_query": CompletionAsyncClient(
+                transport=completion_transports.CompletionGrpcAsyncIOTransport(
+                    channel=channel
+                )
+            ).complete_query,
+        }
+        position = iter(range(len(schedule)))
+
+        async def worker():
+            for index in position:
+                name = schedule[index]
+                with timer.measure():
+                    request = getattr(workload, name)()
+                start = time.perf_counter()
+                error = None
+                try:
+                    await clients[name](request=request)
+                except Exception as exc:  # pragma: NO COVER
+                    error = exc
+                recorder.record(name, time.perf_counter() - start, error)
+
+        await asyncio.gather(*(worker() for _ in range(max(1, concurrency))))
+        await channel.close()
+
+    # asyncio.run() needs Python 3.7.
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    try:
+        loop.run_until_complete(run())
+    finally:
+        asyncio.set_event_loop(None)
+        loop.close()
+
+
+class _Endpoint:
+    """Adapts a bare ``host:port`` to the ``channel()`` interface of the fake."""
+
+    def __init__(self, endpoint: str):
+        self.endpoint = endpoint
+
+    channel = FakeTalentServer.channel
+
+
+def _serve_child(connection, latency: float, seed: Optional[int]) -> None:
+    with FakeTalentServer(latency=latency, seed=seed) as server:
+        connection.send(server.endpoint)
+        connection.recv()
+
+
+@contextlib.contextmanager
+def _server(endpoint: Optional[str], latency: float, seed: Optional[int]):
+    if endpoint:
+        yield _Endpoint(endpoint)
+        return
+    context = multiprocessing.get_context("spawn")
+    parent, child = context.Pipe()
+    process = context.Process(target=_serve_child, args=(child, latency, seed))
+    process.start()
+    try:
+        yield _Endpoint(parent.recv())
+    finally:
+        parent.send(None)
+        process.join()
+
+
+def environment() -> Dict[str, object]:
+    """Describe the interpreter, machine and library versions for a report."""
+    versions = {}
+    for dist in ("google-cloud-talent", "google-api-core", "grpcio", "proto-plus"):
+        try:
+            versions[dist] = pkg_resources.get_distribution(dist).version
+        except pkg_resources.DistributionNotFound:  # pragma: NO COVER
+            versions[dist] = None
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "versions": versions,
+    }
+
+
+def run_benchmark(
+    *,
+    modes: Sequence[str] = MODES,
+    mix: str = DEFAULT_MIX,
+    requests: int = 2000,
+    concurrency: int = 8,
+    warmup: int = 100,
+    jobs: int = 500,
+    latency: float = 0.0,
+    seed: int = 0,
+    endpoint: Optional[str] = None,
+) -> Dict[str, object]:
+    """Run the benchmark and return its report.
+
+    Args:
+        modes (Sequence[str]): Any of ``"sync"`` (one thread, sequential),
+            ``"threaded"`` (``concurrency`` threads sharing a sync client)
+            and ``"async"`` (``concurrency`` tasks sharing an asyncio client).
+        mix (str): Weighted operations, as ``name=weight`` pairs.
+        requests (int): Measured RPCs per mode.
+        concurrency (int): Workers for the threaded and async modes.
+        warmup (int): Unmeasured RPCs issued before each mode.
+        jobs (int): Jobs to create in the fake tenant before measuring.
+        latency (float): Artificial server latency, in seconds, for the
+            fake server. Ignored when ``endpoint`` is set.
+        seed (int): Seed for the operation schedule and request contents.
+        endpoint (Optional[str]): ``host:port`` of an already running fake
+            server, e.g. one started with ``--serve``.
+
+    Returns:
+        dict: A JSON-serializable report.
+    """
+    weights = parse_mix(mix)
+    for mode in modes:
+        if mode not in MODES:
+            raise ValueError("Unknown mode {!r}.".format(mode))
+    schedule = random.Random(seed).choices(
+        list(weights), weights=list(weights.values()), k=requests
+    )
+    timer = _ProtoPlusTimer()
+    report = {
+        "config": {
+            "modes": list(modes),
+            "mix": dict(weights),
+            "requests": requests,
+            "concurrency": concurrency,
+            "warmup": warmup,
+            "jobs": jobs,
+            "latency": latency,
+            "seed": seed,
+            "endpoint": endpoint,
+        },
+        "environment": environment(),
+        "results": [],
+    }
+
+    with _server(endpoint, latency, seed) as server, timer.installed():
+        names = _seed_data(server.channel(), jobs)
+        for mode in modes:
+            runner = _run_async if mode == "async" else _run_sync
+            workers = 1 if mode == "sync" else concurrency
+            if warmup:
+                runner(
+                    server,
+                    _Workload(names["tenant"], names["company"], seed),
+                    schedule[:warmup],
+                    _ProtoPlusTimer(),
+                    _Recorder(),
+                    workers,
+                )
+
+            recorder = _Recorder()
+            timer.seconds = 0.0
+            workload = _Workload(names["tenant"], names["company"], seed)
+            wall, cpu = time.perf_counter(), time.process_time()
+            runner(server, workload, schedule, timer, recorder, workers)
+            wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+
+            completed = sum(len(v) for v in recorder.latencies.values())
+            everything = [s for v in recorder.latencies.values() for s in v]
+            report["results"].append(
+                {
+                    "mode": mode,
+                    "concurrency": workers,
+                    "completed": completed,
+                    "errors": dict(recorder.errors),
+                    "wall_seconds": wall,
+                    "cpu_seconds": cpu,
+                    "rps": completed / wall if wall else 0.0,
+                    "rps_per_core": completed / cpu if cpu else 0.0,
+                    "latency": _summary(everything),
+                    "methods": {
+                        name: _summary(values)
+                        for name, values in sorted(recorder.latencies.items())
+                    },
+                    "cpu_breakdown": {
+                        "proto_plus_seconds": timer.seconds,
+                        "grpc_and_other_seconds": max(0.0, cpu - timer.seconds),
+                        "proto_plus_fraction": timer.seconds / cpu if cpu else 0.0,
+                    },
+                }
+            )
+    return report
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m google.cloud.talent_helpers.benchmark",
+        description="Measure Talent v4 client throughput against a fake server.",
+    )
+    parser.add_argument("--modes", default=",".join(MODES))
+    parser.add_argument("--mix", default=DEFAULT_MIX)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--warmup", type=int, default=100)
+    parser.add_argument("--jobs", type=int, default=500)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--endpoint", default=None)
+    parser.add_argument("--output", default="-", help="File for the JSON report.")
+    parser.add_argument(
+        "--serve",
+        action="store_true",
+        help="Only run the fake server, printing its endpoint.",
+    )
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = _parser().parse_args(argv)
+
+    if args.serve:
+        with FakeTalentServer(latency=args.latency, seed=args.seed) as server:
+            print(server.endpoint, flush=True)
+            try:
+                threading.Event().wait()
+            except KeyboardInterrupt:
+                pass
+        return 0
+
+    report = run_benchmark(
+        modes=[m.strip() for m in args.modes.split(",") if m.strip()],
+        mix=args.mix,
+        requests=args.requests,
+        concurrency=args.concurrency,
+        warmup=args.warmup,
+        jobs=args.jobs,
+        latency=args.latency,
+        seed=args.seed,
+        endpoint=args.endpoint,
+    )
+    text = json.dumps(report, indent=2, sort_keys=True)
+    if args.output == "-":
+        print(text)
+    else:
+        with open(args.output, "w") as output:
+            output.write(text + "\n")
+    return 0
+
+
+if __name__ == "__main__":  # pragma: NO COVER
+    sys.exit(main())
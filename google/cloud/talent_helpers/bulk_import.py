@@ -0,0 +1,634 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Resumable bulk import of jobs from NDJSON and CSV files.
+
+:func:`import_jobs` streams records from disk, parses them into v4
+:class:`~google.cloud.talent_v4.types.Job` messages in a process pool and
+sends them through ``batch_create_jobs`` (or ``batch_update_jobs``) with
+a bounded number of batches in flight::
+
+    result = import_jobs(client, tenant, "jobs.ndjson")
+    for failure in result.failures:
+        print(failure.offset, failure.message)
+
+Input formats:
+
+* **NDJSON**: one JSON object per line, in the proto3 JSON mapping of
+  ``Job`` (``requisitionId`` and ``requisition_id`` are both accepted).
+* **CSV**: a header row naming ``Job`` fields, with dotted paths for
+  nested fields (``application_info.uris``). Cells of repeated fields are
+  split on ``list_separator``; empty cells are left unset.
+
+Progress is recorded in a checkpoint file (``<path>.checkpoint`` by
+default) after every acknowledged batch. Running the same import again
+skips every record the service has already answered for, whether it
+succeeded or failed, so a crashed import resumes where it stopped.
+Delete the checkpoint to import the file from the top.
+
+A ``deadline`` bounds the whole import: each batch request and operation
+gets the time left, and once it runs out no further batches are sent and
+the import returns with ``deadline_exceeded`` set. Batches cut short are
+left out of the checkpoint, so running the import again sends them.
+"""
+
+import collections
+import concurrent.futures
+import csv
+import io
+import json
+import multiprocessing
+import os
+import sys
+import threading
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+from google.api_core import exceptions  # type: ignore
+from google.protobuf import json_format  # type: ignore
+
+from google.cloud.talent_helpers import paging
+from google.cloud.talent_v4.types import job as gct_job
+
+
+ImportFailure = collections.namedtuple("ImportFailure", ["offset", "code", "message"])
+ImportFailure.__doc__ = """A record that was not imported.
+
+``offset`` is the byte offset where the record starts in the source
+file, ``code`` the ``google.rpc.Code`` value (``3``, INVALID_ARGUMENT,
+for records that could not be parsed) and ``message`` the reason."""
+
+_INVALID_ARGUMENT = 3
+
+# What a batch request or operation cut short by its timeout raises.
+_EXPIRED_ERRORS = (
+    exceptions.DeadlineExceeded,
+    exceptions.RetryError,
+    concurrent.futures.TimeoutError,
+)
+
+
+class ImportResult:
+    """The outcome of :func:`import_jobs`.
+
+    Attributes:
+        succeeded (int): Records the service accepted in this run.
+        failures (List[~.ImportFailure]): Records that were rejected by
+            the service or could not be parsed, in this run.
+        skipped (int): Records already acknowledged by an earlier run.
+        deadline_exceeded (bool): Whether the import stopped early because
+            its deadline passed. Records not yet acknowledged are imported
+            by the next run.
+    """
+
+    def __init__(self) -> None:
+        self.succeeded = 0
+        self.failures: List[ImportFailure] = []
+        self.skipped = 0
+        self.deadline_exceeded = False
+
+    @property
+    def failed(self) -> int:
+        """int: The number of failures."""
+        return len(self.failures)
+
+    def __repr__(self) -> str:
+        return "<ImportResult succeeded={} failed={} skipped={}>".format(
+            self.succeeded, self.failed, self.skipped
+        )
+
+
+class _Checkpoint:
+    """Byte ranges of the source the service has acknowledged.
+
+    Batches may complete out of order, so the file keeps a contiguous
+    ``offset`` below which every record is done plus the completed
+    ``ranges`` above it.
+    """
+
+    def __init__(self, path: str, source: str) -> None:
+        self.path = path
+        self.source = source
+        self.offset = 0
+        self.ranges: List[Tuple[int, int]] = []
+        self._lock = threading.Lock()
+        if os.path.exists(path):
+            with open(path) as stream:
+                state = json.load(stream)
+            if state.get("source") != source:
+                raise ValueError(
+                    "Checkpoint {} belongs to {}, not {}.".format(
+                        path, state.get("source"), source
+                    )
+                )
+            self.offset = state["offset"]
+            self.ranges = [tuple(r) for r in state["ranges"]]
+
+    def done(self, start: int, end: int) -> bool:
+        if end <= self.offset:
+            return True
+        return any(lo <= start and end <= hi for lo, hi in self.ranges)
+
+    def add(self, start: int, end: int) -> None:
+        with self._lock:
+            ranges = sorted(self.ranges + [(start, end)])
+            merged: List[Tuple[int, int]] = []
+            for lo, hi in ranges:
+                if merged and lo <= merged[-1][1]:
+                    merged[-1] = (merged[-1][0], max(hi, merged[-1][1]))
+                else:
+                    merged.append((lo, hi))
+            while merged and merged[0][0] <= self.offset:
+                self.offset = max(self.offset, merged.pop(0)[1])
+            self.ranges = merged
+            self._save()
+
+    def _save(self) -> None:
+        temporary = self.path + ".tmp"
+        with open(temporary, "w") as stream:
+            json.dump(
+                {"source": self.source, "offset": self.offset, "ranges": self.ranges},
+                stream,
+            )
+            stream.flush()
+            os.fsync(stream.fileno())
+        os.replace(temporary, self.path)
+
+
+def _read_records(path: str, csv_format: bool, chunk_size: int):
+    """Yield ``(start, end, data)`` for every record of the source file.
+
+    The file is read in binary chunks of ``chunk_size`` bytes. CSV
+    records may span lines inside quoted cells; a record ends at the first
+    newline where the quotes seen so far are balanced.
+    """
+    with open(path, "rb", buffering=chunk_size) as stream:
+        offset = 0
+        pending: List[bytes] = []
+        quotes = 0
+        start = 0
+        for line in stream:
+            end = offset + len(line)
+            if not pending:
+                start = offset
+            offset = end
+            if csv_format:
+                pending.append(line)
+                quotes += line.count(b'"')
+                if quotes % 2:
+                    continue
+                line = b"".join(pending)
+                pending, quotes = [], 0
+            if line.strip():
+                yield start, end, line
+        if pending:
+            yield start, offset, b"".join(pending)
+
+
+def _field(descriptor, name: str):
+    field = descriptor.fields_by_name.get(name)
+    if field is None:
+        field = descriptor.fields_by_camelcase_name.get(name)
+    if field is None:
+        raise ValueError(
+            "{} has no field named {!r}.".format(descriptor.full_name, name)
+        )
+    return field
+
+
+def _csv_value(field, cell: str):
+    # json_format only accepts JSON booleans for bool fields.
+    if field.type == field.TYPE_BOOL:
+        return cell.strip().lower() in ("true", "1", "yes")
+    return cell
+
+
+def _csv_dict(header: Sequence[str], row: Sequence[str], separator: str) -> Dict:
+    if len(row) != len(header):
+        raise ValueError("Expected {} columns, found {}.".format(len(header), len(row)))
+    result: Dict = {}
+    for column, value in zip(header, row):
+        if not value:
+            continue
+        descriptor = gct_job.Job.pb().DESCRIPTOR
+        target = result
+        names = column.split(".")
+        for name in names[:-1]:
+            descriptor = _field(descriptor, name).message_type
+            if descriptor is None:
+                raise ValueError("{!r} is not a message field.".format(name))
+            target = target.setdefault(name, {})
+        field = _field(descriptor, names[-1])
+        if field.label == field.LABEL_REPEATED:
+            target[names[-1]] = [
+                _csv_value(field, cell) for cell in value.split(separator)
+            ]
+        else:
+            target[names[-1]] = _csv_value(field, value)
+    return result
+
+
+def _parse_batch(
+    records: Sequence[bytes], header: Optional[Sequence[str]], separator: str
+) -> List[Tuple[Optional[bytes], Optional[str]]]:
+    """Parse raw records into serialized ``Job`` messages.
+
+    Runs in the worker processes, so it takes and returns plain bytes and
+    strings. Each result is either ``(job_bytes, None)`` or
+    ``(None, error_message)``.
+    """
+    results: List[Tuple[Optional[bytes], Optional[str]]] = []
+    job_type = gct_job.Job.pb()
+    for data in records:
+        try:
+            text = data.decode("utf-8")
+            if header is None:
+                values = json.loads(text)
+            else:
+                (row,) = csv.reader(io.StringIO(text))
+                values = _csv_dict(header, row, separator)
+            message = json_format.ParseDict(values, job_type())
+            results.append((message.SerializeToString(), None))
+        except Exception as exc:
+            results.append((None, "{}: {}".format(type(exc).__name__, exc)))
+    return results
+
+
+def _timeout(deadline: Optional[paging.Deadline], timeout: Optional[float]):
+    return timeout if deadline is None else deadline.timeout(timeout)
+
+
+def _cut_off(
+    exc: BaseException, deadline: Optional[paging.Deadline], timeout: Optional[float]
+) -> bool:
+    """Whether ``exc`` means the deadline stopped a batch, not a failure."""
+    if deadline is None or not isinstance(exc, _EXPIRED_ERRORS):
+        return False
+    # Retries give up slightly before the deadline itself passes.
+    return deadline.expired or timeout is None or deadline.remaining() < timeout
+
+
+def _import_batch(
+    client,
+    parent: str,
+    records: Sequence[bytes],
+    header: Optional[Sequence[str]],
+    separator: str,
+    update: bool,
+    update_mask_paths: Optional[List[str]],
+    timeout: Optional[float],
+    deadline: Optional[paging.Deadline] = None,
+) -> Tuple[List[Tuple[int, int, str]], int]:
+    """Parse and send one batch in a :class:`ClientPool` worker.
+
+    Returns the ``(index, code, message)`` of every failed record, by
+    position in ``records``, and the number of records imported.
+    """
+    failures: List[Tuple[int, int, str]] = []
+    indexes, jobs = [], []
+    for index, (data, error) in enumerate(_parse_batch(records, header, separator)):
+        if error is not None:
+            failures.append((index, _INVALID_ARGUMENT, error))
+        else:
+            indexes.append(index)
+            jobs.append(gct_job.Job.deserialize(data))
+    if not jobs:
+        return failures, 0
+    if update:
+        request = {"parent": parent, "jobs": jobs}
+        if update_mask_paths is not None:
+            request["update_mask"] = {"paths": update_mask_paths}
+        operation = client.batch_update_jobs(
+            request=request, timeout=_timeout(deadline, timeout)
+        )
+    else:
+        operation = client.batch_create_jobs(
+            parent=parent, jobs=jobs, timeout=_timeout(deadline, timeout)
+        )
+    response = operation.result(timeout=_timeout(deadline, timeout))
+    succeeded = 0
+    for index, job_result in zip(indexes, response.job_results):
+        if job_result.status.code:
+            failures.append((index, job_result.status.code, job_result.status.message))
+        else:
+            succeeded += 1
+    return failures, succeeded
+
+
+class _Inline:
+    """Stands in for a process pool when ``workers`` is ``0``."""
+
+    def submit(self, func, *args):
+        future = concurrent.futures.Future()
+        future.set_result(func(*args))
+        return future
+
+    def shutdown(self, wait=True):
+        pass
+
+
+def import_jobs(
+    client,
+    parent: str,
+    path: str,
+    *,
+    update: bool = False,
+    update_mask=None,
+    csv_format: Optional[bool] = None,
+    list_separator: str = "|",
+    batch_size: int = 100,
+    max_in_flight: int = 4,
+    workers: Optional[int] = None,
+    checkpoint_path: Optional[str] = None,
+    chunk_size: int = 1 << 20,
+    timeout: Optional[float] = None,
+    pool=None,
+    deadline: Union[paging.Deadline, float, None] = None,
+) -> ImportResult:
+    """Import every job in an NDJSON or CSV file.
+
+    Args:
+        client (~.JobServiceClient): The v4 client used to send batches.
+        parent (str): The tenant the jobs belong to.
+        path (str): The source file.
+        update (bool): Send ``batch_update_jobs`` instead of
+            ``batch_create_jobs``. Records must then carry the job ``name``.
+        update_mask (Optional[google.protobuf.field_mask_pb2.FieldMask]):
+            The fields to update when ``update`` is set. ``None`` replaces
+            the whole job.
+        csv_format (Optional[bool]): Whether the file is CSV. ``None``
+            infers it from a ``.csv`` suffix.
+        list_separator (str): Separates values of repeated fields in CSV
+            cells.
+        batch_size (int): Jobs per batch request; at most 200.
+        max_in_flight (int): Batches sent and awaited concurrently.
+        workers (Optional[int]): Parsing processes. ``None`` uses one per
+            CPU; ``0`` parses in the calling thread, as does Python 3.6,
+            whose process pools cannot spawn their workers.
+        checkpoint_path (Optional[str]): Where progress is recorded.
+            Defaults to ``path`` plus ``.checkpoint``.
+        chunk_size (int): Bytes read from the source at a time.
+        timeout (Optional[float]): Timeout for each batch request and for
+            its long-running operation.
+        pool (Optional[~.process_pool.ClientPool]): A pool of
+            ``JobServiceClient`` workers. Each batch is then parsed, sent
+            and awaited in a worker with its own client, ``client`` and
+            ``workers`` are ignored, and ``max_in_flight`` batches are
+            handed to the pool at once.
+        deadline (Union[~.paging.Deadline, float, None]): Bounds the whole
+            import, as a deadline or a budget in seconds from now. Each
+            request and operation wait is capped at the time left; once
+            it has passed no further batches are sent.
+
+    Returns:
+        ~.ImportResult: What was imported in this run.
+
+    Raises:
+        google.api_core.exceptions.GoogleAPICallError: If a batch request
+            or operation fails. Batches acknowledged before the error are
+            in the checkpoint, so running the import again resumes.
+        ValueError: If the checkpoint was written for another file.
+    """
+    if csv_format is None:
+        csv_format = path.lower().endswith(".csv")
+    checkpoint = _Checkpoint(
+        checkpoint_path or path + ".checkpoint", os.path.abspath(path)
+    )
+    result = ImportResult()
+    deadline = paging.Deadline.of(deadline)
+    records = _read_records(path, csv_format, chunk_size)
+
+    header = None
+    if csv_format:
+        for start, end, data in records:
+            (header,) = csv.reader(io.StringIO(data.decode("utf-8-sig")))
+            break
+        if header is None:
+            return result
+
+    if pool is not None:
+        return _import_with_pool(
+            pool,
+            parent,
+            records,
+            header,
+            checkpoint,
+            result,
+            update=update,
+            update_mask=update_mask,
+            list_separator=list_separator,
+            batch_size=batch_size,
+            max_in_flight=max_in_flight,
+            timeout=timeout,
+            deadline=deadline,
+        )
+
+    if workers == 0 or sys.version_info < (3, 7):
+        parser = _Inline()
+    else:
+        # gRPC does not support fork() while channels are in use.
+        parser = concurrent.futures.ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+        )
+    sender = concurrent.futures.ThreadPoolExecutor(max_workers=max_in_flight)
+    slots = threading.BoundedSemaphore(max_in_flight)
+    lock = threading.Lock()
+    errors: List[Exception] = []
+
+    def send(first, batch, parsed):
+        try:
+            offsets, jobs = [], []
+            failures = []
+            for (start, end), (data, error) in zip(batch, parsed):
+                if error is not None:
+                    failures.append(ImportFailure(start, _INVALID_ARGUMENT, error))
+                else:
+                    offsets.append(start)
+                    jobs.append(gct_job.Job.deserialize(data))
+            succeeded = 0
+            if jobs:
+                if update:
+                    operation = client.batch_update_jobs(
+                        request={
+                            "parent": parent,
+                            "jobs": jobs,
+                            "update_mask": update_mask,
+                        },
+                        timeout=_timeout(deadline, timeout),
+                    )
+                else:
+                    operation = client.batch_create_jobs(
+                        parent=parent, jobs=jobs, timeout=_timeout(deadline, timeout)
+                    )
+                response = operation.result(timeout=_timeout(deadline, timeout))
+                for offset, job_result in zip(offsets, response.job_results):
+                    if job_result.status.code:
+                        failures.append(
+                            ImportFailure(
+                                offset,
+                                job_result.status.code,
+                                job_result.status.message,
+                            )
+                        )
+                    else:
+                        succeeded += 1
+            checkpoint.add(first, batch[-1][1])
+            with lock:
+                result.succeeded += succeeded
+                result.failures.extend(failures)
+        except Exception as exc:
+            with lock:
+                if _cut_off(exc, deadline, timeout):
+                    result.deadline_exceeded = True
+                else:
+                    errors.append(exc)
+        finally:
+            slots.release()
+
+    def dispatch():
+        # Hand the oldest parsed batch to the sender once a slot frees up.
+        first, spans, future = pending.popleft()
+        parsed = future.result()
+        slots.acquire()
+        if errors or expired():
+            slots.release()
+            return
+        sender.submit(send, first, spans, parsed)
+
+    def expired():
+        if deadline is None or not deadline.expired:
+            return False
+        result.deadline_exceeded = True
+        return True
+
+    # Keep about one batch per worker parsing ahead of the sender, so
+    # memory stays bounded however large the file is.
+    depth = workers if workers is not None else os.cpu_count() or 1
+    pending: collections.deque = collections.deque()
+    try:
+        for first, batch in _batches(records, checkpoint, result, batch_size):
+            if errors or expired():
+                break
+            spans = [(start, end) for start, end, _ in batch]
+            future = parser.submit(
+                _parse_batch, [data for _, _, data in batch], header, list_separator
+            )
+            pending.append((first, spans, future))
+            if len(pending) > depth:
+                dispatch()
+        while pending and not errors and not expired():
+            dispatch()
+    finally:
+        sender.shutdown(wait=True)
+        parser.shutdown(wait=True)
+    if errors:
+        raise errors[0]
+    result.failures.sort()
+    return result
+
+
+def _batches(records, checkpoint: _Checkpoint, result: ImportResult, batch_size: int):
+    """Yield ``(first, batch)`` for the records not done yet.
+
+    ``first`` is where the bytes the batch accounts for start: the end of
+    the record before it, so the CSV header and blank lines between
+    records are checkpointed along with the records that follow them.
+    """
+    batch: List[Tuple[int, int, bytes]] = []
+    first = covered = 0
+    for start, end, data in records:
+        if checkpoint.done(start, end):
+            result.skipped += 1
+        else:
+            if not batch:
+                first = covered
+            batch.append((start, end, data))
+            if len(batch) >= batch_size:
+                yield first, batch
+                batch = []
+        covered = end
+    if batch:
+        yield first, batch
+
+
+def _import_with_pool(
+    pool,
+    parent,
+    records,
+    header,
+    checkpoint,
+    result,
+    *,
+    update,
+    update_mask,
+    list_separator,
+    batch_size,
+    max_in_flight,
+    timeout,
+    deadline,
+):
+    paths = None if update_mask is None else list(update_mask.paths)
+
+    def collect(first, spans, future):
+        try:
+            failures, succeeded = future.result()
+        except Exception as exc:
+            if not _cut_off(exc, deadline, timeout):
+                raise
+            result.deadline_exceeded = True
+            return
+        checkpoint.add(first, spans[-1][1])
+        result.succeeded += succeeded
+        result.failures.extend(
+            ImportFailure(spans[index][0], code, message)
+            for index, code, message in failures
+        )
+
+    pending: collections.deque = collections.deque()
+    try:
+        for first, batch in _batches(records, checkpoint, result, batch_size):
+            if deadline is not None and deadline.expired:
+                result.deadline_exceeded = True
+                break
+            spans = [(start, end) for start, end, _ in batch]
+            future = pool.run(
+                _import_batch,
+                parent,
+                [data for _, _, data in batch],
+                header,
+                list_separator,
+                update,
+                paths,
+                timeout,
+                deadline,
+            )
+            pending.append((first, spans, future))
+            if len(pending) >= max_in_flight:
+                collect(*pending.popleft())
+        while pending:
+            collect(*pending.popleft())
+    finally:
+        for _, _, future in pending:
+            future.cancel()
+        # Record batches that finished before an error, so a rerun skips them.
+        for first, spans, future in pending:
+            if future.done() and not future.cancelled() and not future.exception():
+                collect(first, spans, future)
+    result.failures.sort()
+    return result
+
+
+__all__ = ("ImportFailure", "ImportResult", "import_jobs")
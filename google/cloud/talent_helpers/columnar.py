@@ -0,0 +1,466 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Columnar NumPy views of jobs and search results.
+
+:func:`to_columns` reads a batch of ``Job`` messages, or the matching jobs
+of a ``SearchJobsResponse``, once and returns a :class:`JobColumns` of
+NumPy arrays with one row per job, so scoring and filtering can be
+vectorized instead of reading proto-plus attributes job by job::
+
+    columns = to_columns(response)
+    recent = columns.posting_publish_time > numpy.datetime64("2020-06-01")
+    full_time = columns.has(columns.employment_types, EmploymentType.FULL_TIME)
+    shortlist = columns.take(numpy.flatnonzero(recent & full_time))
+
+Missing values are ``NaN`` for floats and ``NaT`` for times. Categorical
+strings such as the company are dictionary-encoded as a
+:class:`Categorical`. Repeated enums are packed into ``uint64`` bit
+masks, one bit per enum value.
+
+:func:`annualize_compensation` computes the annualized base and total
+compensation ranges of many jobs locally, with the semantics the service
+documents for ``CompensationInfo``, so they can be validated and bucketed
+before the jobs are ingested::
+
+    compensation = annualize_compensation(jobs)
+    usd = compensation.currency.categories.index("USD")
+    buckets = numpy.digitize(
+        compensation.total_max[compensation.currency.codes == usd], edges
+    )
+
+This module requires NumPy, installed with the ``numpy`` extra.
+"""
+
+import collections
+from typing import Dict, List
+
+try:
+    import numpy  # type: ignore
+except ImportError:  # pragma: NO COVER
+    raise ImportError(
+        "google.cloud.talent_helpers.columnar requires NumPy. "
+        "Install it with: pip install google-cloud-talent[numpy]"
+    )
+
+from google.cloud.talent_v4.types import common
+
+
+Categorical = collections.namedtuple("Categorical", ["codes", "categories"])
+Categorical.__doc__ = """Dictionary-encoded strings.
+
+``codes`` is an ``int32`` array indexing ``categories``, a list of the
+distinct non-empty values in order of first appearance. Empty strings
+are coded ``-1``."""
+
+_STRINGS = ("name", "requisition_id", "title")
+_CATEGORICALS = ("company", "company_display_name", "language_code")
+_ENUMS = ("job_level", "posting_region", "visibility")
+_ENUM_SETS = ("employment_types", "degree_types", "job_benefits")
+_TIMES = (
+    "posting_publish_time",
+    "posting_expire_time",
+    "posting_create_time",
+    "posting_update_time",
+)
+_COMPENSATION = (
+    "annualized_base_compensation_range",
+    "annualized_total_compensation_range",
+)
+_NAT = numpy.datetime64("NaT", "us")
+
+_Unit = common.CompensationInfo.CompensationUnit
+
+# Units per year inferred for full-time jobs, indexed by CompensationUnit.
+# Other units are not inferred.
+_UNITS_PER_YEAR = numpy.full(max(_Unit) + 1, numpy.nan)
+_UNITS_PER_YEAR[
+    [_Unit.HOURLY, _Unit.DAILY, _Unit.WEEKLY, _Unit.MONTHLY, _Unit.YEARLY]
+] = [2080.0, 260.0, 52.0, 12.0, 1.0]
+_BASE = common.CompensationInfo.CompensationType.BASE
+_FULL_TIME = common.EmploymentType.FULL_TIME
+
+CompensationColumns = collections.namedtuple(
+    "CompensationColumns",
+    ["base_min", "base_max", "total_min", "total_max", "currency", "mixed_currency"],
+)
+CompensationColumns.__doc__ = """Annualized compensation, one row per job.
+
+The ``float64`` arrays ``base_min``, ``base_max``, ``total_min`` and
+``total_max`` bound the annualized base and total compensation ranges.
+They are ``NaN`` when no entry can be annualized, and a range without a
+maximum has an infinite ``*_max``. ``currency`` is a :class:`Categorical`
+of each row's currency code. ``mixed_currency`` flags rows whose entries
+use several currencies; their totals are ``NaN``."""
+
+
+class _Encoder:
+    def __init__(self):
+        self.categories: List[str] = []
+        self.index: Dict[str, int] = {}
+
+    def __call__(self, value: str) -> int:
+        if not value:
+            return -1
+        code = self.index.get(value)
+        if code is None:
+            code = self.index[value] = len(self.categories)
+            self.categories.append(value)
+        return code
+
+
+def _money(money) -> float:
+    return money.units + money.nanos * 1e-9
+
+
+def _time(timestamp):
+    if not (timestamp.seconds or timestamp.nanos):
+        return _NAT
+    return numpy.datetime64(timestamp.seconds * 1000000 + timestamp.nanos // 1000, "us")
+
+
+def _mask(values) -> int:
+    mask = 0
+    for value in values:
+        mask |= 1 << value
+    return mask
+
+
+class JobColumns:
+    """Per-job NumPy arrays built by :func:`to_columns`.
+
+    Every attribute below except the ``location_*`` arrays has one row per
+    job, in input order.
+
+    Attributes:
+        name, requisition_id, title (numpy.ndarray): Strings, as ``object``
+            arrays.
+        company, company_display_name, language_code (~.Categorical):
+            Dictionary-encoded strings.
+        job_level, posting_region, visibility (numpy.ndarray): ``int32``
+            enum values.
+        employment_types, degree_types, job_benefits (numpy.ndarray):
+            ``uint64`` masks with bit ``1 << value`` set for each value.
+        posting_publish_time, posting_expire_time, posting_create_time,
+        posting_update_time (numpy.ndarray): ``datetime64[us]``.
+        base_compensation_min, base_compensation_max,
+        total_compensation_min, total_compensation_max (numpy.ndarray):
+            ``float64`` bounds of the annualized compensation ranges.
+        compensation_currency (~.Categorical): The currency of the
+            annualized total range, or of the base range if it is unset.
+        latitude, longitude (numpy.ndarray): ``float64`` coordinates of
+            each job's first derived location.
+        location_count (numpy.ndarray): ``int32`` number of derived
+            locations.
+        location_job (numpy.ndarray): ``int32`` row of the job each derived
+            location belongs to.
+        location_latitude, location_longitude (numpy.ndarray): ``float64``
+            coordinates of every derived location.
+        location_type (numpy.ndarray): ``int32`` ``LocationType`` of every
+            derived location.
+        travel_duration (numpy.ndarray): ``float64`` commute time in
+            seconds for search results with a commute filter.
+    """
+
+    def __init__(self, **columns) -> None:
+        self.__dict__.update(columns)
+
+    def __len__(self) -> int:
+        return len(self.name)
+
+    def __repr__(self) -> str:
+        return "<JobColumns jobs={} locations={}>".format(
+            len(self), len(self.location_job)
+        )
+
+    @staticmethod
+    def has(mask: numpy.ndarray, value: int) -> numpy.ndarray:
+        """Return whether each row of an enum mask contains ``value``."""
+        return (mask & numpy.uint64(1 << int(value))) != 0
+
+    def take(self, rows) -> "JobColumns":
+        """Return the columns of the given rows.
+
+        Args:
+            rows (numpy.ndarray): Row indices, or a boolean mask with one
+                entry per job.
+
+        Returns:
+            ~.JobColumns: The selected jobs, in the order of ``rows``.
+        """
+        rows = numpy.asarray(rows)
+        if rows.dtype == bool:
+            rows = numpy.flatnonzero(rows)
+        columns = {}
+        for key, value in self.__dict__.items():
+            if key.startswith("location_") and key != "location_count":
+                continue
+            if isinstance(value, Categorical):
+                columns[key] = Categorical(value.codes[rows], value.categories)
+            else:
+                columns[key] = value[rows]
+        # Keep the derived locations of the selected jobs, grouped by their
+        # new rows.
+        new_rows = numpy.full(len(self), -1, dtype=numpy.int64)
+        new_rows[rows] = numpy.arange(len(rows))
+        remapped = new_rows[self.location_job]
+        kept = numpy.flatnonzero(remapped >= 0)
+        kept = kept[numpy.argsort(remapped[kept], kind="stable")]
+        columns["location_job"] = remapped[kept].astype(numpy.int32)
+        for key in ("location_latitude", "location_longitude", "location_type"):
+            columns[key] = getattr(self, key)[kept]
+        return JobColumns(**columns)
+
+
+def _jobs(source):
+    matching_jobs = getattr(source, "matching_jobs", None)
+    if matching_jobs is None:
+        return [type(j).pb(j) if hasattr(type(j), "pb") else j for j in source], None
+    response = type(source).pb(source) if hasattr(type(source), "pb") else source
+    matches = response.matching_jobs
+    return [m.job for m in matches], matches
+
+
+def to_columns(source) -> JobColumns:
+    """Convert jobs or search results to columns.
+
+    Args:
+        source (Union[Iterable[~.job.Job], ~.job_service.SearchJobsResponse]):
+            v4 or v4beta1 jobs, as proto-plus or protobuf messages, or a
+            search response whose matching jobs are converted.
+
+    Returns:
+        ~.JobColumns: One row per job.
+    """
+    jobs, matches = _jobs(source)
+    count = len(jobs)
+    encoders = {key: _Encoder() for key in _CATEGORICALS + ("currency",)}
+    columns = {key: numpy.empty(count, dtype=object) for key in _STRINGS}
+    for key in _CATEGORICALS + ("compensation_currency",) + _ENUMS:
+        columns[key] = numpy.empty(count, dtype=numpy.int32)
+    for key in _ENUM_SETS:
+        columns[key] = numpy.empty(count, dtype=numpy.uint64)
+    for key in _TIMES:
+        columns[key] = numpy.empty(count, dtype="datetime64[us]")
+    for key in (
+        "base_compensation_min",
+        "base_compensation_max",
+        "total_compensation_min",
+        "total_compensation_max",
+        "latitude",
+        "longitude",
+        "travel_duration",
+    ):
+        columns[key] = numpy.full(count, numpy.nan)
+    columns["location_count"] = numpy.empty(count, dtype=numpy.int32)
+    location_job: List[int] = []
+    location_latitude: List[float] = []
+    location_longitude: List[float] = []
+    location_type: List[int] = []
+
+    for row, job in enumerate(jobs):
+        for key in _STRINGS:
+            columns[key][row] = getattr(job, key)
+        for key in _CATEGORICALS:
+            columns[key][row] = encoders[key](getattr(job, key))
+        for key in _ENUMS:
+            columns[key][row] = getattr(job, key)
+        for key in _ENUM_SETS:
+            columns[key][row] = _mask(getattr(job, key))
+        for key in _TIMES:
+            columns[key][row] = _time(getattr(job, key))
+
+        currency = ""
+        info = job.compensation_info
+        for prefix, field in zip(("base", "total"), _COMPENSATION):
+            if info.HasField(field):
+                bounds = getattr(info, field)
+                if bounds.HasField("min_compensation"):
+                    columns[prefix + "_compensation_min"][row] = _money(
+                        bounds.min_compensation
+                    )
+                    currency = bounds.min_compensation.currency_code or currency
+                if bounds.HasField("max_compensation"):
+                    columns[prefix + "_compensation_max"][row] = _money(
+                        bounds.max_compensation
+                    )
+                    currency = bounds.max_compensation.currency_code or currency
+        columns["compensation_currency"][row] = encoders["currency"](currency)
+
+        locations = job.derived_info.locations
+        columns["location_count"][row] = len(locations)
+        for index, location in enumerate(locations):
+            lat_lng = location.lat_lng
+            if index == 0:
+                columns["latitude"][row] = lat_lng.latitude
+                columns["longitude"][row] = lat_lng.longitude
+            location_job.append(row)
+            location_latitude.append(lat_lng.latitude)
+            location_longitude.append(lat_lng.longitude)
+            location_type.append(location.location_type)
+
+    if matches is not None:
+        for row, match in enumerate(matches):
+            if match.HasField("commute_info"):
+                duration = match.commute_info.travel_duration
+                columns["travel_duration"][row] = (
+                    duration.seconds + duration.nanos * 1e-9
+                )
+
+    for key in _CATEGORICALS:
+        columns[key] = Categorical(columns[key], encoders[key].categories)
+    columns["compensation_currency"] = Categorical(
+        columns["compensation_currency"], encoders["currency"].categories
+    )
+    columns["location_job"] = numpy.array(location_job, dtype=numpy.int32)
+    columns["location_latitude"] = numpy.array(location_latitude, dtype=numpy.float64)
+    columns["location_longitude"] = numpy.array(location_longitude, dtype=numpy.float64)
+    columns["location_type"] = numpy.array(location_type, dtype=numpy.int32)
+    return JobColumns(**columns)
+
+
+def annualize_compensation(source, *, full_time=None) -> CompensationColumns:
+    """Annualize the compensation of many jobs at once.
+
+    An entry is annualized when it has an ``amount`` or a ``range`` and its
+    ``expected_units_per_year`` is set, or can be inferred from its
+    ``unit`` for a full-time job (2080 hours, 260 days, 52 weeks or 12
+    months per year). A range without a minimum starts at zero and one
+    without a maximum is unbounded. The base range comes from the ``BASE``
+    entry, and the total range sums every annualized entry.
+
+    Args:
+        source (Iterable[Union[~.job.Job, ~.common.CompensationInfo]]):
+            v4 or v4beta1 jobs or compensation infos, as proto-plus or
+            protobuf messages.
+        full_time (Union[None, bool, Sequence[bool]]): Whether units per
+            year may be inferred for each row. By default, this is whether
+            a job's ``employment_types`` include ``FULL_TIME``, and false
+            for bare ``CompensationInfo`` messages.
+
+    Returns:
+        ~.CompensationColumns: One row per input message.
+    """
+    messages = [type(m).pb(m) if hasattr(type(m), "pb") else m for m in source]
+    count = len(messages)
+    inferred = numpy.zeros(count, dtype=bool)
+    rows: List[int] = []
+    types: List[int] = []
+    units: List[int] = []
+    lows: List[float] = []
+    highs: List[float] = []
+    expected: List[float] = []
+    currencies: List[int] = []
+    encoder = _Encoder()
+
+    for row, message in enumerate(messages):
+        info = getattr(message, "compensation_info", None)
+        if info is None:
+            info = message
+        else:
+            inferred[row] = _FULL_TIME in message.employment_types
+        for entry in info.entries:
+            kind = entry.WhichOneof("compensation_amount")
+            if kind == "amount":
+                low = high = _money(entry.amount)
+                currency = entry.amount.currency_code
+            elif kind == "range_":
+                bounds = entry.range_
+                low = _money(bounds.min_compensation)
+                high = (
+                    _money(bounds.max_compensation)
+                    if bounds.HasField("max_compensation")
+                    else numpy.inf
+                )
+                currency = (
+                    bounds.min_compensation.currency_code
+                    or bounds.max_compensation.currency_code
+                )
+            else:
+                continue
+            rows.append(row)
+            types.append(entry.type_)
+            units.append(entry.unit)
+            lows.append(low)
+            highs.append(high)
+            expected.append(
+                entry.expected_units_per_year.value
+                if entry.HasField("expected_units_per_year")
+                else numpy.nan
+            )
+            currencies.append(encoder(currency))
+
+    if full_time is not None:
+        inferred = numpy.broadcast_to(numpy.asarray(full_time, dtype=bool), (count,))
+    entry_row = numpy.array(rows, dtype=numpy.intp)
+    entry_unit = numpy.array(units, dtype=numpy.intp)
+    per_year = numpy.array(expected, dtype=numpy.float64)
+    default = _UNITS_PER_YEAR[numpy.clip(entry_unit, 0, len(_UNITS_PER_YEAR) - 1)]
+    per_year = numpy.where(
+        numpy.isnan(per_year) & inferred[entry_row], default, per_year
+    )
+    valid = ~numpy.isnan(per_year)
+    low = numpy.array(lows, dtype=numpy.float64) * per_year
+    high = numpy.array(highs, dtype=numpy.float64) * per_year
+    codes = numpy.array(currencies, dtype=numpy.int32)
+
+    base_min = numpy.full(count, numpy.nan)
+    base_max = numpy.full(count, numpy.nan)
+    base = valid & (numpy.array(types, dtype=numpy.int32) == _BASE)
+    base_min[entry_row[base]] = low[base]
+    base_max[entry_row[base]] = high[base]
+
+    valid_row, low, high, codes = (
+        entry_row[valid],
+        low[valid],
+        high[valid],
+        codes[valid],
+    )
+    total_min = numpy.zeros(count)
+    total_max = numpy.zeros(count)
+    numpy.add.at(total_min, valid_row, low)
+    numpy.add.at(total_max, valid_row, high)
+    annualized = numpy.bincount(valid_row, minlength=count) > 0
+
+    # Each row's currency is that of its first annualized entry, and a row
+    # is mixed if any other annualized entry disagrees with it.
+    currency = numpy.full(count, -1, dtype=numpy.int32)
+    first_rows, first = numpy.unique(valid_row, return_index=True)
+    currency[first_rows] = codes[first]
+    mixed = numpy.zeros(count, dtype=bool)
+    mixed[valid_row[codes != currency[valid_row]]] = True
+
+    missing = ~annualized | mixed
+    total_min[missing] = numpy.nan
+    total_max[missing] = numpy.nan
+    return CompensationColumns(
+        base_min,
+        base_max,
+        total_min,
+        total_max,
+        Categorical(currency, encoder.categories),
+        mixed,
+    )
+
+
+__all__ = (
+    "Categorical",
+    "CompensationColumns",
+    "JobColumns",
+    "annualize_compensation",
+    "to_columns",
+)
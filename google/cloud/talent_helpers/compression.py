@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Per-method gRPC request compression for the Talent transports.
+
+Requests such as ``CreateProfileRequest`` with a structured resume, or
+``BatchCreateJobsRequest`` with hundreds of HTML job descriptions, are
+large and compress several times over. Pass a :class:`CompressionPolicy`
+to any v4 or v4beta1 transport to compress them on the wire::
+
+    policy = CompressionPolicy(
+        methods=dict.fromkeys(LARGE_PAYLOAD_METHODS, "gzip"), min_size=4096
+    )
+    client = JobServiceClient(
+        transport=transports.JobServiceGrpcTransport(compression=policy)
+    )
+
+Requests smaller than the threshold are sent uncompressed, since
+compressing them costs CPU for little gain. The size check reuses the
+serialized size protobuf computes anyway, so it is cheap. Only requests
+are affected; response compression is chosen by the server.
+"""
+
+from typing import Callable, Mapping, Optional, Tuple, Union
+
+import grpc  # type: ignore
+
+from google.cloud.talent_helpers import metrics
+from google.cloud.talent_helpers import wrapping
+
+
+ALGORITHMS = {
+    None: grpc.Compression.NoCompression,
+    "none": grpc.Compression.NoCompression,
+    "gzip": grpc.Compression.Gzip,
+    "deflate": grpc.Compression.Deflate,
+}
+
+LARGE_PAYLOAD_METHODS = (
+    "batch_create_jobs",
+    "batch_update_jobs",
+    "create_job",
+    "update_job",
+    "create_profile",
+    "update_profile",
+)
+"""Methods whose requests are typically large, text-heavy payloads."""
+
+_Setting = Union[Optional[str], Tuple[Optional[str], int]]
+
+
+def _algorithm(name) -> grpc.Compression:
+    if isinstance(name, grpc.Compression):
+        return name
+    try:
+        return ALGORITHMS[name.lower() if isinstance(name, str) else name]
+    except KeyError:
+        raise ValueError("Unsupported compression algorithm: {!r}".format(name))
+
+
+class CompressionPolicy(wrapping.MethodInterceptor):
+    """Chooses the compression of each request.
+
+    Args:
+        default (Optional[str]): The algorithm for methods not listed in
+            ``methods``: ``"gzip"``, ``"deflate"`` or ``None``.
+        methods (Mapping[str, Union[Optional[str], Tuple[Optional[str], int]]]):
+            Per-method overrides keyed by the snake_case method name used on
+            the transports (e.g. ``"batch_create_jobs"``). A value is an
+            algorithm, or an ``(algorithm, min_size)`` pair.
+        min_size (int): Requests serializing to fewer bytes than this are
+            not compressed.
+    """
+
+    def __init__(
+        self,
+        default: Optional[str] = None,
+        *,
+        methods: Optional[Mapping[str, _Setting]] = None,
+        min_size: int = 1024,
+    ) -> None:
+        self._default = (_algorithm(default), min_size)
+        self._methods = {}
+        for method, setting in (methods or {}).items():
+            if isinstance(setting, tuple):
+                algorithm, threshold = setting
+            else:
+                algorithm, threshold = setting, min_size
+            self._methods[method] = (_algorithm(algorithm), threshold)
+
+    def setting(self, method: str) -> Tuple[grpc.Compression, int]:
+        """Return the algorithm and size threshold for a method."""
+        return self._methods.get(method, self._default)
+
+    def wrap_attempt(
+        self, key: wrapping.MethodKey, func: Callable, asyncio: bool
+    ) -> Callable:
+        algorithm, min_size = self.setting(key.method)
+        if algorithm == grpc.Compression.NoCompression:
+            return func
+
+        def attempt(request, **kwargs):
+            size = metrics.byte_size(request)
+            if size is not None and size >= min_size:
+                kwargs.setdefault("compression", algorithm)
+            return func(request, **kwargs)
+
+        return attempt
+
+
+__all__ = ("ALGORITHMS", "CompressionPolicy", "LARGE_PAYLOAD_METHODS")
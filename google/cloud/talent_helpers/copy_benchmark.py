@@ -0,0 +1,197 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Benchmark of message pickling and copying.
+
+Times ``pickle`` round trips, ``copy.copy`` and ``copy.deepcopy`` of a
+v4 ``Job`` and a v4beta1 ``Profile``, with the methods from
+:mod:`~google.cloud.talent_helpers.copying` and with proto-plus' default
+behavior, and reports the speedup as JSON::
+
+    python -m google.cloud.talent_helpers.copy_benchmark --size 50 --number 200
+
+``--size`` scales the repeated fields of the sample messages. The
+protobuf runtime in use (``python``, ``cpp`` or ``upb``) is reported too,
+since it dominates serialization cost.
+"""
+
+import argparse
+import contextlib
+import copy
+import json
+import pickle
+import sys
+import time
+from typing import Callable, Dict, Optional, Sequence
+
+from google.cloud.talent_helpers import copying
+from google.cloud.talent_helpers import benchmark
+from google.cloud.talent_v4.types import job as job_v4
+from google.cloud.talent_v4beta1.types import profile as profile_v4beta1
+from google.protobuf.internal import api_implementation  # type: ignore
+
+
+OPERATIONS: Dict[str, Callable] = {
+    "pickle": lambda message: pickle.loads(
+        pickle.dumps(message, pickle.HIGHEST_PROTOCOL)
+    ),
+    "copy": copy.copy,
+    "deepcopy": copy.deepcopy,
+}
+
+
+def sample_job(size: int = 10) -> job_v4.Job:
+    """A ``Job`` with ``size`` entries in each of its repeated fields."""
+    return job_v4.Job(
+        name="projects/p/tenants/t/jobs/1",
+        company="projects/p/tenants/t/companies/c",
+        requisition_id="req-1",
+        title="Software Engineer",
+        description="Write code. " * 10 * size,
+        addresses=["{} Main St, Mountain View, CA".format(i) for i in range(size)],
+        qualifications="Python. " * size,
+        custom_attributes={
+            "attr-{}".format(i): {"string_values": ["a", "b"], "filterable": True}
+            for i in range(size)
+        },
+        derived_info={
+            "locations": [
+                {"lat_lng": {"latitude": i, "longitude": -i}} for i in range(size)
+            ]
+        },
+    )
+
+
+def sample_profile(size: int = 10) -> profile_v4beta1.Profile:
+    """A ``Profile`` with ``size`` entries in each of its repeated fields."""
+    return profile_v4beta1.Profile(
+        external_id="cand-1",
+        group_id="g",
+        person_names=[{"formatted_name": "Name {}".format(i)} for i in range(size)],
+        addresses=[
+            {"unstructured_address": "{} Main St".format(i)} for i in range(size)
+        ],
+        employment_records=[
+            {
+                "employer_name": "Employer {}".format(i),
+                "job_title": "Engineer",
+                "job_description": "Wrote code. " * 20,
+            }
+            for i in range(size)
+        ],
+        skills=[{"display_name": "skill-{}".format(i)} for i in range(2 * size)],
+        custom_attributes={
+            "attr-{}".format(i): {"string_values": ["a", "b"]} for i in range(size)
+        },
+    )
+
+
+@contextlib.contextmanager
+def _default_behavior(message_class):
+    installed = {name: vars(message_class)[name] for name in copying.METHODS}
+    for name in installed:
+        delattr(message_class, name)
+    try:
+        yield
+    finally:
+        for name, method in installed.items():
+            setattr(message_class, name, method)
+
+
+def _time(operation: Callable, message, number: int) -> float:
+    start = time.perf_counter()
+    for _ in range(number):
+        operation(message)
+    return (time.perf_counter() - start) / number
+
+
+def run_benchmark(
+    *, size: int = 10, number: int = 100, operations: Sequence[str] = tuple(OPERATIONS)
+) -> Dict[str, object]:
+    """Run the benchmark and return its report.
+
+    Args:
+        size (int): Scales the repeated fields of the sample messages.
+        number (int): Repetitions of each operation per measurement.
+        operations (Sequence[str]): Any of ``"pickle"``, ``"copy"`` and
+            ``"deepcopy"``.
+
+    Returns:
+        dict: A JSON-serializable report.
+    """
+    for name in operations:
+        if name not in OPERATIONS:
+            raise ValueError("Unknown operation {!r}.".format(name))
+    report = {
+        "config": {"size": size, "number": number, "operations": list(operations)},
+        "environment": dict(
+            benchmark.environment(), protobuf_implementation=api_implementation.Type()
+        ),
+        "results": [],
+    }
+    for message in (sample_job(size), sample_profile(size)):
+        message_class = type(message)
+        for name in operations:
+            operation = OPERATIONS[name]
+            assert operation(message) == message
+            with _default_behavior(message_class):
+                assert operation(message) == message
+                default = _time(operation, message, number)
+            installed = _time(operation, message, number)
+            report["results"].append(
+                {
+                    "message": message_class.__qualname__,
+                    "bytes": len(message_class.serialize(message)),
+                    "operation": name,
+                    "default_seconds": default,
+                    "seconds": installed,
+                    "speedup": default / installed if installed else 0.0,
+                }
+            )
+    return report
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m google.cloud.talent_helpers.copy_benchmark",
+        description="Measure pickling and copying of Talent messages.",
+    )
+    parser.add_argument("--size", type=int, default=10)
+    parser.add_argument("--number", type=int, default=100)
+    parser.add_argument("--operations", default=",".join(OPERATIONS))
+    parser.add_argument("--output", default="-", help="File for the JSON report.")
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = _parser().parse_args(argv)
+    report = run_benchmark(
+        size=args.size,
+        number=args.number,
+        operations=[o.strip() for o in args.operations.split(",") if o.strip()],
+    )
+    text = json.dumps(report, indent=2, sort_keys=True)
+    if args.output == "-":
+        print(text)
+    else:
+        with open(args.output, "w") as output:
+            output.write(text + "\n")
+    return 0
+
+
+if __name__ == "__main__":  # pragma: NO COVER
+    sys.exit(main())
@@ -0,0 +1,207 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Parallel retrieval of deep v4 search result ranges.
+
+Paging through ``next_page_token`` fetches one page per round trip, so
+reading the top 1000 results takes ten sequential calls.
+:func:`search_range` computes the page windows up front and requests them
+concurrently with ``offset`` and ``max_page_size`` instead::
+
+    result = search_range(client, request, stop=1000)
+    assert len(result.response.matching_jobs) <= 1000
+
+The pages are stitched back together in rank order. Concurrent pages are
+not a consistent snapshot: if the index changes between requests, a job
+can shift across a page boundary and be returned twice. Such duplicates
+are dropped and counted. The stitched range ends at the first short
+page. Histograms are only requested with the first page.
+"""
+
+import asyncio
+import concurrent.futures
+from typing import List, Optional, Tuple
+
+
+MAX_PAGE_SIZE = 100
+"""The largest ``max_page_size`` the service accepts."""
+
+MAX_OFFSET = 5000
+"""The largest ``offset`` the service accepts."""
+
+
+class DeepSearchResult:
+    """The stitched result of :func:`search_range`.
+
+    Attributes:
+        response (~.job_service.SearchJobsResponse): The first page's
+            response, with the matching jobs of every page in rank order.
+            Its ``next_page_token`` is cleared.
+        duplicates (int): Matching jobs dropped because an earlier page
+            already returned them.
+        pages (int): The number of pages requested.
+    """
+
+    def __init__(self, response, duplicates: int, pages: int) -> None:
+        self.response = response
+        self.duplicates = duplicates
+        self.pages = pages
+
+    def __repr__(self) -> str:
+        return "<DeepSearchResult jobs={} duplicates={} pages={}>".format(
+            len(self.response.matching_jobs), self.duplicates, self.pages
+        )
+
+
+def _windows(start: int, stop: int, page_size: int) -> List[Tuple[int, int]]:
+    if not 1 <= page_size <= MAX_PAGE_SIZE:
+        raise ValueError("page_size must be between 1 and {}.".format(MAX_PAGE_SIZE))
+    if not 0 <= start < stop:
+        raise ValueError("Expected 0 <= start < stop.")
+    if start > MAX_OFFSET:
+        raise ValueError("start cannot exceed {}.".format(MAX_OFFSET))
+    return [
+        (offset, min(page_size, stop - offset))
+        for offset in range(start, min(stop, MAX_OFFSET + 1), page_size)
+    ]
+
+
+def _page_requests(request, windows):
+    request_type = type(request)
+    original = request_type.pb(request)
+    pages = []
+    for index, (offset, size) in enumerate(windows):
+        page = type(original)()
+        page.CopyFrom(original)
+        page.ClearField("page_token")
+        page.offset = offset
+        page.max_page_size = size
+        if index:
+            page.ClearField("histogram_queries")
+        pages.append(request_type(page))
+    return pages
+
+
+def _stitch(windows, responses) -> DeepSearchResult:
+    first = responses[0]
+    matches = []
+    seen = set()
+    duplicates = 0
+    for (offset, size), response in zip(windows, responses):
+        for match in response.matching_jobs:
+            if match.job.name in seen:
+                duplicates += 1
+                continue
+            seen.add(match.job.name)
+            matches.append(match)
+        if len(response.matching_jobs) < size:
+            break
+    stitched = type(first).pb()()
+    stitched.CopyFrom(type(first).pb(first))
+    stitched.ClearField("next_page_token")
+    del stitched.matching_jobs[:]
+    stitched.matching_jobs.extend(type(match).pb(match) for match in matches)
+    return DeepSearchResult(type(first)(stitched), duplicates, len(windows))
+
+
+def search_range(
+    client,
+    request,
+    *,
+    start: int = 0,
+    stop: int = 1000,
+    page_size: int = MAX_PAGE_SIZE,
+    max_concurrency: Optional[int] = None,
+    **kwargs,
+) -> DeepSearchResult:
+    """Fetch the search results ranked ``start`` to ``stop`` in parallel.
+
+    Args:
+        client (~.JobServiceClient): A v4 job service client.
+        request (~.job_service.SearchJobsRequest): The search. Its
+            ``offset``, ``max_page_size`` and ``page_token`` are replaced.
+        start (int): The first result, at most ``MAX_OFFSET``.
+        stop (int): One past the last result. No page can start past
+            ``MAX_OFFSET``, so results beyond the last page that starts
+            at or before it are not requested.
+        page_size (int): Results per request, at most ``MAX_PAGE_SIZE``.
+        max_concurrency (Optional[int]): The most pages requested at once.
+            Defaults to all of them.
+        kwargs: Passed to ``client.search_jobs``, e.g. ``timeout``.
+
+    Returns:
+        ~.DeepSearchResult: The stitched results.
+
+    Raises:
+        ValueError: If the range or page size is out of bounds.
+        google.api_core.exceptions.GoogleAPICallError: If any page fails.
+    """
+    windows = _windows(start, stop, page_size)
+    pages = _page_requests(request, windows)
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=max_concurrency or len(pages)
+    ) as executor:
+        futures = [
+            executor.submit(client.search_jobs, request=page, **kwargs)
+            for page in pages
+        ]
+        try:
+            responses = [future.result() for future in futures]
+        except Exception:
+            for future in futures:
+                future.cancel()
+            raise
+    return _stitch(windows, responses)
+
+
+async def search_range_async(
+    client,
+    request,
+    *,
+    start: int = 0,
+    stop: int = 1000,
+    page_size: int = MAX_PAGE_SIZE,
+    max_concurrency: Optional[int] = None,
+    **kwargs,
+) -> DeepSearchResult:
+    """Like :func:`search_range`, with a ``JobServiceAsyncClient``."""
+    windows = _windows(start, stop, page_size)
+    slots = asyncio.Semaphore(max_concurrency or len(windows))
+
+    async def search(page):
+        async with slots:
+            return await client.search_jobs(request=page, **kwargs)
+
+    tasks = [
+        asyncio.ensure_future(search(page)) for page in _page_requests(request, windows)
+    ]
+    try:
+        responses = await asyncio.gather(*tasks)
+    except Exception:
+        for task in tasks:
+            task.cancel()
+        raise
+    return _stitch(windows, responses)
+
+
+__all__ = (
+    "DeepSearchResult",
+    "MAX_OFFSET",
+    "MAX_PAGE_SIZE",
+    "search_range",
+    "search_range_async",
+)
@@ -0,0 +1,197 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Streaming newline-delimited JSON export of list results.
+
+:func:`export_ndjson` drains any list pager, such as the v4
+``ListJobsPager`` and ``ListCompaniesPager`` or the v4beta1
+``ListProfilesPager``, into a file with one JSON object per line::
+
+    pager = client.list_jobs(parent=tenant, filter=filter_)
+    count = export_ndjson(pager, "jobs.ndjson.gz", compress=True)
+
+The calling thread fetches pages while a writer thread encodes and
+writes the previous ones, so network round trips overlap with encoding
+and disk I/O. At most ``max_pending_pages`` pages are held in memory at
+once regardless of how many results are exported.
+
+Each line is the proto3 JSON mapping of the item produced by
+``google.protobuf.json_format``, encoded straight from the underlying
+protobuf messages without wrapping each item in a proto-plus object.
+"""
+
+import gzip
+import json
+import os
+import queue
+import threading
+from typing import Any, BinaryIO, Iterable, Union
+
+from google.protobuf import json_format  # type: ignore
+
+
+_DONE = object()
+
+_FIELD_CACHE: dict = {}
+
+
+def _items_field(response_pb) -> str:
+    # The one repeated message field of a List*Response holds its items.
+    descriptor = response_pb.DESCRIPTOR
+    name = _FIELD_CACHE.get(descriptor.full_name)
+    if name is None:
+        fields = [
+            field.name
+            for field in descriptor.fields
+            if field.label == field.LABEL_REPEATED
+            and field.message_type is not None
+            and not field.message_type.GetOptions().map_entry
+        ]
+        if len(fields) != 1:
+            raise TypeError(
+                "Cannot tell which field of {} holds the listed items.".format(
+                    descriptor.full_name
+                )
+            )
+        name = _FIELD_CACHE[descriptor.full_name] = fields[0]
+    return name
+
+
+def _raw_pb(message):
+    pb = getattr(type(message), "pb", None)
+    return pb(message) if pb is not None else message
+
+
+class _Writer(threading.Thread):
+    """Encodes queued pages and writes them, one ``write`` per page."""
+
+    def __init__(self, stream, pages, options):
+        super().__init__(name="talent-ndjson-writer", daemon=True)
+        self.stream = stream
+        self.pages = pages
+        self.options = options
+        self.count = 0
+        self.error = None
+
+    def run(self):
+        encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+        while True:
+            items = self.pages.get()
+            if items is _DONE:
+                return
+            if self.error is not None:
+                # Keep draining so the producer never blocks on a full queue.
+                continue
+            try:
+                lines = [
+                    encoder.encode(json_format.MessageToDict(item, **self.options))
+                    for item in items
+                ]
+                if lines:
+                    lines.append("")
+                    self.stream.write("\n".join(lines).encode("utf-8"))
+                self.count += len(items)
+            except Exception as exc:
+                self.error = exc
+
+
+def export_ndjson(
+    pager: Iterable[Any],
+    destination: Union[str, os.PathLike, BinaryIO],
+    *,
+    compress: bool = False,
+    compresslevel: int = 6,
+    max_pending_pages: int = 4,
+    preserving_proto_field_name: bool = False,
+    use_integers_for_enums: bool = False,
+    deadline=None,
+) -> int:
+    """Write every item of a list pager as newline-delimited JSON.
+
+    Args:
+        pager: A synchronous list pager, e.g. the one returned by
+            ``JobServiceClient.list_jobs``. Iteration resumes from the
+            pager's current page.
+        destination (Union[str, os.PathLike, BinaryIO]): A path, which is
+            created or truncated, or a binary file object, which is left
+            open.
+        compress (bool): Whether to gzip-compress the output.
+        compresslevel (int): The gzip compression level, from 1 to 9.
+        max_pending_pages (int): How many fetched pages may wait for the
+            writer thread before fetching blocks.
+        preserving_proto_field_name (bool): Use the proto field names
+            (``requisition_id``) rather than the JSON names
+            (``requisitionId``).
+        use_integers_for_enums (bool): Write enum values as numbers
+            rather than names.
+        deadline (Union[~.paging.Deadline, float, None]): Bounds the time
+            spent fetching further pages, as a deadline or a budget in
+            seconds from now. Once it has passed the export stops cleanly;
+            the pager's ``deadline_exceeded`` is then set and its
+            checkpoint points at the first page not written.
+
+    Returns:
+        int: The number of items written.
+
+    Raises:
+        google.api_core.exceptions.GoogleAPICallError: If fetching a page
+            fails. Items from earlier pages have been written.
+    """
+    if isinstance(destination, (str, os.PathLike)):
+        raw = open(destination, "wb")
+        owned = True
+    else:
+        raw, owned = destination, False
+    if deadline is not None:
+        pager.set_deadline(deadline)
+    stream = raw
+    if compress:
+        stream = gzip.GzipFile(fileobj=raw, mode="wb", compresslevel=compresslevel)
+
+    pages = queue.Queue(maxsize=max(1, max_pending_pages))
+    writer = _Writer(
+        stream,
+        pages,
+        {
+            "preserving_proto_field_name": preserving_proto_field_name,
+            "use_integers_for_enums": use_integers_for_enums,
+        },
+    )
+    writer.start()
+    try:
+        for page in pager.pages:
+            page_pb = _raw_pb(page)
+            pages.put(getattr(page_pb, _items_field(page_pb)))
+            if writer.error is not None:
+                break
+    finally:
+        pages.put(_DONE)
+        writer.join()
+        try:
+            if stream is not raw:
+                stream.close()
+            else:
+                stream.flush()
+        finally:
+            if owned:
+                raw.close()
+    if writer.error is not None:
+        raise writer.error
+    return writer.count
+
+
+__all__ = ("export_ndjson",)
@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Concurrent iteration over many async pagers.
+
+:func:`fan_out` drives several async pagers, such as
+``ListJobsAsyncPager`` or ``SearchProfilesAsyncPager``, at once and
+merges their items into a single async iterator::
+
+    sources = {
+        tenant: functools.partial(client.list_jobs, parent=tenant, filter=f)
+        for tenant, f in filters.items()
+    }
+    async for tenant, job in fan_out(sources, max_concurrency=8):
+        ...
+
+Items from one source arrive in that source's order; items from
+different sources interleave as their pages arrive. At most
+``max_concurrency`` sources page at once and at most ``max_buffered``
+items wait for the consumer, so a slow consumer stalls the page fetches
+instead of letting results pile up in memory.
+"""
+
+import asyncio
+import inspect
+import sys
+from typing import Any, AsyncIterator, Hashable, Mapping, Tuple, Union
+
+if sys.version_info >= (3, 7):
+    _current_task = asyncio.current_task
+else:
+    _current_task = asyncio.Task.current_task
+
+
+class _Finished:
+    __slots__ = ("error",)
+
+    def __init__(self, error):
+        self.error = error
+
+
+async def fan_out(
+    sources: Union[Mapping[Hashable, Any], Any],
+    *,
+    max_concurrency: int = 8,
+    max_buffered: int = 100,
+) -> AsyncIterator[Tuple[Hashable, Any]]:
+    """Iterate over many async pagers concurrently.
+
+    Args:
+        sources: A mapping from a key to a source, or an iterable of
+            sources keyed by position. A source is an async iterable (such
+            as an async pager), an awaitable resolving to one (such as
+            ``client.list_jobs(...)``), or a callable returning either.
+            Callables are only invoked once a concurrency slot is free, so
+            they are preferred for large numbers of sources.
+        max_concurrency (int): The most sources paging at once.
+        max_buffered (int): The most items waiting for the consumer.
+
+    Yields:
+        Tuple[Hashable, Any]: The source's key and an item.
+
+    Raises:
+        Exception: The first error raised by any source. The other sources
+            are cancelled.
+
+    To stop early, close the iterator (``await merged.aclose()``, or
+    ``contextlib.aclosing``) so the sources still running are cancelled
+    right away rather than when the iterator is garbage collected.
+    """
+    if isinstance(sources, Mapping):
+        keyed = iter(sources.items())
+    else:
+        keyed = enumerate(sources)
+    queue = asyncio.Queue(maxsize=max(1, max_buffered))
+    slots = asyncio.Semaphore(max(1, max_concurrency))
+    tasks = set()
+    # Sources whose task has not started running yet.
+    unstarted = {}
+    # Producers (the launcher and every started source) that have not yet
+    # put their ``_Finished`` marker on the queue.
+    outstanding = 1
+
+    async def drain(key, source):
+        unstarted.pop(_current_task(), None)
+        error = None
+        try:
+            if callable(source):
+                source = source()
+            if inspect.isawaitable(source):
+                source = await source
+            async for item in source:
+                await queue.put((key, item))
+        except Exception as exc:
+            error = exc
+        finally:
+            slots.release()
+        await queue.put(_Finished(error))
+
+    async def launch():
+        nonlocal outstanding
+        error = None
+        try:
+            while True:
+                # Take a slot before pulling the next source, so a source
+                # is never left waiting in the launcher.
+                await slots.acquire()
+                try:
+                    key, source = next(keyed)
+                except StopIteration:
+                    slots.release()
+                    break
+                outstanding += 1
+                task = asyncio.ensure_future(drain(key, source))
+                unstarted[task] = source
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+        except Exception as exc:
+            error = exc
+        await queue.put(_Finished(error))
+
+    tasks.add(asyncio.ensure_future(launch()))
+    try:
+        while outstanding:
+            entry = await queue.get()
+            if isinstance(entry, _Finished):
+                outstanding -= 1
+                if entry.error is not None:
+                    raise entry.error
+                continue
+            yield entry
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        # Close coroutine sources that never ran, so they do not warn
+        # about never being awaited.
+        for source in list(unstarted.values()) + [s for _, s in keyed]:
+            if (
+                inspect.iscoroutine(source)
+                and inspect.getcoroutinestate(source) == inspect.CORO_CREATED
+            ):
+                source.close()
+
+
+__all__ = ("fan_out",)
@@ -0,0 +1,281 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Federated job search across many tenants.
+
+:func:`federated_search` sends one v4 ``SearchJobsRequest`` to several
+tenant parents concurrently and merges the responses::
+
+    result = federated_search(client, request, [brand_a, brand_b, brand_c])
+    for parent, match in zip(result.parents, result.response.matching_jobs):
+        ...
+
+The shards are searched in parallel, so the latency is that of the
+slowest shard. Their ``matching_jobs`` are combined with a k-way heap
+merge:
+
+* by default, by rank: every shard's first result, then every shard's
+  second result, and so on;
+* with ``key``, by the value it returns for each
+  ``SearchJobsResponse.MatchingJob``. Each shard must already be sorted by
+  that key, as it is when the key mirrors the request's ``order_by``.
+
+Jobs whose ``requisition_id`` was already merged from a higher ranked
+shard result are dropped. ``total_size`` is summed over the shards, and
+histogram counts are added up per ``histogram_query``. Those totals are
+not deduplicated.
+
+:func:`federated_search_async` does the same with an async client.
+"""
+
+import asyncio
+import concurrent.futures
+import heapq
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+
+class FederatedSearchResult:
+    """The merged result of a federated search.
+
+    Attributes:
+        response (~.job_service.SearchJobsResponse): The merged response.
+            It has no ``next_page_token``; see ``next_page_tokens``.
+        parents (List[str]): The tenant each of ``response.matching_jobs``
+            came from, in the same order.
+        next_page_tokens (Dict[str, str]): The next page token of every
+            shard with more results. Pass it as ``page_tokens`` to fetch
+            the next page of the federated search.
+        errors (Dict[str, Exception]): Shards that failed, if partial
+            results were allowed.
+        duplicates (int): Matching jobs dropped as duplicates.
+    """
+
+    def __init__(self, response, parents, next_page_tokens, errors, duplicates):
+        self.response = response
+        self.parents = parents
+        self.next_page_tokens = next_page_tokens
+        self.errors = errors
+        self.duplicates = duplicates
+
+    def __repr__(self) -> str:
+        return "<FederatedSearchResult jobs={} total_size={} errors={}>".format(
+            len(self.parents), self.response.total_size, len(self.errors)
+        )
+
+
+def _requisition_id(match) -> str:
+    return match.job.requisition_id or match.job.name
+
+
+def _shard_requests(request, parents, page_tokens):
+    request_type = type(request)
+    if page_tokens is not None:
+        parents = [parent for parent in parents if page_tokens.get(parent)]
+    shards = []
+    for parent in parents:
+        shard = request_type.pb()()
+        shard.CopyFrom(request_type.pb(request))
+        shard.parent = parent
+        if page_tokens is not None:
+            shard.page_token = page_tokens[parent]
+        shards.append((parent, request_type(shard)))
+    return shards
+
+
+def _merge(
+    responses: Sequence, key, reverse: bool, dedupe_key, errors
+) -> FederatedSearchResult:
+    """Merge ``(parent, response)`` pairs in shard order."""
+    # Each shard's ranks ascend, so they can only be merged best first.
+    reverse = reverse and key is not None
+    sign = -1 if reverse else 1
+
+    def stream(shard, parent, response):
+        # Shard and position break ties, so messages are never compared.
+        for position, match in enumerate(response.matching_jobs):
+            rank = key(match) if key else position
+            yield rank, sign * shard, sign * position, parent, match
+
+    streams = [
+        stream(shard, parent, response)
+        for shard, (parent, response) in enumerate(responses)
+    ]
+
+    parents: List[str] = []
+    matches: List[Any] = []
+    seen = set()
+    duplicates = 0
+    for _, _, _, parent, match in heapq.merge(*streams, reverse=reverse):
+        identity = dedupe_key(match)
+        if identity in seen:
+            duplicates += 1
+            continue
+        seen.add(identity)
+        parents.append(parent)
+        matches.append(match)
+
+    histograms: Dict[str, Dict[str, int]] = {}
+    total_size = 0
+    for _, response in responses:
+        total_size += response.total_size
+        for result in response.histogram_query_results:
+            counts = histograms.setdefault(result.histogram_query, {})
+            for bucket, count in result.histogram.items():
+                counts[bucket] = counts.get(bucket, 0) + count
+
+    fields = {
+        "matching_jobs": matches,
+        "total_size": total_size,
+        "histogram_query_results": [
+            {"histogram_query": query, "histogram": counts}
+            for query, counts in histograms.items()
+        ],
+    }
+    if responses:
+        first = responses[0][1]
+        fields["location_filters"] = first.location_filters
+        fields["spell_correction"] = first.spell_correction
+        response = type(first)(fields)
+    else:
+        response = None
+    return FederatedSearchResult(
+        response,
+        parents,
+        {
+            parent: response.next_page_token
+            for parent, response in responses
+            if response.next_page_token
+        },
+        errors,
+        duplicates,
+    )
+
+
+def federated_search(
+    client,
+    request,
+    parents: Sequence[str],
+    *,
+    key: Optional[Callable[[Any], Any]] = None,
+    reverse: bool = False,
+    dedupe_key: Callable[[Any], Any] = _requisition_id,
+    page_tokens: Optional[Dict[str, str]] = None,
+    allow_partial: bool = False,
+    max_concurrency: Optional[int] = None,
+    **kwargs,
+) -> FederatedSearchResult:
+    """Run one search against many tenants and merge the results.
+
+    Args:
+        client (~.JobServiceClient): A v4 job service client.
+        request (~.job_service.SearchJobsRequest): The search. Its
+            ``parent`` and ``page_token`` are replaced for every shard.
+        parents (Sequence[str]): The tenants to search, highest priority
+            first; ties in the merge go to earlier tenants.
+        key (Optional[Callable]): Sort key for the merge, applied to each
+            ``MatchingJob``. ``None`` merges by rank.
+        reverse (bool): Merge in descending ``key`` order. Ignored
+            without ``key``.
+        dedupe_key (Callable): Identifies duplicate matching jobs. Defaults
+            to the job's ``requisition_id``.
+        page_tokens (Optional[Dict[str, str]]): ``next_page_tokens`` from a
+            previous result. Only tenants with a token are searched.
+        allow_partial (bool): Return the shards that succeeded and report
+            failed shards in ``errors`` instead of raising.
+        max_concurrency (Optional[int]): The most shards searched at once.
+            Defaults to all of them.
+        kwargs: Passed to ``client.search_jobs``, e.g. ``timeout``.
+
+    Returns:
+        ~.FederatedSearchResult: The merged result. Its ``response`` is
+        ``None`` if no shard was searched successfully.
+
+    Raises:
+        google.api_core.exceptions.GoogleAPICallError: The first shard
+            error, unless ``allow_partial`` is set.
+    """
+    shards = _shard_requests(request, parents, page_tokens)
+    if not shards:
+        return _merge([], key, reverse, dedupe_key, {})
+    executor = concurrent.futures.ThreadPoolExecutor(
+        max_workers=max_concurrency or len(shards)
+    )
+    futures = [
+        (parent, executor.submit(client.search_jobs, request=shard, **kwargs))
+        for parent, shard in shards
+    ]
+    try:
+        if not allow_partial:
+            # Raise as soon as any shard fails, not after the slowest one.
+            concurrent.futures.wait(
+                [future for _, future in futures],
+                return_when=concurrent.futures.FIRST_EXCEPTION,
+            )
+            for _, future in futures:
+                if future.done() and future.exception() is not None:
+                    raise future.exception()
+        responses, errors = [], {}
+        for parent, future in futures:
+            try:
+                responses.append((parent, future.result()))
+            except Exception as exc:
+                errors[parent] = exc
+    finally:
+        for _, future in futures:
+            future.cancel()
+        executor.shutdown(wait=False)
+    return _merge(responses, key, reverse, dedupe_key, errors)
+
+
+async def federated_search_async(
+    client,
+    request,
+    parents: Sequence[str],
+    *,
+    key: Optional[Callable[[Any], Any]] = None,
+    reverse: bool = False,
+    dedupe_key: Callable[[Any], Any] = _requisition_id,
+    page_tokens: Optional[Dict[str, str]] = None,
+    allow_partial: bool = False,
+    max_concurrency: Optional[int] = None,
+    **kwargs,
+) -> FederatedSearchResult:
+    """Like :func:`federated_search`, with a ``JobServiceAsyncClient``."""
+    shards = _shard_requests(request, parents, page_tokens)
+    slots = asyncio.Semaphore(max_concurrency or max(1, len(shards)))
+
+    async def search(shard):
+        async with slots:
+            return await client.search_jobs(request=shard, **kwargs)
+
+    tasks = [asyncio.ensure_future(search(shard)) for _, shard in shards]
+    try:
+        results = await asyncio.gather(*tasks, return_exceptions=allow_partial)
+    except Exception:
+        for task in tasks:
+            task.cancel()
+        raise
+    responses, errors = [], {}
+    for (parent, _), result in zip(shards, results):
+        if isinstance(result, Exception):
+            errors[parent] = result
+        else:
+            responses.append((parent, result))
+    return _merge(responses, key, reverse, dedupe_key, errors)
+
+
+__all__ = ("FederatedSearchResult", "federated_search", "federated_search_async")
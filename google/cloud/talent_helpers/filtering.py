@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Building ``filter`` strings for the list methods.
+
+``list_jobs`` and ``list_profiles`` take a filter such as
+``companyName = "..." AND requisitionId = "..."``. Values that come from
+source systems may contain quotes or backslashes, so they are written
+with :func:`quote`::
+
+    client.list_profiles(
+        parent=tenant, filter="externalId = {}".format(quote(external_id))
+    )
+"""
+
+import re
+
+
+def quote(value: str) -> str:
+    """Return ``value`` as a double-quoted filter string.
+
+    Backslashes and double quotes are escaped with a backslash.
+    """
+    return '"{}"'.format(value.replace("\\", "\\\\").replace('"', '\\"'))
+
+
+def unquote(text: str) -> str:
+    """Undo the escaping of :func:`quote` in the text between the quotes."""
+    return re.sub(r"\\(.)", r"\1", text)
+
+
+__all__ = ("quote", "unquote")
@@ -0,0 +1,277 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""A client-side cache of the locations the service resolves for searches.
+
+Every ``search_jobs`` call geocodes the ``address`` of each
+``LocationFilter`` on the server and reports the result in
+``SearchJobsResponse.location_filters``. :class:`GeocodeCache` remembers
+those results and rewrites later requests to search from the cached
+coordinates, which skips server-side geocoding::
+
+    cache = GeocodeCache("geocode.bin")
+    response = cache.search_jobs(client, request)  # rewrite, call, learn
+    cache.save()
+
+Only addresses resolved to a city or something smaller (a locality,
+postal code, neighborhood or street address) are rewritten. The filter
+then searches a circle around the location's center whose radius is the
+location's ``radius_miles`` plus the filter's ``distance_in_miles``,
+which approximates searching the address's area. States and countries
+are not circles, so their filters are sent unchanged.
+
+The cache works with both v4 and v4beta1 requests. Commute filters
+already carry ``start_coordinates`` and are left alone.
+"""
+
+import collections
+import os
+import struct
+import threading
+from typing import Optional, Tuple
+
+from google.cloud.talent_v4.types import common
+
+
+# Location types that LocationFilter.distance_in_miles applies to.
+_LocationType = common.Location.LocationType
+_CITY_OR_SMALLER = frozenset(
+    (
+        _LocationType.LOCALITY,
+        _LocationType.POSTAL_CODE,
+        _LocationType.SUB_LOCALITY,
+        _LocationType.SUB_LOCALITY_1,
+        _LocationType.SUB_LOCALITY_2,
+        _LocationType.NEIGHBORHOOD,
+        _LocationType.STREET_ADDRESS,
+    )
+)
+
+_MAGIC = b"TGEO\x01"
+_KEY_SIZE = struct.Struct("<H")
+_VALUE = struct.Struct("<dddB")
+
+
+def _key(address: str, region_code: str) -> Tuple[str, str]:
+    return " ".join(address.split()).casefold(), region_code.strip().upper()
+
+
+def _pb(message):
+    pb = getattr(type(message), "pb", None)
+    return pb(message) if pb is not None else message
+
+
+class GeocodeCache:
+    """Maps search addresses to the locations the service resolved.
+
+    Args:
+        path (Optional[str]): A file written by :meth:`save`. It is loaded
+            if it exists and is the default for :meth:`save`.
+        max_entries (int): The most addresses kept; the least recently
+            used are evicted first.
+    """
+
+    def __init__(self, path: Optional[str] = None, *, max_entries: int = 100000):
+        self.path = path
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        # (address, region_code) -> (latitude, longitude, radius, type)
+        self._entries: collections.OrderedDict = collections.OrderedDict()
+        if path is not None and os.path.exists(path):
+            self.load(path)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, address: str, region_code: str = "") -> Optional[common.Location]:
+        """Return the cached location of an address.
+
+        Args:
+            address (str): The address, as sent in a ``LocationFilter``.
+                Case and whitespace differences are ignored.
+            region_code (str): The filter's CLDR region code.
+
+        Returns:
+            Optional[~.common.Location]: ``None`` if the address is unknown.
+        """
+        entry = self._lookup(_key(address, region_code))
+        if entry is None:
+            return None
+        latitude, longitude, radius, location_type = entry
+        return common.Location(
+            location_type=location_type,
+            lat_lng={"latitude": latitude, "longitude": longitude},
+            radius_miles=radius,
+        )
+
+    def put(self, address: str, region_code: str, location) -> None:
+        """Cache the location an address resolved to.
+
+        Args:
+            address (str): The address.
+            region_code (str): The CLDR region code it was resolved with.
+            location: A v4 or v4beta1 ``Location``.
+        """
+        location = _pb(location)
+        self._store(
+            _key(address, region_code),
+            (
+                location.lat_lng.latitude,
+                location.lat_lng.longitude,
+                location.radius_miles,
+                location.location_type,
+            ),
+        )
+
+    def _lookup(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def _store(self, key, entry) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def learn(self, request, response) -> int:
+        """Cache the locations a search resolved.
+
+        Args:
+            request: The ``SearchJobsRequest`` as it was sent.
+            response: The ``SearchJobsResponse`` it returned.
+
+        Returns:
+            int: The number of addresses cached.
+        """
+        filters = _pb(request).job_query.location_filters
+        resolved = _pb(response).location_filters
+        if len(filters) != len(resolved):
+            return 0
+        learned = 0
+        for location_filter, location in zip(filters, resolved):
+            if (
+                location_filter.address
+                and location.location_type
+                and location.HasField("lat_lng")
+            ):
+                self.put(location_filter.address, location_filter.region_code, location)
+                learned += 1
+        return learned
+
+    def rewrite(self, request):
+        """Replace cached addresses in a search request with coordinates.
+
+        Args:
+            request: A v4 or v4beta1 ``SearchJobsRequest``. It is not
+                modified.
+
+        Returns:
+            The request if nothing was rewritten, otherwise a rewritten
+            copy of it.
+        """
+        original = _pb(request)
+        hits = {}
+        for index, location_filter in enumerate(original.job_query.location_filters):
+            if not location_filter.address:
+                continue
+            entry = self._lookup(
+                _key(location_filter.address, location_filter.region_code)
+            )
+            if entry is not None and entry[3] in _CITY_OR_SMALLER:
+                hits[index] = entry
+        if not hits:
+            return request
+
+        rewritten = type(original)()
+        rewritten.CopyFrom(original)
+        filters = rewritten.job_query.location_filters
+        for index, (latitude, longitude, radius, _) in hits.items():
+            location_filter = filters[index]
+            location_filter.ClearField("address")
+            location_filter.ClearField("region_code")
+            location_filter.lat_lng.latitude = latitude
+            location_filter.lat_lng.longitude = longitude
+            location_filter.distance_in_miles += radius
+        return rewritten if original is request else type(request)(rewritten)
+
+    def search_jobs(self, client, request, **kwargs):
+        """Search with cached coordinates and cache what the service resolves.
+
+        Args:
+            client: A v4 or v4beta1 ``JobServiceClient``.
+            request: The ``SearchJobsRequest``.
+            kwargs: Passed to ``client.search_jobs``, e.g. ``retry``.
+
+        Returns:
+            The client's ``search_jobs`` result.
+        """
+        request = self.rewrite(request)
+        response = client.search_jobs(request=request, **kwargs)
+        self.learn(request, response)
+        return response
+
+    def save(self, path: Optional[str] = None) -> None:
+        """Atomically write the cache in a compact binary format.
+
+        Each entry takes 27 bytes plus its address and region code.
+
+        Args:
+            path (Optional[str]): Defaults to the path the cache was created
+                with.
+        """
+        path = path or self.path
+        if path is None:
+            raise ValueError("No path to save the geocode cache to.")
+        with self._lock:
+            entries = list(self._entries.items())
+        temporary = path + ".tmp"
+        with open(temporary, "wb") as stream:
+            stream.write(_MAGIC)
+            for (address, region_code), entry in entries:
+                key = "{}\x1f{}".format(region_code, address).encode("utf-8")
+                stream.write(_KEY_SIZE.pack(len(key)))
+                stream.write(key)
+                stream.write(_VALUE.pack(*entry))
+        os.replace(temporary, path)
+
+    def load(self, path: str) -> None:
+        """Add the entries of a file written by :meth:`save`.
+
+        Raises:
+            ValueError: If the file is not a geocode cache.
+        """
+        with open(path, "rb") as stream:
+            data = stream.read()
+        if not data.startswith(_MAGIC):
+            raise ValueError("{} is not a geocode cache file.".format(path))
+        offset = len(_MAGIC)
+        while offset < len(data):
+            (size,) = _KEY_SIZE.unpack_from(data, offset)
+            offset += _KEY_SIZE.size
+            region_code, address = (
+                data[offset : offset + size].decode("utf-8").split("\x1f", 1)
+            )
+            offset += size
+            self._store((address, region_code), _VALUE.unpack_from(data, offset))
+            offset += _VALUE.size
+
+
+__all__ = ("GeocodeCache",)
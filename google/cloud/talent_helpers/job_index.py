@@ -0,0 +1,321 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Resolution of requisition IDs to v4 job names.
+
+``get_job``, ``delete_job`` and ``batch_delete_jobs`` take job names,
+while most source systems key jobs by requisition ID. A :class:`JobIndex`
+maps each job's ``company``, ``requisition_id`` and ``language_code`` to
+its name, so bulk updates and deletes need no lookup request per job::
+
+    index = JobIndex(tenant)
+    index.refresh(client, company)
+    client.batch_delete_jobs(
+        parent=tenant,
+        names=[index.name(company, r) for r in requisition_ids],
+    )
+
+:meth:`JobIndex.refresh` lists a company's jobs with ``JOB_VIEW_ID_ONLY``,
+which returns up to 1000 jobs per page. Afterwards the index is kept
+current by passing it what the service returns: :meth:`JobIndex.record`
+accepts a created or updated ``Job`` and the responses of the batch
+create, update and delete operations.
+
+:meth:`JobIndex.save` writes the index as gzip-compressed JSON with the
+tenant and company prefixes factored out of every name, so it takes a few
+bytes per job, and :meth:`JobIndex.load` reads it back.
+"""
+
+import collections
+import gzip
+import json
+import os
+import threading
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from google.api_core import gapic_v1  # type: ignore
+from google.api_core import retry as retries  # type: ignore
+
+from google.cloud.talent_helpers import filtering
+from google.cloud.talent_v4.types import job as gct_job
+from google.cloud.talent_v4.types import job_service
+
+
+JobKey = collections.namedtuple(
+    "JobKey", ["company", "requisition_id", "language_code"]
+)
+JobKey.__doc__ = """Identifies a job within its tenant, e.g.
+``JobKey("projects/p/tenants/t/companies/c", "req-1", "en-US")``."""
+
+_FORMAT_VERSION = 1
+
+_PAGE_SIZE = 1000
+
+
+def _pb(message):
+    pb = getattr(type(message), "pb", None)
+    return pb(message) if pb is not None else message
+
+
+def _relative(name: str, prefix: str) -> str:
+    return name[len(prefix) :] if name.startswith(prefix) else "/" + name
+
+
+def _absolute(name: str, prefix: str) -> str:
+    return name[1:] if name.startswith("/") else prefix + name
+
+
+class JobIndex:
+    """Maps the key of every job in a tenant to the job's name.
+
+    The index is safe to update from several threads.
+
+    Args:
+        parent (str): The tenant, e.g. ``"projects/p/tenants/t"``.
+    """
+
+    def __init__(self, parent: str) -> None:
+        self.parent = parent
+        self._names: Dict[JobKey, str] = {}
+        self._keys: Dict[str, JobKey] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __contains__(self, key) -> bool:
+        return key in self._names
+
+    def __iter__(self) -> Iterator[JobKey]:
+        return iter(list(self._names))
+
+    def name(
+        self, company: str, requisition_id: str, language_code: Optional[str] = None
+    ) -> str:
+        """Return the name of a job.
+
+        Args:
+            company (str): The company's resource name.
+            requisition_id (str): The job's requisition ID.
+            language_code (Optional[str]): The job's language. ``None``
+                matches any, as long as only one is indexed.
+
+        Returns:
+            str: The job's resource name.
+
+        Raises:
+            KeyError: If no job, or more than one, matches.
+        """
+        if language_code is not None:
+            return self._names[JobKey(company, requisition_id, language_code)]
+        with self._lock:
+            names = [
+                name
+                for key, name in self._names.items()
+                if key.company == company and key.requisition_id == requisition_id
+            ]
+        if len(names) != 1:
+            raise KeyError(
+                "{} jobs match requisition_id {!r} of {}.".format(
+                    len(names), requisition_id, company
+                )
+            )
+        return names[0]
+
+    def key(self, name: str) -> JobKey:
+        """Return the key of a job, by name.
+
+        Raises:
+            KeyError: If the job is not indexed.
+        """
+        return self._keys[name]
+
+    def add(self, key: JobKey, name: str) -> None:
+        """Index a job, replacing any job previously stored under ``key``."""
+        with self._lock:
+            self._add(JobKey(*key), name)
+
+    def discard(self, name: str) -> None:
+        """Remove a job from the index, by name, if it is indexed."""
+        with self._lock:
+            self._discard(name)
+
+    def record(self, response: Any) -> None:
+        """Apply what the service returned for a job or a batch of jobs.
+
+        Args:
+            response: A ``Job`` returned by ``create_job`` or
+                ``update_job``, or the ``BatchCreateJobsResponse``,
+                ``BatchUpdateJobsResponse`` or ``BatchDeleteJobsResponse``
+                of a batch operation. Failed batch results are ignored.
+        """
+        response = _pb(response)
+        deleted = isinstance(response, job_service.BatchDeleteJobsResponse.pb())
+        with self._lock:
+            if isinstance(response, gct_job.Job.pb()):
+                self._add_job(response)
+                return
+            for result in response.job_results:
+                if result.status.code:
+                    continue
+                if deleted:
+                    self._discard(result.job.name)
+                else:
+                    self._add_job(result.job)
+
+    def refresh(
+        self,
+        client,
+        company: str,
+        *,
+        retry: retries.Retry = gapic_v1.method.DEFAULT,
+        timeout: float = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> int:
+        """Replace the index entries of one company with its listed jobs.
+
+        Args:
+            client (~.JobServiceClient): A v4 client.
+            company (str): The company's resource name.
+            retry (google.api_core.retry.Retry): Designation of what errors,
+                if any, should be retried.
+            timeout (float): The timeout for each page request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with each request as metadata.
+
+        Returns:
+            int: The number of jobs the company has.
+        """
+        pager = client.list_jobs(
+            request=self._list_request(company),
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+        return self._replace(company, list(pager))
+
+    async def refresh_async(
+        self,
+        client,
+        company: str,
+        *,
+        retry: retries.Retry = gapic_v1.method.DEFAULT,
+        timeout: float = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> int:
+        """Like :meth:`refresh`, with a ``JobServiceAsyncClient``."""
+        pager = await client.list_jobs(
+            request=self._list_request(company),
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+        jobs = [job async for job in pager]
+        return self._replace(company, jobs)
+
+    def save(self, path: str) -> None:
+        """Atomically write the index to ``path``."""
+        jobs_prefix = self.parent + "/jobs/"
+        companies_prefix = self.parent + "/companies/"
+        companies: Dict[str, List[List[str]]] = {}
+        with self._lock:
+            for key, name in sorted(self._names.items()):
+                company = _relative(key.company, companies_prefix)
+                companies.setdefault(company, []).append(
+                    [
+                        key.requisition_id,
+                        key.language_code,
+                        _relative(name, jobs_prefix),
+                    ]
+                )
+        state = {
+            "version": _FORMAT_VERSION,
+            "parent": self.parent,
+            "companies": companies,
+        }
+        temporary = path + ".tmp"
+        with open(temporary, "wb") as raw:
+            with gzip.GzipFile(fileobj=raw, mode="wb") as stream:
+                stream.write(json.dumps(state, separators=(",", ":")).encode("utf-8"))
+            raw.flush()
+            os.fsync(raw.fileno())
+        os.replace(temporary, path)
+
+    @classmethod
+    def load(cls, path: str) -> "JobIndex":
+        """Read an index written by :meth:`save`.
+
+        Raises:
+            ValueError: If the file was written in an unknown format.
+        """
+        with gzip.open(path, "rb") as stream:
+            state = json.loads(stream.read().decode("utf-8"))
+        if state.get("version") != _FORMAT_VERSION:
+            raise ValueError(
+                "Unsupported job index version: {!r}.".format(state.get("version"))
+            )
+        index = cls(state["parent"])
+        jobs_prefix = index.parent + "/jobs/"
+        companies_prefix = index.parent + "/companies/"
+        for company, jobs in state["companies"].items():
+            company = _absolute(company, companies_prefix)
+            for requisition_id, language_code, name in jobs:
+                index._add(
+                    JobKey(company, requisition_id, language_code),
+                    _absolute(name, jobs_prefix),
+                )
+        return index
+
+    def _list_request(self, company: str) -> job_service.ListJobsRequest:
+        return job_service.ListJobsRequest(
+            parent=self.parent,
+            filter="companyName = {}".format(filtering.quote(company)),
+            page_size=_PAGE_SIZE,
+            job_view=job_service.JobView.JOB_VIEW_ID_ONLY,
+        )
+
+    def _replace(self, company: str, jobs) -> int:
+        # The ID-only view leaves out the company, which the filter fixed.
+        with self._lock:
+            for key, name in list(self._names.items()):
+                if key.company == company:
+                    self._discard(name)
+            for job in jobs:
+                job = _pb(job)
+                self._add(
+                    JobKey(company, job.requisition_id, job.language_code), job.name
+                )
+        return len(jobs)
+
+    def _add_job(self, job) -> None:
+        self._add(JobKey(job.company, job.requisition_id, job.language_code), job.name)
+
+    def _add(self, key: JobKey, name: str) -> None:
+        previous = self._names.get(key)
+        if previous is not None:
+            del self._keys[previous]
+        self._discard(name)
+        self._names[key] = name
+        self._keys[name] = key
+
+    def _discard(self, name: str) -> None:
+        key = self._keys.pop(name, None)
+        if key is not None:
+            del self._names[key]
+
+
+__all__ = ("JobIndex", "JobKey")
@@ -0,0 +1,236 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Per-method timeout and retry overrides for the Talent transports.
+
+The generated transports give each method a default timeout and retry
+policy. A :class:`MethodConfig` overrides them per method, per service or
+for everything, from a dictionary or a JSON or YAML file in the
+`gRPC service config`_ format::
+
+    {
+        "methodConfig": [
+            {
+                "name": [{"service": "google.cloud.talent.v4.Completion"}],
+                "timeout": "0.3s"
+            },
+            {
+                "name": [
+                    {"service": "google.cloud.talent.v4.JobService",
+                     "method": "BatchCreateJobs"}
+                ],
+                "timeout": "120s",
+                "retryPolicy": {
+                    "initialBackoff": "1s",
+                    "maxBackoff": "30s",
+                    "backoffMultiplier": 2,
+                    "retryableStatusCodes": ["UNAVAILABLE"]
+                }
+            }
+        ]
+    }
+
+Load the file once and pass the same config to every transport::
+
+    config = MethodConfig.from_file("talent_methods.json")
+    client = JobServiceClient(
+        transport=transports.JobServiceGrpcTransport(method_config=config)
+    )
+
+Each of ``timeout`` and ``retryPolicy`` is taken from the entry naming
+the method, else the entry naming its service, else an entry with an
+empty name (``"name": [{}]``), else the transport's default.
+``"retryPolicy": null`` disables retries. Method names may be given as in
+the proto (``CompleteQuery``) or as on the transports
+(``complete_query``).
+
+As in gRPC, ``timeout`` bounds the whole call, so it also becomes the
+deadline of the retry policy, configured or default. ``maxAttempts`` has
+no equivalent in ``google.api_core`` retries and is ignored.
+
+.. _gRPC service config:
+    https://github.com/grpc/grpc/blob/master/doc/service_config.md
+"""
+
+import json
+import re
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+import grpc  # type: ignore
+
+from google.api_core import exceptions  # type: ignore
+from google.api_core import retry as retries  # type: ignore
+from google.api_core import retry_async  # type: ignore
+from google.cloud.talent_helpers import wrapping
+
+
+_UNSET = object()
+_RETRY_KEYS = frozenset(
+    (
+        "initialBackoff",
+        "maxBackoff",
+        "backoffMultiplier",
+        "retryableStatusCodes",
+        "maxAttempts",
+    )
+)
+
+
+def _snake_case(name: str) -> str:
+    return re.sub(r"(?<!^)(?=[A-Z])", "_", name).lower()
+
+
+def _seconds(value, field: str) -> float:
+    if isinstance(value, str) and value.endswith("s"):
+        value = value[:-1]
+    try:
+        seconds = float(value)
+    except (TypeError, ValueError):
+        raise ValueError("Invalid duration for {}: {!r}".format(field, value))
+    if seconds < 0:
+        raise ValueError("Negative duration for {}: {!r}".format(field, value))
+    return seconds
+
+
+def _status_error(name: str) -> type:
+    try:
+        code = grpc.StatusCode[name.upper()]
+    except (AttributeError, KeyError):
+        raise ValueError("Unknown status code: {!r}".format(name))
+    return exceptions.exception_class_for_grpc_status(code)
+
+
+class _Entry:
+    __slots__ = ("timeout", "retry")
+
+    def __init__(self, config: Mapping[str, Any]) -> None:
+        self.timeout = _UNSET
+        self.retry = _UNSET
+        if config.get("timeout") is not None:
+            self.timeout = _seconds(config["timeout"], "timeout")
+        if "retryPolicy" in config:
+            policy = config["retryPolicy"]
+            self.retry = None if policy is None else self._retry_arguments(policy)
+
+    @staticmethod
+    def _retry_arguments(policy: Mapping[str, Any]) -> Dict[str, Any]:
+        unknown = set(policy) - _RETRY_KEYS
+        if unknown:
+            raise ValueError("Unknown retryPolicy fields: {}".format(sorted(unknown)))
+        codes = policy.get("retryableStatusCodes")
+        if not codes:
+            raise ValueError("retryPolicy needs retryableStatusCodes.")
+        arguments: Dict[str, Any] = {
+            "predicate": tuple(_status_error(code) for code in codes)
+        }
+        for key, argument in (("initialBackoff", "initial"), ("maxBackoff", "maximum")):
+            if key in policy:
+                arguments[argument] = _seconds(policy[key], key)
+        if "backoffMultiplier" in policy:
+            arguments["multiplier"] = float(policy["backoffMultiplier"])
+        return arguments
+
+
+class MethodConfig:
+    """Timeout and retry overrides for transport methods.
+
+    Args:
+        config (Mapping[str, Any]): A gRPC service config; only its
+            ``methodConfig`` list is used.
+
+    Raises:
+        ValueError: If the config is malformed.
+    """
+
+    def __init__(self, config: Mapping[str, Any]) -> None:
+        self._methods: Dict[Tuple[str, str], _Entry] = {}
+        self._services: Dict[str, _Entry] = {}
+        self._default: Optional[_Entry] = None
+        for item in config.get("methodConfig", ()):
+            entry = _Entry(item)
+            for name in item.get("name") or ({},):
+                service, method = name.get("service"), name.get("method")
+                if method and not service:
+                    raise ValueError("A method name needs a service: {!r}".format(name))
+                if method:
+                    self._methods[service, _snake_case(method)] = entry
+                elif service:
+                    self._services[service] = entry
+                else:
+                    self._default = entry
+
+    @classmethod
+    def from_file(cls, path: str) -> "MethodConfig":
+        """Load a config from a JSON file, or a YAML one ending in ``.yaml``
+        or ``.yml``, which needs PyYAML.
+        """
+        with open(path, encoding="utf-8") as stream:
+            if path.endswith((".yaml", ".yml")):
+                try:
+                    import yaml  # type: ignore
+                except ImportError:  # pragma: NO COVER
+                    raise ImportError(
+                        "Loading YAML method configs requires PyYAML. "
+                        "Install it with: pip install google-cloud-talent[yaml]"
+                    )
+                return cls(yaml.safe_load(stream) or {})
+            return cls(json.load(stream))
+
+    def _entries(self, key: wrapping.MethodKey) -> List[_Entry]:
+        entries = [
+            self._methods.get((key.service, key.method)),
+            self._services.get(key.service),
+            self._default,
+        ]
+        return [entry for entry in entries if entry is not None]
+
+    def resolve(
+        self, key: wrapping.MethodKey, default_retry, default_timeout, asyncio: bool
+    ) -> Tuple[Any, Any]:
+        """Apply the overrides for one method.
+
+        Args:
+            key (~.MethodKey): The method.
+            default_retry: The transport's default retry.
+            default_timeout: The transport's default timeout.
+            asyncio (bool): Whether the transport uses ``grpc.aio``, which
+                needs an ``AsyncRetry``.
+
+        Returns:
+            Tuple[Any, Any]: The retry and timeout to use.
+        """
+        entries = self._entries(key)
+        timeout = next((e.timeout for e in entries if e.timeout is not _UNSET), _UNSET)
+        policy = next((e.retry for e in entries if e.retry is not _UNSET), _UNSET)
+
+        retry = default_retry
+        if policy is None:
+            retry = None
+        elif policy is _UNSET:
+            if timeout is not _UNSET and retry is not None:
+                retry = retry.with_deadline(timeout)
+        else:
+            arguments = dict(policy)
+            arguments["predicate"] = retries.if_exception_type(*arguments["predicate"])
+            if timeout is not _UNSET:
+                arguments["deadline"] = timeout
+            retry_class = retry_async.AsyncRetry if asyncio else retries.Retry
+            retry = retry_class(**arguments)
+        return retry, default_timeout if timeout is _UNSET else timeout
+
+
+__all__ = ("MethodConfig",)
@@ -0,0 +1,419 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Per-method client metrics for the Talent transports.
+
+Pass a :class:`MetricsRecorder` to any v4 or v4beta1 transport::
+
+    recorder = MetricsRecorder()
+    client = JobServiceClient(
+        transport=transports.JobServiceGrpcTransport(metrics=recorder)
+    )
+    ...
+    recorder.snapshot()       # plain dictionaries
+    recorder.to_prometheus()  # Prometheus text exposition format
+
+Recording is a handful of counter updates and one ``bisect`` per
+histogram under a per-method lock, so it is cheap enough to leave on.
+One recorder can be shared by several transports.
+"""
+
+import bisect
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Sequence
+
+from google.cloud.talent_helpers import wrapping
+
+
+DEFAULT_LATENCY_BUCKETS = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+DEFAULT_SIZE_BUCKETS = (64, 256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+
+def status_name(exc: BaseException) -> str:
+    """Return the gRPC status name for an exception raised by a call."""
+    code = getattr(exc, "grpc_status_code", None)
+    if code is None and callable(getattr(exc, "code", None)):
+        try:
+            code = exc.code()
+        except Exception:  # pragma: NO COVER
+            code = None
+    name = getattr(code, "name", None)
+    if name:
+        return name
+    cause = getattr(exc, "cause", None)
+    if cause is not None and cause is not exc:
+        return status_name(cause)
+    return "UNKNOWN"
+
+
+def byte_size(message) -> Optional[int]:
+    """Return the serialized size of a proto-plus or protobuf message."""
+    try:
+        pb = getattr(type(message), "pb", None)
+        if pb is not None:
+            message = pb(message)
+        return message.ByteSize()
+    except (AttributeError, TypeError):
+        return None
+
+
+class Histogram:
+    """A fixed-bucket histogram with cumulative Prometheus semantics.
+
+    Args:
+        bounds (Sequence[float]): Sorted, inclusive upper bounds. An implicit
+            ``+Inf`` bucket catches everything above the last bound.
+    """
+
+    __slots__ = ("bounds", "counts", "sum", "count")
+
+    def __init__(self, bounds: Sequence[float]) -> None:
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def quantile(self, fraction: float) -> float:
+        """Estimate a quantile by interpolating within its bucket."""
+        if not self.count:
+            return 0.0
+        rank = fraction * self.count
+        seen = 0
+        for index, bucket in enumerate(self.counts):
+            if seen + bucket >= rank and bucket:
+                lower = self.bounds[index - 1] if index else 0.0
+                if index == len(self.bounds):
+                    return lower
+                upper = self.bounds[index]
+                return lower + (upper - lower) * (rank - seen) / bucket
+            seen += bucket
+        return self.bounds[-1]  # pragma: NO COVER
+
+    def snapshot(self) -> Dict[str, object]:
+        cumulative = 0
+        buckets = []
+        for bound, bucket in zip(self.bounds + (float("inf"),), self.counts):
+            cumulative += bucket
+            buckets.append((bound, cumulative))
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "p50": self.quantile(0.5),
+            "p90": self.quantile(0.9),
+            "p99": self.quantile(0.99),
+            "buckets": buckets,
+        }
+
+
+class _MethodMetrics:
+    __slots__ = (
+        "lock",
+        "calls",
+        "attempts",
+        "in_flight",
+        "status_codes",
+        "latency",
+        "request_bytes",
+        "response_bytes",
+    )
+
+    def __init__(self, latency_buckets, size_buckets):
+        self.lock = threading.Lock()
+        self.clear(latency_buckets, size_buckets)
+
+    def clear(self, latency_buckets, size_buckets):
+        self.calls = 0
+        self.attempts = 0
+        self.in_flight = 0
+        self.status_codes: Dict[str, int] = {}
+        self.latency = Histogram(latency_buckets)
+        self.request_bytes = Histogram(size_buckets)
+        self.response_bytes = Histogram(size_buckets)
+
+
+class MetricsRecorder(wrapping.MethodInterceptor):
+    """Records latency, retries, status codes and payload sizes per method.
+
+    For every method the recorder tracks:
+
+    * ``latency``: seconds per client call, including retries and backoff;
+    * ``calls`` and ``attempts``; ``retries`` is their difference;
+    * ``status_codes``: final gRPC status of each call, ``OK`` included;
+    * ``request_bytes`` and ``response_bytes``: serialized size of each
+      attempt's payloads;
+    * ``in_flight``: calls that have started but not finished.
+
+    Args:
+        latency_buckets (Sequence[float]): Histogram bounds, in seconds.
+        size_buckets (Sequence[float]): Histogram bounds, in bytes.
+        record_sizes (bool): Whether to compute payload sizes. Disabling
+            it saves a ``ByteSize()`` call per request and response.
+    """
+
+    def __init__(
+        self,
+        *,
+        latency_buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+        size_buckets: Sequence[float] = DEFAULT_SIZE_BUCKETS,
+        record_sizes: bool = True,
+    ) -> None:
+        self._latency_buckets = tuple(latency_buckets)
+        self._size_buckets = tuple(size_buckets)
+        self._record_sizes = record_sizes
+        self._lock = threading.Lock()
+        self._methods: Dict[wrapping.MethodKey, _MethodMetrics] = {}
+
+    def _metrics_for(self, key: wrapping.MethodKey) -> _MethodMetrics:
+        with self._lock:
+            if key not in self._methods:
+                self._methods[key] = _MethodMetrics(
+                    self._latency_buckets, self._size_buckets
+                )
+            return self._methods[key]
+
+    def _before_attempt(self, stats: _MethodMetrics, request) -> None:
+        size = byte_size(request) if self._record_sizes else None
+        with stats.lock:
+            stats.attempts += 1
+            if size is not None:
+                stats.request_bytes.observe(size)
+
+    def _after_attempt(self, stats: _MethodMetrics, response) -> None:
+        size = byte_size(response) if self._record_sizes else None
+        if size is not None:
+            with stats.lock:
+                stats.response_bytes.observe(size)
+
+    def _begin(self, stats: _MethodMetrics) -> float:
+        with stats.lock:
+            stats.calls += 1
+            stats.in_flight += 1
+        return time.perf_counter()
+
+    def _end(self, stats: _MethodMetrics, start: float, status: str) -> None:
+        elapsed = time.perf_counter() - start
+        with stats.lock:
+            stats.in_flight -= 1
+            stats.latency.observe(elapsed)
+            stats.status_codes[status] = stats.status_codes.get(status, 0) + 1
+
+    def wrap_attempt(
+        self, key: wrapping.MethodKey, func: Callable, asyncio: bool
+    ) -> Callable:
+        stats = self._metrics_for(key)
+
+        if asyncio:
+
+            def attempt(request, **kwargs):
+                self._before_attempt(stats, request)
+                call = func(request, **kwargs)
+
+                async def complete():
+                    response = await call
+                    self._after_attempt(stats, response)
+                    return response
+
+                return complete()
+
+            return attempt
+
+        def attempt(request, **kwargs):
+            self._before_attempt(stats, request)
+            response = func(request, **kwargs)
+            self._after_attempt(stats, response)
+            return response
+
+        return attempt
+
+    def wrap_call(
+        self, key: wrapping.MethodKey, func: Callable, asyncio: bool
+    ) -> Callable:
+        stats = self._metrics_for(key)
+
+        if asyncio:
+
+            async def call(*args, **kwargs):
+                start, status = self._begin(stats), "OK"
+                try:
+                    return await func(*args, **kwargs)
+                except Exception as exc:
+                    status = status_name(exc)
+                    raise
+                finally:
+                    self._end(stats, start, status)
+
+            return call
+
+        def call(*args, **kwargs):
+            start, status = self._begin(stats), "OK"
+            try:
+                return func(*args, **kwargs)
+            except Exception as exc:
+                status = status_name(exc)
+                raise
+            finally:
+                self._end(stats, start, status)
+
+        return call
+
+    def reset(self) -> None:
+        """Forget everything recorded so far."""
+        with self._lock:
+            methods = list(self._methods.values())
+        for stats in methods:
+            with stats.lock:
+                # In-flight calls still finish against this object, so keep
+                # their count rather than letting it go negative.
+                in_flight = stats.in_flight
+                stats.clear(self._latency_buckets, self._size_buckets)
+                stats.in_flight = in_flight
+
+    def snapshot(self) -> Dict[str, Dict[str, object]]:
+        """Return a point-in-time copy of every method's metrics.
+
+        Returns:
+            Dict[str, dict]: Keyed by ``"<service>/<method>"``. Histograms
+            are reported with ``count``, ``sum``, estimated ``p50``, ``p90``
+            and ``p99``, and cumulative ``buckets`` of ``(le, count)``.
+        """
+        with self._lock:
+            methods = list(self._methods.items())
+        result = {}
+        for key, stats in sorted(methods):
+            with stats.lock:
+                result["{}/{}".format(key.service, key.method)] = {
+                    "service": key.service,
+                    "method": key.method,
+                    "calls": stats.calls,
+                    "attempts": stats.attempts,
+                    "retries": max(0, stats.attempts - stats.calls),
+                    "in_flight": stats.in_flight,
+                    "status_codes": dict(stats.status_codes),
+                    "latency": stats.latency.snapshot(),
+                    "request_bytes": stats.request_bytes.snapshot(),
+                    "response_bytes": stats.response_bytes.snapshot(),
+                }
+        return result
+
+    def to_prometheus(self, prefix: str = "talent_client") -> str:
+        """Render the metrics in the Prometheus text exposition format.
+
+        Args:
+            prefix (str): Prepended to every metric name.
+
+        Returns:
+            str: The exposition text, ending with a newline.
+        """
+        snapshot = self.snapshot()
+        lines: List[str] = []
+
+        def header(name, kind, text):
+            lines.append("# HELP {}_{} {}".format(prefix, name, text))
+            lines.append("# TYPE {}_{} {}".format(prefix, name, kind))
+
+        def labels(entry, **extra):
+            pairs = [("service", entry["service"]), ("method", entry["method"])]
+            pairs.extend(sorted(extra.items()))
+            return ",".join(
+                '{}="{}"'.format(k, str(v).replace("\\", "\\\\").replace('"', '\\"'))
+                for k, v in pairs
+            )
+
+        def histogram(name, field, text):
+            header(name, "histogram", text)
+            for entry in snapshot.values():
+                data = entry[field]
+                for bound, count in data["buckets"]:
+                    le = "+Inf" if bound == float("inf") else repr(float(bound))
+                    lines.append(
+                        "{}_{}_bucket{{{}}} {}".format(
+                            prefix, name, labels(entry, le=le), count
+                        )
+                    )
+                lines.append(
+                    "{}_{}_sum{{{}}} {}".format(
+                        prefix, name, labels(entry), repr(float(data["sum"]))
+                    )
+                )
+                lines.append(
+                    "{}_{}_count{{{}}} {}".format(
+                        prefix, name, labels(entry), data["count"]
+                    )
+                )
+
+        histogram(
+            "latency_seconds",
+            "latency",
+            "Client call latency, including retries and backoff.",
+        )
+        header("calls_total", "counter", "Client calls by final gRPC status code.")
+        for entry in snapshot.values():
+            for code, count in sorted(entry["status_codes"].items()):
+                lines.append(
+                    "{}_calls_total{{{}}} {}".format(
+                        prefix, labels(entry, code=code), count
+                    )
+                )
+        header("attempts_total", "counter", "RPC attempts sent, including retries.")
+        for entry in snapshot.values():
+            lines.append(
+                "{}_attempts_total{{{}}} {}".format(
+                    prefix, labels(entry), entry["attempts"]
+                )
+            )
+        header("retries_total", "counter", "RPC attempts beyond the first per call.")
+        for entry in snapshot.values():
+            lines.append(
+                "{}_retries_total{{{}}} {}".format(
+                    prefix, labels(entry), entry["retries"]
+                )
+            )
+        header("in_flight", "gauge", "Client calls currently in progress.")
+        for entry in snapshot.values():
+            lines.append(
+                "{}_in_flight{{{}}} {}".format(
+                    prefix, labels(entry), entry["in_flight"]
+                )
+            )
+        histogram("request_bytes", "request_bytes", "Serialized request size.")
+        histogram("response_bytes", "response_bytes", "Serialized response size.")
+        return "\n".join(lines) + "\n"
+
+
+__all__ = ("Histogram", "MetricsRecorder")
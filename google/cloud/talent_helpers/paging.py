@@ -0,0 +1,330 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Checkpoints for the generated v4 and v4beta1 pagers.
+
+Every pager records where a walk stands as a :class:`PagerCheckpoint`:
+the ``page_token`` that fetched the page being consumed and the number
+of that page's items already consumed. A walk interrupted by a crash or
+a failed page fetch resumes from its checkpoint with a single request,
+instead of paging from the top again::
+
+    checkpoint = PagerCheckpoint.load("walk.json")
+    pager = client.list_jobs(
+        request={
+            "parent": tenant,
+            "filter": filter_,
+            "page_token": checkpoint.page_token if checkpoint else "",
+        }
+    )
+    if checkpoint:
+        pager.resume(checkpoint)
+    pager.persist("walk.json")
+    for job in pager:
+        ...
+
+An item counts as consumed once the caller asks for the next one, so
+a resumed walk yields the item it was interrupted on again. Page tokens
+are only valid for the request that produced them; resume with the same
+request fields.
+
+Pagers fetch later pages with the ``retry`` and ``timeout`` of the call
+that created them. :meth:`~CheckpointMixin.set_deadline` also bounds the
+whole walk: each page request gets the time left, and once it runs out
+iteration stops with the checkpoint at the next page::
+
+    deadline = Deadline(600)
+    pager = client.list_jobs(request=request, timeout=deadline.remaining())
+    for job in pager.set_deadline(deadline):
+        ...
+    if pager.deadline_exceeded:
+        pager.checkpoint().save("walk.json")
+"""
+
+import collections
+import itertools
+import json
+import os
+import time
+from typing import Any, Dict, Iterable, Iterator, Optional, TypeVar, Union
+
+from google.api_core import exceptions  # type: ignore
+from google.api_core import gapic_v1  # type: ignore
+
+
+_T = TypeVar("_T")
+
+# The errors a request cut short by its timeout or retry deadline raises.
+_EXPIRED_ERRORS = (exceptions.DeadlineExceeded, exceptions.RetryError)
+
+
+class Deadline:
+    """An end-to-end time budget, counted from its creation.
+
+    Args:
+        timeout (float): The budget, in seconds.
+    """
+
+    def __init__(self, timeout: float) -> None:
+        self._expiry = time.monotonic() + timeout
+
+    @classmethod
+    def of(cls, deadline: Union["Deadline", float, None]) -> Optional["Deadline"]:
+        """Return ``deadline``, or a new one for a number of seconds."""
+        if deadline is None or isinstance(deadline, Deadline):
+            return deadline
+        return cls(deadline)
+
+    def remaining(self) -> float:
+        """Return the seconds left, or ``0.0`` once the deadline has passed."""
+        return max(0.0, self._expiry - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        """bool: Whether the deadline has passed."""
+        return time.monotonic() >= self._expiry
+
+    def timeout(self, timeout: Optional[float] = None) -> float:
+        """Return the seconds left, capped at ``timeout`` when one is given."""
+        remaining = self.remaining()
+        return remaining if timeout is None else min(timeout, remaining)
+
+
+class PagerCheckpoint(
+    collections.namedtuple("PagerCheckpoint", ["page_token", "offset"])
+):
+    """The position of a paged walk.
+
+    Attributes:
+        page_token (str): The token of the page being consumed; empty for
+            the first page.
+        offset (int): Items of that page already consumed.
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def load(cls, path: str) -> Optional["PagerCheckpoint"]:
+        """Read a checkpoint saved by :meth:`save`.
+
+        Args:
+            path (str): The checkpoint file.
+
+        Returns:
+            Optional[~.PagerCheckpoint]: ``None`` if the file does not exist.
+        """
+        if not os.path.exists(path):
+            return None
+        with open(path) as stream:
+            state = json.load(stream)
+        return cls(state["page_token"], state["offset"])
+
+    def save(self, path: str) -> None:
+        """Atomically write the checkpoint to ``path``."""
+        temporary = path + ".tmp"
+        with open(temporary, "w") as stream:
+            json.dump({"page_token": self.page_token, "offset": self.offset}, stream)
+        os.replace(temporary, path)
+
+
+class CheckpointMixin:
+    """Checkpoint support shared by the generated pagers.
+
+    Pagers fetch every page but the first through :meth:`_next_page` or
+    :meth:`_next_page_async`, and yield items through :meth:`_track`.
+    """
+
+    _page_token: Optional[str] = None
+    _offset = 0
+    _checkpoint_path: Optional[str] = None
+    _save_every = 0
+    _retry = gapic_v1.method.DEFAULT
+    _timeout = gapic_v1.method.DEFAULT
+    _deadline: Optional[Deadline] = None
+    _deadline_exceeded = False
+
+    @property
+    def deadline_exceeded(self) -> bool:
+        """bool: Whether iteration stopped early because the deadline passed.
+
+        The checkpoint then points at the first page not fetched.
+        """
+        return self._deadline_exceeded
+
+    def set_deadline(self, deadline: Union[Deadline, float]):
+        """Bound the time spent fetching further pages.
+
+        Each page request gets the time left, capped at the pager's
+        ``timeout``, and its retries stop at the deadline too. Once it has
+        passed, iteration stops cleanly instead of raising, and
+        :attr:`deadline_exceeded` is set.
+
+        Args:
+            deadline (Union[~.Deadline, float]): A deadline, or a budget in
+                seconds from now.
+
+        Returns:
+            The pager, for chaining.
+        """
+        self._deadline = Deadline.of(deadline)
+        return self
+
+    def checkpoint(self) -> PagerCheckpoint:
+        """Return the current position of the walk.
+
+        Returns:
+            ~.PagerCheckpoint: Pass it to :meth:`resume` on a pager created
+            from a request with its ``page_token``.
+        """
+        page_token = self._page_token
+        if page_token is None:
+            page_token = self._request.page_token
+        return PagerCheckpoint(page_token, self._offset)
+
+    def resume(self, checkpoint: PagerCheckpoint):
+        """Skip the items of the first page consumed before ``checkpoint``.
+
+        Args:
+            checkpoint (~.PagerCheckpoint): A checkpoint whose
+                ``page_token`` this pager's request was created with.
+
+        Returns:
+            The pager, for chaining.
+
+        Raises:
+            ValueError: If iteration has already started or the pager was
+                created with a different page token.
+        """
+        if self._page_token is not None or self._offset:
+            raise ValueError("Cannot resume a pager after iteration has started.")
+        if checkpoint.page_token != self._request.page_token:
+            raise ValueError(
+                "The pager was created with page token {!r}, not {!r}.".format(
+                    self._request.page_token, checkpoint.page_token
+                )
+            )
+        self._offset = checkpoint.offset
+        return self
+
+    def persist(self, path: str, *, every: int = 0):
+        """Save the checkpoint to ``path`` as the walk progresses.
+
+        The checkpoint is saved now, after every page, and, if ``every`` is
+        set, after each ``every`` items.
+
+        Args:
+            path (str): The checkpoint file; see :meth:`PagerCheckpoint.load`.
+            every (int): Also save after this many items of a page.
+
+        Returns:
+            The pager, for chaining.
+        """
+        self._checkpoint_path = path
+        self._save_every = every
+        self._save()
+        return self
+
+    def _save(self) -> None:
+        if self._checkpoint_path is not None:
+            self.checkpoint().save(self._checkpoint_path)
+
+    def _page_fetched(self) -> None:
+        self._page_token = self._request.page_token
+        self._offset = 0
+        self._save()
+
+    def _page_timeout(self) -> Optional[float]:
+        # The per-page limit the deadline is capped at, if there is one.
+        timeout = self._timeout
+        if timeout is gapic_v1.method.DEFAULT:
+            timeout = getattr(self._method, "default_timeout", None)
+        return timeout if isinstance(timeout, (int, float)) else None
+
+    def _call_options(self) -> Dict[str, Any]:
+        retry, timeout = self._retry, self._timeout
+        if self._deadline is not None:
+            timeout = self._deadline.timeout(self._page_timeout())
+            if retry is gapic_v1.method.DEFAULT:
+                retry = getattr(self._method, "default_retry", retry)
+            if retry not in (None, gapic_v1.method.DEFAULT):
+                retry = retry.with_deadline(timeout)
+        return {"retry": retry, "timeout": timeout, "metadata": self._metadata}
+
+    def _stop(self) -> bool:
+        # Point the checkpoint at the page that was not fetched.
+        self._deadline_exceeded = True
+        self._page_token = self._response.next_page_token
+        self._offset = 0
+        self._save()
+        return False
+
+    def _cut_short(self, timeout: Any) -> bool:
+        # Retries give up slightly before the deadline, so a request counts
+        # as cut short whenever the time left was its tightest limit.
+        if self._deadline is None:
+            return False
+        limit = self._page_timeout()
+        return self._deadline.expired or limit is None or timeout < limit
+
+    def _next_page(self) -> bool:
+        """Fetch the next page into ``_response``, if the walk goes on."""
+        if not self._response.next_page_token:
+            return False
+        if self._deadline is not None and self._deadline.expired:
+            return self._stop()
+        self._request.page_token = self._response.next_page_token
+        options = self._call_options()
+        try:
+            self._response = self._method(self._request, **options)
+        except _EXPIRED_ERRORS:
+            if self._cut_short(options["timeout"]):
+                return self._stop()
+            raise
+        self._page_fetched()
+        return True
+
+    async def _next_page_async(self) -> bool:
+        """Like :meth:`_next_page`, for the asyncio pagers."""
+        if not self._response.next_page_token:
+            return False
+        if self._deadline is not None and self._deadline.expired:
+            return self._stop()
+        self._request.page_token = self._response.next_page_token
+        options = self._call_options()
+        try:
+            self._response = await self._method(self._request, **options)
+        except _EXPIRED_ERRORS:
+            if self._cut_short(options["timeout"]):
+                return self._stop()
+            raise
+        self._page_fetched()
+        return True
+
+    def _track(self, items: Iterable[_T]) -> Iterator[_T]:
+        if self._page_token is None:
+            # Pin the first page's token before ``pages`` overwrites the
+            # request's token to fetch the next page.
+            self._page_token = self._request.page_token
+        for item in itertools.islice(items, self._offset, None):
+            yield item
+            self._offset += 1
+            if self._save_every and not self._offset % self._save_every:
+                self._save()
+        self._save()
+
+
+__all__ = ("CheckpointMixin", "Deadline", "PagerCheckpoint")
@@ -0,0 +1,321 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Run client work in a pool of worker processes.
+
+Building ``Job`` messages, decoding responses and encoding JSON are CPU
+bound and hold the GIL, so one client process tops out at one core.
+:class:`ClientPool` starts worker processes that each build their own
+client from a picklable :class:`ClientConfig`, and moves requests and
+responses between processes as serialized protobuf bytes::
+
+    config = ClientConfig(JobServiceClient, client_options={"credentials_file": key})
+    with ClientPool(config, processes=8) as pool:
+        jobs = list(pool.map("get_job", requests))
+        result = import_jobs(None, tenant, "jobs.ndjson", pool=pool)
+
+:func:`~google.cloud.talent_helpers.bulk_import.import_jobs` and
+:func:`~google.cloud.talent_helpers.profile_loader.load_profiles` accept a
+pool and then parse, send and decode in the workers. :meth:`ClientPool.run`
+runs any module-level function with the worker's client.
+
+Workers are started with the ``spawn`` method, since gRPC does not
+support ``fork()`` while channels are in use, so the code using the pool
+must be importable (guarded by ``if __name__ == "__main__":`` in scripts).
+"""
+
+import asyncio
+import collections
+import concurrent.futures
+import inspect
+import multiprocessing
+import os
+import sys
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+import grpc  # type: ignore
+from grpc.experimental import aio  # type: ignore
+
+from google.api_core import exceptions  # type: ignore
+
+
+class ClientConfig:
+    """A picklable recipe for building a client in a worker process.
+
+    Credentials objects usually cannot be pickled, so credentials are
+    given as configuration, for example a ``credentials_file`` in
+    ``client_options``, or left to Application Default Credentials.
+
+    Args:
+        client_class (type): The client to build, such as
+            ``JobServiceClient`` or ``ProfileServiceAsyncClient``.
+        client_options (Optional[dict]): Passed to the client as
+            ``client_options``.
+        emulator_host (Optional[str]): A ``host:port`` to connect to
+            without credentials or TLS instead, such as a local emulator or
+            :class:`~google.cloud.talent_helpers.FakeTalentServer`.
+    """
+
+    def __init__(
+        self,
+        client_class: type,
+        *,
+        client_options: Optional[dict] = None,
+        emulator_host: Optional[str] = None,
+    ) -> None:
+        self.client_class = client_class
+        self.client_options = client_options
+        self.emulator_host = emulator_host
+
+    @property
+    def asyncio(self) -> bool:
+        """Whether the client is an asyncio client."""
+        return self.client_class.__name__.endswith("AsyncClient")
+
+    def build(self):
+        """Build the client. Asyncio clients must be built in a running loop."""
+        if self.emulator_host is None:
+            return self.client_class(client_options=self.client_options)
+        if self.asyncio:
+            transport_class = self.client_class.get_transport_class("grpc_asyncio")
+            channel = aio.insecure_channel(self.emulator_host)
+        else:
+            transport_class = self.client_class.get_transport_class("grpc")
+            channel = grpc.insecure_channel(self.emulator_host)
+        return self.client_class(transport=transport_class(channel=channel))
+
+
+# State of a worker process, set by ``_initialize``.
+_CONFIG: Optional[ClientConfig] = None
+_CLIENT: Any = None
+_LOOP: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _initialize(config: ClientConfig) -> None:
+    global _CONFIG
+    _CONFIG = config
+
+
+async def _build_async(config: ClientConfig):
+    return config.build()
+
+
+def _worker_client():
+    global _CLIENT, _LOOP
+    if _CLIENT is None:
+        if _CONFIG.asyncio:
+            _LOOP = asyncio.new_event_loop()
+            asyncio.set_event_loop(_LOOP)
+            _CLIENT = _LOOP.run_until_complete(_build_async(_CONFIG))
+        else:
+            _CLIENT = _CONFIG.build()
+    return _CLIENT
+
+
+def portable_error(exc: exceptions.GoogleAPICallError) -> exceptions.GoogleAPICallError:
+    """Return a copy of an API error that can be pickled.
+
+    API errors keep a reference to the gRPC call, which cannot be sent
+    back to the parent process.
+    """
+    return type(exc)(exc.message)
+
+
+def _run(func: Callable, args: tuple):
+    try:
+        result = func(_worker_client(), *args)
+        if inspect.isawaitable(result):
+            result = _LOOP.run_until_complete(result)
+        return result
+    except exceptions.GoogleAPICallError as exc:
+        raise portable_error(exc) from None
+    except exceptions.RetryError as exc:
+        # RetryError cannot be unpickled; retries only give up at their
+        # deadline, so report it as one.
+        raise exceptions.DeadlineExceeded(exc.message) from None
+
+
+def _call(client, method: str, request_class: type, data: bytes, kwargs: dict):
+    response = getattr(client, method)(
+        request=request_class.deserialize(data), **kwargs
+    )
+    if inspect.isawaitable(response):
+        return _finish_async(response)
+    return _encode_response(response)
+
+
+async def _finish_async(response):
+    return _encode_response(await response)
+
+
+def _encode_response(response):
+    if hasattr(response, "pages"):
+        raise TypeError("Paged methods cannot be called through a ClientPool.")
+    if hasattr(response, "result") and hasattr(response, "operation"):
+        raise TypeError(
+            "Long-running methods cannot be called through a ClientPool; "
+            "use ClientPool.run to wait for them in the worker."
+        )
+    return type(response), type(response).serialize(response)
+
+
+def _decode_response(future: concurrent.futures.Future) -> Any:
+    response_class, data = future.result()
+    return response_class.deserialize(data)
+
+
+# Before Python 3.7, ProcessPoolExecutor can neither spawn nor initialize
+# its workers.
+_EXECUTOR_OPTIONS = sys.version_info >= (3, 7)
+
+
+class _SpawnPool:
+    """Stands in for ``ProcessPoolExecutor`` on Python 3.6."""
+
+    def __init__(self, processes: int, config: ClientConfig) -> None:
+        self._pool = multiprocessing.get_context("spawn").Pool(
+            processes, initializer=_initialize, initargs=(config,)
+        )
+
+    def submit(self, func: Callable, *args) -> concurrent.futures.Future:
+        future: concurrent.futures.Future = concurrent.futures.Future()
+        future.set_running_or_notify_cancel()
+        self._pool.apply_async(
+            func, args, callback=future.set_result, error_callback=future.set_exception
+        )
+        return future
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._pool.close()
+        if wait:
+            self._pool.join()
+
+
+class ClientPool:
+    """Worker processes that each own a client.
+
+    Args:
+        config (~.ClientConfig): How each worker builds its client.
+        processes (Optional[int]): The number of workers. Defaults to the
+            number of CPUs.
+    """
+
+    def __init__(self, config: ClientConfig, *, processes: Optional[int] = None):
+        self.config = config
+        self.processes = processes or os.cpu_count() or 1
+        if _EXECUTOR_OPTIONS:
+            self._executor = concurrent.futures.ProcessPoolExecutor(
+                max_workers=self.processes,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_initialize,
+                initargs=(config,),
+            )
+        else:
+            self._executor = _SpawnPool(self.processes, config)
+
+    def __enter__(self) -> "ClientPool":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def close(self, wait: bool = True) -> None:
+        """Stop the workers, by default after pending work is done."""
+        self._executor.shutdown(wait=wait)
+
+    def run(self, func: Callable, *args) -> concurrent.futures.Future:
+        """Run ``func(client, *args)`` in a worker.
+
+        Args:
+            func (Callable): A module-level function. It may be a
+                coroutine function when the pool uses an asyncio client.
+            args: Picklable arguments; pass messages as serialized bytes.
+
+        Returns:
+            concurrent.futures.Future: Resolves to the function's result.
+            API errors are raised without their gRPC call details.
+        """
+        return self._executor.submit(_run, func, args)
+
+    def submit(self, method: str, request, **kwargs) -> concurrent.futures.Future:
+        """Call a client method in a worker.
+
+        Args:
+            method (str): The method name, e.g. ``"get_job"``. Paged and
+                long-running methods are not supported.
+            request (proto.Message): The request message.
+            kwargs: Picklable keyword arguments, e.g. ``timeout``.
+
+        Returns:
+            concurrent.futures.Future: Resolves to the response message.
+        """
+        encoded = self.run(
+            _call, method, type(request), type(request).serialize(request), kwargs
+        )
+        decoded: concurrent.futures.Future = concurrent.futures.Future()
+
+        def done(future):
+            if not decoded.set_running_or_notify_cancel():
+                return
+            try:
+                decoded.set_result(_decode_response(future))
+            except BaseException as exc:
+                decoded.set_exception(exc)
+
+        encoded.add_done_callback(done)
+        decoded.add_done_callback(
+            lambda future: future.cancelled() and encoded.cancel()
+        )
+        return decoded
+
+    def map(
+        self,
+        method: str,
+        requests: Iterable[Any],
+        *,
+        max_in_flight: Optional[int] = None,
+        **kwargs,
+    ) -> Iterator[Any]:
+        """Call a client method for many requests, yielding responses in order.
+
+        Args:
+            method (str): The method name.
+            requests (Iterable[proto.Message]): Read lazily.
+            max_in_flight (Optional[int]): The most requests submitted
+                ahead of the consumer. Defaults to twice the number of
+                workers.
+            kwargs: Picklable keyword arguments for every call.
+
+        Raises:
+            google.api_core.exceptions.GoogleAPICallError: The first failed
+                call, when its response is reached.
+        """
+        limit = max_in_flight or 2 * self.processes
+        pending: collections.deque = collections.deque()
+        try:
+            for request in requests:
+                pending.append(self.submit(method, request, **kwargs))
+                if len(pending) >= limit:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+__all__ = ("ClientConfig", "ClientPool", "portable_error")
@@ -0,0 +1,412 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Concurrent, idempotent bulk loading of v4beta1 profiles.
+
+``ProfileService`` has no batch RPC, so :func:`load_profiles` drives
+``create_profile`` from many concurrent calls on a
+``ProfileServiceAsyncClient`` and streams one result per profile::
+
+    async for result in load_profiles(client, tenant, profiles):
+        if result.error is not None:
+            log.warning("profile %d failed: %s", result.index, result.error)
+
+Requests are paced by an :class:`AdaptiveRateLimiter`, which raises its
+rate slowly while calls succeed and halves it when the service pushes
+back with ``RESOURCE_EXHAUSTED`` or ``UNAVAILABLE``. Those codes, along
+with ``DEADLINE_EXCEEDED``, ``ABORTED`` and ``INTERNAL``, are retried with
+exponential backoff.
+
+A profile whose ``external_id`` already exists in the tenant is looked up
+with ``list_profiles`` and, by default, updated in place, so loading the
+same data twice leaves one profile per ``external_id``.
+"""
+
+import asyncio
+import collections
+import random
+import time
+from typing import Any, AsyncIterator, Iterable, Optional
+
+from google.api_core import exceptions  # type: ignore
+
+from google.cloud.talent_helpers import filtering
+from google.cloud.talent_helpers import process_pool
+from google.cloud.talent_v4beta1.types import profile as profile_type
+
+
+TRANSIENT_ERRORS = (
+    exceptions.Aborted,
+    exceptions.DeadlineExceeded,
+    exceptions.InternalServerError,
+    exceptions.ResourceExhausted,
+    exceptions.ServiceUnavailable,
+)
+"""The errors :func:`load_profiles` retries."""
+
+_THROTTLING_ERRORS = (exceptions.ResourceExhausted, exceptions.ServiceUnavailable)
+
+
+ProfileResult = collections.namedtuple(
+    "ProfileResult", ["index", "profile", "action", "error"]
+)
+ProfileResult.__doc__ = """The outcome of loading one profile.
+
+``index`` is the profile's position in the input. ``action`` is
+``"created"``, ``"updated"``, ``"skipped"`` (it already existed and
+conflicts were not updated) or ``"failed"``. ``profile`` is the stored
+profile, or the input profile when ``error`` is set."""
+
+
+class AdaptiveRateLimiter:
+    """Paces requests with additive increase, multiplicative decrease.
+
+    Args:
+        rate (float): The initial rate, in requests per second.
+        min_rate (float): The rate never drops below this.
+        max_rate (float): The rate never rises above this.
+        increase (float): Added to the rate for each second's worth of
+            successful requests.
+        decrease (float): The factor applied to the rate when throttled.
+        cooldown (float): The rate is decreased at most once per this many
+            seconds, so one burst of rejections counts once.
+    """
+
+    def __init__(
+        self,
+        rate: float = 100.0,
+        *,
+        min_rate: float = 1.0,
+        max_rate: float = 1000.0,
+        increase: float = 5.0,
+        decrease: float = 0.5,
+        cooldown: float = 1.0,
+    ) -> None:
+        if not 0 < min_rate <= rate <= max_rate:
+            raise ValueError("Expected 0 < min_rate <= rate <= max_rate.")
+        self._rate = rate
+        self._min_rate = min_rate
+        self._max_rate = max_rate
+        self._increase = increase
+        self._decrease = decrease
+        self._cooldown = cooldown
+        self._next = 0.0
+        self._decreased = float("-inf")
+
+    @property
+    def rate(self) -> float:
+        """The current rate, in requests per second."""
+        return self._rate
+
+    async def acquire(self) -> None:
+        """Wait for the next request slot."""
+        now = time.monotonic()
+        slot = max(now, self._next)
+        self._next = slot + 1.0 / self._rate
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+    def succeeded(self) -> None:
+        """Record a successful request."""
+        self._rate = min(self._max_rate, self._rate + self._increase / self._rate)
+
+    def throttled(self) -> None:
+        """Record a request the service rejected for load."""
+        now = time.monotonic()
+        if now - self._decreased >= self._cooldown:
+            self._decreased = now
+            self._rate = max(self._min_rate, self._rate * self._decrease)
+
+
+class _Finished:
+    __slots__ = ("error",)
+
+    def __init__(self, error):
+        self.error = error
+
+
+class _Loader:
+    def __init__(self, client, parent, limiter, update_existing, update_mask, kwargs):
+        self.client = client
+        self.parent = parent
+        self.limiter = limiter
+        self.update_existing = update_existing
+        self.update_mask = update_mask
+        self.max_attempts = kwargs.pop("max_attempts")
+        self.initial_backoff = kwargs.pop("initial_backoff")
+        self.max_backoff = kwargs.pop("max_backoff")
+        self.kwargs = kwargs
+
+    async def call(self, method, **request):
+        delay = self.initial_backoff
+        for attempt in range(1, self.max_attempts + 1):
+            await self.limiter.acquire()
+            try:
+                response = await method(request=request, retry=None, **self.kwargs)
+            except TRANSIENT_ERRORS as exc:
+                if isinstance(exc, _THROTTLING_ERRORS):
+                    self.limiter.throttled()
+                if attempt == self.max_attempts:
+                    raise
+                await asyncio.sleep(random.uniform(0.0, delay))
+                delay = min(delay * 2.0, self.max_backoff)
+            else:
+                self.limiter.succeeded()
+                return response
+
+    async def existing(self, external_id):
+        response = await self.call(
+            self.client.list_profiles,
+            parent=self.parent,
+            filter="externalId = {}".format(filtering.quote(external_id)),
+            page_size=1,
+        )
+        async for found in response:
+            return found
+        raise exceptions.NotFound(
+            "Profile with external_id {!r} conflicted but was not found.".format(
+                external_id
+            )
+        )
+
+    async def load(self, index, profile):
+        try:
+            try:
+                created = await self.call(
+                    self.client.create_profile, parent=self.parent, profile=profile
+                )
+                return ProfileResult(index, created, "created", None)
+            except exceptions.AlreadyExists:
+                if not profile.external_id:
+                    raise
+            found = await self.existing(profile.external_id)
+            if not self.update_existing:
+                return ProfileResult(index, found, "skipped", None)
+            update = type(profile).pb()()
+            update.CopyFrom(type(profile).pb(profile))
+            update.name = found.name
+            request = {"profile": type(profile)(update)}
+            if self.update_mask is not None:
+                request["update_mask"] = self.update_mask
+            updated = await self.call(self.client.update_profile, **request)
+            return ProfileResult(index, updated, "updated", None)
+        except exceptions.GoogleAPICallError as exc:
+            return ProfileResult(index, profile, "failed", exc)
+
+
+async def load_profiles(
+    client,
+    parent: str,
+    profiles: Iterable[Any],
+    *,
+    max_concurrency: int = 32,
+    limiter: Optional[AdaptiveRateLimiter] = None,
+    update_existing: bool = True,
+    update_mask=None,
+    max_attempts: int = 5,
+    initial_backoff: float = 0.1,
+    max_backoff: float = 10.0,
+    pool=None,
+    batch_size: int = 100,
+    **kwargs,
+) -> AsyncIterator[ProfileResult]:
+    """Create many profiles concurrently, resolving conflicts by external ID.
+
+    Args:
+        client (~.ProfileServiceAsyncClient): A v4beta1 async client.
+        parent (str): The tenant, e.g. ``"projects/p/tenants/t"``.
+        profiles (Iterable[Union[~.profile.Profile, dict]]): The profiles,
+            read lazily so they can be streamed from a file. Dicts are
+            converted to ``Profile``.
+        max_concurrency (int): The most profiles in flight at once.
+        limiter (Optional[~.AdaptiveRateLimiter]): Paces every RPC the
+            loader sends. Defaults to a new limiter starting at 100
+            requests per second.
+        update_existing (bool): Whether to update the stored profile when
+            the ``external_id`` already exists, or leave it unchanged.
+        update_mask (Optional[~.field_mask.FieldMask]): Limits the update
+            of existing profiles to these fields. By default the stored
+            profile is replaced.
+        max_attempts (int): The most attempts per RPC on transient errors.
+        initial_backoff (float): The upper bound of the first random
+            backoff, in seconds. It doubles after each attempt.
+        max_backoff (float): The largest backoff bound, in seconds.
+        pool (Optional[~.process_pool.ClientPool]): A pool of
+            ``ProfileServiceAsyncClient`` workers. Profiles are then sent
+            in batches of ``batch_size`` and loaded in the workers, each
+            with ``max_concurrency`` profiles in flight, and ``client`` is
+            ignored. Every worker paces itself with its own copy of
+            ``limiter``, so the pool sends up to ``processes`` times its
+            rate.
+        batch_size (int): The profiles handed to a pool worker at once.
+        kwargs: Passed to every client call, e.g. ``timeout``.
+
+    Yields:
+        ~.ProfileResult: One per profile, in completion order. RPC failures
+        are reported in the result rather than raised.
+
+    Raises:
+        Exception: Any error raised while reading ``profiles``.
+    """
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be positive.")
+    if pool is not None:
+        options = dict(
+            kwargs,
+            max_concurrency=max_concurrency,
+            limiter=limiter or AdaptiveRateLimiter(),
+            update_existing=update_existing,
+            update_mask=None if update_mask is None else list(update_mask.paths),
+            max_attempts=max_attempts,
+            initial_backoff=initial_backoff,
+            max_backoff=max_backoff,
+        )
+        async for result in _load_with_pool(
+            pool, parent, profiles, batch_size, options
+        ):
+            yield result
+        return
+    loader = _Loader(
+        client,
+        parent,
+        limiter or AdaptiveRateLimiter(),
+        update_existing,
+        update_mask,
+        dict(
+            kwargs,
+            max_attempts=max_attempts,
+            initial_backoff=initial_backoff,
+            max_backoff=max_backoff,
+        ),
+    )
+    source = enumerate(profiles)
+    results: asyncio.Queue = asyncio.Queue(maxsize=max_concurrency)
+
+    async def work():
+        error = None
+        try:
+            for index, item in source:
+                if isinstance(item, dict):
+                    item = profile_type.Profile(**item)
+                await results.put(await loader.load(index, item))
+        except Exception as exc:
+            error = exc
+        await results.put(_Finished(error))
+
+    workers = [asyncio.ensure_future(work()) for _ in range(max_concurrency)]
+    try:
+        running = len(workers)
+        while running:
+            result = await results.get()
+            if isinstance(result, _Finished):
+                running -= 1
+                if result.error is not None:
+                    raise result.error
+                continue
+            yield result
+    finally:
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+
+# The limiter of a ``ClientPool`` worker, kept across batches so its rate
+# keeps adapting.
+_WORKER_LIMITER: Optional[AdaptiveRateLimiter] = None
+
+
+async def _load_batch(client, parent: str, start: int, data: list, options: dict):
+    """Load one batch in a :class:`ClientPool` worker.
+
+    Returns ``(index, action, profile, error)`` tuples with the profile
+    serialized and the error made picklable.
+    """
+    global _WORKER_LIMITER
+    if _WORKER_LIMITER is None:
+        _WORKER_LIMITER = options["limiter"]
+    options = dict(options, limiter=_WORKER_LIMITER)
+    if options["update_mask"] is not None:
+        options["update_mask"] = {"paths": options["update_mask"]}
+
+    results = []
+    profiles = (profile_type.Profile.deserialize(item) for item in data)
+    async for result in load_profiles(client, parent, profiles, **options):
+        error = result.error
+        if error is not None:
+            error = process_pool.portable_error(error)
+        results.append(
+            (
+                start + result.index,
+                result.action,
+                profile_type.Profile.serialize(result.profile),
+                error,
+            )
+        )
+    return results
+
+
+async def _load_with_pool(pool, parent, profiles, batch_size, options):
+    def batches():
+        batch: list = []
+        for index, item in enumerate(profiles):
+            if isinstance(item, dict):
+                item = profile_type.Profile(**item)
+            batch.append(profile_type.Profile.serialize(item))
+            if len(batch) >= batch_size:
+                yield index + 1 - len(batch), batch
+                batch = []
+        if batch:
+            yield index + 1 - len(batch), batch
+
+    pending: set = set()
+    try:
+        for start, batch in batches():
+            pending.add(
+                asyncio.wrap_future(
+                    pool.run(_load_batch, parent, start, batch, options)
+                )
+            )
+            if len(pending) < 2 * pool.processes:
+                continue
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for future in done:
+                for result in _decode_batch(future.result()):
+                    yield result
+        for future in asyncio.as_completed(pending):
+            for result in _decode_batch(await future):
+                yield result
+        pending = set()
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+def _decode_batch(results):
+    for index, action, data, error in results:
+        yield ProfileResult(
+            index, profile_type.Profile.deserialize(data), action, error
+        )
+
+
+__all__ = (
+    "AdaptiveRateLimiter",
+    "ProfileResult",
+    "TRANSIENT_ERRORS",
+    "load_profiles",
+)
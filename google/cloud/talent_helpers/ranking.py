@@ -0,0 +1,333 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Local re-ranking of search results with custom ranking expressions.
+
+``SearchJobsRequest.CustomRankingInfo.ranking_expression`` combines
+numeric ``Job.custom_attributes`` with ``+``, ``-``, ``*``, ``/``,
+numbers and parentheses. Trying a new expression normally costs a new
+``search_jobs`` call. :class:`Reranker` instead re-orders an
+already-fetched response locally, evaluating compiled expressions over
+NumPy arrays of the candidates' attributes::
+
+    reranker = Reranker(response)
+    for expression in ("(year + 25) * 0.25 - (freshness / 0.5)", "salary"):
+        variant = reranker.rerank(expression)
+
+As on the service, an expression is invalid for a job that lacks one of
+the attributes it references, or when it divides by zero; such jobs are
+demoted to the end in their original order.
+
+The service's blend of its relevance score with the expression is not
+public. Locally the original rank stands in for relevance, and
+:data:`IMPORTANCE_WEIGHTS` approximates each ``ImportanceLevel`` with the
+weight given to the expression, from 0 for ``NONE`` to 1 for
+``EXTREME``, where results are sorted by the expression alone.
+
+This module requires NumPy, installed with the ``numpy`` extra.
+"""
+
+import functools
+import re
+from typing import Callable, Dict, FrozenSet, Iterable, Mapping, Optional
+
+try:
+    import numpy  # type: ignore
+except ImportError:  # pragma: NO COVER
+    raise ImportError(
+        "google.cloud.talent_helpers.ranking requires NumPy. "
+        "Install it with: pip install google-cloud-talent[numpy]"
+    )
+
+
+MAX_EXPRESSION_LENGTH = 100
+
+IMPORTANCE_WEIGHTS = {0: 1.0, 1: 0.0, 2: 0.2, 3: 0.4, 4: 0.6, 5: 0.8, 6: 1.0}
+"""Weight of the expression per ``CustomRankingInfo.ImportanceLevel``.
+
+An unspecified level is treated as ``EXTREME``."""
+
+_TOKEN = re.compile(
+    r"\s*(?:(?P<number>(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)"
+    r"|(?P<name>[A-Za-z_][A-Za-z0-9_]*)|(?P<op>[-+*/()]))"
+)
+
+
+class _Parser:
+    """Recursive-descent parser producing vectorized closures.
+
+    Each closure takes a mapping from attribute name to ``float64`` array
+    and returns an array, or a scalar for constant subexpressions.
+    """
+
+    def __init__(self, expression: str) -> None:
+        self.expression = expression
+        self.tokens = []
+        position = 0
+        stripped = expression.rstrip()
+        while position < len(stripped):
+            match = _TOKEN.match(stripped, position)
+            if match is None:
+                raise ValueError(
+                    "Unexpected character at {} in ranking expression: {!r}".format(
+                        position, expression
+                    )
+                )
+            self.tokens.append((match.lastgroup, match.group(match.lastgroup)))
+            position = match.end()
+        self.position = 0
+        self.names = set()
+
+    def peek(self) -> Optional[str]:
+        if self.position < len(self.tokens):
+            return self.tokens[self.position][1]
+        return None
+
+    def take(self):
+        if self.position >= len(self.tokens):
+            raise ValueError(
+                "Unexpected end of ranking expression: {!r}".format(self.expression)
+            )
+        token = self.tokens[self.position]
+        self.position += 1
+        return token
+
+    def parse(self) -> Callable:
+        evaluate = self.sum()
+        if self.position != len(self.tokens):
+            raise ValueError(
+                "Unexpected {!r} in ranking expression: {!r}".format(
+                    self.peek(), self.expression
+                )
+            )
+        return evaluate
+
+    def sum(self) -> Callable:
+        left = self.product()
+        while self.peek() in ("+", "-"):
+            operator = self.take()[1]
+            left = _binary(operator, left, self.product())
+        return left
+
+    def product(self) -> Callable:
+        left = self.factor()
+        while self.peek() in ("*", "/"):
+            operator = self.take()[1]
+            left = _binary(operator, left, self.factor())
+        return left
+
+    def factor(self) -> Callable:
+        kind, value = self.take()
+        if value == "-":
+            operand = self.factor()
+            return lambda env: -operand(env)
+        if value == "+":
+            return self.factor()
+        if value == "(":
+            inner = self.sum()
+            if self.take()[1] != ")":
+                raise ValueError(
+                    "Unbalanced parenthesis in ranking expression: {!r}".format(
+                        self.expression
+                    )
+                )
+            return inner
+        if kind == "number":
+            number = float(value)
+            return lambda env: number
+        if kind == "name":
+            self.names.add(value)
+            return lambda env: env[value]
+        raise ValueError(
+            "Unexpected {!r} in ranking expression: {!r}".format(value, self.expression)
+        )
+
+
+def _divide(left, right):
+    right = numpy.asarray(right, dtype=numpy.float64)
+    return numpy.true_divide(left, numpy.where(right == 0, numpy.nan, right))
+
+
+_OPERATORS = {
+    "+": numpy.add,
+    "-": numpy.subtract,
+    "*": numpy.multiply,
+    "/": _divide,
+}
+
+
+def _binary(operator: str, left: Callable, right: Callable) -> Callable:
+    function = _OPERATORS[operator]
+    return lambda env: function(left(env), right(env))
+
+
+class RankingExpression:
+    """A compiled ranking expression.
+
+    Use :func:`compile_expression` rather than creating this directly.
+
+    Attributes:
+        expression (str): The source expression.
+        attributes (FrozenSet[str]): The custom attributes it references.
+    """
+
+    def __init__(self, expression: str) -> None:
+        if len(expression) >= MAX_EXPRESSION_LENGTH:
+            raise ValueError(
+                "Ranking expressions must be shorter than {} characters.".format(
+                    MAX_EXPRESSION_LENGTH
+                )
+            )
+        parser = _Parser(expression)
+        self._evaluate = parser.parse()
+        self.expression = expression
+        self.attributes: FrozenSet[str] = frozenset(parser.names)
+
+    def __repr__(self) -> str:
+        return "RankingExpression({!r})".format(self.expression)
+
+    def evaluate(self, attributes: Mapping[str, numpy.ndarray], size: int):
+        """Score candidates.
+
+        Args:
+            attributes (Mapping[str, numpy.ndarray]): ``float64`` values of
+                each referenced attribute, ``NaN`` where a candidate lacks
+                it.
+            size (int): The number of candidates.
+
+        Returns:
+            numpy.ndarray: ``float64`` scores, ``NaN`` where the expression
+            is invalid.
+        """
+        with numpy.errstate(invalid="ignore", divide="ignore", over="ignore"):
+            scores = numpy.broadcast_to(
+                numpy.asarray(self._evaluate(attributes), dtype=numpy.float64), (size,)
+            )
+        return numpy.where(numpy.isfinite(scores), scores, numpy.nan)
+
+
+@functools.lru_cache(maxsize=256)
+def compile_expression(expression: str) -> RankingExpression:
+    """Compile a ``ranking_expression``, caching the result.
+
+    Raises:
+        ValueError: If the expression is too long or malformed.
+    """
+    return RankingExpression(expression)
+
+
+def _numeric_attributes(jobs, names: Iterable[str]) -> Dict[str, numpy.ndarray]:
+    columns = {name: numpy.full(len(jobs), numpy.nan) for name in names}
+    for row, job in enumerate(jobs):
+        attributes = job.custom_attributes
+        for name, column in columns.items():
+            if name in attributes and attributes[name].long_values:
+                column[row] = attributes[name].long_values[0]
+    return columns
+
+
+class Reranker:
+    """Re-orders one search response's matching jobs locally.
+
+    Args:
+        response (~.job_service.SearchJobsResponse): A v4 or v4beta1
+            response, as a proto-plus or protobuf message. It is not
+            modified.
+    """
+
+    def __init__(self, response) -> None:
+        self._response_type = type(response)
+        pb = getattr(self._response_type, "pb", None)
+        self._response = pb(response) if pb is not None else response
+        self._jobs = [match.job for match in self._response.matching_jobs]
+        self._columns: Dict[str, numpy.ndarray] = {}
+        size = len(self._jobs)
+        self._relevance = 1.0 - numpy.arange(size) / max(size, 1)
+
+    def __len__(self) -> int:
+        return len(self._jobs)
+
+    def scores(self, expression) -> numpy.ndarray:
+        """Evaluate an expression for every matching job.
+
+        Args:
+            expression (Union[str, ~.RankingExpression]): The expression.
+
+        Returns:
+            numpy.ndarray: ``float64`` scores in the response's order,
+            ``NaN`` where the expression is invalid.
+        """
+        if isinstance(expression, str):
+            expression = compile_expression(expression)
+        missing = expression.attributes.difference(self._columns)
+        if missing:
+            self._columns.update(_numeric_attributes(self._jobs, missing))
+        return expression.evaluate(self._columns, len(self._jobs))
+
+    def order(self, expression, *, importance_level: int = 0) -> numpy.ndarray:
+        """Return the new order of the matching jobs.
+
+        Args:
+            expression (Union[str, ~.RankingExpression]): The expression.
+            importance_level (int): A ``CustomRankingInfo.ImportanceLevel``.
+
+        Returns:
+            numpy.ndarray: Indices into the response's matching jobs, best
+            first.
+        """
+        scores = self.scores(expression)
+        valid = ~numpy.isnan(scores)
+        weight = IMPORTANCE_WEIGHTS[int(importance_level)]
+        combined = numpy.zeros(len(scores))
+        if valid.any():
+            low, high = scores[valid].min(), scores[valid].max()
+            spread = (high - low) or 1.0
+            combined[valid] = (scores[valid] - low) / spread
+        combined = weight * combined + (1.0 - weight) * self._relevance
+        # Sort valid jobs by combined score, breaking ties by original rank,
+        # then append the invalid ones in their original order.
+        return numpy.lexsort((numpy.arange(len(scores)), -combined, ~valid))
+
+    def rerank(self, expression, *, importance_level: int = 0):
+        """Return a copy of the response with its matching jobs re-ordered.
+
+        Args:
+            expression (Union[str, ~.RankingExpression]): The expression.
+            importance_level (int): A ``CustomRankingInfo.ImportanceLevel``.
+
+        Returns:
+            ~.job_service.SearchJobsResponse: Of the same type as the
+            response given to the constructor.
+        """
+        order = self.order(expression, importance_level=importance_level)
+        reranked = type(self._response)()
+        reranked.CopyFrom(self._response)
+        del reranked.matching_jobs[:]
+        matches = self._response.matching_jobs
+        reranked.matching_jobs.extend(matches[int(i)] for i in order)
+        if self._response_type is type(self._response):
+            return reranked
+        return self._response_type(reranked)
+
+
+__all__ = (
+    "IMPORTANCE_WEIGHTS",
+    "MAX_EXPRESSION_LENGTH",
+    "RankingExpression",
+    "Reranker",
+    "compile_expression",
+)
@@ -0,0 +1,425 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Retry budgets and circuit breakers for the Talent transports.
+
+The default ``Retry`` of each transport method retries every call on its
+own, so during a partial outage each client multiplies its load on the
+backend. A :class:`ResiliencePolicy` passed to any v4 or v4beta1
+transport bounds that in two ways::
+
+    policy = ResiliencePolicy()
+    client = JobServiceClient(
+        transport=transports.JobServiceGrpcTransport(resilience=policy)
+    )
+
+* A :class:`RetryBudget` caps retries at a fraction of the original
+  attempts sent recently. By default every policy uses
+  :data:`PROCESS_RETRY_BUDGET`, so the cap holds across all transports in
+  the process. Once it is spent, a call fails with
+  :class:`RetryBudgetExhausted` instead of sending its next retry.
+* A :class:`CircuitBreaker` per method opens after consecutive
+  ``UNAVAILABLE`` or ``DEADLINE_EXCEEDED`` attempts. While open, calls
+  fail at once with :class:`CircuitOpenError`. After ``reset_timeout``
+  the breaker lets a few probe attempts through, and closes again when
+  one succeeds.
+
+Both errors report ``UNAVAILABLE`` but are not ``ServiceUnavailable``
+subclasses, so the transports' default retry policies do not retry them.
+The budget is checked once the retry's backoff has elapsed.
+"""
+
+import collections
+import http.client
+import threading
+import time
+from typing import Callable, Dict, Iterable, Optional
+
+import grpc  # type: ignore
+
+from google.api_core import exceptions  # type: ignore
+from google.cloud.talent_helpers import metrics
+from google.cloud.talent_helpers import wrapping
+
+
+DEFAULT_FAILURE_CODES = (grpc.StatusCode.UNAVAILABLE, grpc.StatusCode.DEADLINE_EXCEEDED)
+"""The status codes a :class:`CircuitBreaker` counts as failures."""
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class RetryBudgetExhausted(exceptions.GoogleAPICallError):
+    """A retry was not sent because the retry budget is spent.
+
+    ``errors`` holds the error of the last attempt.
+    """
+
+    code = http.client.SERVICE_UNAVAILABLE
+    grpc_status_code = grpc.StatusCode.UNAVAILABLE
+
+
+class CircuitOpenError(exceptions.GoogleAPICallError):
+    """An attempt was not sent because the method's circuit is open."""
+
+    code = http.client.SERVICE_UNAVAILABLE
+    grpc_status_code = grpc.StatusCode.UNAVAILABLE
+
+
+class RetryBudget:
+    """Limits retries to a fraction of original attempts.
+
+    Attempts are counted over a sliding window. A retry is allowed while
+    the retries in the window stay below ``ratio`` times the original
+    attempts in it, plus ``min_per_second`` times its length so that
+    clients with little traffic can still retry. One budget can be shared
+    by any number of transports and threads.
+
+    Args:
+        ratio (float): Retries allowed per original attempt, e.g. ``0.1``.
+        min_per_second (float): Retries allowed per second regardless of
+            traffic.
+        window (float): The length of the window, in seconds.
+    """
+
+    _SLOTS = 10
+
+    def __init__(
+        self, ratio: float = 0.1, *, min_per_second: float = 10.0, window: float = 10.0
+    ) -> None:
+        if ratio < 0 or min_per_second < 0 or window <= 0:
+            raise ValueError("Expected ratio >= 0, min_per_second >= 0, window > 0.")
+        self._ratio = ratio
+        self._reserve = min_per_second * window
+        self._width = window / self._SLOTS
+        self._lock = threading.Lock()
+        self._slots: collections.deque = collections.deque()
+        self._originals = 0
+        self._retries = 0
+
+    def _current(self) -> list:
+        slot = int(time.monotonic() // self._width)
+        while self._slots and self._slots[0][0] <= slot - self._SLOTS:
+            _, originals, retries = self._slots.popleft()
+            self._originals -= originals
+            self._retries -= retries
+        if not self._slots or self._slots[-1][0] != slot:
+            self._slots.append([slot, 0, 0])
+        return self._slots[-1]
+
+    @property
+    def available(self) -> float:
+        """The retries that could be sent right now."""
+        with self._lock:
+            self._current()
+            return max(
+                0.0, self._ratio * self._originals + self._reserve - self._retries
+            )
+
+    def record_original(self) -> None:
+        """Count an original attempt."""
+        with self._lock:
+            self._current()[1] += 1
+            self._originals += 1
+
+    def try_retry(self) -> bool:
+        """Count a retry if the budget allows it.
+
+        Returns:
+            bool: Whether the retry may be sent.
+        """
+        with self._lock:
+            slot = self._current()
+            if self._retries + 1 > self._ratio * self._originals + self._reserve:
+                return False
+            slot[2] += 1
+            self._retries += 1
+            return True
+
+
+PROCESS_RETRY_BUDGET = RetryBudget()
+"""The budget shared by every :class:`ResiliencePolicy` not given another."""
+
+
+class CircuitBreaker:
+    """Fails fast while a method keeps failing.
+
+    The breaker starts ``closed``. After ``failure_threshold`` consecutive
+    failed attempts it opens and rejects attempts for ``reset_timeout``
+    seconds. It is then ``half_open``: up to ``half_open_probes`` attempts
+    go through at a time, and the first result decides whether it closes
+    or opens again.
+
+    Args:
+        failure_threshold (int): Consecutive failures that open the
+            breaker.
+        reset_timeout (float): Seconds the breaker stays open.
+        half_open_probes (int): Attempts allowed at once while half-open.
+        failure_codes (Iterable[grpc.StatusCode]): The status codes that
+            count as failures. Any other outcome counts as a success, since
+            the backend answered.
+    """
+
+    def __init__(
+        self,
+        *,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        half_open_probes: int = 1,
+        failure_codes: Iterable[grpc.StatusCode] = DEFAULT_FAILURE_CODES,
+    ) -> None:
+        if failure_threshold < 1 or half_open_probes < 1:
+            raise ValueError("failure_threshold and half_open_probes must be positive.")
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+        self._half_open_probes = half_open_probes
+        self._failure_codes = frozenset(code.name for code in failure_codes)
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._failures = 0
+        self._opened = 0.0
+        self._probes = 0
+
+    @property
+    def state(self) -> str:
+        """``"closed"``, ``"open"`` or ``"half_open"``."""
+        with self._lock:
+            if self._state == OPEN and self._retry_in() <= 0:
+                return HALF_OPEN
+            return self._state
+
+    def _retry_in(self) -> float:
+        return self._opened + self._reset_timeout - time.monotonic()
+
+    def _open(self) -> None:
+        self._state = OPEN
+        self._opened = time.monotonic()
+        self._probes = 0
+
+    def is_failure(self, exc: BaseException) -> bool:
+        """Whether an attempt's error counts as a failure."""
+        return metrics.status_name(exc) in self._failure_codes
+
+    def admit(self) -> Optional[str]:
+        """Ask to send an attempt.
+
+        Returns:
+            Optional[str]: ``None`` if the attempt must not be sent, or
+            the state it was admitted in, to pass to :meth:`record`.
+        """
+        with self._lock:
+            if self._state == CLOSED:
+                return CLOSED
+            if self._state == OPEN:
+                if self._retry_in() > 0:
+                    return None
+                self._state = HALF_OPEN
+            if self._probes >= self._half_open_probes:
+                return None
+            self._probes += 1
+            return HALF_OPEN
+
+    def record(self, admitted: str, failed: Optional[bool]) -> None:
+        """Record the outcome of an admitted attempt.
+
+        Args:
+            admitted (str): What :meth:`admit` returned.
+            failed (Optional[bool]): Whether the attempt failed, or
+                ``None`` if it ended without an answer, e.g. cancelled.
+        """
+        with self._lock:
+            if admitted == HALF_OPEN:
+                self._probes = max(0, self._probes - 1)
+                if self._state != HALF_OPEN or failed is None:
+                    return
+                if failed:
+                    self._open()
+                else:
+                    self._state = CLOSED
+                    self._failures = 0
+            elif self._state == CLOSED:
+                # Attempts admitted before the breaker opened do not count.
+                if failed:
+                    self._failures += 1
+                    if self._failures >= self._failure_threshold:
+                        self._open()
+                elif failed is False:
+                    self._failures = 0
+
+    def error(self, key: wrapping.MethodKey) -> CircuitOpenError:
+        """Return the error raised for an attempt that was not admitted."""
+        with self._lock:
+            retry_in = max(0.0, self._retry_in())
+        return CircuitOpenError(
+            "Circuit open for {}/{}; retry in {:.1f}s.".format(
+                key.service, key.method, retry_in
+            )
+        )
+
+
+class _CallState:
+    __slots__ = ("attempts", "last_error")
+
+    def __init__(self):
+        self.attempts = 0
+        self.last_error = None
+
+
+_CALL = wrapping.context_var("talent_resilience_call")
+
+
+class ResiliencePolicy(wrapping.MethodInterceptor):
+    """Applies a retry budget and per-method circuit breakers.
+
+    Args:
+        retry_budget (Optional[~.RetryBudget]): The budget for retries.
+            Defaults to :data:`PROCESS_RETRY_BUDGET`; ``None`` disables it.
+        circuit_breaker (Optional[Callable[[], ~.CircuitBreaker]]): Builds
+            the breaker of each method, e.g.
+            ``functools.partial(CircuitBreaker, failure_threshold=10)``.
+            ``None`` disables circuit breaking.
+    """
+
+    def __init__(
+        self,
+        *,
+        retry_budget: Optional[RetryBudget] = PROCESS_RETRY_BUDGET,
+        circuit_breaker: Optional[Callable[[], CircuitBreaker]] = CircuitBreaker,
+    ) -> None:
+        self.retry_budget = retry_budget
+        self._circuit_breaker = circuit_breaker
+        self._breakers: Dict[wrapping.MethodKey, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def breaker(self, key: wrapping.MethodKey) -> Optional[CircuitBreaker]:
+        """Return the breaker of a method, creating it on first use."""
+        if self._circuit_breaker is None:
+            return None
+        with self._lock:
+            breaker = self._breakers.get(key)
+            if breaker is None:
+                breaker = self._breakers[key] = self._circuit_breaker()
+            return breaker
+
+    def wrap_call(
+        self, key: wrapping.MethodKey, func: Callable, asyncio: bool
+    ) -> Callable:
+        if asyncio:
+
+            async def call(*args, **kwargs):
+                token = _CALL.set(_CallState())
+                try:
+                    return await func(*args, **kwargs)
+                finally:
+                    _CALL.reset(token)
+
+            return call
+
+        def call(*args, **kwargs):
+            token = _CALL.set(_CallState())
+            try:
+                return func(*args, **kwargs)
+            finally:
+                _CALL.reset(token)
+
+        return call
+
+    def _admit(self, key, breaker, state):
+        if self.retry_budget is not None:
+            if state is None or not state.attempts:
+                self.retry_budget.record_original()
+            elif not self.retry_budget.try_retry():
+                last = state.last_error
+                if isinstance(last, grpc.RpcError):
+                    last = exceptions.from_grpc_error(last)
+                raise RetryBudgetExhausted(
+                    "Retry budget exhausted for {}/{}; last error: {}".format(
+                        key.service, key.method, last
+                    ),
+                    errors=(last,),
+                )
+        if state is not None:
+            state.attempts += 1
+        if breaker is None:
+            return None
+        admitted = breaker.admit()
+        if admitted is None:
+            raise breaker.error(key)
+        return admitted
+
+    @staticmethod
+    def _settle(breaker, admitted, state, exc):
+        if state is not None:
+            state.last_error = exc
+        if admitted is not None:
+            if exc is None:
+                breaker.record(admitted, False)
+            elif isinstance(exc, Exception):
+                breaker.record(admitted, breaker.is_failure(exc))
+            else:
+                breaker.record(admitted, None)
+
+    def wrap_attempt(
+        self, key: wrapping.MethodKey, func: Callable, asyncio: bool
+    ) -> Callable:
+        breaker = self.breaker(key)
+        if asyncio:
+
+            def attempt(request, **kwargs):
+                state = _CALL.get()
+
+                async def complete():
+                    admitted = self._admit(key, breaker, state)
+                    try:
+                        response = await func(request, **kwargs)
+                    except BaseException as exc:
+                        self._settle(breaker, admitted, state, exc)
+                        raise
+                    self._settle(breaker, admitted, state, None)
+                    return response
+
+                return complete()
+
+            return attempt
+
+        def attempt(request, **kwargs):
+            state = _CALL.get()
+            admitted = self._admit(key, breaker, state)
+            try:
+                response = func(request, **kwargs)
+            except BaseException as exc:
+                self._settle(breaker, admitted, state, exc)
+                raise
+            self._settle(breaker, admitted, state, None)
+            return response
+
+        return attempt
+
+
+__all__ = (
+    "CLOSED",
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "DEFAULT_FAILURE_CODES",
+    "HALF_OPEN",
+    "OPEN",
+    "PROCESS_RETRY_BUDGET",
+    "ResiliencePolicy",
+    "RetryBudget",
+    "RetryBudgetExhausted",
+)
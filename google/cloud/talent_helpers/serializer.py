@@ -0,0 +1,359 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Fast proto3 JSON encoding of Talent messages.
+
+:class:`JsonSerializer` produces the same JSON as
+``google.protobuf.json_format`` for v4 and v4beta1 messages, but
+precomputes, per message type, the JSON key and value converter of
+every field, including the enum value names of fields such as
+``EmploymentType`` or ``JobCategory``. Encoding then walks the fields
+set on the underlying protobuf without any per-field reflection::
+
+    serializer = JsonSerializer(
+        job_service.SearchJobsResponse,
+        fields=["matching_jobs.job.name", "matching_jobs.job.title"],
+    )
+    body = serializer.to_json(response)
+
+Without ``fields``, ``to_json`` returns exactly
+``json.dumps(json_format.MessageToDict(message), separators=(",", ":"),
+ensure_ascii=False)`` under the same options. With ``backend="orjson"``
+the document is encoded by orjson, if installed, which is faster; it
+parses to the same value, but floats with exponents are written
+differently (``1e16`` rather than ``1e+16``).
+"""
+
+import base64
+import functools
+import json
+import math
+import struct
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+from google.protobuf import descriptor as descriptor_lib  # type: ignore
+from google.protobuf import json_format  # type: ignore
+
+_FieldDescriptor = descriptor_lib.FieldDescriptor
+
+_INT64_TYPES = frozenset(
+    (_FieldDescriptor.CPPTYPE_INT64, _FieldDescriptor.CPPTYPE_UINT64)
+)
+
+# Messages json_format gives a special JSON form that needs no options.
+_JSON_STRING_TYPES = frozenset(
+    (
+        "google.protobuf.Duration",
+        "google.protobuf.FieldMask",
+        "google.protobuf.Timestamp",
+    )
+)
+
+# The other messages with a special JSON form, left to json_format.
+_JSON_FORMAT_TYPES = frozenset(
+    (
+        "google.protobuf.Any",
+        "google.protobuf.ListValue",
+        "google.protobuf.Struct",
+        "google.protobuf.Value",
+    )
+)
+
+_FLOAT = struct.Struct("<f")
+
+# A field subset: field name -> subset of that field's message, where
+# None selects the whole field.
+_Subset = Optional[Dict[str, "_Subset"]]
+
+_ENCODE_JSON = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False).encode
+
+
+def _double(value):
+    if math.isinf(value):
+        return "-Infinity" if value < 0 else "Infinity"
+    if math.isnan(value):
+        return "NaN"
+    return value
+
+
+def _float(value):
+    if math.isinf(value) or math.isnan(value):
+        return _double(value)
+    # The shortest decimal that reads back as the same 32-bit float.
+    for precision in range(6, 10):
+        rounded = float("{0:.{1}g}".format(value, precision))
+        if _FLOAT.unpack(_FLOAT.pack(rounded))[0] == value:
+            return rounded
+    return value
+
+
+def _int64(value):
+    return str(value)
+
+
+def _bytes(value):
+    return base64.b64encode(value).decode("utf-8")
+
+
+def _map_key(key) -> str:
+    if isinstance(key, bool):
+        return "true" if key else "false"
+    return str(key)
+
+
+def _parse_fields(fields: Iterable[str]) -> Tuple:
+    tree: dict = {}
+    for path in fields:
+        node = tree
+        parts = path.split(".")
+        for index, part in enumerate(parts):
+            last = index == len(parts) - 1
+            if last:
+                node[part] = None
+            elif node.get(part, ()) is None:
+                break
+            else:
+                node = node.setdefault(part, {})
+    return _freeze(tree)
+
+
+def _freeze(tree) -> Tuple:
+    # A hashable form of a subset, so encoders can be cached by it.
+    return tuple(
+        sorted(
+            (name, None if child is None else _freeze(child))
+            for name, child in tree.items()
+        )
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _message_encoder(descriptor, options_key, subset) -> Callable:
+    full_name = descriptor.full_name
+    if full_name in _JSON_STRING_TYPES:
+        return lambda message: message.ToJsonString()
+    if descriptor.file.name == "google/protobuf/wrappers.proto":
+        convert = _value_encoder(descriptor.fields_by_name["value"], options_key)
+        return lambda message: convert(message.value)
+    if full_name in _JSON_FORMAT_TYPES:
+        preserving, integers = options_key
+        return functools.partial(
+            json_format.MessageToDict,
+            preserving_proto_field_name=preserving,
+            use_integers_for_enums=integers,
+        )
+    return _RegularEncoder(descriptor, options_key, subset)
+
+
+@functools.lru_cache(maxsize=None)
+def _value_encoder(field, options_key, subset=None) -> Callable:
+    cpp_type = field.cpp_type
+    if cpp_type == _FieldDescriptor.CPPTYPE_MESSAGE:
+        return _message_encoder(field.message_type, options_key, subset)
+    if cpp_type == _FieldDescriptor.CPPTYPE_ENUM:
+        if options_key[1]:
+            return int
+        if field.enum_type.full_name == "google.protobuf.NullValue":
+            return lambda value: None
+        names = {value.number: value.name for value in field.enum_type.values}
+        return lambda value: names.get(value, value)
+    if cpp_type == _FieldDescriptor.CPPTYPE_STRING:
+        return _bytes if field.type == _FieldDescriptor.TYPE_BYTES else str
+    if cpp_type == _FieldDescriptor.CPPTYPE_BOOL:
+        return bool
+    if cpp_type in _INT64_TYPES:
+        return _int64
+    if cpp_type == _FieldDescriptor.CPPTYPE_DOUBLE:
+        return _double
+    if cpp_type == _FieldDescriptor.CPPTYPE_FLOAT:
+        return _float
+    return int
+
+
+def _field_encoder(field, options_key, subset) -> Callable:
+    message_type = field.message_type
+    if message_type is not None and message_type.GetOptions().map_entry:
+        convert = _value_encoder(
+            message_type.fields_by_name["value"], options_key, subset
+        )
+        return lambda value: {_map_key(k): convert(v) for k, v in value.items()}
+    convert = _value_encoder(field, options_key, subset)
+    if field.label == _FieldDescriptor.LABEL_REPEATED:
+        if convert in (str, int, bool):
+            return list
+        return lambda value: [convert(item) for item in value]
+    return convert
+
+
+class _RegularEncoder:
+    """Encodes the set fields of one message type.
+
+    The field table is built on first use, so recursive message types do
+    not recurse while building encoders.
+    """
+
+    def __init__(self, descriptor, options_key, subset) -> None:
+        self._descriptor = descriptor
+        self._options_key = options_key
+        self._subset = subset
+        self._table: Optional[Dict[int, Tuple[str, Callable]]] = None
+
+    def _build(self) -> Dict[int, Tuple[str, Callable]]:
+        if self._subset is None:
+            selected = [(field, None) for field in self._descriptor.fields]
+        else:
+            fields = self._descriptor.fields_by_name
+            selected = [(fields[name], child) for name, child in self._subset]
+        preserving = self._options_key[0]
+        return {
+            field.number: (
+                field.name if preserving else field.json_name,
+                _field_encoder(field, self._options_key, child),
+            )
+            for field, child in selected
+        }
+
+    def __call__(self, message) -> dict:
+        table = self._table
+        if table is None:
+            table = self._table = self._build()
+        result = {}
+        for field, value in message.ListFields():
+            entry = table.get(field.number)
+            if entry is not None:
+                result[entry[0]] = entry[1](value)
+        return result
+
+
+class JsonSerializer:
+    """Encodes one message type as proto3 JSON.
+
+    Args:
+        message_type (type): A proto-plus or protobuf message class, e.g.
+            ``job.Job`` or ``job_service.SearchJobsResponse``.
+        fields (Optional[Iterable[str]]): Dotted field paths, using proto
+            field names, to include, e.g. ``"matching_jobs.job.title"``.
+            Paths through repeated and map fields apply to every element.
+            By default every set field is included.
+        preserving_proto_field_name (bool): Use proto field names rather
+            than lowerCamelCase JSON names.
+        use_integers_for_enums (bool): Encode enums as numbers rather than
+            value names.
+        backend (str): ``"json"`` for the standard library or ``"orjson"``.
+
+    Raises:
+        ValueError: If a field path does not exist.
+        ImportError: If ``backend`` is ``"orjson"`` and it is not
+            installed.
+    """
+
+    def __init__(
+        self,
+        message_type,
+        *,
+        fields: Optional[Iterable[str]] = None,
+        preserving_proto_field_name: bool = False,
+        use_integers_for_enums: bool = False,
+        backend: str = "json",
+    ) -> None:
+        pb = getattr(message_type, "pb", None)
+        descriptor = (pb() if pb is not None else message_type).DESCRIPTOR
+        options_key = (bool(preserving_proto_field_name), bool(use_integers_for_enums))
+        subset = None
+        if fields is not None:
+            subset = _parse_fields(fields)
+            _check_subset(descriptor, subset)
+        self._encode_message = _message_encoder(descriptor, options_key, subset)
+        if backend == "orjson":
+            import orjson  # type: ignore
+
+            self._dumps = orjson.dumps
+        elif backend == "json":
+            self._dumps = None
+        else:
+            raise ValueError("Unknown JSON backend: {!r}".format(backend))
+
+    def to_dict(self, message) -> dict:
+        """Return the JSON object of a message as Python values."""
+        pb = getattr(type(message), "pb", None)
+        if pb is not None:
+            message = pb(message)
+        return self._encode_message(message)
+
+    def to_json(self, message) -> str:
+        """Return the compact JSON text of a message."""
+        if self._dumps is None:
+            return _ENCODE_JSON(self.to_dict(message))
+        return self._dumps(self.to_dict(message)).decode("utf-8")
+
+    def to_json_bytes(self, message) -> bytes:
+        """Return the compact JSON of a message as UTF-8 bytes."""
+        if self._dumps is None:
+            return _ENCODE_JSON(self.to_dict(message)).encode("utf-8")
+        return self._dumps(self.to_dict(message))
+
+
+def _check_subset(descriptor, subset) -> None:
+    for name, child in subset:
+        field = descriptor.fields_by_name.get(name)
+        if field is None:
+            raise ValueError("{} has no field {!r}.".format(descriptor.full_name, name))
+        if child is None:
+            continue
+        message_type = field.message_type
+        if message_type is not None and message_type.GetOptions().map_entry:
+            message_type = message_type.fields_by_name["value"].message_type
+        if message_type is None:
+            raise ValueError(
+                "{}.{} is not a message field.".format(descriptor.full_name, name)
+            )
+        _check_subset(message_type, child)
+
+
+@functools.lru_cache(maxsize=256)
+def _serializer(message_type, fields, preserving, integers, backend):
+    return JsonSerializer(
+        message_type,
+        fields=fields,
+        preserving_proto_field_name=preserving,
+        use_integers_for_enums=integers,
+        backend=backend,
+    )
+
+
+def to_json(
+    message,
+    *,
+    fields: Optional[Iterable[str]] = None,
+    preserving_proto_field_name: bool = False,
+    use_integers_for_enums: bool = False,
+    backend: str = "json",
+) -> str:
+    """Encode a message with a cached :class:`JsonSerializer`.
+
+    Takes the same keyword arguments as :class:`JsonSerializer`.
+    """
+    return _serializer(
+        type(message),
+        None if fields is None else tuple(fields),
+        preserving_proto_field_name,
+        use_integers_for_enums,
+        backend,
+    ).to_json(message)
+
+
+__all__ = ("JsonSerializer", "to_json")
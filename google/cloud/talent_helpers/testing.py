@@ -0,0 +1,1036 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""An in-process fake of the Talent v4 API and the v4beta1 ProfileService.
+
+The fake speaks real gRPC over a local port, so the generated transports
+exercise the same serialization and channel code paths they use against
+production. It is meant for offline load testing and benchmarking, not as
+a faithful model of the service's ranking or geocoding behavior.
+
+Example::
+
+    from google.cloud.talent_helpers import FakeTalentServer
+    from google.cloud.talent_v4.services.job_service import JobServiceClient
+    from google.cloud.talent_v4.services.job_service import transports
+
+    with FakeTalentServer(latency=0.002) as server:
+        client = JobServiceClient(
+            transport=transports.JobServiceGrpcTransport(channel=server.channel())
+        )
+        client.search_jobs(request={"parent": "projects/p/tenants/t"})
+"""
+
+import collections
+import hashlib
+import itertools
+import random
+import re
+import threading
+import time
+from concurrent import futures
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
+
+import grpc  # type: ignore
+from grpc.experimental import aio  # type: ignore
+
+from google.api_core import exceptions  # type: ignore
+from google.longrunning import operations_pb2  # type: ignore
+from google.protobuf import empty_pb2  # type: ignore
+from google.protobuf import timestamp_pb2  # type: ignore
+from google.rpc import status_pb2  # type: ignore
+
+from google.cloud.talent_helpers import filtering
+from google.cloud.talent_v4.types import common
+from google.cloud.talent_v4.types import company
+from google.cloud.talent_v4.types import company_service
+from google.cloud.talent_v4.types import completion_service
+from google.cloud.talent_v4.types import event
+from google.cloud.talent_v4.types import event_service
+from google.cloud.talent_v4.types import job
+from google.cloud.talent_v4.types import job_service
+from google.cloud.talent_v4.types import tenant
+from google.cloud.talent_v4.types import tenant_service
+from google.cloud.talent_v4beta1.types import profile
+from google.cloud.talent_v4beta1.types import profile_service
+
+
+_JobView = job_service.JobView
+_FILTER_TERM = re.compile(r'(\w+)\s*=\s*"((?:[^"\\]|\\.)*)"')
+_HISTOGRAM_COUNT = re.compile(r"^\s*count\(\s*(\w+)\s*\)\s*$")
+
+# Jobs created without posting_expire_time expire after 30 days.
+_DEFAULT_EXPIRY = 30 * 24 * 60 * 60
+
+# Handlers that only read the state; they run without the server lock so
+# concurrent calls are served concurrently.
+_READ_ONLY = frozenset(
+    (
+        "get_tenant",
+        "list_tenants",
+        "get_company",
+        "list_companies",
+        "get_job",
+        "list_jobs",
+        "search_jobs",
+        "search_jobs_for_alert",
+        "get_operation",
+        "get_profile",
+        "list_profiles",
+        "complete_query",
+    )
+)
+
+# Job fields returned for each reduced job view, mirroring the
+# documentation on ``google.cloud.talent.v4.JobView``.
+_VIEW_FIELDS = {
+    _JobView.JOB_VIEW_ID_ONLY: ("name", "requisition_id", "language_code"),
+    _JobView.JOB_VIEW_MINIMAL: (
+        "name",
+        "requisition_id",
+        "title",
+        "company",
+        "derived_info",
+        "language_code",
+    ),
+    _JobView.JOB_VIEW_SMALL: (
+        "name",
+        "requisition_id",
+        "title",
+        "company",
+        "derived_info",
+        "language_code",
+        "visibility",
+        "description",
+    ),
+}
+
+
+def _now() -> timestamp_pb2.Timestamp:
+    now = timestamp_pb2.Timestamp()
+    now.GetCurrentTime()
+    return now
+
+
+def _geocode(address: str):
+    """Resolve an address to a deterministic, made-up location."""
+    digest = hashlib.sha1(address.strip().lower().encode("utf-8")).digest()
+    location = common.Location.pb()(
+        location_type=common.Location.LocationType.LOCALITY, radius_miles=10.0,
+    )
+    location.lat_lng.latitude = digest[0] / 255.0 * 180.0 - 90.0
+    location.lat_lng.longitude = digest[1] / 255.0 * 360.0 - 180.0
+    location.postal_address.address_lines.append(address)
+    return location
+
+
+def _paginate(items: list, page_token: str, page_size: int) -> Tuple[list, str]:
+    try:
+        start = int(page_token) if page_token else 0
+    except ValueError:
+        raise exceptions.InvalidArgument("Invalid page token: %r" % page_token)
+    end = start + page_size
+    return items[start:end], (str(end) if end < len(items) else "")
+
+
+def _updated(stored, update, update_mask):
+    # Stored messages are never changed in place: handlers that only read
+    # run without the lock and may be serializing them.
+    updated = type(stored)()
+    updated.CopyFrom(stored)
+    if update_mask.paths:
+        try:
+            update_mask.MergeMessage(
+                update, updated, replace_message_field=True, replace_repeated_field=True
+            )
+        except ValueError as exc:
+            raise exceptions.InvalidArgument(str(exc))
+    else:
+        updated.CopyFrom(update)
+        updated.name = stored.name
+    return updated
+
+
+def _filter_terms(text: str) -> Dict[str, str]:
+    return {
+        field: filtering.unquote(value) for field, value in _FILTER_TERM.findall(text)
+    }
+
+
+def _values(collection: Dict[str, Any]) -> list:
+    # ``list`` copies the values without running Python code, so no writer
+    # can resize the dict half way through.
+    return list(collection.values())
+
+
+def _project_job(source, job_view: int):
+    fields = _VIEW_FIELDS.get(job_view)
+    if fields is None:
+        return source
+    projected = job.Job.pb()()
+    for field in fields:
+        if field == "derived_info":
+            projected.derived_info.locations.extend(source.derived_info.locations)
+        else:
+            setattr(projected, field, getattr(source, field))
+    return projected
+
+
+class _Fault:
+    def __init__(self, exception, method, rate, count):
+        self.exception = exception
+        self.method = method
+        self.rate = rate
+        self.remaining = count
+
+
+class _State:
+    """In-memory resources of the fake server, stored as raw protobufs."""
+
+    def __init__(self):
+        self.tenants: Dict[str, object] = collections.OrderedDict()
+        self.companies: Dict[str, object] = collections.OrderedDict()
+        self.jobs: Dict[str, object] = collections.OrderedDict()
+        self.profiles: Dict[str, object] = collections.OrderedDict()
+        self.job_keys: Dict[Tuple[str, str, str], str] = {}
+        self.events: List[object] = []
+        self.operations: Dict[str, object] = {}
+        self.ids = itertools.count(1)
+
+    def new_name(self, parent: str, collection: str) -> str:
+        return "{}/{}/{}".format(parent, collection, next(self.ids))
+
+
+class FakeTalentServer:
+    """An in-process gRPC server implementing the Talent v4 services.
+
+    ``JobService``, ``CompanyService``, ``TenantService``, ``EventService``,
+    ``Completion`` and the ``google.longrunning.Operations`` methods used by
+    the batch job RPCs are served from in-memory state, as are the v4beta1
+    ``ProfileService`` CRUD methods.
+
+    Args:
+        latency (float): Artificial delay, in seconds, added to every RPC.
+            Use :meth:`set_latency` for per-method values.
+        jitter (float): Upper bound, in seconds, of an additional uniformly
+            distributed delay.
+        max_workers (int): Size of the server's handler thread pool.
+        seed (Optional[int]): Seed for jitter and fault injection, so runs
+            can be reproduced.
+        host (str): The interface to bind; a free port is picked on start.
+    """
+
+    def __init__(
+        self,
+        *,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        max_workers: int = 16,
+        seed: Optional[int] = None,
+        host: str = "localhost",
+    ) -> None:
+        self._latency: Dict[Optional[str], float] = {None: latency}
+        self._jitter = jitter
+        self._max_workers = max_workers
+        self._random = random.Random(seed)
+        self._host = host
+        self._faults: List[_Fault] = []
+        # ``_lock`` guards the stored resources and is held by the handlers
+        # that change them; ``_control_lock`` guards latency, faults and
+        # call counts.
+        self._lock = threading.RLock()
+        self._control_lock = threading.Lock()
+        self._state = _State()
+        self._server = None
+        self.port: Optional[int] = None
+        self.calls: collections.Counter = collections.Counter()
+
+    @property
+    def endpoint(self) -> str:
+        """The ``host:port`` address the server is listening on."""
+        if self.port is None:
+            raise RuntimeError("The server has not been started.")
+        return "{}:{}".format(self._host, self.port)
+
+    def start(self) -> "FakeTalentServer":
+        """Start serving on a free local port."""
+        server = grpc.server(futures.ThreadPoolExecutor(max_workers=self._max_workers))
+        server.add_generic_rpc_handlers(self._handlers())
+        self.port = server.add_insecure_port("{}:0".format(self._host))
+        server.start()
+        self._server = server
+        return self
+
+    def stop(self, grace: Optional[float] = None) -> None:
+        """Stop serving, optionally letting in-flight RPCs finish."""
+        if self._server is not None:
+            self._server.stop(grace).wait()
+            self._server = None
+
+    def __enter__(self) -> "FakeTalentServer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.stop()
+
+    def channel(self, *, asyncio: bool = False):
+        """Return an insecure channel connected to the server.
+
+        Args:
+            asyncio (bool): Return a ``grpc.experimental.aio`` channel, for
+                use with the ``*GrpcAsyncIOTransport`` classes. It must be
+                created from within the event loop that will use it.
+
+        Returns:
+            Union[grpc.Channel, aio.Channel]: The channel, suitable for the
+            ``channel`` argument of any v4 gRPC transport.
+        """
+        if asyncio:
+            return aio.insecure_channel(self.endpoint)
+        return grpc.insecure_channel(self.endpoint)
+
+    def set_latency(self, seconds: float, method: Optional[str] = None) -> None:
+        """Set the artificial latency of one method, or of every method.
+
+        Args:
+            seconds (float): The delay to add before handling the RPC.
+            method (Optional[str]): The snake_case method name, as used on
+                the transports (e.g. ``"search_jobs"``). ``None`` changes
+                the default for methods without their own setting.
+        """
+        with self._control_lock:
+            self._latency[method] = seconds
+
+    def inject_fault(
+        self,
+        exception: Type[exceptions.GoogleAPICallError] = exceptions.ServiceUnavailable,
+        *,
+        method: Optional[str] = None,
+        rate: float = 1.0,
+        count: Optional[int] = None,
+    ) -> None:
+        """Make RPCs fail with the status code of ``exception``.
+
+        Args:
+            exception (Type[google.api_core.exceptions.GoogleAPICallError]):
+                The error to raise on the client, such as
+                ``ServiceUnavailable`` or ``ResourceExhausted``.
+            method (Optional[str]): Restrict the fault to one snake_case
+                method name. ``None`` applies it to every method.
+            rate (float): Probability in ``[0, 1]`` that a matching RPC fails.
+            count (Optional[int]): Stop injecting after this many failures.
+        """
+        with self._control_lock:
+            self._faults.append(_Fault(exception, method, rate, count))
+
+    def clear_faults(self) -> None:
+        """Remove every injected fault."""
+        with self._control_lock:
+            self._faults = []
+
+    def reset(self) -> None:
+        """Drop all stored resources, call counts and faults."""
+        with self._lock, self._control_lock:
+            self._state = _State()
+            self._faults = []
+            self.calls.clear()
+
+    def _handlers(self):
+        table = (
+            (
+                "google.cloud.talent.v4.JobService",
+                (
+                    ("CreateJob", "create_job", job_service.CreateJobRequest, job.Job),
+                    (
+                        "BatchCreateJobs",
+                        "batch_create_jobs",
+                        job_service.BatchCreateJobsRequest,
+                        operations_pb2.Operation,
+                    ),
+                    ("GetJob", "get_job", job_service.GetJobRequest, job.Job),
+                    ("UpdateJob", "update_job", job_service.UpdateJobRequest, job.Job),
+                    (
+                        "BatchUpdateJobs",
+                        "batch_update_jobs",
+                        job_service.BatchUpdateJobsRequest,
+                        operations_pb2.Operation,
+                    ),
+                    (
+                        "DeleteJob",
+                        "delete_job",
+                        job_service.DeleteJobRequest,
+                        empty_pb2.Empty,
+                    ),
+                    (
+                        "BatchDeleteJobs",
+                        "batch_delete_jobs",
+                        job_service.BatchDeleteJobsRequest,
+                        operations_pb2.Operation,
+                    ),
+                    (
+                        "ListJobs",
+                        "list_jobs",
+                        job_service.ListJobsRequest,
+                        job_service.ListJobsResponse,
+                    ),
+                    (
+                        "SearchJobs",
+                        "search_jobs",
+                        job_service.SearchJobsRequest,
+                        job_service.SearchJobsResponse,
+                    ),
+                    (
+                        "SearchJobsForAlert",
+                        "search_jobs_for_alert",
+                        job_service.SearchJobsRequest,
+                        job_service.SearchJobsResponse,
+                    ),
+                ),
+            ),
+            (
+                "google.cloud.talent.v4.CompanyService",
+                (
+                    (
+                        "CreateCompany",
+                        "create_company",
+                        company_service.CreateCompanyRequest,
+                        company.Company,
+                    ),
+                    (
+                        "GetCompany",
+                        "get_company",
+                        company_service.GetCompanyRequest,
+                        company.Company,
+                    ),
+                    (
+                        "UpdateCompany",
+                        "update_company",
+                        company_service.UpdateCompanyRequest,
+                        company.Company,
+                    ),
+                    (
+                        "DeleteCompany",
+                        "delete_company",
+                        company_service.DeleteCompanyRequest,
+                        empty_pb2.Empty,
+                    ),
+                    (
+                        "ListCompanies",
+                        "list_companies",
+                        company_service.ListCompaniesRequest,
+                        company_service.ListCompaniesResponse,
+                    ),
+                ),
+            ),
+            (
+                "google.cloud.talent.v4.TenantService",
+                (
+                    (
+                        "CreateTenant",
+                        "create_tenant",
+                        tenant_service.CreateTenantRequest,
+                        tenant.Tenant,
+                    ),
+                    (
+                        "GetTenant",
+                        "get_tenant",
+                        tenant_service.GetTenantRequest,
+                        tenant.Tenant,
+                    ),
+                    (
+                        "UpdateTenant",
+                        "update_tenant",
+                        tenant_service.UpdateTenantRequest,
+                        tenant.Tenant,
+                    ),
+                    (
+                        "DeleteTenant",
+                        "delete_tenant",
+                        tenant_service.DeleteTenantRequest,
+                        empty_pb2.Empty,
+                    ),
+                    (
+                        "ListTenants",
+                        "list_tenants",
+                        tenant_service.ListTenantsRequest,
+                        tenant_service.ListTenantsResponse,
+                    ),
+                ),
+            ),
+            (
+                "google.cloud.talent.v4.EventService",
+                (
+                    (
+                        "CreateClientEvent",
+                        "create_client_event",
+                        event_service.CreateClientEventRequest,
+                        event.ClientEvent,
+                    ),
+                ),
+            ),
+            (
+                "google.cloud.talent.v4.Completion",
+                (
+                    (
+                        "CompleteQuery",
+                        "complete_query",
+                        completion_service.CompleteQueryRequest,
+                        completion_service.CompleteQueryResponse,
+                    ),
+                ),
+            ),
+            (
+                "google.cloud.talent.v4beta1.ProfileService",
+                (
+                    (
+                        "CreateProfile",
+                        "create_profile",
+                        profile_service.CreateProfileRequest,
+                        profile.Profile,
+                    ),
+                    (
+                        "GetProfile",
+                        "get_profile",
+                        profile_service.GetProfileRequest,
+                        profile.Profile,
+                    ),
+                    (
+                        "UpdateProfile",
+                        "update_profile",
+                        profile_service.UpdateProfileRequest,
+                        profile.Profile,
+                    ),
+                    (
+                        "DeleteProfile",
+                        "delete_profile",
+                        profile_service.DeleteProfileRequest,
+                        empty_pb2.Empty,
+                    ),
+                    (
+                        "ListProfiles",
+                        "list_profiles",
+                        profile_service.ListProfilesRequest,
+                        profile_service.ListProfilesResponse,
+                    ),
+                ),
+            ),
+            (
+                "google.longrunning.Operations",
+                (
+                    (
+                        "GetOperation",
+                        "get_operation",
+                        operations_pb2.GetOperationRequest,
+                        operations_pb2.Operation,
+                    ),
+                ),
+            ),
+        )
+
+        handlers = []
+        for service, methods in table:
+            rpcs = {}
+            for rpc, name, request_type, response_type in methods:
+                # The server works on raw protobufs; proto-plus wrapping is
+                # only paid for on the client side being measured.
+                request_pb = getattr(request_type, "pb", lambda: request_type)()
+                response_pb = getattr(response_type, "pb", lambda: response_type)()
+                rpcs[rpc] = grpc.unary_unary_rpc_method_handler(
+                    self._wrap(name, getattr(self, "_" + name)),
+                    request_deserializer=request_pb.FromString,
+                    response_serializer=response_pb.SerializeToString,
+                )
+            handlers.append(grpc.method_handlers_generic_handler(service, rpcs))
+        return handlers
+
+    def _wrap(self, name: str, impl: Callable) -> Callable:
+        def handler(request, context):
+            with self._control_lock:
+                self.calls[name] += 1
+                delay = self._latency.get(name, self._latency[None])
+                if self._jitter:
+                    delay += self._random.uniform(0.0, self._jitter)
+                fault = self._pick_fault(name)
+            if delay:
+                time.sleep(delay)
+            if fault is not None:
+                context.abort(
+                    fault.grpc_status_code, "Injected fault for {}.".format(name)
+                )
+            try:
+                if name in _READ_ONLY:
+                    return impl(request)
+                with self._lock:
+                    return impl(request)
+            except exceptions.GoogleAPICallError as exc:
+                context.abort(exc.grpc_status_code, exc.message)
+
+        return handler
+
+    def _pick_fault(self, name: str):
+        for fault in self._faults:
+            if fault.method not in (None, name):
+                continue
+            if fault.remaining is not None and fault.remaining <= 0:
+                continue
+            if self._random.random() < fault.rate:
+                if fault.remaining is not None:
+                    fault.remaining -= 1
+                return fault.exception
+        return None
+
+    def _get(self, collection: Dict[str, object], name: str):
+        try:
+            return collection[name]
+        except KeyError:
+            raise exceptions.NotFound("Resource not found: {}".format(name))
+
+    # TenantService
+
+    def _create_tenant(self, request):
+        if not request.tenant.external_id:
+            raise exceptions.InvalidArgument("Tenant.external_id is required.")
+        for existing in self._state.tenants.values():
+            if existing.external_id == request.tenant.external_id:
+                raise exceptions.AlreadyExists(
+                    "Tenant already exists: {}".format(existing.name)
+                )
+        created = tenant.Tenant.pb()()
+        created.CopyFrom(request.tenant)
+        created.name = self._state.new_name(request.parent, "tenants")
+        self._state.tenants[created.name] = created
+        return created
+
+    def _get_tenant(self, request):
+        return self._get(self._state.tenants, request.name)
+
+    def _update_tenant(self, request):
+        stored = self._get(self._state.tenants, request.tenant.name)
+        updated = _updated(stored, request.tenant, request.update_mask)
+        self._state.tenants[updated.name] = updated
+        return updated
+
+    def _delete_tenant(self, request):
+        self._get(self._state.tenants, request.name)
+        del self._state.tenants[request.name]
+        return empty_pb2.Empty()
+
+    def _list_tenants(self, request):
+        tenants = [
+            t
+            for t in _values(self._state.tenants)
+            if t.name.startswith(request.parent + "/")
+        ]
+        page, token = _paginate(tenants, request.page_token, request.page_size or 100)
+        return tenant_service.ListTenantsResponse.pb()(
+            tenants=page, next_page_token=token
+        )
+
+    # CompanyService
+
+    def _create_company(self, request):
+        if not request.company.display_name or not request.company.external_id:
+            raise exceptions.InvalidArgument(
+                "Company.display_name and Company.external_id are required."
+            )
+        for existing in self._state.companies.values():
+            if (
+                existing.name.startswith(request.parent + "/")
+                and existing.external_id == request.company.external_id
+            ):
+                raise exceptions.AlreadyExists(
+                    "Company already exists: {}".format(existing.name)
+                )
+        created = company.Company.pb()()
+        created.CopyFrom(request.company)
+        created.name = self._state.new_name(request.parent, "companies")
+        self._state.companies[created.name] = created
+        return created
+
+    def _get_company(self, request):
+        return self._get(self._state.companies, request.name)
+
+    def _update_company(self, request):
+        stored = self._get(self._state.companies, request.company.name)
+        updated = _updated(stored, request.company, request.update_mask)
+        self._state.companies[updated.name] = updated
+        return updated
+
+    def _delete_company(self, request):
+        self._get(self._state.companies, request.name)
+        if any(j.company == request.name for j in self._state.jobs.values()):
+            raise exceptions.FailedPrecondition(
+                "Company still has open jobs: {}".format(request.name)
+            )
+        del self._state.companies[request.name]
+        return empty_pb2.Empty()
+
+    def _list_companies(self, request):
+        companies = [
+            c
+            for c in _values(self._state.companies)
+            if c.name.startswith(request.parent + "/")
+        ]
+        if request.require_open_jobs:
+            with_jobs = {j.company for j in _values(self._state.jobs)}
+            companies = [c for c in companies if c.name in with_jobs]
+        page, token = _paginate(companies, request.page_token, request.page_size or 100)
+        return company_service.ListCompaniesResponse.pb()(
+            companies=page, next_page_token=token
+        )
+
+    # JobService
+
+    def _insert_job(self, parent: str, source):
+        if not (
+            source.company
+            and source.requisition_id
+            and source.title
+            and source.description
+        ):
+            raise exceptions.InvalidArgument(
+                "Job.company, Job.requisition_id, Job.title and "
+                "Job.description are required."
+            )
+        key = (source.company, source.requisition_id, source.language_code)
+        if key in self._state.job_keys:
+            raise exceptions.AlreadyExists(
+                "Job already exists: {}".format(self._state.job_keys[key])
+            )
+        created = job.Job.pb()()
+        created.CopyFrom(source)
+        created.name = self._state.new_name(parent, "jobs")
+        created.posting_create_time.CopyFrom(_now())
+        created.posting_update_time.CopyFrom(created.posting_create_time)
+        if not source.HasField("posting_expire_time"):
+            created.posting_expire_time.FromSeconds(
+                created.posting_create_time.seconds + _DEFAULT_EXPIRY
+            )
+        if source.company in self._state.companies:
+            created.company_display_name = self._state.companies[
+                source.company
+            ].display_name
+        for address in source.addresses:
+            created.derived_info.locations.append(_geocode(address))
+        self._state.jobs[created.name] = created
+        self._state.job_keys[key] = created.name
+        return created
+
+    def _replace_job(self, update, update_mask):
+        stored = self._get(self._state.jobs, update.name)
+        old_key = (stored.company, stored.requisition_id, stored.language_code)
+        updated = _updated(stored, update, update_mask)
+        updated.posting_update_time.CopyFrom(_now())
+        del self._state.job_keys[old_key]
+        key = (updated.company, updated.requisition_id, updated.language_code)
+        self._state.job_keys[key] = updated.name
+        self._state.jobs[updated.name] = updated
+        return updated
+
+    def _remove_job(self, name: str) -> None:
+        stored = self._get(self._state.jobs, name)
+        del self._state.jobs[name]
+        del self._state.job_keys[
+            (stored.company, stored.requisition_id, stored.language_code)
+        ]
+
+    def _create_job(self, request):
+        return self._insert_job(request.parent, request.job)
+
+    def _get_job(self, request):
+        return self._get(self._state.jobs, request.name)
+
+    def _update_job(self, request):
+        return self._replace_job(request.job, request.update_mask)
+
+    def _delete_job(self, request):
+        self._remove_job(request.name)
+        return empty_pb2.Empty()
+
+    def _batch(self, parent: str, items, apply: Callable, response_type):
+        response = response_type.pb()()
+        for item in items:
+            result = response.job_results.add()
+            try:
+                result.job.CopyFrom(
+                    _project_job(apply(item), _JobView.JOB_VIEW_MINIMAL)
+                )
+            except exceptions.GoogleAPICallError as exc:
+                if isinstance(item, str):
+                    result.job.name = item
+                else:
+                    result.job.CopyFrom(item)
+                result.status.CopyFrom(
+                    status_pb2.Status(
+                        code=exc.grpc_status_code.value[0], message=exc.message
+                    )
+                )
+
+        failures = sum(1 for r in response.job_results if r.status.code)
+        metadata = common.BatchOperationMetadata.pb()(
+            state=common.BatchOperationMetadata.State.SUCCEEDED,
+            success_count=len(response.job_results) - failures,
+            failure_count=failures,
+            total_count=len(response.job_results),
+        )
+        metadata.create_time.CopyFrom(_now())
+        metadata.update_time.CopyFrom(metadata.create_time)
+        metadata.end_time.CopyFrom(metadata.create_time)
+
+        operation = operations_pb2.Operation(
+            name="{}/operations/{}".format(parent, next(self._state.ids)), done=True
+        )
+        operation.metadata.Pack(metadata)
+        operation.response.Pack(response)
+        self._state.operations[operation.name] = operation
+        return operation
+
+    def _batch_create_jobs(self, request):
+        return self._batch(
+            request.parent,
+            request.jobs,
+            lambda j: self._insert_job(request.parent, j),
+            job_service.BatchCreateJobsResponse,
+        )
+
+    def _batch_update_jobs(self, request):
+        return self._batch(
+            request.parent,
+            request.jobs,
+            lambda j: self._replace_job(j, request.update_mask),
+            job_service.BatchUpdateJobsResponse,
+        )
+
+    def _batch_delete_jobs(self, request):
+        def delete(name):
+            stored = self._get(self._state.jobs, name)
+            self._remove_job(name)
+            return stored
+
+        return self._batch(
+            request.parent, request.names, delete, job_service.BatchDeleteJobsResponse,
+        )
+
+    def _get_operation(self, request):
+        return self._get(self._state.operations, request.name)
+
+    def _list_jobs(self, request):
+        terms = _filter_terms(request.filter)
+        if "companyName" not in terms:
+            raise exceptions.InvalidArgument("The filter must include companyName.")
+        if terms.get("status", "OPEN") == "EXPIRED":
+            jobs = []
+        else:
+            jobs = [
+                j
+                for j in _values(self._state.jobs)
+                if j.name.startswith(request.parent + "/jobs/")
+                and j.company == terms["companyName"]
+                and terms.get("requisitionId", j.requisition_id) == j.requisition_id
+            ]
+        limit = 1000 if request.job_view == _JobView.JOB_VIEW_ID_ONLY else 100
+        page_size = request.page_size if 0 < request.page_size <= limit else 100
+        page, token = _paginate(jobs, request.page_token, page_size)
+        return job_service.ListJobsResponse.pb()(
+            jobs=[
+                _project_job(j, request.job_view or _JobView.JOB_VIEW_FULL)
+                for j in page
+            ],
+            next_page_token=token,
+        )
+
+    def _matches(self, query, candidate) -> bool:
+        text = "{} {}".format(candidate.title, candidate.description).lower()
+        if any(word not in text for word in query.query.lower().split()):
+            return False
+        if query.companies and candidate.company not in query.companies:
+            return False
+        if (
+            query.company_display_names
+            and candidate.company_display_name not in query.company_display_names
+        ):
+            return False
+        if query.employment_types and not set(query.employment_types) & set(
+            candidate.employment_types
+        ):
+            return False
+        if query.language_codes and candidate.language_code not in query.language_codes:
+            return False
+        return candidate.name not in query.excluded_jobs
+
+    def _search_jobs(self, request):
+        matches = [
+            j
+            for j in _values(self._state.jobs)
+            if j.name.startswith(request.parent + "/jobs/")
+            and self._matches(request.job_query, j)
+        ]
+        response = job_service.SearchJobsResponse.pb()(total_size=len(matches))
+
+        page_size = request.max_page_size if 0 < request.max_page_size <= 100 else 10
+        start = request.offset
+        if request.page_token:
+            try:
+                start = int(request.page_token)
+            except ValueError:
+                raise exceptions.InvalidArgument(
+                    "Invalid page token: %r" % request.page_token
+                )
+        page, token = _paginate(matches, str(start), page_size)
+        response.next_page_token = token
+
+        job_view = request.job_view or _JobView.JOB_VIEW_SMALL
+        for found in page:
+            matching = response.matching_jobs.add()
+            matching.job.CopyFrom(_project_job(found, job_view))
+            matching.job_title_snippet = found.title
+            matching.job_summary = found.description[:200]
+
+        for location_filter in request.job_query.location_filters:
+            if location_filter.address:
+                response.location_filters.append(_geocode(location_filter.address))
+            elif location_filter.HasField("lat_lng"):
+                resolved = response.location_filters.add()
+                resolved.lat_lng.CopyFrom(location_filter.lat_lng)
+                resolved.radius_miles = location_filter.distance_in_miles
+
+        for query in request.histogram_queries:
+            result = response.histogram_query_results.add(
+                histogram_query=query.histogram_query
+            )
+            match = _HISTOGRAM_COUNT.match(query.histogram_query)
+            field = match and job.Job.pb().DESCRIPTOR.fields_by_name.get(match.group(1))
+            if not field:
+                continue
+            for found in matches:
+                value = getattr(found, field.name)
+                if field.label != field.LABEL_REPEATED:
+                    value = [value]
+                for key in value:
+                    if field.enum_type is not None:
+                        key = field.enum_type.values_by_number[key].name
+                    if key != "":
+                        result.histogram[str(key)] += 1
+        return response
+
+    def _search_jobs_for_alert(self, request):
+        return self._search_jobs(request)
+
+    # EventService
+
+    def _create_client_event(self, request):
+        created = event.ClientEvent.pb()()
+        created.CopyFrom(request.client_event)
+        if not created.HasField("create_time"):
+            created.create_time.CopyFrom(_now())
+        self._state.events.append((request.parent, created))
+        return created
+
+    @property
+    def events(self) -> List[event.ClientEvent]:
+        """The client events recorded so far."""
+        with self._lock:
+            return [event.ClientEvent(e) for _, e in self._state.events]
+
+    # ProfileService (v4beta1)
+
+    def _create_profile(self, request):
+        external_id = request.profile.external_id
+        for existing in self._state.profiles.values():
+            if (
+                external_id
+                and existing.name.startswith(request.parent + "/")
+                and existing.external_id == external_id
+            ):
+                raise exceptions.AlreadyExists(
+                    "Profile already exists: {}".format(existing.name)
+                )
+        created = profile.Profile.pb()()
+        created.CopyFrom(request.profile)
+        created.name = self._state.new_name(request.parent, "profiles")
+        created.create_time.CopyFrom(_now())
+        created.update_time.CopyFrom(created.create_time)
+        self._state.profiles[created.name] = created
+        return created
+
+    def _get_profile(self, request):
+        return self._get(self._state.profiles, request.name)
+
+    def _update_profile(self, request):
+        stored = self._get(self._state.profiles, request.profile.name)
+        updated = _updated(stored, request.profile, request.update_mask)
+        updated.create_time.CopyFrom(stored.create_time)
+        updated.update_time.CopyFrom(_now())
+        self._state.profiles[updated.name] = updated
+        return updated
+
+    def _delete_profile(self, request):
+        self._get(self._state.profiles, request.name)
+        del self._state.profiles[request.name]
+        return empty_pb2.Empty()
+
+    def _list_profiles(self, request):
+        terms = _filter_terms(request.filter)
+        if "externalId" in terms and "groupId" in terms:
+            raise exceptions.InvalidArgument(
+                "externalId and groupId cannot be specified at the same time."
+            )
+        profiles = [
+            p
+            for p in _values(self._state.profiles)
+            if p.name.startswith(request.parent + "/profiles/")
+            and terms.get("externalId", p.external_id) == p.external_id
+            and terms.get("groupId", p.group_id) == p.group_id
+        ]
+        page_size = request.page_size if 0 < request.page_size <= 100 else 100
+        page, token = _paginate(profiles, request.page_token, page_size)
+        return profile_service.ListProfilesResponse.pb()(
+            profiles=page, next_page_token=token
+        )
+
+    # Completion
+
+    def _complete_query(self, request):
+        if not 0 < request.page_size <= 100:
+            raise exceptions.InvalidArgument("page_size must be between 1 and 100.")
+        prefix = request.query.lower()
+        kinds = completion_service.CompleteQueryRequest.CompletionType
+        want_titles = request.type_ in (kinds.JOB_TITLE, kinds.COMBINED, 0)
+        want_companies = request.type_ in (kinds.COMPANY_NAME, kinds.COMBINED)
+
+        candidates = collections.OrderedDict()
+        if want_titles:
+            for found in _values(self._state.jobs):
+                if found.name.startswith(request.tenant + "/") and (
+                    not request.company or found.company == request.company
+                ):
+                    candidates.setdefault(found.title, kinds.JOB_TITLE)
+        if want_companies:
+            for found in _values(self._state.companies):
+                if found.name.startswith(request.tenant + "/"):
+                    candidates.setdefault(found.display_name, kinds.COMPANY_NAME)
+
+        response = completion_service.CompleteQueryResponse.pb()()
+        for suggestion, kind in candidates.items():
+            if len(response.completion_results) >= request.page_size:
+                break
+            if suggestion.lower().startswith(prefix):
+                response.completion_results.add(suggestion=suggestion, type_=kind)
+        return response
+
+
+__all__ = ("FakeTalentServer",)
@@ -0,0 +1,250 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Idempotent creation of v4 jobs.
+
+A job is identified within its tenant by ``company``, ``requisition_id``
+and ``language_code``. :func:`upsert_job` creates it, and when the service
+answers ``ALREADY_EXISTS`` it looks the stored job up with ``list_jobs``
+and updates it if its content differs::
+
+    result = upsert_job(client, tenant, job)
+    print(result.action, result.job.name)
+
+Calling it twice with the same job leaves one job behind, so unlike
+``create_job`` it is safe to retry after a timeout: a create that reached
+the service before the client gave up is found and reconciled. For the
+same reason the create and update requests are retried on
+``UNAVAILABLE`` and ``DEADLINE_EXCEEDED`` by default.
+:func:`upsert_job_async` does the same with a ``JobServiceAsyncClient``.
+"""
+
+import collections
+from typing import Any, Optional, Sequence, Tuple
+
+from google.api_core import exceptions  # type: ignore
+from google.api_core import gapic_v1  # type: ignore
+from google.api_core import retry as retries  # type: ignore
+from google.api_core import retry_async  # type: ignore
+from google.protobuf import field_mask_pb2  # type: ignore
+
+from google.cloud.talent_helpers import filtering
+from google.cloud.talent_v4.types import job as gct_job
+from google.cloud.talent_v4.types import job_service
+
+
+UpsertResult = collections.namedtuple("UpsertResult", ["job", "action"])
+UpsertResult.__doc__ = """The outcome of :func:`upsert_job`.
+
+``job`` is the stored job. ``action`` is ``"created"``, ``"updated"`` or
+``"unchanged"`` (a job with the same key and content already existed)."""
+
+_RETRYABLE = retries.if_exception_type(
+    exceptions.ServiceUnavailable, exceptions.DeadlineExceeded,
+)
+
+DEFAULT_RETRY = retries.Retry(
+    initial=0.1, maximum=60.0, multiplier=1.3, predicate=_RETRYABLE
+)
+"""The retry of the create and update requests sent by :func:`upsert_job`."""
+
+DEFAULT_ASYNC_RETRY = retry_async.AsyncRetry(
+    initial=0.1, maximum=60.0, multiplier=1.3, predicate=_RETRYABLE
+)
+"""The retry of the create and update requests sent by
+:func:`upsert_job_async`."""
+
+# Fields the service sets; they never count as a difference.
+_OUTPUT_ONLY = frozenset(
+    (
+        "company_display_name",
+        "derived_info",
+        "posting_create_time",
+        "posting_update_time",
+    )
+)
+
+
+def _lookup_request(parent: str, job) -> job_service.ListJobsRequest:
+    return job_service.ListJobsRequest(
+        parent=parent,
+        filter="companyName = {} AND requisitionId = {}".format(
+            filtering.quote(job.company), filtering.quote(job.requisition_id)
+        ),
+        job_view=job_service.JobView.JOB_VIEW_FULL,
+    )
+
+
+def _not_found(job) -> exceptions.NotFound:
+    return exceptions.NotFound(
+        "Job with requisition_id {!r} conflicted but was not found.".format(
+            job.requisition_id
+        )
+    )
+
+
+def _matches(job, found) -> bool:
+    # The service fills in a missing language code, so it matches any.
+    return not job.language_code or job.language_code == found.language_code
+
+
+def _update_for(job, found, update_mask) -> Optional[Tuple[gct_job.Job, Any]]:
+    """Return the update that makes ``found`` match ``job``, if one is needed.
+
+    Without ``update_mask`` only the fields set on ``job`` are compared
+    and updated, so fields the service filled in keep their values.
+    """
+    source = gct_job.Job.pb(job)
+    stored = gct_job.Job.pb(found)
+    if update_mask is None:
+        update_mask = field_mask_pb2.FieldMask(
+            paths=[
+                field.name
+                for field, _ in source.ListFields()
+                if field.name not in _OUTPUT_ONLY and field.name != "name"
+            ]
+        )
+    merged = type(stored)()
+    merged.CopyFrom(stored)
+    update_mask.MergeMessage(
+        source, merged, replace_message_field=True, replace_repeated_field=True
+    )
+    if not source.language_code:
+        merged.language_code = stored.language_code
+    if merged == stored:
+        return None
+    update = type(source)()
+    update.CopyFrom(source)
+    update.name = stored.name
+    update.language_code = merged.language_code
+    return gct_job.Job(update), update_mask
+
+
+def _options(retry, timeout, metadata, default_retry):
+    if retry is gapic_v1.method.DEFAULT:
+        retry = default_retry
+    return {"retry": retry, "timeout": timeout, "metadata": metadata}
+
+
+def upsert_job(
+    client,
+    parent: str,
+    job: Any,
+    *,
+    update_mask: Optional[field_mask_pb2.FieldMask] = None,
+    retry: retries.Retry = gapic_v1.method.DEFAULT,
+    timeout: float = gapic_v1.method.DEFAULT,
+    metadata: Sequence[Tuple[str, str]] = (),
+) -> UpsertResult:
+    """Create a job, or update the stored job with the same key.
+
+    Args:
+        client (~.JobServiceClient): A v4 client.
+        parent (str): The tenant, e.g. ``"projects/p/tenants/t"``.
+        job (Union[~.job.Job, dict]): The job. ``company`` and
+            ``requisition_id`` identify the stored job on conflict.
+        update_mask (Optional[~.field_mask.FieldMask]): Limits the update
+            of an existing job, and the comparison deciding whether one is
+            needed, to these fields. Defaults to the fields set on ``job``.
+        retry (google.api_core.retry.Retry): Designation of what errors, if
+            any, should be retried. Defaults to :data:`DEFAULT_RETRY` for
+            the create and update requests and to the method default for
+            the lookup.
+        timeout (float): The timeout for each request.
+        metadata (Sequence[Tuple[str, str]]): Strings which should be
+            sent along with each request as metadata.
+
+    Returns:
+        ~.UpsertResult: The stored job and what was done to it.
+
+    Raises:
+        google.api_core.exceptions.NotFound: If the job conflicted but no
+            job with its key could be found, e.g. because it was deleted
+            in between.
+        google.api_core.exceptions.GoogleAPICallError: If a request fails.
+    """
+    job = gct_job.Job(job)
+    write = _options(retry, timeout, metadata, DEFAULT_RETRY)
+    try:
+        created = client.create_job(parent=parent, job=job, **write)
+        return UpsertResult(created, "created")
+    except exceptions.AlreadyExists:
+        pass
+    pager = client.list_jobs(
+        request=_lookup_request(parent, job),
+        retry=retry,
+        timeout=timeout,
+        metadata=metadata,
+    )
+    for found in pager:
+        if _matches(job, found):
+            break
+    else:
+        raise _not_found(job)
+    update = _update_for(job, found, update_mask)
+    if update is None:
+        return UpsertResult(found, "unchanged")
+    updated = client.update_job(job=update[0], update_mask=update[1], **write)
+    return UpsertResult(updated, "updated")
+
+
+async def upsert_job_async(
+    client,
+    parent: str,
+    job: Any,
+    *,
+    update_mask: Optional[field_mask_pb2.FieldMask] = None,
+    retry: retries.Retry = gapic_v1.method.DEFAULT,
+    timeout: float = gapic_v1.method.DEFAULT,
+    metadata: Sequence[Tuple[str, str]] = (),
+) -> UpsertResult:
+    """Like :func:`upsert_job`, with a ``JobServiceAsyncClient``.
+
+    The create and update requests default to :data:`DEFAULT_ASYNC_RETRY`.
+    """
+    job = gct_job.Job(job)
+    write = _options(retry, timeout, metadata, DEFAULT_ASYNC_RETRY)
+    try:
+        created = await client.create_job(parent=parent, job=job, **write)
+        return UpsertResult(created, "created")
+    except exceptions.AlreadyExists:
+        pass
+    pager = await client.list_jobs(
+        request=_lookup_request(parent, job),
+        retry=retry,
+        timeout=timeout,
+        metadata=metadata,
+    )
+    async for found in pager:
+        if _matches(job, found):
+            break
+    else:
+        raise _not_found(job)
+    update = _update_for(job, found, update_mask)
+    if update is None:
+        return UpsertResult(found, "unchanged")
+    updated = await client.update_job(job=update[0], update_mask=update[1], **write)
+    return UpsertResult(updated, "updated")
+
+
+__all__ = (
+    "DEFAULT_ASYNC_RETRY",
+    "DEFAULT_RETRY",
+    "UpsertResult",
+    "upsert_job",
+    "upsert_job_async",
+)
@@ -0,0 +1,253 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Method wrapping shared by the v4 and v4beta1 transports.
+
+Each transport builds its ``_wrapped_methods`` through :func:`wrap_method`,
+which applies the usual ``google.api_core.gapic_v1`` retry, timeout and
+error mapping, and layers any :class:`MethodInterceptor` configured on the
+transport around it:
+
+* *attempt* wrappers sit below the retry logic and see every RPC sent on
+  the wire, with raw ``grpc.RpcError`` failures;
+* *call* wrappers sit above it and see one invocation per client call,
+  with ``google.api_core.exceptions`` failures.
+
+The gRPC transports also pass their stubs' request serializers and response
+deserializers through :func:`wrap_codec`, so interceptors can observe
+serialization separately from the time spent on the network.
+"""
+
+import collections
+import threading
+from typing import Callable, Sequence
+
+try:
+    import contextvars
+except ImportError:  # Python 3.6
+    contextvars = None
+
+from grpc.experimental import aio  # type: ignore
+
+from google.api_core import gapic_v1  # type: ignore
+
+
+MethodKey = collections.namedtuple("MethodKey", ["service", "method"])
+MethodKey.__doc__ = """Identifies a wrapped method, e.g.
+``MethodKey("google.cloud.talent.v4.JobService", "search_jobs")``."""
+
+
+class MethodInterceptor:
+    """Base class for per-transport method interceptors.
+
+    Subclasses override either hook; the defaults return the callable
+    unchanged, which adds no overhead.
+    """
+
+    def wrap_attempt(self, key: MethodKey, func: Callable, asyncio: bool) -> Callable:
+        """Wrap the stub invoked once per attempt.
+
+        Args:
+            key (~.MethodKey): The method being wrapped.
+            func (Callable): Takes the request and the stub's keyword
+                arguments. When ``asyncio`` is true it returns an awaitable.
+            asyncio (bool): Whether the transport uses ``grpc.aio``.
+
+        Returns:
+            Callable: A callable with the same signature as ``func``.
+        """
+        return func
+
+    def wrap_call(self, key: MethodKey, func: Callable, asyncio: bool) -> Callable:
+        """Wrap the fully wrapped method invoked once per client call.
+
+        Args:
+            key (~.MethodKey): The method being wrapped.
+            func (Callable): Accepts the request plus ``retry``, ``timeout``
+                and ``metadata``. When ``asyncio`` is true it returns an
+                awaitable.
+            asyncio (bool): Whether the transport uses ``grpc.aio``.
+
+        Returns:
+            Callable: A callable with the same signature as ``func``.
+        """
+        return func
+
+    def wrap_serializer(self, func: Callable) -> Callable:
+        """Wrap a stub's request serializer.
+
+        Args:
+            func (Callable): Turns a request message into ``bytes``.
+
+        Returns:
+            Callable: A callable with the same signature as ``func``.
+        """
+        return func
+
+    def wrap_deserializer(self, func: Callable) -> Callable:
+        """Wrap a stub's response deserializer.
+
+        Args:
+            func (Callable): Turns ``bytes`` into a response message.
+
+        Returns:
+            Callable: A callable with the same signature as ``func``.
+        """
+        return func
+
+
+class _ThreadLocalVar:
+    """Stands in for ``contextvars.ContextVar`` on Python 3.6.
+
+    Values are kept per thread, so coroutines running concurrently on one
+    event loop share them.
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self._local = threading.local()
+
+    def get(self):
+        return getattr(self._local, "value", None)
+
+    def set(self, value):
+        token = (self.get(),)
+        self._local.value = value
+        return token
+
+    def reset(self, token) -> None:
+        self._local.value = token[0]
+
+
+def context_var(name: str):
+    """Return a variable holding per-call state for an interceptor.
+
+    Args:
+        name (str): The variable's name.
+
+    Returns:
+        A ``contextvars.ContextVar`` defaulting to ``None``, or a
+        thread-local equivalent where ``contextvars`` is unavailable.
+    """
+    if contextvars is None:
+        return _ThreadLocalVar(name)
+    return contextvars.ContextVar(name, default=None)
+
+
+class _AsyncStub(aio.UnaryUnaryMultiCallable):
+    """Presents intercepted attempts as a ``grpc.aio`` unary stub.
+
+    ``google.api_core`` only applies unary error mapping to instances of
+    ``aio.UnaryUnaryMultiCallable``; anything else is treated as a stream.
+    """
+
+    def __init__(self, func: Callable) -> None:
+        self._func = func
+
+    def __call__(self, request, **kwargs):
+        return self._func(request, **kwargs)
+
+
+def wrap_method(
+    func: Callable,
+    *,
+    service: str,
+    method: str,
+    default_retry=None,
+    default_timeout=None,
+    client_info: gapic_v1.client_info.ClientInfo = gapic_v1.client_info.DEFAULT_CLIENT_INFO,
+    interceptors: Sequence[MethodInterceptor] = (),
+    method_config=None,
+) -> Callable:
+    """Wrap a transport stub with common behavior and interceptors.
+
+    Args:
+        func (Callable): The gRPC stub, synchronous or ``grpc.aio``.
+        service (str): The fully-qualified service name.
+        method (str): The snake_case method name used on the transport.
+        default_retry (Optional[google.api_core.retry.Retry]): The retry
+            applied when the caller does not pass one.
+        default_timeout (Optional[float]): The timeout applied when the
+            caller does not pass one.
+        client_info (google.api_core.gapic_v1.client_info.ClientInfo):
+            Client info sent along with every request.
+        interceptors (Sequence[~.MethodInterceptor]): Applied in order, so
+            the first interceptor is closest to the wire.
+        method_config (Optional[~.method_config.MethodConfig]): Overrides
+            ``default_retry`` and ``default_timeout``.
+
+    Returns:
+        Callable: The wrapped method, taking optional ``retry``, ``timeout``
+        and ``metadata`` arguments. Its ``default_retry`` and
+        ``default_timeout`` attributes hold those used when the caller
+        passes none.
+    """
+    key = MethodKey(service, method)
+    asyncio = isinstance(func, aio.UnaryUnaryMultiCallable)
+    if method_config is not None:
+        default_retry, default_timeout = method_config.resolve(
+            key, default_retry, default_timeout, asyncio
+        )
+
+    attempt = func
+    for interceptor in interceptors:
+        attempt = interceptor.wrap_attempt(key, attempt, asyncio)
+    if asyncio and attempt is not func:
+        attempt = _AsyncStub(attempt)
+
+    gapic_method = gapic_v1.method_async if asyncio else gapic_v1.method
+    wrapped = gapic_method.wrap_method(
+        attempt,
+        default_retry=default_retry,
+        default_timeout=default_timeout,
+        client_info=client_info,
+    )
+    for interceptor in interceptors:
+        wrapped = interceptor.wrap_call(key, wrapped, asyncio)
+    wrapped.default_retry = default_retry
+    wrapped.default_timeout = default_timeout
+    return wrapped
+
+
+def wrap_codec(
+    func: Callable, *, serializer: bool, interceptors: Sequence[MethodInterceptor] = ()
+) -> Callable:
+    """Wrap a stub's request serializer or response deserializer.
+
+    Args:
+        func (Callable): The serializer or deserializer.
+        serializer (bool): Whether ``func`` is a request serializer.
+        interceptors (Sequence[~.MethodInterceptor]): Applied in order.
+
+    Returns:
+        Callable: ``func`` itself when no interceptor wraps it.
+    """
+    for interceptor in interceptors:
+        if serializer:
+            func = interceptor.wrap_serializer(func)
+        else:
+            func = interceptor.wrap_deserializer(func)
+    return func
+
+
+__all__ = (
+    "MethodInterceptor",
+    "MethodKey",
+    "context_var",
+    "wrap_codec",
+    "wrap_method",
+)
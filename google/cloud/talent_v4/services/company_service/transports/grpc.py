@@ -22,6 +22,11 @@ from google.api_core import grpc_helpers  # type: ignore
 from google.api_core import gapic_v1  # type: ignore
 from google import auth  # type: ignore
 from google.auth import credentials  # type: ignore
+from google.cloud.talent_helpers import metrics as metrics_lib  # type: ignore
+from google.cloud.talent_helpers import profiling  # type: ignore
+from google.cloud.talent_helpers import compression as compression_lib  # type: ignore
+from google.cloud.talent_helpers import resilience as resilience_lib  # type: ignore
+from google.cloud.talent_helpers import method_config as method_config_lib  # type: ignore
 from google.auth.transport.grpc import SslCredentials  # type: ignore
 
 import grpc  # type: ignore
@@ -63,6 +68,11 @@ class CompanyServiceGrpcTransport(CompanyServiceTransport):
         ssl_channel_credentials: grpc.ChannelCredentials = None,
         quota_project_id: Optional[str] = None,
         client_info: gapic_v1.client_info.ClientInfo = DEFAULT_CLIENT_INFO,
+        metrics: Optional[metrics_lib.MetricsRecorder] = None,
+        profiler: Optional[profiling.CallProfiler] = None,
+        compression: Optional[compression_lib.CompressionPolicy] = None,
+        resilience: Optional[resilience_lib.ResiliencePolicy] = None,
+        method_config: Optional[method_config_lib.MethodConfig] = None,
     ) -> None:
         """Instantiate the transport.
 
@@ -98,6 +108,23 @@ class CompanyServiceGrpcTransport(CompanyServiceTransport):
                 API requests. If ``None``, then default info will be used.	
                 Generally, you only need to set this if you're developing	
                 your own client library.
+            metrics (Optional[google.cloud.talent_helpers.metrics.MetricsRecorder]):
+                A recorder for per-method latency, retry, status code and
+                payload size metrics. If ``None``, nothing is recorded.
+            profiler (Optional[google.cloud.talent_helpers.profiling.CallProfiler]):
+                A profiler reporting how long each call spends building,
+                serializing, on the network, deserializing and retrying.
+                If ``None``, calls are not profiled.
+            compression (Optional[google.cloud.talent_helpers.compression.CompressionPolicy]):
+                Chooses the gRPC compression of each request by method
+                and size. If ``None``, requests are not compressed.
+            resilience (Optional[google.cloud.talent_helpers.resilience.ResiliencePolicy]):
+                Applies a retry budget and per-method circuit breakers
+                to every call. If ``None``, retries are only bounded by
+                each method's retry policy.
+            method_config (Optional[google.cloud.talent_helpers.method_config.MethodConfig]):
+                Overrides the default timeout and retry of each
+                method. If ``None``, the generated defaults apply.
 
         Raises:
           google.auth.exceptions.MutualTLSChannelError: If mutual TLS transport
@@ -176,6 +203,11 @@ class CompanyServiceGrpcTransport(CompanyServiceTransport):
             scopes=scopes or self.AUTH_SCOPES,
             quota_project_id=quota_project_id,
             client_info=client_info,
+            metrics=metrics,
+            profiler=profiler,
+            compression=compression,
+            resilience=resilience,
+            method_config=method_config,
         )
 
     @classmethod
@@ -254,8 +286,12 @@ class CompanyServiceGrpcTransport(CompanyServiceTransport):
         if "create_company" not in self._stubs:
             self._stubs["create_company"] = self.grpc_channel.unary_unary(
                 "/google.cloud.talent.v4.CompanyService/CreateCompany",
-                request_serializer=company_service.CreateCompanyRequest.serialize,
-                response_deserializer=gct_company.Company.deserialize,
+                request_serializer=self._wrap_serializer(
+                    company_service.CreateCompanyRequest.serialize
+                ),
+                response_deserializer=self._wrap_deserializer(
+                    gct_company.Company.deserialize
+                ),
             )
         return self._stubs["create_company"]
 
@@ -280,8 +316,12 @@ class CompanyServiceGrpcTransport(CompanyServiceTransport):
         if "get_company" not in self._stubs:
             self._stubs["get_company"] = self.grpc_channel.unary_unary(
                 "/google.cloud.talent.v4.CompanyService/GetCompany",
-                request_serializer=company_service.GetCompanyRequest.serialize,
-                response_deserializer=company.Company.deserialize,
+                request_serializer=self._wrap_serializer(
+                    company_service.GetCompanyRequest.serialize
+                ),
+                response_deserializer=self._wrap_deserializer(
+                    company.Company.deserialize
+                ),
             )
         return self._stubs["get_company"]
 
@@ -306,8 +346,12 @@ class CompanyServiceGrpcTransport(CompanyServiceTransport):
         if "update_company" not in self._stubs:
             self._stubs["update_company"] = self.grpc_channel.unary_unary(
                 "/google.cloud.talent.v4.CompanyService/UpdateCompany",
-                request_serializer=company_service.UpdateCompanyRequest.serialize,
-                response_deserializer=gct_company.Company.deserialize,
+                request_serializer=self._wrap_serializer(
+                    company_service.UpdateCompanyRequest.serialize
+                ),
+                response_deserializer=self._wrap_deserializer(
+                    gct_company.Company.deserialize
+                ),
             )
         return self._stubs["update_company"]
 
@@ -334,8 +378,10 @@ class CompanyServiceGrpcTransport(CompanyServiceTransport):
         if "delete_company" not in self._stubs:
             self._stubs["delete_company"] = self.grpc_channel.unary_unary(
                 "/google.cloud.talent.v4.CompanyService/DeleteCompany",
-                request_serializer=company_service.DeleteCompanyRequest.serialize,
-                response_deserializer=empty.Empty.FromString,
+                request_serializer=self._wrap_serializer(
+                    company_service.DeleteCompanyRequest.serialize
+                ),
+                response_deserializer=self._wrap_deserializer(empty.Empty.FromString),
             )
         return self._stubs["delete_company"]
 
@@ -362,8 +408,12 @@ class CompanyServiceGrpcTransport(CompanyServiceTransport):
         if "list_companies" not in self._stubs:
             self._stubs["list_companies"] = self.grpc_channel.unary_unary(
                 "/google.cloud.talent.v4.CompanyService/ListCompanies",
-                request_serializer=company_service.ListCompaniesRequest.serialize,
-                response_deserializer=company_service.ListCompaniesResponse.deserialize,
+                request_serializer=self._wrap_serializer(
+                    company_service.ListCompaniesRequest.serialize
+                ),
+                response_deserializer=self._wrap_deserializer(
+                    company_service.ListCompaniesResponse.deserialize
+                ),
             )
         return self._stubs["list_companies"]
 
@@ -22,6 +22,11 @@ from google.api_core import gapic_v1  # type: ignore
 from google.api_core import grpc_helpers_async  # type: ignore
 from google import auth  # type: ignore
 from google.auth import credentials  # type: ignore
+from google.cloud.talent_helpers import metrics as metrics_lib  # type: ignore
+from google.cloud.talent_helpers import profiling  # type: ignore
+from google.cloud.talent_helpers import compression as compression_lib  # type: ignore
+from google.cloud.talent_helpers import resilience as resilience_lib  # type: ignore
+from google.cloud.talent_helpers import method_config as method_config_lib  # type: ignore
 from google.auth.transport.grpc import SslCredentials  # type: ignore
 
 import grpc  # type: ignore
@@ -107,6 +112,11 @@ class CompanyServiceGrpcAsyncIOTransport(CompanyServiceTransport):
         ssl_channel_credentials: grpc.ChannelCredentials = None,
         quota_project_id=None,
         client_info: gapic_v1.client_info.ClientInfo = DEFAULT_CLIENT_INFO,
+        metrics: Optional[metrics_lib.MetricsRecorder] = None,
+        profiler: Optional[profiling.CallProfiler] = None,
+        compression: Optional[compression_lib.CompressionPolicy] = None,
+        resilience: Optional[resilience_lib.ResiliencePolicy] = None,
+        method_config: Optional[method_config_lib.MethodConfig] = None,
     ) -> None:
         """Instantiate the transport.
 
@@ -143,6 +153,23 @@ class CompanyServiceGrpcAsyncIOTransport(CompanyServiceTransport):
                 API requests. If ``None``, then default info will be used.	
                 Generally, you only need to set this if you're developing	
                 your own client library.
+            metrics (Optional[google.cloud.talent_helpers.metrics.MetricsRecorder]):
+                A recorder for per-method latency, retry, status code and
+                payload size metrics. If ``None``, nothing is recorded.
+            profiler (Optional[google.cloud.talent_helpers.profiling.CallProfiler]):
+                A profiler reporting how long each call spends building,
+                serializing, on the network, deserializing and retrying.
+                If ``None``, calls are not profiled.
+            compression (Optional[google.cloud.talent_helpers.compression.CompressionPolicy]):
+                Chooses the gRPC compression of each request by method
+                and size. If ``None``, requests are not compressed.
+            resilience (Optional[google.cloud.talent_helpers.resilience.ResiliencePolicy]):
+                Applies a retry budget and per-method circuit breakers
+                to every call. If ``None``, retries are only bounded by
+                each method's retry policy.
+            method_config (Optional[google.cloud.talent_helpers.method_config.MethodConfig]):
+                Overrides the default timeout and retry of each
+                method. If ``None``, the generated defaults apply.
 
         Raises:
             google.auth.exceptions.MutualTlsChannelError: If mutual TLS transport
@@ -211,6 +238,8 @@ class CompanyServiceGrpcAsyncIOTransport(CompanyServiceTransport):
                 quota_project_id=quota_project_id,
             )
 
+        self._stubs = {}
+
         # Run the base constructor.
         super().__init__(
             host=host,
@@ -219,10 +248,13 @@ class CompanyServiceGrpcAsyncIOTransport(CompanyServiceTransport):
             scopes=scopes or self.AUTH_SCOPES,
             quota_project_id=quota_project_id,
             client_info=client_info,
+            metrics=metrics,
+            profiler=profiler,
+            compression=compression,
+            resilience=resilience,
+            method_config=method_config,
         )
 
-        self._stubs = {}
-
     @property
     def grpc_channel(self) -> aio.Channel:
         """Create the channel designed to connect to this service.
@@ -256,8 +288,12 @@ class CompanyServiceGrpcAsyncIOTransport(CompanyServiceTransport):
         if "create_company" not in self._stubs:
             self._stubs["create_company"] = self.grpc_channel.unary_unary(
                 "/google.cloud.talent.v4.CompanyService/CreateCompany",
-                request_serializer=company_service.CreateCompanyRequest.serialize,
-                response_deserializer=gct_company.Company.deserialize,
+                request_serializer=self._wrap_serializer(
+                    company_service.CreateCompanyRequest.serialize
+                ),
+                response_deserializer=self._wrap_deserializer(
+                    gct_company.Company.deserialize
+                ),
             )
         return self._stubs["create_company"]
 
@@ -282,8 +318,12 @@ class CompanyServiceGrpcAsyncIOTransport(CompanyServiceTransport):
         if "get_company" not in self._stubs:
             self._stubs["get_company"] = self.grpc_channel.unary_unary(
                 "/google.cloud.talent.v4.CompanyService/GetCompany",
-                request_serializer=company_service.GetCompanyRequest.serialize,
-                response_deserializer=company.Company.deserialize,
+                request_serializer=self._wrap_serializer(
+                    company_service.GetCompanyRequest.serialize
+                ),
+                response_deserializer=self._wrap_deserializer(
+                    company.Company.deserialize
+                ),
             )
         return self._stubs["get_company"]
 
@@ -310,8 +350,12 @@ class CompanyServiceGrpcAsyncIOTransport(CompanyServiceTransport):
         if "update_company" not in self._stubs:
             self._stubs["update_company"] = self.grpc_channel.unary_unary(
                 "/google.cloud.talent.v4.CompanyService/UpdateCompany",
-                request_serializer=company_service.UpdateCompanyRequest.serialize,
-                response_deserializer=gct_company.Company.deserialize,
+                request_serializer=self._wrap_serializer(
+                    company_service.UpdateCompanyRequest.serialize
+                ),
+                response_deserializer=self._wrap_deserializer(
+                    gct_company.Company.deserialize
+                ),
             )
         return self._stubs["update_company"]
 
@@ -338,8 +382,10 @@ class CompanyServiceGrpcAsyncIOTransport(CompanyServiceTransport):
         if "delete_company" not in self._stubs:
             self._stubs["delete_company"] = self.grpc_channel.unary_unary(
                 "/google.cloud.talent.v4.CompanyService/DeleteCompany",
-                request_serializer=company_service.DeleteCompanyRequest.serialize,
-                response_deserializer=empty.Empty.FromString,
+                request_serializer=self._wrap_serializer(
+                    company_service.DeleteCompanyRequest.serialize
+                ),
+                response_deserializer=self._wrap_deserializer(empty.Empty.FromString),
             )
         return self._stubs["delete_company"]
 
@@ -367,8 +413,12 @@ class CompanyServiceGrpcAsyncIOTransport(CompanyServiceTransport):
         if "list_companies" not in self._stubs:
             self._stubs["list_companies"] = self.grpc_channel.unary_unary(
                 "/google.cloud.talent.v4.CompanyService/ListCompanies",
-                request_serializer=company_service.ListCompaniesRequest.serialize,
-                response_deserializer=company_service.ListCompaniesResponse.deserialize,
+                request_serializer=self._wrap_serializer(
+                    company_service.ListCompaniesRequest.serialize
+                ),
+                response_deserializer=self._wrap_deserializer(
+                    company_service.ListCompaniesResponse.deserialize
+                ),
             )
         return self._stubs["list_companies"]
 
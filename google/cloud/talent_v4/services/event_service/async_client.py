@@ -107,7 +107,7 @@ class EventServiceAsyncClient:
         parent: str = None,
         client_event: event.ClientEvent = None,
         retry: retries.Retry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: float = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> event.ClientEvent:
         r"""Report events issued when end user interacts with customer's
@@ -180,11 +180,9 @@ class EventServiceAsyncClient:
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.create_client_event,
-            default_timeout=30.0,
-            client_info=DEFAULT_CLIENT_INFO,
-        )
+        rpc = self._client._transport._wrapped_methods[
+            self._client._transport.create_client_event
+        ]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
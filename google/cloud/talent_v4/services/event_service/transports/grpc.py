@@ -22,6 +22,11 @@ from google.api_core import grpc_helpers  # type: ignore
 from google.api_core import gapic_v1  # type: ignore
 from google import auth  # type: ignore
 from google.auth import credentials  # type: ignore
+from google.cloud.talent_helpers import metrics as metrics_lib  # type: ignore
+from google.cloud.talent_helpers import profiling  # type: ignore
+from google.cloud.talent_helpers import compression as compression_lib  # type: ignore
+from google.cloud.talent_helpers import resilience as resilience_lib  # type: ignore
+from google.cloud.talent_helpers import method_config as method_config_lib  # type: ignore
 from google.auth.transport.grpc import SslCredentials  # type: ignore
 
 import grpc  # type: ignore
@@ -60,6 +65,11 @@ class EventServiceGrpcTransport(EventServiceTransport):
         ssl_channel_credentials: grpc.ChannelCredentials = None,
         quota_project_id: Optional[str] = None,
         client_info: gapic_v1.client_info.ClientInfo = DEFAULT_CLIENT_INFO,
+        metrics: Optional[metrics_lib.MetricsRecorder] = None,
+        profiler: Optional[profiling.CallProfiler] = None,
+        compression: Optional[compression_lib.CompressionPolicy] = None,
+        resilience: Optional[resilience_lib.ResiliencePolicy] = None,
+        method_config: Optional[method_config_lib.MethodConfig] = None,
     ) -> None:
         """Instantiate the transport.
 
@@ -95,6 +105,23 @@ class EventServiceGrpcTransport(EventServiceTransport):
                 API requests. If ``None``, then default info will be used.	
                 Generally, you only need to set this if you're developing	
                 your own client library.
+            metrics (Optional[google.cloud.talent_helpers.metrics.MetricsRecorder]):
+                A recorder for per-method latency, retry, status code and
+                payload size metrics. If ``None``, nothing is recorded.
+            profiler (Optional[google.cloud.talent_helpers.profiling.CallProfiler]):
+                A profiler reporting how long each call spends building,
+                serializing, on the network, deserializing and retrying.
+                If ``None``, calls are not profiled.
+            compression (Optional[google.cloud.talent_helpers.compression.CompressionPolicy]):
+                Chooses the gRPC compression of each request by method
+                and size. If ``None``, requests are not compressed.
+            resilience (Optional[google.cloud.talent_helpers.resilience.ResiliencePolicy]):
+                Applies a retry budget and per-method circuit breakers
+                to every call. If ``None``, retries are only bounded by
+                each method's retry policy.
+            method_config (Optional[google.cloud.talent_helpers.method_config.MethodConfig]):
+                Overrides the default timeout and retry of each
+                method. If ``None``, the generated defaults apply.
 
         Raises:
           google.auth.exceptions.MutualTLSChannelError: If mutual TLS transport
@@ -173,6 +200,11 @@ class EventServiceGrpcTransport(EventServiceTransport):
             scopes=scopes or self.AUTH_SCOPES,
             quota_project_id=quota_project_id,
             client_info=client_info,
+            metrics=metrics,
+            profiler=profiler,
+            compression=compression,
+            resilience=resilience,
+            method_config=method_config,
         )
 
     @classmethod
@@ -257,8 +289,12 @@ class EventServiceGrpcTransport(EventServiceTransport):
         if "create_client_event" not in self._stubs:
             self._stubs["create_client_event"] = self.grpc_channel.unary_unary(
                 "/google.cloud.talent.v4.EventService/CreateClientEvent",
-                request_serializer=event_service.CreateClientEventRequest.serialize,
-                response_deserializer=event.ClientEvent.deserialize,
+                request_serializer=self._wrap_serializer(
+                    event_service.CreateClientEventRequest.serialize
+                ),
+                response_deserializer=self._wrap_deserializer(
+                    event.ClientEvent.deserialize
+                ),
             )
         return self._stubs["create_client_event"]
 
@@ -22,6 +22,11 @@ from google.api_core import gapic_v1  # type: ignore
 from google.api_core import grpc_helpers_async  # type: ignore
 from google import auth  # type: ignore
 from google.auth import credentials  # type: ignore
+from google.cloud.talent_helpers import metrics as metrics_lib  # type: ignore
+from google.cloud.talent_helpers import profiling  # type: ignore
+from google.cloud.talent_helpers import compression as compression_lib  # type: ignore
+from google.cloud.talent_helpers import resilience as resilience_lib  # type: ignore
+from google.cloud.talent_helpers import method_config as method_config_lib  # type: ignore
 from google.auth.transport.grpc import SslCredentials  # type: ignore
 
 import grpc  # type: ignore
@@ -104,6 +109,11 @@ class EventServiceGrpcAsyncIOTransport(EventServiceTransport):
         ssl_channel_credentials: grpc.ChannelCredentials = None,
         quota_project_id=None,
         client_info: gapic_v1.client_info.ClientInfo = DEFAULT_CLIENT_INFO,
+        metrics: Optional[metrics_lib.MetricsRecorder] = None,
+        profiler: Optional[profiling.CallProfiler] = None,
+        compression: Optional[compression_lib.CompressionPolicy] = None,
+        resilience: Optional[resilience_lib.ResiliencePolicy] = None,
+        method_config: Optional[method_config_lib.MethodConfig] = None,
     ) -> None:
         """Instantiate the transport.
 
@@ -140,6 +150,23 @@ class EventServiceGrpcAsyncIOTransport(EventServiceTransport):
                 API requests. If ``None``, then default info will be used.	
                 Generally, you only need to set this if you're developing	
                 your own client library.
+            metrics (Optional[google.cloud.talent_helpers.metrics.MetricsRecorder]):
+                A recorder for per-method latency, retry, status code and
+                payload size metrics. If ``None``, nothing is recorded.
+            profiler (Optional[google.cloud.talent_helpers.profiling.CallProfiler]):
+                A profiler reporting how long each call spends building,
+                serializing, on the network, deserializing and retrying.
+                If ``None``, calls are not profiled.
+            compression (Optional[google.cloud.talent_helpers.compression.CompressionPolicy]):
+                Chooses the gRPC compression of each request by method
+                and size. If ``None``, requests are not compressed.
+            resilience (Optional[google.cloud.talent_helpers.resilience.ResiliencePolicy]):
+                Applies a retry budget and per-method circuit breakers
+                to every call. If ``None``, retries are only bounded by
+                each method's retry policy.
+            method_config (Optional[google.cloud.talent_helpers.method_config.MethodConfig]):
+                Overrides the default timeout and retry of each
+                method. If ``None``, the generated defaults apply.
 
         Raises:
             google.auth.exceptions.MutualTlsChannelError: If mutual TLS transport
@@ -208,6 +235,8 @@ class EventServiceGrpcAsyncIOTransport(EventServiceTransport):
                 quota_project_id=quota_project_id,
             )
 
+        self._stubs = {}
+
         # Run the base constructor.
         super().__init__(
             host=host,
@@ -216,10 +245,13 @@ class EventServiceGrpcAsyncIOTransport(EventServiceTransport):
             scopes=scopes or self.AUTH_SCOPES,
             quota_project_id=quota_project_id,
             client_info=client_info,
+            metrics=metrics,
+            profiler=profiler,
+            compression=compression,
+            resilience=resilience,
+            method_config=method_config,
         )
 
-        self._stubs = {}
-
     @property
     def grpc_channel(self) -> aio.Channel:
         """Create the channel designed to connect to this service.
@@ -259,8 +291,12 @@ class EventServiceGrpcAsyncIOTransport(EventServiceTransport):
         if "create_client_event" not in self._stubs:
             self._stubs["create_client_event"] = self.grpc_channel.unary_unary(
                 "/google.cloud.talent.v4.EventService/CreateClientEvent",
-                request_serializer=event_service.CreateClientEventRequest.serialize,
-                response_deserializer=event.ClientEvent.deserialize,
+                request_serializer=self._wrap_serializer(
+                    event_service.CreateClientEventRequest.serialize
+                ),
+                response_deserializer=self._wrap_deserializer(
+                    event.ClientEvent.deserialize
+                ),
             )
         return self._stubs["create_client_event"]
 
@@ -278,7 +278,7 @@ class JobServiceClient(metaclass=JobServiceClientMeta):
         parent: str = None,
         job: gct_job.Job = None,
         retry: retries.Retry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: float = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> gct_job.Job:
         r"""Creates a new job.
@@ -366,7 +366,7 @@ class JobServiceClient(metaclass=JobServiceClientMeta):
         parent: str = None,
         jobs: Sequence[job.Job] = None,
         retry: retries.Retry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: float = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> operation.Operation:
         r"""Begins executing a batch create jobs operation.
@@ -466,7 +466,7 @@ class JobServiceClient(metaclass=JobServiceClientMeta):
         *,
         name: str = None,
         retry: retries.Retry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: float = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> job.Job:
         r"""Retrieves the specified job, whose status is OPEN or
@@ -545,7 +545,7 @@ class JobServiceClient(metaclass=JobServiceClientMeta):
         job: gct_job.Job = None,
         update_mask: field_mask.FieldMask = None,
         retry: retries.Retry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: float = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> gct_job.Job:
         r"""Updates specified job.
@@ -639,7 +639,7 @@ class JobServiceClient(metaclass=JobServiceClientMeta):
         parent: str = None,
         jobs: Sequence[job.Job] = None,
         retry: retries.Retry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: float = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> operation.Operation:
         r"""Begins executing a batch update jobs operation.
@@ -739,7 +739,7 @@ class JobServiceClient(metaclass=JobServiceClientMeta):
         *,
         name: str = None,
         retry: retries.Retry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: float = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> None:
         r"""Deletes the specified job.
@@ -810,7 +810,7 @@ class JobServiceClient(metaclass=JobServiceClientMeta):
         parent: str = None,
         names: Sequence[str] = None,
         retry: retries.Retry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: float = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> operation.Operation:
         r"""Begins executing a batch delete jobs operation.
@@ -918,7 +918,7 @@ class JobServiceClient(metaclass=JobServiceClientMeta):
         parent: str = None,
         filter: str = None,
         retry: retries.Retry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: float = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> pagers.ListJobsPager:
         r"""Lists jobs by filter.
@@ -1018,7 +1018,12 @@ class JobServiceClient(metaclass=JobServiceClientMeta):
         # This method is paged; wrap the response in a pager, which provides
         # an `__iter__` convenience method.
         response = pagers.ListJobsPager(
-            method=rpc, request=request, response=response, metadata=metadata,
+            method=rpc,
+            request=request,
+            response=response,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
         )
 
         # Done; return the response.
@@ -1029,7 +1034,7 @@ class JobServiceClient(metaclass=JobServiceClientMeta):
         request: job_service.SearchJobsRequest = None,
         *,
         retry: retries.Retry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: float = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> job_service.SearchJobsResponse:
         r"""Searches for jobs using the provided
@@ -1085,7 +1090,7 @@ class JobServiceClient(metaclass=JobServiceClientMeta):
         request: job_service.SearchJobsRequest = None,
         *,
         retry: retries.Retry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: float = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> job_service.SearchJobsResponse:
         r"""Searches for jobs using the provided
@@ -25,6 +25,12 @@ from google.api_core import gapic_v1  # type: ignore
 from google.api_core import retry as retries  # type: ignore
 from google.api_core import operations_v1  # type: ignore
 from google.auth import credentials  # type: ignore
+from google.cloud.talent_helpers import metrics as metrics_lib  # type: ignore
+from google.cloud.talent_helpers import wrapping  # type: ignore
+from google.cloud.talent_helpers import profiling  # type: ignore
+from google.cloud.talent_helpers import compression as compression_lib  # type: ignore
+from google.cloud.talent_helpers import resilience as resilience_lib  # type: ignore
+from google.cloud.talent_helpers import method_config as method_config_lib  # type: ignore
 
 from google.cloud.talent_v4.types import job
 from google.cloud.talent_v4.types import job as gct_job
@@ -58,6 +64,11 @@ class JobServiceTransport(abc.ABC):
         scopes: typing.Optional[typing.Sequence[str]] = AUTH_SCOPES,
         quota_project_id: typing.Optional[str] = None,
         client_info: gapic_v1.client_info.ClientInfo = DEFAULT_CLIENT_INFO,
+        metrics: typing.Optional[metrics_lib.MetricsRecorder] = None,
+        profiler: typing.Optional[profiling.CallProfiler] = None,
+        compression: typing.Optional[compression_lib.CompressionPolicy] = None,
+        resilience: typing.Optional[resilience_lib.ResiliencePolicy] = None,
+        method_config: typing.Optional[method_config_lib.MethodConfig] = None,
         **kwargs,
     ) -> None:
         """Instantiate the transport.
@@ -80,6 +91,23 @@ class JobServiceTransport(abc.ABC):
                 API requests. If ``None``, then default info will be used.	
                 Generally, you only need to set this if you're developing	
                 your own client library.
+            metrics (Optional[google.cloud.talent_helpers.metrics.MetricsRecorder]):
+                A recorder for per-method latency, retry, status code and
+                payload size metrics. If ``None``, nothing is recorded.
+            profiler (Optional[google.cloud.talent_helpers.profiling.CallProfiler]):
+                A profiler reporting how long each call spends building,
+                serializing, on the network, deserializing and retrying.
+                If ``None``, calls are not profiled.
+            compression (Optional[google.cloud.talent_helpers.compression.CompressionPolicy]):
+                Chooses the gRPC compression of each request by method
+                and size. If ``None``, requests are not compressed.
+            resilience (Optional[google.cloud.talent_helpers.resilience.ResiliencePolicy]):
+                Applies a retry budget and per-method circuit breakers
+                to every call. If ``None``, retries are only bounded by
+                each method's retry policy.
+            method_config (Optional[google.cloud.talent_helpers.method_config.MethodConfig]):
+                Overrides the default timeout and retry of each
+                method. If ``None``, the generated defaults apply.
         """
         # Save the hostname. Default to port 443 (HTTPS) if none is specified.
         if ":" not in host:
@@ -106,20 +134,26 @@ class JobServiceTransport(abc.ABC):
         # Save the credentials.
         self._credentials = credentials
 
+        # Save the interceptors applied around every wrapped method.
+        self._interceptors = tuple(
+            i for i in (metrics, profiler, compression, resilience) if i is not None
+        )
+        self._method_config = method_config
+
         # Lifted into its own function so it can be stubbed out during tests.
         self._prep_wrapped_messages(client_info)
 
     def _prep_wrapped_messages(self, client_info):
         # Precompute the wrapped methods.
         self._wrapped_methods = {
-            self.create_job: gapic_v1.method.wrap_method(
-                self.create_job, default_timeout=30.0, client_info=client_info,
+            self.create_job: self._wrap_method(
+                "create_job", default_timeout=30.0, client_info=client_info,
             ),
-            self.batch_create_jobs: gapic_v1.method.wrap_method(
-                self.batch_create_jobs, default_timeout=30.0, client_info=client_info,
+            self.batch_create_jobs: self._wrap_method(
+                "batch_create_jobs", default_timeout=30.0, client_info=client_info,
             ),
-            self.get_job: gapic_v1.method.wrap_method(
-                self.get_job,
+            self.get_job: self._wrap_method(
+                "get_job",
                 default_retry=retries.Retry(
                     initial=0.1,
                     maximum=60.0,
@@ -131,14 +165,14 @@ class JobServiceTransport(abc.ABC):
                 default_timeout=30.0,
                 client_info=client_info,
             ),
-            self.update_job: gapic_v1.method.wrap_method(
-                self.update_job, default_timeout=30.0, client_info=client_info,
+            self.update_job: self._wrap_method(
+                "update_job", default_timeout=30.0, client_info=client_info,
             ),
-            self.batch_update_jobs: gapic_v1.method.wrap_method(
-                self.batch_update_jobs, default_timeout=30.0, client_info=client_info,
+            self.batch_update_jobs: self._wrap_method(
+                "batch_update_jobs", default_timeout=30.0, client_info=client_info,
             ),
-            self.delete_job: gapic_v1.method.wrap_method(
-                self.delete_job,
+            self.delete_job: self._wrap_method(
+                "delete_job",
                 default_retry=retries.Retry(
                     initial=0.1,
                     maximum=60.0,
@@ -150,11 +184,11 @@ class JobServiceTransport(abc.ABC):
                 default_timeout=30.0,
                 client_info=client_info,
             ),
-            self.batch_delete_jobs: gapic_v1.method.wrap_method(
-                self.batch_delete_jobs, default_timeout=30.0, client_info=client_info,
+            self.batch_delete_jobs: self._wrap_method(
+                "batch_delete_jobs", default_timeout=30.0, client_info=client_info,
             ),
-            self.list_jobs: gapic_v1.method.wrap_method(
-                self.list_jobs,
+            self.list_jobs: self._wrap_method(
+                "list_jobs",
                 default_retry=retries.Retry(
                     initial=0.1,
                     maximum=60.0,
@@ -166,16 +200,38 @@ class JobServiceTransport(abc.ABC):
                 default_timeout=30.0,
                 client_info=client_info,
             ),
-            self.search_jobs: gapic_v1.method.wrap_method(
-                self.search_jobs, default_timeout=30.0, client_info=client_info,
+            self.search_jobs: self._wrap_method(
+                "search_jobs", default_timeout=30.0, client_info=client_info,
             ),
-            self.search_jobs_for_alert: gapic_v1.method.wrap_method(
-                self.search_jobs_for_alert,
-                default_timeout=30.0,
-                client_info=client_info,
+            self.search_jobs_for_alert: self._wrap_method(
+                "search_jobs_for_alert", default_timeout=30.0, client_info=client_info,
             ),
         }
 
+    def _wrap_method(self, name, **kwargs):
+        # Apply retry, timeout, error mapping and this transport's
+        # interceptors to the stub behind the ``name`` property.
+        return wrapping.wrap_method(
+            getattr(self, name),
+            service="google.cloud.talent.v4.JobService",
+            method=name,
+            interceptors=self._interceptors,
+            method_config=self._method_config,
+            **kwargs,
+        )
+
+    def _wrap_serializer(self, func):
+        # Let this transport's interceptors observe request encoding.
+        return wrapping.wrap_codec(
+            func, serializer=True, interceptors=self._interceptors
+        )
+
+    def _wrap_deserializer(self, func):
+        # Let this transport's interceptors observe response decoding.
+        return wrapping.wrap_codec(
+            func, serializer=False, interceptors=self._interceptors
+        )
+
     @property
     def operations_client(self) -> operations_v1.OperationsClient:
         """Return the client designed to process long-running operations."""
@@ -23,6 +23,11 @@ from google.api_core import grpc_helpers_async  # type: ignore
 from google.api_core import operations_v1  # type: ignore
 from google import auth  # type: ignore
 from google.auth import credentials  # type: ignore
+from google.cloud.talent_helpers import metrics as metrics_lib  # type: ignore
+from google.cloud.talent_helpers import profiling  # type: ignore
+from google.cloud.talent_helpers import compression as compression_lib  # type: ignore
+from google.cloud.talent_helpers import resilience as resilience_lib  # type: ignore
+from google.cloud.talent_helpers import method_config as method_config_lib  # type: ignore
 from google.auth.transport.grpc import SslCredentials  # type: ignore
 
 import grpc  # type: ignore
@@ -109,6 +114,11 @@ class JobServiceGrpcAsyncIOTransport(JobServiceTransport):
         ssl_channel_credentials: grpc.ChannelCredentials = None,
         quota_project_id=None,
         client_info: gapic_v1.client_info.ClientInfo = DEFAULT_CLIENT_INFO,
+        metrics: Optional[metrics_lib.MetricsRecorder] = None,
+        profiler: Optional[profiling.CallProfiler] = None,
+        compression: Optional[compression_lib.CompressionPolicy] = None,
+        resilience: Optional[resilience_lib.ResiliencePolicy] = None,
+        method_config: Optional[method_config_lib.MethodConfig] = None,
     ) -> None:
         """Instantiate the transport.
 
@@ -145,6 +155,23 @@ class JobServiceGrpcAsyncIOTransport(JobServiceTransport):
                 API requests. If ``None``, then default info will be used.	
                 Generally, you only need to set this if you're developing	
                 your own client library.
+            metrics (Optional[google.cloud.talent_helpers.metrics.MetricsRecorder]):
+                A recorder for per-method latency, retry, status code and
+                payload size metrics. If ``None``, nothing is recorded.
+            profiler (Optional[google.cloud.talent_helpers.profiling.CallProfiler]):
+                A profiler reporting how long each call spends building,
+                serializing, on the network, deserializing and retrying.
+                If ``None``, calls are not profiled.
+            compression (Optional[google.cloud.talent_helpers.compression.CompressionPolicy]):
+                Chooses the gRPC compression of each request by method
+                and size. If ``None``, requests are not compressed.
+            resilience (Optional[google.cloud.talent_helpers.resilience.ResiliencePolicy]):
+                Applies a retry budget and per-method circuit breakers
+                to every call. If ``None``, retries are only bounded by
+                each method's retry policy.
+            method_config (Optional[google.cloud.talent_helpers.method_config.MethodConfig]):
+                Overrides the default timeout and retry of each
+                method. If ``None``, the generated defaults apply.
 
         Raises:
             google.auth.exceptions.MutualTlsChannelError: If mutual TLS transport
@@ -213,6 +240,8 @@ class JobServiceGrpcAsyncIOTransport(JobServiceTransport):
                 quota_project_id=quota_project_id,
             )
 
+        self._stubs = {}
+
         # Run the base constructor.
         super().__init__(
             host=host,
@@ -221,10 +250,13 @@ class JobServiceGrpcAsyncIOTransport(JobServiceTransport):
             scopes=scopes or self.AUTH_SCOPES,
             quota_project_id=quota_project_id,
             client_info=client_info,
+            metrics=metrics,
+            profiler=profiler,
+            compression=compression,
+            resilience=resilience,
+            method_config=method_config,
         )
 
-        self._stubs = {}
-
     @property
     def grpc_channel(self) -> aio.Channel:
         """Create the channel designed to connect to this service.
@@ -274,8 +306,10 @@ class JobServiceGrpcAsyncIOTransport(JobServiceTransport):
         if "create_job" not in self._stubs:
             self._stubs["create_job"] = self.grpc_channel.unary_unary(
                 "/google.cloud.talent.v4.JobService/CreateJob",
-                request_serializer=job_service.CreateJobRequest.serialize,
-                response_deserializer=gct_job.Job.deserialize,
+                request_serializer=self._wrap_serializer(
+                    job_service.CreateJobRequest.serialize
+                ),
+                response_deserializer=self._wrap_deserializer(gct_job.Job.deserialize),
             )
         return self._stubs["create_job"]
 
@@ -302,8 +336,12 @@ class JobServiceGrpcAsyncIOTransport(JobServiceTransport):
         if "batch_create_jobs" not in self._stubs:
             self._stubs["batch_create_jobs"] = self.grpc_channel.unary_unary(
                 "/google.cloud.talent.v4.JobService/BatchCreateJobs",
-                request_serializer=job_service.BatchCreateJobsRequest.serialize,
-                response_deserializer=operations.Operation.FromString,
+                request_serializer=self._wrap_serializer(
+                    job_service.BatchCreateJobsRequest.serialize
+                ),
+                response_deserializer=self._wrap_deserializer(
+                    operations.Operation.FromString
+                ),
             )
         return self._stubs["batch_create_jobs"]
 
@@ -327,8 +365,10 @@ class JobServiceGrpcAsyncIOTransport(JobServiceTransport):
         if "get_job" not in self._stubs:
             self._stubs["get_job"] = self.grpc_channel.unary_unary(
                 "/google.cloud.talent.v4.JobService/GetJob",
-                request_serializer=job_service.GetJobRequest.serialize,
-                response_deserializer=job.Job.deserialize,
+                request_serializer=self._wrap_serializer(
+                    job_service.GetJobRequest.serialize
+                ),
+                response_deserializer=self._wrap_deserializer(job.Job.deserialize),
             )
         return self._stubs["get_job"]
 
@@ -356,8 +396,10 @@ class JobServiceGrpcAsyncIOTransport(JobServiceTransport):
         if "update_job" not in self._stubs:
             self._stubs["update_job"] = self.grpc_channel.unary_unary(
                 "/google.cloud.talent.v4.JobService/UpdateJob",
-                request_serializer=job_service.UpdateJobRequest.serialize,
-                response_deserializer=gct_job.Job.deserialize,
+                request_serializer=self._wrap_serializer(
+                    job_service.UpdateJobRequest.serialize
+                ),
+                response_deserializer=self._wrap_deserializer(gct_job.Job.deserialize),
             )
         return self._stubs["update_job"]
 
@@ -384,8 +426,12 @@ class JobServiceGrpcAsyncIOTransport(JobServiceTransport):
         if "batch_update_jobs" not in self._stubs:
             self._stubs["batch_update_jobs"] = self.grpc_channel.unary_unary(
                 "/google.cloud.talent.v4.JobService/BatchUpdateJobs",
-                request_serializer=job_service.BatchUpdateJobsRequest.serialize,
-                response_deserializer=operations.Operation.FromString,
+                request_serializer=self._wrap_serializer(
+                    job_service.BatchUpdateJobsRequest.serialize
+                ),
+                response_deserializer=self._wrap_deserializer(
+                    operations.Operation.FromString
+                ),
             )
         return self._stubs["batch_update_jobs"]
 
@@ -412,8 +458,10 @@ class JobServiceGrpcAsyncIOTransport(JobServiceTransport):
         if "delete_job" not in self._stubs:
             self._stubs["delete_job"] = self.grpc_channel.unary_unary(
                 "/google.cloud.talent.v4.JobService/DeleteJob",
-                request_serializer=job_service.DeleteJobRequest.serialize,
-                response_deserializer=empty.Empty.FromString,
+                request_serializer=self._wrap_serializer(
+                    job_service.DeleteJobRequest.serialize
+                ),
+                response_deserializer=self._wrap_deserializer(empty.Empty.FromString),
             )
         return self._stubs["delete_job"]
 
@@ -440,8 +488,12 @@ class JobServiceGrpcAsyncIOTransport(JobServiceTransport):
         if "batch_delete_jobs" not in self._stubs:
             self._stubs["batch_delete_jobs"] = self.grpc_channel.unary_unary(
                 "/google.cloud.talent.v4.JobService/BatchDeleteJobs",
-                request_serializer=job_service.BatchDeleteJobsRequest.serialize,
-                response_deserializer=operations.Operation.FromString,
+                request_serializer=self._wrap_serializer(
+                    job_service.BatchDeleteJobsRequest.serialize
+                ),
+                response_deserializer=self._wrap_deserializer(
+                    operations.Operation.FromString
+                ),
             )
         return self._stubs["batch_delete_jobs"]
 
@@ -468,8 +520,12 @@ class JobServiceGrpcAsyncIOTransport(JobServiceTransport):
         if "list_jobs" not in self._stubs:
             self._stubs["list_jobs"] = self.grpc_channel.unary_unary(
                 "/google.cloud.talent.v4.JobService/ListJobs",
-                request_serializer=job_service.ListJobsRequest.serialize,
-                response_deserializer=job_service.ListJobsResponse.deserialize,
+                request_serializer=self._wrap_serializer(
+                    job_service.ListJobsRequest.serialize
+                ),
+                response_deserializer=self._wrap_deserializer(
+                    job_service.ListJobsResponse.deserialize
+                ),
             )
         return self._stubs["list_jobs"]
 
@@ -502,8 +558,12 @@ class JobServiceGrpcAsyncIOTransport(JobServiceTransport):
         if "search_jobs" not in self._stubs:
             self._stubs["search_jobs"] = self.grpc_channel.unary_unary(
                 "/google.cloud.talent.v4.JobService/SearchJobs",
-                request_serializer=job_service.SearchJobsRequest.serialize,
-                response_deserializer=job_service.SearchJobsResponse.deserialize,
+                request_serializer=self._wrap_serializer(
+                    job_service.SearchJobsRequest.serialize
+                ),
+                response_deserializer=self._wrap_deserializer(
+                    job_service.SearchJobsResponse.deserialize
+                ),
             )
         return self._stubs["search_jobs"]
 
@@ -542,8 +602,12 @@ class JobServiceGrpcAsyncIOTransport(JobServiceTransport):
         if "search_jobs_for_alert" not in self._stubs:
             self._stubs["search_jobs_for_alert"] = self.grpc_channel.unary_unary(
                 "/google.cloud.talent.v4.JobService/SearchJobsForAlert",
-                request_serializer=job_service.SearchJobsRequest.serialize,
-                response_deserializer=job_service.SearchJobsResponse.deserialize,
+                request_serializer=self._wrap_serializer(
+                    job_service.SearchJobsRequest.serialize
+                ),
+                response_deserializer=self._wrap_deserializer(
+                    job_service.SearchJobsResponse.deserialize
+                ),
             )
         return self._stubs["search_jobs_for_alert"]
 
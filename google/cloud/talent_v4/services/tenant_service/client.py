@@ -270,7 +270,7 @@ class TenantServiceClient(metaclass=TenantServiceClientMeta):
         parent: str = None,
         tenant: gct_tenant.Tenant = None,
         retry: retries.Retry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: float = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> gct_tenant.Tenant:
         r"""Creates a new tenant entity.
@@ -358,7 +358,7 @@ class TenantServiceClient(metaclass=TenantServiceClientMeta):
         *,
         name: str = None,
         retry: retries.Retry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: float = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> tenant.Tenant:
         r"""Retrieves specified tenant.
@@ -441,7 +441,7 @@ class TenantServiceClient(metaclass=TenantServiceClientMeta):
         tenant: gct_tenant.Tenant = None,
         update_mask: field_mask.FieldMask = None,
         retry: retries.Retry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: float = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> gct_tenant.Tenant:
         r"""Updates specified tenant.
@@ -539,7 +539,7 @@ class TenantServiceClient(metaclass=TenantServiceClientMeta):
         *,
         name: str = None,
         retry: retries.Retry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: float = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> None:
         r"""Deletes specified tenant.
@@ -607,7 +607,7 @@ class TenantServiceClient(metaclass=TenantServiceClientMeta):
         *,
         parent: str = None,
         retry: retries.Retry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: float = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> pagers.ListTenantsPager:
         r"""Lists all tenants associated with the project.
@@ -679,7 +679,12 @@ class TenantServiceClient(metaclass=TenantServiceClientMeta):
         # This method is paged; wrap the response in a pager, which provides
         # an `__iter__` convenience method.
         response = pagers.ListTenantsPager(
-            method=rpc, request=request, response=response, metadata=metadata,
+            method=rpc,
+            request=request,
+            response=response,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
         )
 
         # Done; return the response.
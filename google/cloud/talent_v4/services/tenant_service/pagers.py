@@ -17,11 +17,15 @@
 
 from typing import Any, AsyncIterable, Awaitable, Callable, Iterable, Sequence, Tuple
 
+from google.api_core import gapic_v1  # type: ignore
+from google.api_core import retry as retries  # type: ignore
+from google.cloud.talent_helpers import paging  # type: ignore
+
 from google.cloud.talent_v4.types import tenant
 from google.cloud.talent_v4.types import tenant_service
 
 
-class ListTenantsPager:
+class ListTenantsPager(paging.CheckpointMixin):
     """A pager for iterating through ``list_tenants`` requests.
 
     This class thinly wraps an initial
@@ -45,6 +49,8 @@ class ListTenantsPager:
         request: tenant_service.ListTenantsRequest,
         response: tenant_service.ListTenantsResponse,
         *,
+        retry: retries.Retry = gapic_v1.method.DEFAULT,
+        timeout: float = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = ()
     ):
         """Instantiate the pager.
@@ -56,12 +62,17 @@ class ListTenantsPager:
                 The initial request object.
             response (:class:`~.tenant_service.ListTenantsResponse`):
                 The initial response object.
+            retry (google.api_core.retry.Retry): Designation of what errors,
+                if any, should be retried when fetching further pages.
+            timeout (float): The timeout for each further page request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
         """
         self._method = method
         self._request = tenant_service.ListTenantsRequest(request)
         self._response = response
+        self._retry = retry
+        self._timeout = timeout
         self._metadata = metadata
 
     def __getattr__(self, name: str) -> Any:
@@ -70,20 +81,18 @@ class ListTenantsPager:
     @property
     def pages(self) -> Iterable[tenant_service.ListTenantsResponse]:
         yield self._response
-        while self._response.next_page_token:
-            self._request.page_token = self._response.next_page_token
-            self._response = self._method(self._request, metadata=self._metadata)
+        while self._next_page():
             yield self._response
 
     def __iter__(self) -> Iterable[tenant.Tenant]:
         for page in self.pages:
-            yield from page.tenants
+            yield from self._track(page.tenants)
 
     def __repr__(self) -> str:
         return "{0}<{1!r}>".format(self.__class__.__name__, self._response)
 
 
-class ListTenantsAsyncPager:
+class ListTenantsAsyncPager(paging.CheckpointMixin):
     """A pager for iterating through ``list_tenants`` requests.
 
     This class thinly wraps an initial
@@ -107,6 +116,8 @@ class ListTenantsAsyncPager:
         request: tenant_service.ListTenantsRequest,
         response: tenant_service.ListTenantsResponse,
         *,
+        retry: retries.Retry = gapic_v1.method.DEFAULT,
+        timeout: float = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = ()
     ):
         """Instantiate the pager.
@@ -118,12 +129,17 @@ class ListTenantsAsyncPager:
                 The initial request object.
             response (:class:`~.tenant_service.ListTenantsResponse`):
                 The initial response object.
+            retry (google.api_core.retry.Retry): Designation of what errors,
+                if any, should be retried when fetching further pages.
+            timeout (float): The timeout for each further page request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
         """
         self._method = method
         self._request = tenant_service.ListTenantsRequest(request)
         self._response = response
+        self._retry = retry
+        self._timeout = timeout
         self._metadata = metadata
 
     def __getattr__(self, name: str) -> Any:
@@ -132,15 +148,13 @@ class ListTenantsAsyncPager:
     @property
     async def pages(self) -> AsyncIterable[tenant_service.ListTenantsResponse]:
         yield self._response
-        while self._response.next_page_token:
-            self._request.page_token = self._response.next_page_token
-            self._response = await self._method(self._request, metadata=self._metadata)
+        while await self._next_page_async():
             yield self._response
 
     def __aiter__(self) -> AsyncIterable[tenant.Tenant]:
         async def async_generator():
             async for page in self.pages:
-                for response in page.tenants:
+                for response in self._track(page.tenants):
                     yield response
 
         return async_generator()
@@ -22,6 +22,11 @@ from google.api_core import grpc_helpers  # type: ignore
 from google.api_core import gapic_v1  # type: ignore
 from google import auth  # type: ignore
 from google.auth import credentials  # type: ignore
+from google.cloud.talent_helpers import metrics as metrics_lib  # type: ignore
+from google.cloud.talent_helpers import profiling  # type: ignore
+from google.cloud.talent_helpers import compression as compression_lib  # type: ignore
+from google.cloud.talent_helpers import resilience as resilience_lib  # type: ignore
+from google.cloud.talent_helpers import method_config as method_config_lib  # type: ignore
 from google.auth.transport.grpc import SslCredentials  # type: ignore
 
 import grpc  # type: ignore
@@ -63,6 +68,11 @@ class TenantServiceGrpcTransport(TenantServiceTransport):
         ssl_channel_credentials: grpc.ChannelCredentials = None,
         quota_project_id: Optional[str] = None,
         client_info: gapic_v1.client_info.ClientInfo = DEFAULT_CLIENT_INFO,
+        metrics: Optional[metrics_lib.MetricsRecorder] = None,
+        profiler: Optional[profiling.CallProfiler] = None,
+        compression: Optional[compression_lib.CompressionPolicy] = None,
+        resilience: Optional[resilience_lib.ResiliencePolicy] = None,
+        method_config: Optional[method_config_lib.MethodConfig] = None,
     ) -> None:
         """Instantiate the transport.
 
@@ -98,6 +108,23 @@ class TenantServiceGrpcTransport(TenantServiceTransport):
                 API requests. If ``None``, then default info will be used.	
                 Generally, you only need to set this if you're developing	
                 your own client library.
+            metrics (Optional[google.cloud.talent_helpers.metrics.MetricsRecorder]):
+                A recorder for per-method latency, retry, status code and
+                payload size metrics. If ``None``, nothing is recorded.
+            profiler (Optional[google.cloud.talent_helpers.profiling.CallProfiler]):
+                A profiler reporting how long each call spends building,
+                serializing, on the network, deserializing and retrying.
+                If ``None``, calls are not profiled.
+            compression (Optional[google.cloud.talent_helpers.compression.CompressionPolicy]):
+                Chooses the gRPC compression of each request by method
+                and size. If ``None``, requests are not compressed.
+            resilience (Optional[google.cloud.talent_helpers.resilience.ResiliencePolicy]):
+                Applies a retry budget and per-method circuit breakers
+                to every call. If ``None``, retries are only bounded by
+                each method's retry policy.
+            method_config (Optional[google.cloud.talent_helpers.method_config.MethodConfig]):
+                Overrides the default timeout and retry of each
+                method. If ``None``, the generated defaults apply.
 
         Raises:
           google.auth.exceptions.MutualTLSChannelError: If mutual TLS transport
@@ -176,6 +203,11 @@ class TenantServiceGrpcTransport(TenantServiceTransport):
             scopes=scopes or self.AUTH_SCOPES,
             quota_project_id=quota_project_id,
             client_info=client_info,
+            metrics=metrics,
+            profiler=profiler,
+            compression=compression,
+            resilience=resilience,
+            method_config=method_config,
         )
 
     @classmethod
@@ -254,8 +286,12 @@ class TenantServiceGrpcTransport(TenantServiceTransport):
         if "create_tenant" not in self._stubs:
             self._stubs["create_tenant"] = self.grpc_channel.unary_unary(
                 "/google.cloud.talent.v4.TenantService/CreateTenant",
-                request_serializer=tenant_service.CreateTenantRequest.serialize,
-                response_deserializer=gct_tenant.Tenant.deserialize,
+                request_serializer=self._wrap_serializer(
+                    tenant_service.CreateTenantRequest.serialize
+                ),
+                response_deserializer=self._wrap_deserializer(
+                    gct_tenant.Tenant.deserialize
+                ),
             )
         return self._stubs["create_tenant"]
 
@@ -278,8 +314,12 @@ class TenantServiceGrpcTransport(TenantServiceTransport):
         if "get_tenant" not in self._stubs:
             self._stubs["get_tenant"] = self.grpc_channel.unary_unary(
                 "/google.cloud.talent.v4.TenantService/GetTenant",
-                request_serializer=tenant_service.GetTenantRequest.serialize,
-                response_deserializer=tenant.Tenant.deserialize,
+                request_serializer=self._wrap_serializer(
+                    tenant_service.GetTenantRequest.serialize
+                ),
+                response_deserializer=self._wrap_deserializer(
+                    tenant.Tenant.deserialize
+                ),
             )
         return self._stubs["get_tenant"]
 
@@ -304,8 +344,12 @@ class TenantServiceGrpcTransport(TenantServiceTransport):
         if "update_tenant" not in self._stubs:
             self._stubs["update_tenant"] = self.grpc_channel.unary_unary(
                 "/google.cloud.talent.v4.TenantService/UpdateTenant",
-                request_serializer=tenant_service.UpdateTenantRequest.serialize,
-                response_deserializer=gct_tenant.Tenant.deserialize,
+                request_serializer=self._wrap_serializer(
+                    tenant_service.UpdateTenantRequest.serialize
+                ),
+                response_deserializer=self._wrap_deserializer(
+                    gct_tenant.Tenant.deserialize
+                ),
             )
         return self._stubs["update_tenant"]
 
@@ -330,8 +374,10 @@ class TenantServiceGrpcTransport(TenantServiceTransport):
         if "delete_tenant" not in self._stubs:
             self._stubs["delete_tenant"] = self.grpc_channel.unary_unary(
                 "/google.cloud.talent.v4.TenantService/DeleteTenant",
-                request_serializer=tenant_service.DeleteTenantRequest.serialize,
-                response_deserializer=empty.Empty.FromString,
+                request_serializer=self._wrap_serializer(
+                    tenant_service.DeleteTenantRequest.serialize
+                ),
+                response_deserializer=self._wrap_deserializer(empty.Empty.FromString),
             )
         return self._stubs["delete_tenant"]
 
@@ -358,8 +404,12 @@ class TenantServiceGrpcTransport(TenantServiceTransport):
         if "list_tenants" not in self._stubs:
             self._stubs["list_tenants"] = self.grpc_channel.unary_unary(
                 "/google.cloud.talent.v4.TenantService/ListTenants",
-                request_serializer=tenant_service.ListTenantsRequest.serialize,
-                response_deserializer=tenant_service.ListTenantsResponse.deserialize,
+                request_serializer=self._wrap_serializer(
+                    tenant_service.ListTenantsRequest.serialize
+                ),
+                response_deserializer=self._wrap_deserializer(
+                    tenant_service.ListTenantsResponse.deserialize
+                ),
             )
         return self._stubs["list_tenants"]
 
@@ -15,6 +15,8 @@
 # limitations under the License.
 #
 
+from google.cloud.talent_helpers import copying as _copying  # type: ignore
+
 from .common import (
     TimestampRange,
     Location,
@@ -135,3 +137,5 @@ __all__ = (
     "ListTenantsRequest",
     "ListTenantsResponse",
 )
+
+_copying.install(globals())
@@ -282,7 +282,7 @@ class ApplicationServiceClient(metaclass=ApplicationServiceClientMeta):
         parent: str = None,
         application: gct_application.Application = None,
         retry: retries.Retry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: float = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> gct_application.Application:
         r"""Creates a new application entity.
@@ -367,7 +367,7 @@ class ApplicationServiceClient(metaclass=ApplicationServiceClientMeta):
         *,
         name: str = None,
         retry: retries.Retry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: float = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> application.Application:
         r"""Retrieves specified application.
@@ -445,7 +445,7 @@ class ApplicationServiceClient(metaclass=ApplicationServiceClientMeta):
         *,
         application: gct_application.Application = None,
         retry: retries.Retry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: float = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> gct_application.Application:
         r"""Updates specified application.
@@ -521,7 +521,7 @@ class ApplicationServiceClient(metaclass=ApplicationServiceClientMeta):
         *,
         name: str = None,
         retry: retries.Retry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: float = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> None:
         r"""Deletes specified application.
@@ -591,7 +591,7 @@ class ApplicationServiceClient(metaclass=ApplicationServiceClientMeta):
         *,
         parent: str = None,
         retry: retries.Retry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: float = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> pagers.ListApplicationsPager:
         r"""Lists all applications associated with the profile.
@@ -665,7 +665,12 @@ class ApplicationServiceClient(metaclass=ApplicationServiceClientMeta):
         # This method is paged; wrap the response in a pager, which provides
         # an `__iter__` convenience method.
         response = pagers.ListApplicationsPager(
-            method=rpc, request=request, response=response, metadata=metadata,
+            method=rpc,
+            request=request,
+            response=response,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
         )
 
         # Done; return the response.
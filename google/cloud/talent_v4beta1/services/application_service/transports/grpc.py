@@ -22,6 +22,11 @@ from google.api_core import grpc_helpers  # type: ignore
 from google.api_core import gapic_v1  # type: ignore
 from google import auth  # type: ignore
 from google.auth import credentials  # type: ignore
+from google.cloud.talent_helpers import metrics as metrics_lib  # type: ignore
+from google.cloud.talent_helpers import profiling  # type: ignore
+from google.cloud.talent_helpers import compression as compression_lib  # type: ignore
+from google.cloud.talent_helpers import resilience as resilience_lib  # type: ignore
+from google.cloud.talent_helpers import method_config as method_config_lib  # type: ignore
 from google.auth.transport.grpc import SslCredentials  # type: ignore
 
 import grpc  # type: ignore
@@ -63,6 +68,11 @@ class ApplicationServiceGrpcTransport(ApplicationServiceTransport):
         ssl_channel_credentials: grpc.ChannelCredentials = None,
         quota_project_id: Optional[str] = None,
         client_info: gapic_v1.client_info.ClientInfo = DEFAULT_CLIENT_INFO,
+        metrics: Optional[metrics_lib.MetricsRecorder] = None,
+        profiler: Optional[profiling.CallProfiler] = None,
+        compression: Optional[compression_lib.CompressionPolicy] = None,
+        resilience: Optional[resilience_lib.ResiliencePolicy] = None,
+        method_config: Optional[method_config_lib.MethodConfig] = None,
     ) -> None:
         """Instantiate the transport.
 
@@ -98,6 +108,23 @@ class ApplicationServiceGrpcTransport(ApplicationServiceTransport):
                 API requests. If ``None``, then default info will be used.	
                 Generally, you only need to set this if you're developing	
                 your own client library.
+            metrics (Optional[google.cloud.talent_helpers.metrics.MetricsRecorder]):
+                A recorder for per-method latency, retry, status code and
+                payload size metrics. If ``None``, nothing is recorded.
+            profiler (Optional[google.cloud.talent_helpers.profiling.CallProfiler]):
+                A profiler reporting how long each call spends building,
+                serializing, on the network, deserializing and retrying.
+                If ``None``, calls are not profiled.
+            compression (Optional[google.cloud.talent_helpers.compression.CompressionPolicy]):
+                Chooses the gRPC compression of each request by method
+                and size. If ``None``, requests are not compressed.
+            resilience (Optional[google.cloud.talent_helpers.resilience.ResiliencePolicy]):
+                Applies a retry budget and per-method circuit breakers
+                to every call. If ``None``, retries are only bounded by
+                each method's retry policy.
+            method_config (Optional[google.cloud.talent_helpers.method_config.MethodConfig]):
+                Overrides the default timeout and retry of each
+                method. If ``None``, the generated defaults apply.
 
         Raises:
           google.auth.exceptions.MutualTLSChannelError: If mutual TLS transport
@@ -176,6 +203,11 @@ class ApplicationServiceGrpcTransport(ApplicationServiceTransport):
             scopes=scopes or self.AUTH_SCOPES,
             quota_project_id=quota_project_id,
             client_info=client_info,
+            metrics=metrics,
+            profiler=profiler,
+            compression=compression,
+            resilience=resilience,
+            method_config=method_config,
         )
 
     @classmethod
@@ -256,8 +288,12 @@ class ApplicationServiceGrpcTransport(ApplicationServiceTransport):
         if "create_application" not in self._stubs:
             self._stubs["create_application"] = self.grpc_channel.unary_unary(
                 "/google.cloud.talent.v4beta1.ApplicationService/CreateApplication",
-                request_serializer=application_service.CreateApplicationRequest.serialize,
-                response_deserializer=gct_application.Application.deserialize,
+                request_serializer=self._wrap_serializer(
+                    application_service.CreateApplicationRequest.serialize
+                ),
+                response_deserializer=self._wrap_deserializer(
+                    gct_application.Application.deserialize
+                ),
             )
         return self._stubs["create_application"]
 
@@ -282,8 +318,12 @@ class ApplicationServiceGrpcTransport(ApplicationServiceTransport):
         if "get_application" not in self._stubs:
             self._stubs["get_application"] = self.grpc_channel.unary_unary(
                 "/google.cloud.talent.v4beta1.ApplicationService/GetApplication",
-                request_serializer=application_service.GetApplicationRequest.serialize,
-                response_deserializer=application.Application.deserialize,
+                request_serializer=self._wrap_serializer(
+                    application_service.GetApplicationRequest.serialize
+                ),
+                response_deserializer=self._wrap_deserializer(
+                    application.Application.deserialize
+                ),
             )
         return self._stubs["get_application"]
 
@@ -310,8 +350,12 @@ class ApplicationServiceGrpcTransport(ApplicationServiceTransport):
         if "update_application" not in self._stubs:
             self._stubs["update_application"] = self.grpc_channel.unary_unary(
                 "/google.cloud.talent.v4beta1.ApplicationService/UpdateApplication",
-                request_serializer=application_service.UpdateApplicationRequest.serialize,
-                response_deserializer=gct_application.Application.deserialize,
+                request_serializer=self._wrap_serializer(
+                    application_service.UpdateApplicationRequest.serialize
+                ),
+                response_deserializer=self._wrap_deserializer(
+                    gct_application.Application.deserialize
+                ),
             )
         return self._stubs["update_application"]
 
@@ -336,8 +380,10 @@ class ApplicationServiceGrpcTransport(ApplicationServiceTransport):
         if "delete_application" not in self._stubs:
             self._stubs["delete_application"] = self.grpc_channel.unary_unary(
                 "/google.cloud.talent.v4beta1.ApplicationService/DeleteApplication",
-                request_serializer=application_service.DeleteApplicationRequest.serialize,
-                response_deserializer=empty.Empty.FromString,
+                request_serializer=self._wrap_serializer(
+                    application_service.DeleteApplicationRequest.serialize
+                ),
+                response_deserializer=self._wrap_deserializer(empty.Empty.FromString),
             )
         return self._stubs["delete_application"]
 
@@ -365,8 +411,12 @@ class ApplicationServiceGrpcTransport(ApplicationServiceTransport):
         if "list_applications" not in self._stubs:
             self._stubs["list_applications"] = self.grpc_channel.unary_unary(
                 "/google.cloud.talent.v4beta1.ApplicationService/ListApplications",
-                request_serializer=application_service.ListApplicationsRequest.serialize,
-                response_deserializer=application_service.ListApplicationsResponse.deserialize,
+                request_serializer=self._wrap_serializer(
+                    application_service.ListApplicationsRequest.serialize
+                ),
+                response_deserializer=self._wrap_deserializer(
+                    application_service.ListApplicationsResponse.deserialize
+                ),
             )
         return self._stubs["list_applications"]
 
@@ -22,6 +22,11 @@ from google.api_core import gapic_v1  # type: ignore
 from google.api_core import grpc_helpers_async  # type: ignore
 from google import auth  # type: ignore
 from google.auth import credentials  # type: ignore
+from google.cloud.talent_helpers import metrics as metrics_lib  # type: ignore
+from google.cloud.talent_helpers import profiling  # type: ignore
+from google.cloud.talent_helpers import compression as compression_lib  # type: ignore
+from google.cloud.talent_helpers import resilience as resilience_lib  # type: ignore
+from google.cloud.talent_helpers import method_config as method_config_lib  # type: ignore
 from google.auth.transport.grpc import SslCredentials  # type: ignore
 
 import grpc  # type: ignore
@@ -107,6 +112,11 @@ class ApplicationServiceGrpcAsyncIOTransport(ApplicationServiceTransport):
         ssl_channel_credentials: grpc.ChannelCredentials = None,
         quota_project_id=None,
         client_info: gapic_v1.client_info.ClientInfo = DEFAULT_CLIENT_INFO,
+        metrics: Optional[metrics_lib.MetricsRecorder] = None,
+        profiler: Optional[profiling.CallProfiler] = None,
+        compression: Optional[compression_lib.CompressionPolicy] = None,
+        resilience: Optional[resilience_lib.ResiliencePolicy] = None,
+        method_config: Optional[method_config_lib.MethodConfig] = None,
     ) -> None:
         """Instantiate the transport.
 
@@ -143,6 +153,23 @@ class ApplicationServiceGrpcAsyncIOTransport(ApplicationServiceTransport):
                 API requests. If ``None``, then default info will be used.	
                 Generally, you only need to set this if you're developing	
                 your own client library.
+            metrics (Optional[google.cloud.talent_helpers.metrics.MetricsRecorder]):
+                A recorder for per-method latency, retry, status code and
+                payload size metrics. If ``None``, nothing is recorded.
+            profiler (Optional[google.cloud.talent_helpers.profiling.CallProfiler]):
+                A profiler reporting how long each call spends building,
+                serializing, on the network, deserializing and retrying.
+                If ``None``, calls are not profiled.
+            compression (Optional[google.cloud.talent_helpers.compression.CompressionPolicy]):
+                Chooses the gRPC compression of each request by method
+                and size. If ``None``, requests are not compressed.
+            resilience (Optional[google.cloud.talent_helpers.resilience.ResiliencePolicy]):
+                Applies a retry budget and per-method circuit breakers
+                to every call. If ``None``, retries are only bounded by
+                each method's retry policy.
+            method_config (Optional[google.cloud.talent_helpers.method_config.MethodConfig]):
+                Overrides the default timeout and retry of each
+                method. If ``None``, the generated defaults apply.
 
         Raises:
             google.auth.exceptions.MutualTlsChannelError: If mutual TLS transport
@@ -211,6 +238,8 @@ class ApplicationServiceGrpcAsyncIOTransport(ApplicationServiceTransport):
                 quota_project_id=quota_project_id,
             )
 
+        self._stubs = {}
+
         # Run the base constructor.
         super().__init__(
             host=host,
@@ -219,10 +248,13 @@ class ApplicationServiceGrpcAsyncIOTransport(ApplicationServiceTransport):
             scopes=scopes or self.AUTH_SCOPES,
             quota_project_id=quota_project_id,
             client_info=client_info,
+            metrics=metrics,
+            profiler=profiler,
+            compression=compression,
+            resilience=resilience,
+            method_config=method_config,
         )
 
-        self._stubs = {}
-
     @property
     def grpc_channel(self) -> aio.Channel:
         """Create the channel designed to connect to this service.
@@ -257,8 +289,12 @@ class ApplicationServiceGrpcAsyncIOTransport(ApplicationServiceTransport):
         if "create_application" not in self._stubs:
             self._stubs["create_application"] = self.grpc_channel.unary_unary(
                 "/google.cloud.talent.v4beta1.ApplicationService/CreateApplication",
-                request_serializer=application_service.CreateApplicationRequest.serialize,
-                response_deserializer=gct_application.Application.deserialize,
+                request_serializer=self._wrap_serializer(
+                    application_service.CreateApplicationRequest.serialize
+                ),
+                response_deserializer=self._wrap_deserializer(
+                    gct_application.Application.deserialize
+                ),
             )
         return self._stubs["create_application"]
 
@@ -285,8 +321,12 @@ class ApplicationServiceGrpcAsyncIOTransport(ApplicationServiceTransport):
         if "get_application" not in self._stubs:
             self._stubs["get_application"] = self.grpc_channel.unary_unary(
                 "/google.cloud.talent.v4beta1.ApplicationService/GetApplication",
-                request_serializer=application_service.GetApplicationRequest.serialize,
-                response_deserializer=application.Application.deserialize,
+                request_serializer=self._wrap_serializer(
+                    application_service.GetApplicationRequest.serialize
+                ),
+                response_deserializer=self._wrap_deserializer(
+                    application.Application.deserialize
+                ),
             )
         return self._stubs["get_application"]
 
@@ -314,8 +354,12 @@ class ApplicationServiceGrpcAsyncIOTransport(ApplicationServiceTransport):
         if "update_application" not in self._stubs:
             self._stubs["update_application"] = self.grpc_channel.unary_unary(
                 "/google.cloud.talent.v4beta1.ApplicationService/UpdateApplication",
-                request_serializer=application_service.UpdateApplicationRequest.serialize,
-                response_deserializer=gct_application.Application.deserialize,
+                request_serializer=self._wrap_serializer(
+                    application_service.UpdateApplicationRequest.serialize
+                ),
+                response_deserializer=self._wrap_deserializer(
+                    gct_application.Application.deserialize
+                ),
             )
         return self._stubs["update_application"]
 
@@ -342,8 +386,10 @@ class ApplicationServiceGrpcAsyncIOTransport(ApplicationServiceTransport):
         if "delete_application" not in self._stubs:
             self._stubs["delete_application"] = self.grpc_channel.unary_unary(
                 "/google.cloud.talent.v4beta1.ApplicationService/DeleteApplication",
-                request_serializer=application_service.DeleteApplicationRequest.serialize,
-                response_deserializer=empty.Empty.FromString,
+                request_serializer=self._wrap_serializer(
+                    application_service.DeleteApplicationRequest.serialize
+                ),
+                response_deserializer=self._wrap_deserializer(empty.Empty.FromString),
             )
         return self._stubs["delete_application"]
 
@@ -371,8 +417,12 @@ class ApplicationServiceGrpcAsyncIOTransport(ApplicationServiceTransport):
         if "list_applications" not in self._stubs:
             self._stubs["list_applications"] = self.grpc_channel.unary_unary(
                 "/google.cloud.talent.v4beta1.ApplicationService/ListApplications",
-                request_serializer=application_service.ListApplicationsRequest.serialize,
-                response_deserializer=application_service.ListApplicationsResponse.deserialize,
+                request_serializer=self._wrap_serializer(
+                    application_service.ListApplicationsRequest.serialize
+                ),
+                response_deserializer=self._wrap_deserializer(
+                    application_service.ListApplicationsResponse.deserialize
+                ),
             )
         return self._stubs["list_applications"]
 
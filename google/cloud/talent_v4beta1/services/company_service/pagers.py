@@ -17,11 +17,15 @@
 
 from typing import Any, AsyncIterable, Awaitable, Callable, Iterable, Sequence, Tuple
 
+from google.api_core import gapic_v1  # type: ignore
+from google.api_core import retry as retries  # type: ignore
+from google.cloud.talent_helpers import paging  # type: ignore
+
 from google.cloud.talent_v4beta1.types import company
 from google.cloud.talent_v4beta1.types import company_service
 
 
-class ListCompaniesPager:
+class ListCompaniesPager(paging.CheckpointMixin):
     """A pager for iterating through ``list_companies`` requests.
 
     This class thinly wraps an initial
@@ -45,6 +49,8 @@ class ListCompaniesPager:
         request: company_service.ListCompaniesRequest,
         response: company_service.ListCompaniesResponse,
         *,
+        retry: retries.Retry = gapic_v1.method.DEFAULT,
+        timeout: float = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = ()
     ):
         """Instantiate the pager.
@@ -56,12 +62,17 @@ class ListCompaniesPager:
                 The initial request object.
             response (:class:`~.company_service.ListCompaniesResponse`):
                 The initial response object.
+            retry (google.api_core.retry.Retry): Designation of what errors,
+                if any, should be retried when fetching further pages.
+            timeout (float): The timeout for each further page request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
         """
         self._method = method
         self._request = company_service.ListCompaniesRequest(request)
         self._response = response
+        self._retry = retry
+        self._timeout = timeout
         self._metadata = metadata
 
     def __getattr__(self, name: str) -> Any:
@@ -70,20 +81,18 @@ class ListCompaniesPager:
     @property
     def pages(self) -> Iterable[company_service.ListCompaniesResponse]:
         yield self._response
-        while self._response.next_page_token:
-            self._request.page_token = self._response.next_page_token
-            self._response = self._method(self._request, metadata=self._metadata)
+        while self._next_page():
             yield self._response
 
     def __iter__(self) -> Iterable[company.Company]:
         for page in self.pages:
-            yield from page.companies
+            yield from self._track(page.companies)
 
     def __repr__(self) -> str:
         return "{0}<{1!r}>".format(self.__class__.__name__, self._response)
 
 
-class ListCompaniesAsyncPager:
+class ListCompaniesAsyncPager(paging.CheckpointMixin):
     """A pager for iterating through ``list_companies`` requests.
 
     This class thinly wraps an initial
@@ -107,6 +116,8 @@ class ListCompaniesAsyncPager:
         request: company_service.ListCompaniesRequest,
         response: company_service.ListCompaniesResponse,
         *,
+        retry: retries.Retry = gapic_v1.method.DEFAULT,
+        timeout: float = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = ()
     ):
         """Instantiate the pager.
@@ -118,12 +129,17 @@ class ListCompaniesAsyncPager:
                 The initial request object.
             response (:class:`~.company_service.ListCompaniesResponse`):
                 The initial response object.
+            retry (google.api_core.retry.Retry): Designation of what errors,
+                if any, should be retried when fetching further pages.
+            timeout (float): The timeout for each further page request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
         """
         self._method = method
         self._request = company_service.ListCompaniesRequest(request)
         self._response = response
+        self._retry = retry
+        self._timeout = timeout
         self._metadata = metadata
 
     def __getattr__(self, name: str) -> Any:
@@ -132,15 +148,13 @@ class ListCompaniesAsyncPager:
     @property
     async def pages(self) -> AsyncIterable[company_service.ListCompaniesResponse]:
         yield self._response
-        while self._response.next_page_token:
-            self._request.page_token = self._response.next_page_token
-            self._response = await self._method(self._request, metadata=self._metadata)
+        while await self._next_page_async():
             yield self._response
 
     def __aiter__(self) -> AsyncIterable[company.Company]:
         async def async_generator():
             async for page in self.pages:
-                for response in page.companies:
+                for response in self._track(page.companies):
                     yield response
 
         return async_generator()
@@ -24,6 +24,12 @@ from google.api_core import exceptions  # type: ignore
 from google.api_core import gapic_v1  # type: ignore
 from google.api_core import retry as retries  # type: ignore
 from google.auth import credentials  # type: ignore
+from google.cloud.talent_helpers import metrics as metrics_lib  # type: ignore
+from google.cloud.talent_helpers import wrapping  # type: ignore
+from google.cloud.talent_helpers import profiling  # type: ignore
+from google.cloud.talent_helpers import compression as compression_lib  # type: ignore
+from google.cloud.talent_helpers import resilience as resilience_lib  # type: ignore
+from google.cloud.talent_helpers import method_config as method_config_lib  # type: ignore
 
 from google.cloud.talent_v4beta1.types import company
 from google.cloud.talent_v4beta1.types import company as gct_company
@@ -56,6 +62,11 @@ class CompanyServiceTransport(abc.ABC):
         scopes: typing.Optional[typing.Sequence[str]] = AUTH_SCOPES,
         quota_project_id: typing.Optional[str] = None,
         client_info: gapic_v1.client_info.ClientInfo = DEFAULT_CLIENT_INFO,
+        metrics: typing.Optional[metrics_lib.MetricsRecorder] = None,
+        profiler: typing.Optional[profiling.CallProfiler] = None,
+        compression: typing.Optional[compression_lib.CompressionPolicy] = None,
+        resilience: typing.Optional[resilience_lib.ResiliencePolicy] = None,
+        method_config: typing.Optional[method_config_lib.MethodConfig] = None,
         **kwargs,
     ) -> None:
         """Instantiate the transport.
@@ -78,6 +89,23 @@ class CompanyServiceTransport(abc.ABC):
                 API requests. If ``None``, then default info will be used.	
                 Generally, you only need to set this if you're developing	
                 your own client library.
+            metrics (Optional[google.cloud.talent_helpers.metrics.MetricsRecorder]):
+                A recorder for per-method latency, retry, status code and
+                payload size metrics. If ``None``, nothing is recorded.
+            profiler (Optional[google.cloud.talent_helpers.profiling.CallProfiler]):
+                A profiler reporting how long each call spends building,
+                serializing, on the network, deserializing and retrying.
+                If ``None``, calls are not profiled.
+            compression (Optional[google.cloud.talent_helpers.compression.CompressionPolicy]):
+                Chooses the gRPC compression of each request by method
+                and size. If ``None``, requests are not compressed.
+            resilience (Optional[google.cloud.talent_helpers.resilience.ResiliencePolicy]):
+                Applies a retry budget and per-method circuit breakers
+                to every call. If ``None``, retries are only bounded by
+                each method's retry policy.
+            method_config (Optional[google.cloud.talent_helpers.method_config.MethodConfig]):
+                Overrides the default timeout and retry of each
+                method. If ``None``, the generated defaults apply.
         """
         # Save the hostname. Default to port 443 (HTTPS) if none is specified.
         if ":" not in host:
@@ -104,17 +132,23 @@ class CompanyServiceTransport(abc.ABC):
         # Save the credentials.
         self._credentials = credentials
 
+        # Save the interceptors applied around every wrapped method.
+        self._interceptors = tuple(
+            i for i in (metrics, profiler, compression, resilience) if i is not None
+        )
+        self._method_config = method_config
+
         # Lifted into its own function so it can be stubbed out during tests.
         self._prep_wrapped_messages(client_info)
 
     def _prep_wrapped_messages(self, client_info):
         # Precompute the wrapped methods.
         self._wrapped_methods = {
-            self.create_company: gapic_v1.method.wrap_method(
-                self.create_company, default_timeout=30.0, client_info=client_info,
+            self.create_company: self._wrap_method(
+                "create_company", default_timeout=30.0, client_info=client_info,
             ),
-            self.get_company: gapic_v1.method.wrap_method(
-                self.get_company,
+            self.get_company: self._wrap_method(
+                "get_company",
                 default_retry=retries.Retry(
                     initial=0.1,
                     maximum=60.0,
@@ -126,11 +160,11 @@ class CompanyServiceTransport(abc.ABC):
                 default_timeout=30.0,
                 client_info=client_info,
             ),
-            self.update_company: gapic_v1.method.wrap_method(
-                self.update_company, default_timeout=30.0, client_info=client_info,
+            self.update_company: self._wrap_method(
+                "update_company", default_timeout=30.0, client_info=client_info,
             ),
-            self.delete_company: gapic_v1.method.wrap_method(
-                self.delete_company,
+            self.delete_company: self._wrap_method(
+                "delete_company",
                 default_retry=retries.Retry(
                     initial=0.1,
                     maximum=60.0,
@@ -142,8 +176,8 @@ class CompanyServiceTransport(abc.ABC):
                 default_timeout=30.0,
                 client_info=client_info,
             ),
-            self.list_companies: gapic_v1.method.wrap_method(
-                self.list_companies,
+            self.list_companies: self._wrap_method(
+                "list_companies",
                 default_retry=retries.Retry(
                     initial=0.1,
                     maximum=60.0,
@@ -157,6 +191,30 @@ class CompanyServiceTransport(abc.ABC):
             ),
         }
 
+    def _wrap_method(self, name, **kwargs):
+        # Apply retry, timeout, error mapping and this transport's
+        # interceptors to the stub behind the ``name`` property.
+        return wrapping.wrap_method(
+            getattr(self, name),
+            service="google.cloud.talent.v4beta1.CompanyService",
+            method=name,
+            interceptors=self._interceptors,
+            method_config=self._method_config,
+            **kwargs,
+        )
+
+    def _wrap_serializer(self, func):
+        # Let this transport's interceptors observe request encoding.
+        return wrapping.wrap_codec(
+            func, serializer=True, interceptors=self._interceptors
+        )
+
+    def _wrap_deserializer(self, func):
+        # Let this transport's interceptors observe response decoding.
+        return wrapping.wrap_codec(
+            func, serializer=False, interceptors=self._interceptors
+        )
+
     @property
     def create_company(
         self,
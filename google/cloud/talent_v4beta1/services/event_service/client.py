@@ -253,7 +253,7 @@ class EventServiceClient(metaclass=EventServiceClientMeta):
         parent: str = None,
         client_event: event.ClientEvent = None,
         retry: retries.Retry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: float = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> event.ClientEvent:
         r"""Report events issued when end user interacts with customer's
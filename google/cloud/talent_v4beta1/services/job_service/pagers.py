@@ -17,11 +17,15 @@
 
 from typing import Any, AsyncIterable, Awaitable, Callable, Iterable, Sequence, Tuple
 
+from google.api_core import gapic_v1  # type: ignore
+from google.api_core import retry as retries  # type: ignore
+from google.cloud.talent_helpers import paging  # type: ignore
+
 from google.cloud.talent_v4beta1.types import job
 from google.cloud.talent_v4beta1.types import job_service
 
 
-class ListJobsPager:
+class ListJobsPager(paging.CheckpointMixin):
     """A pager for iterating through ``list_jobs`` requests.
 
     This class thinly wraps an initial
@@ -45,6 +49,8 @@ class ListJobsPager:
         request: job_service.ListJobsRequest,
         response: job_service.ListJobsResponse,
         *,
+        retry: retries.Retry = gapic_v1.method.DEFAULT,
+        timeout: float = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = ()
     ):
         """Instantiate the pager.
@@ -56,12 +62,17 @@ class ListJobsPager:
                 The initial request object.
             response (:class:`~.job_service.ListJobsResponse`):
                 The initial response object.
+            retry (google.api_core.retry.Retry): Designation of what errors,
+                if any, should be retried when fetching further pages.
+            timeout (float): The timeout for each further page request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
         """
         self._method = method
         self._request = job_service.ListJobsRequest(request)
         self._response = response
+        self._retry = retry
+        self._timeout = timeout
         self._metadata = metadata
 
     def __getattr__(self, name: str) -> Any:
@@ -70,20 +81,18 @@ class ListJobsPager:
     @property
     def pages(self) -> Iterable[job_service.ListJobsResponse]:
         yield self._response
-        while self._response.next_page_token:
-            self._request.page_token = self._response.next_page_token
-            self._response = self._method(self._request, metadata=self._metadata)
+        while self._next_page():
             yield self._response
 
     def __iter__(self) -> Iterable[job.Job]:
         for page in self.pages:
-            yield from page.jobs
+            yield from self._track(page.jobs)
 
     def __repr__(self) -> str:
         return "{0}<{1!r}>".format(self.__class__.__name__, self._response)
 
 
-class ListJobsAsyncPager:
+class ListJobsAsyncPager(paging.CheckpointMixin):
     """A pager for iterating through ``list_jobs`` requests.
 
     This class thinly wraps an initial
@@ -107,6 +116,8 @@ class ListJobsAsyncPager:
         request: job_service.ListJobsRequest,
         response: job_service.ListJobsResponse,
         *,
+        retry: retries.Retry = gapic_v1.method.DEFAULT,
+        timeout: float = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = ()
     ):
         """Instantiate the pager.
@@ -118,12 +129,17 @@ class ListJobsAsyncPager:
                 The initial request object.
             response (:class:`~.job_service.ListJobsResponse`):
                 The initial response object.
+            retry (google.api_core.retry.Retry): Designation of what errors,
+                if any, should be retried when fetching further pages.
+            timeout (float): The timeout for each further page request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
         """
         self._method = method
         self._request = job_service.ListJobsRequest(request)
         self._response = response
+        self._retry = retry
+        self._timeout = timeout
         self._metadata = metadata
 
     def __getattr__(self, name: str) -> Any:
@@ -132,15 +148,13 @@ class ListJobsAsyncPager:
     @property
     async def pages(self) -> AsyncIterable[job_service.ListJobsResponse]:
         yield self._response
-        while self._response.next_page_token:
-            self._request.page_token = self._response.next_page_token
-            self._response = await self._method(self._request, metadata=self._metadata)
+        while await self._next_page_async():
             yield self._response
 
     def __aiter__(self) -> AsyncIterable[job.Job]:
         async def async_generator():
             async for page in self.pages:
-                for response in page.jobs:
+                for response in self._track(page.jobs):
                     yield response
 
         return async_generator()
@@ -149,7 +163,7 @@ class ListJobsAsyncPager:
         return "{0}<{1!r}>".format(self.__class__.__name__, self._response)
 
 
-class SearchJobsPager:
+class SearchJobsPager(paging.CheckpointMixin):
     """A pager for iterating through ``search_jobs`` requests.
 
     This class thinly wraps an initial
@@ -173,6 +187,8 @@ class SearchJobsPager:
         request: job_service.SearchJobsRequest,
         response: job_service.SearchJobsResponse,
         *,
+        retry: retries.Retry = gapic_v1.method.DEFAULT,
+        timeout: float = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = ()
     ):
         """Instantiate the pager.
@@ -184,12 +200,17 @@ class SearchJobsPager:
                 The initial request object.
             response (:class:`~.job_service.SearchJobsResponse`):
                 The initial response object.
+            retry (google.api_core.retry.Retry): Designation of what errors,
+                if any, should be retried when fetching further pages.
+            timeout (float): The timeout for each further page request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
         """
         self._method = method
         self._request = job_service.SearchJobsRequest(request)
         self._response = response
+        self._retry = retry
+        self._timeout = timeout
         self._metadata = metadata
 
     def __getattr__(self, name: str) -> Any:
@@ -198,20 +219,18 @@ class SearchJobsPager:
     @property
     def pages(self) -> Iterable[job_service.SearchJobsResponse]:
         yield self._response
-        while self._response.next_page_token:
-            self._request.page_token = self._response.next_page_token
-            self._response = self._method(self._request, metadata=self._metadata)
+        while self._next_page():
             yield self._response
 
     def __iter__(self) -> Iterable[job_service.SearchJobsResponse.MatchingJob]:
         for page in self.pages:
-            yield from page.matching_jobs
+            yield from self._track(page.matching_jobs)
 
     def __repr__(self) -> str:
         return "{0}<{1!r}>".format(self.__class__.__name__, self._response)
 
 
-class SearchJobsAsyncPager:
+class SearchJobsAsyncPager(paging.CheckpointMixin):
     """A pager for iterating through ``search_jobs`` requests.
 
     This class thinly wraps an initial
@@ -235,6 +254,8 @@ class SearchJobsAsyncPager:
         request: job_service.SearchJobsRequest,
         response: job_service.SearchJobsResponse,
         *,
+        retry: retries.Retry = gapic_v1.method.DEFAULT,
+        timeout: float = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = ()
     ):
         """Instantiate the pager.
@@ -246,12 +267,17 @@ class SearchJobsAsyncPager:
                 The initial request object.
             response (:class:`~.job_service.SearchJobsResponse`):
                 The initial response object.
+            retry (google.api_core.retry.Retry): Designation of what errors,
+                if any, should be retried when fetching further pages.
+            timeout (float): The timeout for each further page request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
         """
         self._method = method
         self._request = job_service.SearchJobsRequest(request)
         self._response = response
+        self._retry = retry
+        self._timeout = timeout
         self._metadata = metadata
 
     def __getattr__(self, name: str) -> Any:
@@ -260,15 +286,13 @@ class SearchJobsAsyncPager:
     @property
     async def pages(self) -> AsyncIterable[job_service.SearchJobsResponse]:
         yield self._response
-        while self._response.next_page_token:
-            self._request.page_token = self._response.next_page_token
-            self._response = await self._method(self._request, metadata=self._metadata)
+        while await self._next_page_async():
             yield self._response
 
     def __aiter__(self) -> AsyncIterable[job_service.SearchJobsResponse.MatchingJob]:
         async def async_generator():
             async for page in self.pages:
-                for response in page.matching_jobs:
+                for response in self._track(page.matching_jobs):
                     yield response
 
         return async_generator()
@@ -277,7 +301,7 @@ class SearchJobsAsyncPager:
         return "{0}<{1!r}>".format(self.__class__.__name__, self._response)
 
 
-class SearchJobsForAlertPager:
+class SearchJobsForAlertPager(paging.CheckpointMixin):
     """A pager for iterating through ``search_jobs_for_alert`` requests.
 
     This class thinly wraps an initial
@@ -301,6 +325,8 @@ class SearchJobsForAlertPager:
         request: job_service.SearchJobsRequest,
         response: job_service.SearchJobsResponse,
         *,
+        retry: retries.Retry = gapic_v1.method.DEFAULT,
+        timeout: float = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = ()
     ):
         """Instantiate the pager.
@@ -312,12 +338,17 @@ class SearchJobsForAlertPager:
                 The initial request object.
             response (:class:`~.job_service.SearchJobsResponse`):
                 The initial response object.
+            retry (google.api_core.retry.Retry): Designation of what errors,
+                if any, should be retried when fetching further pages.
+            timeout (float): The timeout for each further page request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
         """
         self._method = method
         self._request = job_service.SearchJobsRequest(request)
         self._response = response
+        self._retry = retry
+        self._timeout = timeout
         self._metadata = metadata
 
     def __getattr__(self, name: str) -> Any:
@@ -326,20 +357,18 @@ class SearchJobsForAlertPager:
     @property
     def pages(self) -> Iterable[job_service.SearchJobsResponse]:
         yield self._response
-        while self._response.next_page_token:
-            self._request.page_token = self._response.next_page_token
-            self._response = self._method(self._request, metadata=self._metadata)
+        while self._next_page():
             yield self._response
 
     def __iter__(self) -> Iterable[job_service.SearchJobsResponse.MatchingJob]:
         for page in self.pages:
-            yield from page.matching_jobs
+            yield from self._track(page.matching_jobs)
 
     def __repr__(self) -> str:
         return "{0}<{1!r}>".format(self.__class__.__name__, self._response)
 
 
-class SearchJobsForAlertAsyncPager:
+class SearchJobsForAlertAsyncPager(paging.CheckpointMixin):
     """A pager for iterating through ``search_jobs_for_alert`` requests.
 
     This class thinly wraps an initial
@@ -363,6 +392,8 @@ class SearchJobsForAlertAsyncPager:
         request: job_service.SearchJobsRequest,
         response: job_service.SearchJobsResponse,
         *,
+        retry: retries.Retry = gapic_v1.method.DEFAULT,
+        timeout: float = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = ()
     ):
         """Instantiate the pager.
@@ -374,12 +405,17 @@ class SearchJobsForAlertAsyncPager:
                 The initial request object.
             response (:class:`~.job_service.SearchJobsResponse`):
                 The initial response object.
+            retry (google.api_core.retry.Retry): Designation of what errors,
+                if any, should be retried when fetching further pages.
+            timeout (float): The timeout for each further page request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
         """
         self._method = method
         self._request = job_service.SearchJobsRequest(request)
         self._response = response
+        self._retry = retry
+        self._timeout = timeout
         self._metadata = metadata
 
     def __getattr__(self, name: str) -> Any:
@@ -388,15 +424,13 @@ class SearchJobsForAlertAsyncPager:
     @property
     async def pages(self) -> AsyncIterable[job_service.SearchJobsResponse]:
         yield self._response
-        while self._response.next_page_token:
-            self._request.page_token = self._response.next_page_token
-            self._response = await self._method(self._request, metadata=self._metadata)
+        while await self._next_page_async():
             yield self._response
 
     def __aiter__(self) -> AsyncIterable[job_service.SearchJobsResponse.MatchingJob]:
         async def async_generator():
             async for page in self.pages:
-                for response in page.matching_jobs:
+                for response in self._track(page.matching_jobs):
                     yield response
 
         return async_generator()
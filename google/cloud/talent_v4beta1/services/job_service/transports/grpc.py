@@ -23,6 +23,11 @@ from google.api_core import operations_v1  # type: ignore
 from google.api_core import gapic_v1  # type: ignore
 from google import auth  # type: ignore
 from google.auth import credentials  # type: ignore
+from google.cloud.talent_helpers import metrics as metrics_lib  # type: ignore
+from google.cloud.talent_helpers import profiling  # type: ignore
+from google.cloud.talent_helpers import compression as compression_lib  # type: ignore
+from google.cloud.talent_helpers import resilience as resilience_lib  # type: ignore
+from google.cloud.talent_helpers import method_config as method_config_lib  # type: ignore
 from google.auth.transport.grpc import SslCredentials  # type: ignore
 
 import grpc  # type: ignore
@@ -65,6 +70,11 @@ class JobServiceGrpcTransport(JobServiceTransport):
         ssl_channel_credentials: grpc.ChannelCredentials = None,
         quota_project_id: Optional[str] = None,
         client_info: gapic_v1.client_info.ClientInfo = DEFAULT_CLIENT_INFO,
+        metrics: Optional[metrics_lib.MetricsRecorder] = None,
+        profiler: Optional[profiling.CallProfiler] = None,
+        compression: Optional[compression_lib.CompressionPolicy] = None,
+        resilience: Optional[resilience_lib.ResiliencePolicy] = None,
+        method_config: Optional[method_config_lib.MethodConfig] = None,
     ) -> None:
         """Instantiate the transport.
 
@@ -100,6 +110,23 @@ class JobServiceGrpcTransport(JobServiceTransport):
                 API requests. If ``None``, then default info will be used.	
                 Generally, you only need to set this if you're developing	
                 your own client library.
+            metrics (Optional[google.cloud.talent_helpers.metrics.MetricsRecorder]):
+                A recorder for per-method latency, retry, status code and
+                payload size metrics. If ``None``, nothing is recorded.
+            profiler (Optional[google.cloud.talent_helpers.profiling.CallProfiler]):
+                A profiler reporting how long each call spends building,
+                serializing, on the network, deserializing and retrying.
+                If ``None``, calls are not profiled.
+            compression (Optional[google.cloud.talent_helpers.compression.CompressionPolicy]):
+                Chooses the gRPC compression of each request by method
+                and size. If ``None``, requests are not compressed.
+            resilience (Optional[google.cloud.talent_helpers.resilience.ResiliencePolicy]):
+                Applies a retry budget and per-method circuit breakers
+                to every call. If ``None``, retries are only bounded by
+                each method's retry policy.
+            method_config (Optional[google.cloud.talent_helpers.method_config.MethodConfig]):
+                Overrides the default timeout and retry of each
+                method. If ``None``, the generated defaults apply.
 
         Raises:
           google.auth.exceptions.MutualTLSChannelError: If mutual TLS transport
@@ -178,6 +205,11 @@ class JobServiceGrpcTransport(JobServiceTransport):
             scopes=scopes or self.AUTH_SCOPES,
             quota_project_id=quota_project_id,
             client_info=client_info,
+            metrics=metrics,
+            profiler=profiler,
+            compression=compression,
+            resilience=resilience,
+            method_config=method_config,
         )
 
     @classmethod
@@ -272,8 +304,10 @@ class JobServiceGrpcTransport(JobServiceTransport):
         if "create_job" not in self._stubs:
             self._stubs["create_job"] = self.grpc_channel.unary_unary(
                 "/google.cloud.talent.v4beta1.JobService/CreateJob",
-                request_serializer=job_service.CreateJobRequest.serialize,
-                response_deserializer=gct_job.Job.deserialize,
+                request_serializer=self._wrap_serializer(
+                    job_service.CreateJobRequest.serialize
+                ),
+                response_deserializer=self._wrap_deserializer(gct_job.Job.deserialize),
             )
         return self._stubs["create_job"]
 
@@ -298,8 +332,12 @@ class JobServiceGrpcTransport(JobServiceTransport):
         if "batch_create_jobs" not in self._stubs:
             self._stubs["batch_create_jobs"] = self.grpc_channel.unary_unary(
                 "/google.cloud.talent.v4beta1.JobService/BatchCreateJobs",
-                request_serializer=job_service.BatchCreateJobsRequest.serialize,
-                response_deserializer=operations.Operation.FromString,
+                request_serializer=self._wrap_serializer(
+                    job_service.BatchCreateJobsRequest.serialize
+                ),
+                response_deserializer=self._wrap_deserializer(
+                    operations.Operation.FromString
+                ),
             )
         return self._stubs["batch_create_jobs"]
 
@@ -323,8 +361,10 @@ class JobServiceGrpcTransport(JobServiceTransport):
         if "get_job" not in self._stubs:
             self._stubs["get_job"] = self.grpc_channel.unary_unary(
                 "/google.cloud.talent.v4beta1.JobService/GetJob",
-                request_serializer=job_service.GetJobRequest.serialize,
-                response_deserializer=job.Job.deserialize,
+                request_serializer=self._wrap_serializer(
+                    job_service.GetJobRequest.serialize
+                ),
+                response_deserializer=self._wrap_deserializer(job.Job.deserialize),
             )
         return self._stubs["get_job"]
 
@@ -350,8 +390,10 @@ class JobServiceGrpcTransport(JobServiceTransport):
         if "update_job" not in self._stubs:
             self._stubs["update_job"] = self.grpc_channel.unary_unary(
                 "/google.cloud.talent.v4beta1.JobService/UpdateJob",
-                request_serializer=job_service.UpdateJobRequest.serialize,
-                response_deserializer=gct_job.Job.deserialize,
+                request_serializer=self._wrap_serializer(
+                    job_service.UpdateJobRequest.serialize
+                ),
+                response_deserializer=self._wrap_deserializer(gct_job.Job.deserialize),
             )
         return self._stubs["update_job"]
 
@@ -376,8 +418,12 @@ class JobServiceGrpcTransport(JobServiceTransport):
         if "batch_update_jobs" not in self._stubs:
             self._stubs["batch_update_jobs"] = self.grpc_channel.unary_unary(
                 "/google.cloud.talent.v4beta1.JobService/BatchUpdateJobs",
-                request_serializer=job_service.BatchUpdateJobsRequest.serialize,
-                response_deserializer=operations.Operation.FromString,
+                request_serializer=self._wrap_serializer(
+                    job_service.BatchUpdateJobsRequest.serialize
+                ),
+                response_deserializer=self._wrap_deserializer(
+                    operations.Operation.FromString
+                ),
             )
         return self._stubs["batch_update_jobs"]
 
@@ -402,8 +448,10 @@ class JobServiceGrpcTransport(JobServiceTransport):
         if "delete_job" not in self._stubs:
             self._stubs["delete_job"] = self.grpc_channel.unary_unary(
                 "/google.cloud.talent.v4beta1.JobService/DeleteJob",
-                request_serializer=job_service.DeleteJobRequest.serialize,
-                response_deserializer=empty.Empty.FromString,
+                request_serializer=self._wrap_serializer(
+                    job_service.DeleteJobRequest.serialize
+                ),
+                response_deserializer=self._wrap_deserializer(empty.Empty.FromString),
             )
         return self._stubs["delete_job"]
 
@@ -429,8 +477,10 @@ class JobServiceGrpcTransport(JobServiceTransport):
         if "batch_delete_jobs" not in self._stubs:
             self._stubs["batch_delete_jobs"] = self.grpc_channel.unary_unary(
                 "/google.cloud.talent.v4beta1.JobService/BatchDeleteJobs",
-                request_serializer=job_service.BatchDeleteJobsRequest.serialize,
-                response_deserializer=empty.Empty.FromString,
+                request_serializer=self._wrap_serializer(
+                    job_service.BatchDeleteJobsRequest.serialize
+                ),
+                response_deserializer=self._wrap_deserializer(empty.Empty.FromString),
             )
         return self._stubs["batch_delete_jobs"]
 
@@ -455,8 +505,12 @@ class JobServiceGrpcTransport(JobServiceTransport):
         if "list_jobs" not in self._stubs:
             self._stubs["list_jobs"] = self.grpc_channel.unary_unary(
                 "/google.cloud.talent.v4beta1.JobService/ListJobs",
-                request_serializer=job_service.ListJobsRequest.serialize,
-                response_deserializer=job_service.ListJobsResponse.deserialize,
+                request_serializer=self._wrap_serializer(
+                    job_service.ListJobsRequest.serialize
+                ),
+                response_deserializer=self._wrap_deserializer(
+                    job_service.ListJobsResponse.deserialize
+                ),
             )
         return self._stubs["list_jobs"]
 
@@ -487,8 +541,12 @@ class JobServiceGrpcTransport(JobServiceTransport):
         if "search_jobs" not in self._stubs:
             self._stubs["search_jobs"] = self.grpc_channel.unary_unary(
                 "/google.cloud.talent.v4beta1.JobService/SearchJobs",
-                request_serializer=job_service.SearchJobsRequest.serialize,
-                response_deserializer=job_service.SearchJobsResponse.deserialize,
+                request_serializer=self._wrap_serializer(
+                    job_service.SearchJobsRequest.serialize
+                ),
+                response_deserializer=self._wrap_deserializer(
+                    job_service.SearchJobsResponse.deserialize
+                ),
             )
         return self._stubs["search_jobs"]
 
@@ -525,8 +583,12 @@ class JobServiceGrpcTransport(JobServiceTransport):
         if "search_jobs_for_alert" not in self._stubs:
             self._stubs["search_jobs_for_alert"] = self.grpc_channel.unary_unary(
                 "/google.cloud.talent.v4beta1.JobService/SearchJobsForAlert",
-                request_serializer=job_service.SearchJobsRequest.serialize,
-                response_deserializer=job_service.SearchJobsResponse.deserialize,
+                request_serializer=self._wrap_serializer(
+                    job_service.SearchJobsRequest.serialize
+                ),
+                response_deserializer=self._wrap_deserializer(
+                    job_service.SearchJobsResponse.deserialize
+                ),
             )
         return self._stubs["search_jobs_for_alert"]
 
@@ -277,7 +277,7 @@ class ProfileServiceClient(metaclass=ProfileServiceClientMeta):
         *,
         parent: str = None,
         retry: retries.Retry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: float = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> pagers.ListProfilesPager:
         r"""Lists profiles by filter. The order is unspecified.
@@ -349,7 +349,12 @@ class ProfileServiceClient(metaclass=ProfileServiceClientMeta):
         # This method is paged; wrap the response in a pager, which provides
         # an `__iter__` convenience method.
         response = pagers.ListProfilesPager(
-            method=rpc, request=request, response=response, metadata=metadata,
+            method=rpc,
+            request=request,
+            response=response,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
         )
 
         # Done; return the response.
@@ -362,7 +367,7 @@ class ProfileServiceClient(metaclass=ProfileServiceClientMeta):
         parent: str = None,
         profile: gct_profile.Profile = None,
         retry: retries.Retry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: float = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> gct_profile.Profile:
         r"""Creates and returns a new profile.
@@ -447,7 +452,7 @@ class ProfileServiceClient(metaclass=ProfileServiceClientMeta):
         *,
         name: str = None,
         retry: retries.Retry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: float = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> profile.Profile:
         r"""Gets the specified profile.
@@ -524,7 +529,7 @@ class ProfileServiceClient(metaclass=ProfileServiceClientMeta):
         *,
         profile: gct_profile.Profile = None,
         retry: retries.Retry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: float = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> gct_profile.Profile:
         r"""Updates the specified profile and returns the updated
@@ -600,7 +605,7 @@ class ProfileServiceClient(metaclass=ProfileServiceClientMeta):
         *,
         name: str = None,
         retry: retries.Retry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: float = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> None:
         r"""Deletes the specified profile.
@@ -669,7 +674,7 @@ class ProfileServiceClient(metaclass=ProfileServiceClientMeta):
         request: profile_service.SearchProfilesRequest = None,
         *,
         retry: retries.Retry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: float = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> pagers.SearchProfilesPager:
         r"""Searches for profiles within a tenant.
@@ -726,7 +731,12 @@ class ProfileServiceClient(metaclass=ProfileServiceClientMeta):
         # This method is paged; wrap the response in a pager, which provides
         # an `__iter__` convenience method.
         response = pagers.SearchProfilesPager(
-            method=rpc, request=request, response=response, metadata=metadata,
+            method=rpc,
+            request=request,
+            response=response,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
         )
 
         # Done; return the response.
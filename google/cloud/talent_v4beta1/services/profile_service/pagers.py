@@ -17,12 +17,16 @@
 
 from typing import Any, AsyncIterable, Awaitable, Callable, Iterable, Sequence, Tuple
 
+from google.api_core import gapic_v1  # type: ignore
+from google.api_core import retry as retries  # type: ignore
+from google.cloud.talent_helpers import paging  # type: ignore
+
 from google.cloud.talent_v4beta1.types import histogram
 from google.cloud.talent_v4beta1.types import profile
 from google.cloud.talent_v4beta1.types import profile_service
 
 
-class ListProfilesPager:
+class ListProfilesPager(paging.CheckpointMixin):
     """A pager for iterating through ``list_profiles`` requests.
 
     This class thinly wraps an initial
@@ -46,6 +50,8 @@ class ListProfilesPager:
         request: profile_service.ListProfilesRequest,
         response: profile_service.ListProfilesResponse,
         *,
+        retry: retries.Retry = gapic_v1.method.DEFAULT,
+        timeout: float = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = ()
     ):
         """Instantiate the pager.
@@ -57,12 +63,17 @@ class ListProfilesPager:
                 The initial request object.
             response (:class:`~.profile_service.ListProfilesResponse`):
                 The initial response object.
+            retry (google.api_core.retry.Retry): Designation of what errors,
+                if any, should be retried when fetching further pages.
+            timeout (float): The timeout for each further page request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
         """
         self._method = method
         self._request = profile_service.ListProfilesRequest(request)
         self._response = response
+        self._retry = retry
+        self._timeout = timeout
         self._metadata = metadata
 
     def __getattr__(self, name: str) -> Any:
@@ -71,20 +82,18 @@ class ListProfilesPager:
     @property
     def pages(self) -> Iterable[profile_service.ListProfilesResponse]:
         yield self._response
-        while self._response.next_page_token:
-            self._request.page_token = self._response.next_page_token
-            self._response = self._method(self._request, metadata=self._metadata)
+        while self._next_page():
             yield self._response
 
     def __iter__(self) -> Iterable[profile.Profile]:
         for page in self.pages:
-            yield from page.profiles
+            yield from self._track(page.profiles)
 
     def __repr__(self) -> str:
         return "{0}<{1!r}>".format(self.__class__.__name__, self._response)
 
 
-class ListProfilesAsyncPager:
+class ListProfilesAsyncPager(paging.CheckpointMixin):
     """A pager for iterating through ``list_profiles`` requests.
 
     This class thinly wraps an initial
@@ -108,6 +117,8 @@ class ListProfilesAsyncPager:
         request: profile_service.ListProfilesRequest,
         response: profile_service.ListProfilesResponse,
         *,
+        retry: retries.Retry = gapic_v1.method.DEFAULT,
+        timeout: float = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = ()
     ):
         """Instantiate the pager.
@@ -119,12 +130,17 @@ class ListProfilesAsyncPager:
                 The initial request object.
             response (:class:`~.profile_service.ListProfilesResponse`):
                 The initial response object.
+            retry (google.api_core.retry.Retry): Designation of what errors,
+                if any, should be retried when fetching further pages.
+            timeout (float): The timeout for each further page request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
         """
         self._method = method
         self._request = profile_service.ListProfilesRequest(request)
         self._response = response
+        self._retry = retry
+        self._timeout = timeout
         self._metadata = metadata
 
     def __getattr__(self, name: str) -> Any:
@@ -133,15 +149,13 @@ class ListProfilesAsyncPager:
     @property
     async def pages(self) -> AsyncIterable[profile_service.ListProfilesResponse]:
         yield self._response
-        while self._response.next_page_token:
-            self._request.page_token = self._response.next_page_token
-            self._response = await self._method(self._request, metadata=self._metadata)
+        while await self._next_page_async():
             yield self._response
 
     def __aiter__(self) -> AsyncIterable[profile.Profile]:
         async def async_generator():
             async for page in self.pages:
-                for response in page.profiles:
+                for response in self._track(page.profiles):
                     yield response
 
         return async_generator()
@@ -150,7 +164,7 @@ class ListProfilesAsyncPager:
         return "{0}<{1!r}>".format(self.__class__.__name__, self._response)
 
 
-class SearchProfilesPager:
+class SearchProfilesPager(paging.CheckpointMixin):
     """A pager for iterating through ``search_profiles`` requests.
 
     This class thinly wraps an initial
@@ -174,6 +188,8 @@ class SearchProfilesPager:
         request: profile_service.SearchProfilesRequest,
         response: profile_service.SearchProfilesResponse,
         *,
+        retry: retries.Retry = gapic_v1.method.DEFAULT,
+        timeout: float = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = ()
     ):
         """Instantiate the pager.
@@ -185,12 +201,17 @@ class SearchProfilesPager:
                 The initial request object.
             response (:class:`~.profile_service.SearchProfilesResponse`):
                 The initial response object.
+            retry (google.api_core.retry.Retry): Designation of what errors,
+                if any, should be retried when fetching further pages.
+            timeout (float): The timeout for each further page request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
         """
         self._method = method
         self._request = profile_service.SearchProfilesRequest(request)
         self._response = response
+        self._retry = retry
+        self._timeout = timeout
         self._metadata = metadata
 
     def __getattr__(self, name: str) -> Any:
@@ -199,20 +220,18 @@ class SearchProfilesPager:
     @property
     def pages(self) -> Iterable[profile_service.SearchProfilesResponse]:
         yield self._response
-        while self._response.next_page_token:
-            self._request.page_token = self._response.next_page_token
-            self._response = self._method(self._request, metadata=self._metadata)
+        while self._next_page():
             yield self._response
 
     def __iter__(self) -> Iterable[histogram.HistogramQueryResult]:
         for page in self.pages:
-            yield from page.histogram_query_results
+            yield from self._track(page.histogram_query_results)
 
     def __repr__(self) -> str:
         return "{0}<{1!r}>".format(self.__class__.__name__, self._response)
 
 
-class SearchProfilesAsyncPager:
+class SearchProfilesAsyncPager(paging.CheckpointMixin):
     """A pager for iterating through ``search_profiles`` requests.
 
     This class thinly wraps an initial
@@ -236,6 +255,8 @@ class SearchProfilesAsyncPager:
         request: profile_service.SearchProfilesRequest,
         response: profile_service.SearchProfilesResponse,
         *,
+        retry: retries.Retry = gapic_v1.method.DEFAULT,
+        timeout: float = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = ()
     ):
         """Instantiate the pager.
@@ -247,12 +268,17 @@ class SearchProfilesAsyncPager:
                 The initial request object.
             response (:class:`~.profile_service.SearchProfilesResponse`):
                 The initial response object.
+            retry (google.api_core.retry.Retry): Designation of what errors,
+                if any, should be retried when fetching further pages.
+            timeout (float): The timeout for each further page request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
         """
         self._method = method
         self._request = profile_service.SearchProfilesRequest(request)
         self._response = response
+        self._retry = retry
+        self._timeout = timeout
         self._metadata = metadata
 
     def __getattr__(self, name: str) -> Any:
@@ -261,15 +287,13 @@ class SearchProfilesAsyncPager:
     @property
     async def pages(self) -> AsyncIterable[profile_service.SearchProfilesResponse]:
         yield self._response
-        while self._response.next_page_token:
-            self._request.page_token = self._response.next_page_token
-            self._response = await self._method(self._request, metadata=self._metadata)
+        while await self._next_page_async():
             yield self._response
 
     def __aiter__(self) -> AsyncIterable[histogram.HistogramQueryResult]:
         async def async_generator():
             async for page in self.pages:
-                for response in page.histogram_query_results:
+                for response in self._track(page.histogram_query_results):
                     yield response
 
         return async_generator()
@@ -73,7 +73,7 @@ def default(session):
     session.install("asyncmock", "pytest-asyncio")
 
     session.install("mock", "pytest", "pytest-cov")
-    session.install("-e", ".")
+    session.install("-e", ".[numpy,yaml]")
 
     # Run py.test against the unit tests.
     session.run(
@@ -150,7 +150,7 @@ def cover(session):
 def docs(session):
     """Build the docs for this library."""
 
-    session.install("-e", ".")
+    session.install("-e", ".[numpy,yaml]")
     session.install("sphinx", "alabaster", "recommonmark")
 
     shutil.rmtree(os.path.join("docs", "_build"), ignore_errors=True)
@@ -172,7 +172,7 @@ def docs(session):
 def docfx(session):
     """Build the docfx yaml files for this library."""
 
-    session.install("-e", ".")
+    session.install("-e", ".[numpy,yaml]")
     # sphinx-docfx-yaml supports up to sphinx version 1.5.5.
     # https://github.com/docascode/sphinx-docfx-yaml/issues/97
     session.install("sphinx==1.5.5", "alabaster", "recommonmark", "sphinx-docfx-yaml")
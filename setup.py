@@ -33,7 +33,7 @@ dependencies = [
     "proto-plus >= 1.4.0",
     "libcst >= 0.2.5",
 ]
-extras = {}
+extras = {"numpy": ["numpy >= 1.14.0"], "yaml": ["pyyaml >= 5.1"]}
 
 
 # Setup boilerplate below this line.
@@ -23,6 +23,24 @@ common = gcp.CommonTemplates()
 versions = ["v4beta1", "v4"]
 
 excludes = ["setup.py", "nox*.py", "README.rst", "docs/conf.py", "docs/index.rst"]
+
+# The transports build their wrapped methods through
+# google.cloud.talent_helpers.wrapping, which adds the metrics, profiling,
+# compression, resilience and method config options, and the async clients
+# call the transport's wrapped methods. The clients default timeouts to the
+# method config and hand their retry and timeout to the pagers, which
+# checkpoint and bound their walk through google.cloud.talent_helpers.paging.
+# These files are maintained by hand; apply generator changes to them
+# manually.
+for version in versions:
+   excludes += [
+      f"google/cloud/talent_{version}/services/*/async_client.py",
+      f"google/cloud/talent_{version}/services/*/client.py",
+      f"google/cloud/talent_{version}/services/*/pagers.py",
+      f"google/cloud/talent_{version}/services/*/transports/base.py",
+      f"google/cloud/talent_{version}/services/*/transports/grpc.py",
+      f"google/cloud/talent_{version}/services/*/transports/grpc_asyncio.py",
+   ]
 # ----------------------------------------------------------------------------
 # Generate speech GAPIC layer
 # ----------------------------------------------------------------------------
@@ -42,6 +60,19 @@ s.replace(
    "[a-zA-Z][a-zA-Z0-9\_]"
 )
 
+# Give the message types wire-format pickling and fast copying
+s.replace(
+   "google/cloud/talent_v4*/types/__init__.py",
+   r"\n\nfrom \.common import \(",
+   "\n\nfrom google.cloud.talent_helpers import copying as _copying  # type: ignore\n"
+   "\nfrom .common import (",
+)
+s.replace(
+   "google/cloud/talent_v4*/types/__init__.py",
+   r"(\n__all__ = \([^)]*\)\n)",
+   r"\1\n_copying.install(globals())\n",
+)
+
 # ----------------------------------------------------------------------------
 # Add templated files
 # ----------------------------------------------------------------------------
@@ -56,6 +87,16 @@ s.move(templated_files, excludes=[".coveragerc"])  # microgenerator has a good .
 # https://github.com/googleapis/gapic-generator-python/issues/525
 s.replace("noxfile.py", '[\"\']-W[\"\']', '# "-W"')
 
+# Install the numpy extra for the unit tests and docs of talent_helpers.columnar
+s.replace(
+   "noxfile.py",
+   r'(pytest-cov"\)\n|library\."""\n\n)(    session\.install\("-e", ")\."\)',
+   r'\1\2.[numpy]")',
+)
+
+# Install the yaml extra for talent_helpers.method_config
+s.replace("noxfile.py", r'"\.\[numpy\]"\)', '".[numpy,yaml]")')
+
 # ----------------------------------------------------------------------------
 # Samples templates
 # ----------------------------------------------------------------------------
@@ -0,0 +1,202 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import struct
+
+import pytest
+
+from google.api_core import exceptions
+from google.cloud.talent_helpers import FakeTalentServer
+from google.cloud.talent_helpers import alerts
+from google.cloud.talent_v4.services.company_service import CompanyServiceClient
+from google.cloud.talent_v4.services.company_service import (
+    transports as company_transports,
+)
+from google.cloud.talent_v4.services.job_service import JobServiceClient
+from google.cloud.talent_v4.services.job_service import transports
+from google.cloud.talent_v4.services.tenant_service import TenantServiceClient
+from google.cloud.talent_v4.services.tenant_service import (
+    transports as tenant_transports,
+)
+from google.cloud.talent_v4.types import filters
+
+
+@pytest.fixture
+def server():
+    with FakeTalentServer(seed=0) as server:
+        yield server
+
+
+class _Board:
+    def __init__(self, server):
+        channel = server.channel()
+        tenants = TenantServiceClient(
+            transport=tenant_transports.TenantServiceGrpcTransport(channel=channel)
+        )
+        companies = CompanyServiceClient(
+            transport=company_transports.CompanyServiceGrpcTransport(channel=channel)
+        )
+        self.jobs = JobServiceClient(
+            transport=transports.JobServiceGrpcTransport(channel=channel)
+        )
+        self.tenant = tenants.create_tenant(
+            parent="projects/p", tenant={"external_id": "t"}
+        ).name
+        self.company = companies.create_company(
+            parent=self.tenant, company={"display_name": "Acme", "external_id": "a"}
+        ).name
+        self.count = 0
+
+    def post(self, title):
+        self.count += 1
+        return self.jobs.create_job(
+            parent=self.tenant,
+            job={
+                "company": self.company,
+                "requisition_id": "req-{}".format(self.count),
+                "title": title,
+                "description": "Apply now.",
+            },
+        ).name
+
+    def runner(self, **kwargs):
+        return alerts.AlertRunner(
+            self.jobs, {"parent": self.tenant, "max_page_size": 50}, **kwargs
+        )
+
+
+def _delivered(runner):
+    return {d.alert_id: [m.job.name for m in d.matching_jobs] for d in runner.run()}
+
+
+def test_runner_searches_each_distinct_query_once(server):
+    board = _Board(server)
+    engineer = board.post("Engineer")
+    chef = board.post("Chef")
+    runner = board.runner()
+    runner.subscribe("u1", {"query": "engineer"})
+    runner.subscribe("u2", filters.JobQuery(query="engineer"))
+    runner.subscribe("u3", {"query": "chef"})
+
+    delivered = _delivered(runner)
+
+    assert runner.queries == 2
+    assert server.calls["search_jobs_for_alert"] == 2
+    assert delivered == {"u1": [engineer], "u2": [engineer], "u3": [chef]}
+
+
+def test_runner_only_emits_new_jobs(server):
+    board = _Board(server)
+    first = board.post("Engineer")
+    runner = board.runner()
+    runner.subscribe("u1", {"query": "engineer"})
+    runner.subscribe("u2", {"query": "engineer"})
+    assert _delivered(runner) == {"u1": [first], "u2": [first]}
+    assert _delivered(runner) == {}
+
+    runner.subscribe("u3", {"query": "engineer"})
+    second = board.post("Senior Engineer")
+
+    assert _delivered(runner) == {"u1": [second], "u2": [second], "u3": [first, second]}
+
+
+def test_runner_reports_failed_searches(server):
+    board = _Board(server)
+    board.post("Engineer")
+    server.inject_fault(
+        exceptions.InvalidArgument, method="search_jobs_for_alert", count=1
+    )
+    runner = board.runner(max_concurrency=1)
+    runner.subscribe("u1", {"query": "engineer"})
+    runner.subscribe("u2", {"query": "engineer"})
+
+    deliveries = list(runner.run())
+
+    assert [d.alert_id for d in deliveries] == ["u1", "u2"]
+    assert all(isinstance(d.error, exceptions.InvalidArgument) for d in deliveries)
+    assert len(runner.sent("u1")) == 0
+
+
+def test_runner_bounds_concurrency(server):
+    board = _Board(server)
+    board.post("Engineer")
+    runner = board.runner(max_concurrency=2)
+    for i in range(7):
+        runner.subscribe("u{}".format(i), {"query": "engineer", "companies": [str(i)]})
+
+    assert len(list(runner.run())) == 0
+    assert server.calls["search_jobs_for_alert"] == 7
+
+
+def test_unsubscribe(server):
+    board = _Board(server)
+    board.post("Engineer")
+    runner = board.runner()
+    runner.subscribe("u1", {"query": "engineer"})
+    runner.subscribe("u1", {"query": "chef"})
+    runner.subscribe("u2", {"query": "chef"})
+    runner.unsubscribe("u2")
+
+    assert len(runner) == 1
+    assert runner.queries == 1
+    assert _delivered(runner) == {}
+
+
+def test_save_and_load(server, tmp_path):
+    board = _Board(server)
+    board.post("Engineer")
+    runner = board.runner()
+    runner.subscribe("u1", {"query": "engineer"})
+    list(runner.run())
+    runner.save(str(tmp_path / "sent.bin"))
+
+    restored = board.runner()
+    restored.subscribe("u1", {"query": "engineer"})
+    restored.load(str(tmp_path / "sent.bin"))
+    restored.load(str(tmp_path / "missing.bin"))
+
+    assert list(restored.sent("u1")) == list(runner.sent("u1"))
+    assert _delivered(restored) == {}
+
+
+def test_save_is_little_endian(tmp_path):
+    runner = alerts.AlertRunner(None, {})
+    runner.sent("u1").update([1, 2 ** 40])
+    runner.save(str(tmp_path / "sent.bin"))
+
+    assert (tmp_path / "sent.bin").read_bytes() == (
+        b"TALR\x01" + struct.pack("<H", 2) + b"u1" + struct.pack("<IQQ", 2, 1, 2 ** 40)
+    )
+
+
+def test_load_rejects_other_files(tmp_path):
+    path = tmp_path / "other.bin"
+    path.write_bytes(b"nope")
+
+    with pytest.raises(ValueError):
+        alerts.AlertRunner(None, {}).load(str(path))
+
+
+def test_sent_jobs():
+    sent = alerts.SentJobs([5, 1])
+    sent.update([3, 5, 9])
+
+    assert list(sent) == [1, 3, 5, 9]
+    assert 3 in sent and 4 not in sent
+    assert alerts.job_id("tenants/t/jobs/42") == 42
+    assert alerts.job_id("tenants/t/jobs/x") == alerts.job_id("other/jobs/x")
+    assert alerts.job_id("tenants/t/jobs/x") < 2 ** 64
@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import json
+
+import proto
+import pytest
+
+from google.cloud.talent_helpers import benchmark
+from google.cloud.talent_helpers import FakeTalentServer
+
+
+def test_parse_mix():
+    assert benchmark.parse_mix("search_jobs=3, complete_query") == {
+        "search_jobs": 3.0,
+        "complete_query": 1.0,
+    }
+
+
+@pytest.mark.parametrize("mix", ["", "get_job=1", "search_jobs=0"])
+def test_parse_mix_invalid(mix):
+    with pytest.raises(ValueError):
+        benchmark.parse_mix(mix)
+
+
+def test_percentile():
+    ordered = [float(i) for i in range(1, 101)]
+
+    assert benchmark.percentile(ordered, 0.5) == 50.0
+    assert benchmark.percentile(ordered, 0.99) == 99.0
+    assert benchmark.percentile([], 0.5) == 0.0
+
+
+def test_run_benchmark_against_endpoint():
+    with FakeTalentServer() as server:
+        report = benchmark.run_benchmark(
+            modes=benchmark.MODES,
+            requests=40,
+            concurrency=3,
+            warmup=5,
+            jobs=10,
+            endpoint=server.endpoint,
+        )
+
+    assert [r["mode"] for r in report["results"]] == ["sync", "threaded", "async"]
+    for result in report["results"]:
+        assert result["completed"] == 40
+        assert result["errors"] == {}
+        assert result["latency"]["p50_ms"] <= result["latency"]["p99_ms"]
+        assert set(result["methods"]) <= set(benchmark.OPERATIONS)
+        assert result["cpu_breakdown"]["proto_plus_seconds"] > 0
+    json.dumps(report)
+
+    # The proto-plus timing hooks must not outlive the run.
+    assert "wrapper" not in proto.message.MessageMeta.serialize.__qualname__
+
+
+def test_run_benchmark_invalid_mode():
+    with pytest.raises(ValueError):
+        benchmark.run_benchmark(modes=["batch"])
+
+
+def test_main_spawns_server(tmpdir):
+    output = tmpdir.join("report.json")
+
+    assert (
+        benchmark.main(
+            [
+                "--modes=sync",
+                "--requests=10",
+                "--warmup=0",
+                "--jobs=5",
+                "--mix=search_jobs=1,complete_query=1",
+                "--output",
+                str(output),
+            ]
+        )
+        == 0
+    )
+    report = json.loads(output.read())
+    assert report["results"][0]["completed"] == 10
+    assert report["config"]["mix"] == {"search_jobs": 1.0, "complete_query": 1.0}
@@ -0,0 +1,271 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import json
+import time
+
+import mock
+import pytest
+
+from google.api_core import exceptions
+from google.cloud.talent_helpers import FakeTalentServer
+from google.cloud.talent_helpers import bulk_import
+from google.cloud.talent_v4.services.job_service import JobServiceClient
+from google.cloud.talent_v4.services.job_service import transports
+from google.cloud.talent_v4.services.tenant_service import TenantServiceClient
+from google.cloud.talent_v4.services.tenant_service import (
+    transports as tenant_transports,
+)
+from google.cloud.talent_v4.types import common
+from google.protobuf import field_mask_pb2 as field_mask  # type: ignore
+
+
+@pytest.fixture
+def server():
+    with FakeTalentServer(seed=0) as server:
+        yield server
+
+
+@pytest.fixture
+def tenant(server):
+    tenants = TenantServiceClient(
+        transport=tenant_transports.TenantServiceGrpcTransport(channel=server.channel())
+    )
+    return tenants.create_tenant(parent="projects/p", tenant={"external_id": "t"})
+
+
+@pytest.fixture
+def client(server):
+    return JobServiceClient(
+        transport=transports.JobServiceGrpcTransport(channel=server.channel())
+    )
+
+
+def _jobs(client, tenant):
+    return list(
+        client.list_jobs(
+            parent=tenant.name,
+            filter='companyName = "{}/companies/c"'.format(tenant.name),
+        )
+    )
+
+
+def _write_ndjson(path, tenant, count):
+    with open(path, "w") as stream:
+        for i in range(count):
+            record = {
+                "company": tenant.name + "/companies/c",
+                "requisitionId": "req-{}".format(i),
+                "title": "Engineer {}".format(i),
+                "description": "Code.",
+            }
+            stream.write(json.dumps(record) + "\n")
+
+
+def test_import_ndjson(client, tenant, tmp_path):
+    path = str(tmp_path / "jobs.ndjson")
+    _write_ndjson(path, tenant, 7)
+
+    result = bulk_import.import_jobs(
+        client, tenant.name, path, batch_size=3, max_in_flight=2, workers=0
+    )
+
+    assert result.succeeded == 7
+    assert result.failed == result.skipped == 0
+    assert sorted(j.requisition_id for j in _jobs(client, tenant)) == [
+        "req-{}".format(i) for i in range(7)
+    ]
+    with open(path + ".checkpoint") as stream:
+        state = json.load(stream)
+    assert state["offset"] == (tmp_path / "jobs.ndjson").stat().st_size
+    assert state["ranges"] == []
+
+
+def test_import_csv_in_process_pool(client, tenant, tmp_path):
+    path = tmp_path / "jobs.csv"
+    path.write_text(
+        "company,requisition_id,title,description,employment_types,"
+        "application_info.uris,processing_options.disable_street_address_resolution\n"
+        '{0}/companies/c,a,Engineer,"Line one\nLine ""two""",FULL_TIME|PART_TIME,'
+        "https://a.example,true\n"
+        "{0}/companies/c,b,Designer,Design.,,,\n".format(tenant.name)
+    )
+
+    result = bulk_import.import_jobs(client, tenant.name, str(path), workers=2)
+    first, second = _jobs(client, tenant)
+
+    assert result.succeeded == 2
+    assert first.description == 'Line one\nLine "two"'
+    assert list(first.employment_types) == [
+        common.EmploymentType.FULL_TIME,
+        common.EmploymentType.PART_TIME,
+    ]
+    assert list(first.application_info.uris) == ["https://a.example"]
+    assert first.processing_options.disable_street_address_resolution
+    assert second.title == "Designer"
+    assert not second.processing_options.disable_street_address_resolution
+
+
+def test_checkpoint_covers_header_and_blank_lines(client, tenant, tmp_path):
+    path = tmp_path / "jobs.csv"
+    path.write_text(
+        "company,requisition_id,title,description\n"
+        "\n"
+        "{0}/companies/c,a,Engineer,Code.\n"
+        "\n"
+        "\n"
+        "{0}/companies/c,b,Designer,Design.\n".format(tenant.name)
+    )
+
+    result = bulk_import.import_jobs(
+        client, tenant.name, str(path), batch_size=1, workers=0
+    )
+
+    assert result.succeeded == 2
+    with open(str(path) + ".checkpoint") as stream:
+        state = json.load(stream)
+    assert state["offset"] == path.stat().st_size
+    assert state["ranges"] == []
+
+
+def test_import_reports_failures(client, tenant, tmp_path):
+    path = tmp_path / "jobs.ndjson"
+    _write_ndjson(str(path), tenant, 2)
+    with open(str(path), "a") as stream:
+        stream.write("{not json}\n")
+        stream.write(json.dumps({"requisitionId": "x", "unknownField": 1}) + "\n")
+    _write_ndjson(str(tmp_path / "again.ndjson"), tenant, 1)
+    with open(str(path), "a") as stream:
+        stream.write((tmp_path / "again.ndjson").read_text())
+
+    result = bulk_import.import_jobs(client, tenant.name, str(path), workers=0)
+    offsets = [failure.offset for failure in result.failures]
+
+    assert result.succeeded == 2
+    assert [failure.code for failure in result.failures] == [3, 3, 6]
+    assert offsets == sorted(offsets)
+    assert "unknownField" in result.failures[1].message
+
+
+def test_import_resumes_from_checkpoint(client, tenant, tmp_path):
+    path = str(tmp_path / "jobs.ndjson")
+    _write_ndjson(path, tenant, 6)
+    batch_create_jobs = client.batch_create_jobs
+    calls = []
+
+    def flaky(*args, **kwargs):
+        calls.append(kwargs["jobs"])
+        if len(calls) == 2:
+            raise exceptions.ServiceUnavailable("try again")
+        return batch_create_jobs(*args, **kwargs)
+
+    with mock.patch.object(client, "batch_create_jobs", side_effect=flaky):
+        with pytest.raises(exceptions.ServiceUnavailable):
+            bulk_import.import_jobs(
+                client, tenant.name, path, batch_size=2, max_in_flight=1, workers=0
+            )
+    assert len(_jobs(client, tenant)) == 2
+
+    result = bulk_import.import_jobs(
+        client, tenant.name, path, batch_size=2, max_in_flight=1, workers=0
+    )
+
+    assert result.skipped == 2
+    assert result.succeeded == 4
+    assert result.failed == 0
+    assert len(_jobs(client, tenant)) == 6
+
+
+def test_import_deadline_before_start(client, tenant, tmp_path):
+    path = str(tmp_path / "jobs.ndjson")
+    _write_ndjson(path, tenant, 3)
+
+    result = bulk_import.import_jobs(client, tenant.name, path, workers=0, deadline=0)
+    rerun = bulk_import.import_jobs(client, tenant.name, path, workers=0)
+
+    assert result.deadline_exceeded
+    assert result.succeeded == result.failed == 0
+    assert rerun.succeeded == 3 and not rerun.deadline_exceeded
+
+
+def test_import_deadline_cuts_batch(server, client, tenant, tmp_path):
+    path = str(tmp_path / "jobs.ndjson")
+    _write_ndjson(path, tenant, 6)
+    server.set_latency(0.4, method="batch_create_jobs")
+
+    started = time.monotonic()
+    result = bulk_import.import_jobs(
+        client,
+        tenant.name,
+        path,
+        batch_size=3,
+        max_in_flight=1,
+        workers=0,
+        deadline=0.6,
+    )
+    elapsed = time.monotonic() - started
+    # Let the server finish the batch the client gave up on.
+    time.sleep(0.5)
+    server.set_latency(0.0, method="batch_create_jobs")
+    rerun = bulk_import.import_jobs(client, tenant.name, path, workers=0)
+
+    assert elapsed < 0.9
+    assert result.deadline_exceeded
+    assert result.succeeded == 3 and result.failed == 0
+    assert rerun.skipped == 3
+    assert rerun.succeeded + rerun.failed == 3
+
+
+def test_import_update(client, tenant, tmp_path):
+    path = str(tmp_path / "jobs.ndjson")
+    _write_ndjson(path, tenant, 2)
+    bulk_import.import_jobs(client, tenant.name, path, workers=0)
+    with open(path, "w") as stream:
+        for stored in _jobs(client, tenant):
+            stream.write(json.dumps({"name": stored.name, "title": "Renamed"}) + "\n")
+
+    result = bulk_import.import_jobs(
+        client,
+        tenant.name,
+        path,
+        update=True,
+        update_mask=field_mask.FieldMask(paths=["title"]),
+        checkpoint_path=str(tmp_path / "update.checkpoint"),
+        workers=0,
+    )
+
+    assert result.succeeded == 2
+    assert {j.title for j in _jobs(client, tenant)} == {"Renamed"}
+    assert {j.description for j in _jobs(client, tenant)} == {"Code."}
+
+
+def test_checkpoint_merges_out_of_order_ranges(tmp_path):
+    path = str(tmp_path / "checkpoint")
+    checkpoint = bulk_import._Checkpoint(path, "/data/jobs.ndjson")
+
+    checkpoint.add(20, 30)
+    checkpoint.add(40, 50)
+    assert (checkpoint.offset, checkpoint.ranges) == (0, [(20, 30), (40, 50)])
+    checkpoint.add(0, 20)
+    reloaded = bulk_import._Checkpoint(path, "/data/jobs.ndjson")
+
+    assert (reloaded.offset, reloaded.ranges) == (30, [(40, 50)])
+    assert reloaded.done(0, 10)
+    assert reloaded.done(40, 45)
+    assert not reloaded.done(30, 40)
+    with pytest.raises(ValueError):
+        bulk_import._Checkpoint(path, "/data/other.ndjson")
@@ -0,0 +1,228 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import pytest
+
+from google.cloud.talent_v4.types import common
+from google.cloud.talent_v4.types import job
+from google.cloud.talent_v4.types import job_service
+
+numpy = pytest.importorskip("numpy")
+columnar = pytest.importorskip("google.cloud.talent_helpers.columnar")
+
+
+def _jobs():
+    return [
+        job.Job(
+            name="jobs/1",
+            company="companies/a",
+            requisition_id="r1",
+            title="Engineer",
+            language_code="en-US",
+            job_level=common.JobLevel.EXPERIENCED,
+            employment_types=[
+                common.EmploymentType.FULL_TIME,
+                common.EmploymentType.CONTRACTOR,
+            ],
+            posting_publish_time={"seconds": 1600000000, "nanos": 5000},
+            compensation_info={
+                "annualized_total_compensation_range": {
+                    "min_compensation": {"currency_code": "USD", "units": 100000},
+                    "max_compensation": {
+                        "currency_code": "USD",
+                        "units": 150000,
+                        "nanos": 500000000,
+                    },
+                }
+            },
+            derived_info={
+                "locations": [
+                    {
+                        "location_type": 4,
+                        "lat_lng": {"latitude": 1.5, "longitude": 2.5},
+                    },
+                    {
+                        "location_type": 7,
+                        "lat_lng": {"latitude": 3.0, "longitude": 4.0},
+                    },
+                ]
+            },
+        ),
+        job.Job(name="jobs/2", company="companies/b", requisition_id="r2"),
+        job.Job(
+            name="jobs/3",
+            company="companies/a",
+            requisition_id="r3",
+            employment_types=[common.EmploymentType.PART_TIME],
+            derived_info={
+                "locations": [{"lat_lng": {"latitude": -1.0, "longitude": -2.0}}]
+            },
+        ),
+    ]
+
+
+def test_to_columns():
+    columns = columnar.to_columns(_jobs())
+
+    assert len(columns) == 3
+    assert list(columns.name) == ["jobs/1", "jobs/2", "jobs/3"]
+    assert list(columns.company.codes) == [0, 1, 0]
+    assert columns.company.categories == ["companies/a", "companies/b"]
+    assert list(columns.language_code.codes) == [0, -1, -1]
+    assert list(columns.job_level) == [2, 0, 0]
+    assert list(columns.has(columns.employment_types, 1)) == [True, False, False]
+    assert list(columns.has(columns.employment_types, 2)) == [False, False, True]
+    assert columns.posting_publish_time[0] == numpy.datetime64(1600000000000005, "us")
+    assert numpy.isnat(columns.posting_publish_time[1])
+    assert columns.total_compensation_min[0] == 100000
+    assert columns.total_compensation_max[0] == 150000.5
+    assert numpy.isnan(columns.total_compensation_max[1])
+    assert numpy.isnan(columns.base_compensation_min[0])
+    assert list(columns.compensation_currency.codes) == [0, -1, -1]
+    assert list(columns.latitude[[0, 2]]) == [1.5, -1.0]
+    assert numpy.isnan(columns.latitude[1])
+    assert list(columns.location_count) == [2, 0, 1]
+    assert list(columns.location_job) == [0, 0, 2]
+    assert list(columns.location_longitude) == [2.5, 4.0, -2.0]
+    assert list(columns.location_type) == [4, 7, 0]
+
+
+def test_to_columns_accepts_protobufs():
+    columns = columnar.to_columns([job.Job.pb(j) for j in _jobs()])
+
+    assert list(columns.requisition_id) == ["r1", "r2", "r3"]
+
+
+def test_to_columns_search_response():
+    response = job_service.SearchJobsResponse(
+        matching_jobs=[
+            {"job": _jobs()[0], "commute_info": {"travel_duration": {"seconds": 90}}},
+            {"job": _jobs()[1]},
+        ]
+    )
+
+    columns = columnar.to_columns(response)
+
+    assert list(columns.name) == ["jobs/1", "jobs/2"]
+    assert columns.travel_duration[0] == 90.0
+    assert numpy.isnan(columns.travel_duration[1])
+
+
+def test_to_columns_empty():
+    columns = columnar.to_columns([])
+
+    assert len(columns) == 0
+    assert len(columns.location_job) == 0
+
+
+def test_take():
+    columns = columnar.to_columns(_jobs())
+
+    taken = columns.take(numpy.array([2, 0]))
+    masked = columns.take(columns.company.codes == 0)
+
+    assert list(taken.name) == ["jobs/3", "jobs/1"]
+    assert taken.company.categories == columns.company.categories
+    assert list(taken.location_job) == [0, 1, 1]
+    assert list(taken.location_latitude) == [-1.0, 1.5, 3.0]
+    assert list(masked.name) == ["jobs/1", "jobs/3"]
+    assert list(masked.location_job) == [0, 0, 1]
+
+
+def _entry(unit, amount=None, low=None, high=None, kind=1, per_year=None, cur="USD"):
+    entry = {"type_": kind, "unit": unit}
+    if amount is not None:
+        entry["amount"] = {"currency_code": cur, "units": amount}
+    else:
+        entry["range_"] = {}
+        if low is not None:
+            entry["range_"]["min_compensation"] = {"currency_code": cur, "units": low}
+        if high is not None:
+            entry["range_"]["max_compensation"] = {"currency_code": cur, "units": high}
+    if per_year is not None:
+        entry["expected_units_per_year"] = {"value": per_year}
+    return entry
+
+
+def test_annualize_compensation():
+    Unit = common.CompensationInfo.CompensationUnit
+    Type = common.CompensationInfo.CompensationType
+    full_time = [common.EmploymentType.FULL_TIME]
+    jobs = [
+        # Hourly base inferred for a full-time job, plus a yearly bonus.
+        job.Job(
+            employment_types=full_time,
+            compensation_info={
+                "entries": [
+                    _entry(Unit.HOURLY, low=20, high=30),
+                    _entry(Unit.YEARLY, amount=5000, kind=Type.BONUS),
+                ]
+            },
+        ),
+        # Nothing is inferred for part-time jobs without units per year.
+        job.Job(compensation_info={"entries": [_entry(Unit.MONTHLY, amount=100)]}),
+        # Explicit units per year and an open-ended range.
+        job.Job(
+            compensation_info={
+                "entries": [_entry(Unit.DAILY, low=100, per_year=200, cur="EUR")]
+            }
+        ),
+        # Mixed currencies.
+        job.Job(
+            employment_types=full_time,
+            compensation_info={
+                "entries": [
+                    _entry(Unit.YEARLY, amount=1000),
+                    _entry(Unit.YEARLY, amount=10, kind=Type.TIPS, cur="EUR"),
+                ]
+            },
+        ),
+        job.Job(),
+    ]
+
+    compensation = columnar.annualize_compensation(jobs)
+
+    numpy.testing.assert_array_equal(
+        compensation.base_min, [41600, numpy.nan, 20000, 1000, numpy.nan]
+    )
+    numpy.testing.assert_array_equal(
+        compensation.base_max, [62400, numpy.nan, numpy.inf, 1000, numpy.nan]
+    )
+    numpy.testing.assert_array_equal(
+        compensation.total_min, [46600, numpy.nan, 20000, numpy.nan, numpy.nan]
+    )
+    numpy.testing.assert_array_equal(
+        compensation.total_max, [67400, numpy.nan, numpy.inf, numpy.nan, numpy.nan]
+    )
+    assert compensation.currency.categories == ["USD", "EUR"]
+    assert list(compensation.currency.codes) == [0, -1, 1, 0, -1]
+    assert list(compensation.mixed_currency) == [False, False, False, True, False]
+
+
+def test_annualize_compensation_infos():
+    Unit = common.CompensationInfo.CompensationUnit
+    infos = [
+        common.CompensationInfo(entries=[_entry(Unit.WEEKLY, amount=1000)]),
+        common.CompensationInfo.pb()(),
+    ]
+
+    strict = columnar.annualize_compensation(infos)
+    inferred = columnar.annualize_compensation(infos, full_time=True)
+
+    assert numpy.isnan(strict.total_min).all()
+    numpy.testing.assert_array_equal(inferred.total_min, [52000, numpy.nan])
+    assert len(columnar.annualize_compensation([]).total_min) == 0
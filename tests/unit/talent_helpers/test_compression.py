@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import grpc
+import pytest
+
+from google.cloud.talent_helpers import FakeTalentServer
+from google.cloud.talent_helpers import compression
+from google.cloud.talent_helpers import wrapping
+from google.cloud.talent_v4.services.job_service import JobServiceAsyncClient
+from google.cloud.talent_v4.services.job_service import JobServiceClient
+from google.cloud.talent_v4.services.job_service import transports
+from google.cloud.talent_v4.types import job_service
+from google.cloud.talent_v4beta1.services.profile_service import ProfileServiceClient
+from google.cloud.talent_v4beta1.services.profile_service import (
+    transports as profile_transports,
+)
+
+
+KEY = wrapping.MethodKey("google.cloud.talent.v4.JobService", "get_job")
+
+
+def _attempt(policy, method="get_job"):
+    sent = []
+
+    def stub(request, **kwargs):
+        sent.append(kwargs.get("compression"))
+
+    return policy.wrap_attempt(KEY._replace(method=method), stub, False), sent
+
+
+def test_policy_compresses_large_requests():
+    policy = compression.CompressionPolicy("gzip", min_size=100)
+    attempt, sent = _attempt(policy)
+
+    attempt(job_service.GetJobRequest(name="x" * 10))
+    attempt(job_service.GetJobRequest(name="x" * 200))
+
+    assert sent == [None, grpc.Compression.Gzip]
+
+
+def test_policy_per_method_settings():
+    policy = compression.CompressionPolicy(
+        methods={"create_job": "deflate", "update_job": ("gzip", 0), "get_job": None},
+        min_size=100,
+    )
+    stub = object()
+
+    assert policy.setting("create_job") == (grpc.Compression.Deflate, 100)
+    assert policy.setting("update_job") == (grpc.Compression.Gzip, 0)
+    assert policy.setting("delete_job") == (grpc.Compression.NoCompression, 100)
+    # Methods that are never compressed are not wrapped at all.
+    assert policy.wrap_attempt(KEY, stub, False) is stub
+
+
+def test_policy_keeps_explicit_compression():
+    attempt, sent = _attempt(compression.CompressionPolicy("gzip", min_size=0))
+
+    attempt(job_service.GetJobRequest(), compression=grpc.Compression.Deflate)
+
+    assert sent == [grpc.Compression.Deflate]
+
+
+def test_policy_rejects_unknown_algorithms():
+    with pytest.raises(ValueError):
+        compression.CompressionPolicy("brotli")
+
+
+@pytest.mark.parametrize("algorithm", ["gzip", "deflate"])
+def test_compressed_round_trip(algorithm):
+    policy = compression.CompressionPolicy(algorithm, min_size=0)
+    with FakeTalentServer(seed=0) as server:
+        profiles = ProfileServiceClient(
+            transport=profile_transports.ProfileServiceGrpcTransport(
+                channel=server.channel(), compression=policy
+            )
+        )
+        created = profiles.create_profile(
+            parent="projects/p/tenants/t",
+            profile={"resume": {"structured_resume": "Experience. " * 1000}},
+        )
+
+    assert created.resume.structured_resume == "Experience. " * 1000
+    assert profiles._transport._interceptors == (policy,)
+
+
+@pytest.mark.asyncio
+async def test_compressed_round_trip_async():
+    policy = compression.CompressionPolicy("gzip", min_size=0)
+    with FakeTalentServer(seed=0) as server:
+        client = JobServiceAsyncClient(
+            transport=transports.JobServiceGrpcAsyncIOTransport(
+                channel=server.channel(asyncio=True), compression=policy
+            )
+        )
+
+        response = await client.search_jobs(
+            request={"parent": "projects/p/tenants/t", "job_query": {"query": "x"}}
+        )
+
+    assert response.total_size == 0
+    assert server.calls["search_jobs"] == 1
+
+
+def test_large_payload_methods_exist():
+    for method in compression.LARGE_PAYLOAD_METHODS:
+        assert any(
+            hasattr(client, method)
+            for client in (JobServiceClient, ProfileServiceClient)
+        )
@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import json
+
+import pytest
+
+from google.cloud.talent_helpers import copy_benchmark
+from google.cloud.talent_v4.types import job
+
+
+def test_benchmark(tmpdir):
+    output = tmpdir.join("report.json")
+
+    assert (
+        copy_benchmark.main(
+            ["--size=2", "--number=2", "--operations=deepcopy", "--output", str(output)]
+        )
+        == 0
+    )
+    report = json.loads(output.read())
+
+    assert [(r["message"], r["operation"]) for r in report["results"]] == [
+        ("Job", "deepcopy"),
+        ("Profile", "deepcopy"),
+    ]
+    assert all(r["speedup"] > 0 for r in report["results"])
+    assert report["environment"]["protobuf_implementation"]
+    assert "__deepcopy__" in vars(job.Job)
+
+
+def test_benchmark_invalid_operation():
+    with pytest.raises(ValueError):
+        copy_benchmark.run_benchmark(operations=["marshal"])
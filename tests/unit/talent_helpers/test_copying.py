@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import copy
+import pickle
+
+import proto
+import pytest
+
+from google.cloud.talent_helpers import copy_benchmark
+from google.cloud.talent_helpers import copying
+from google.cloud.talent_v4.types import common
+from google.cloud.talent_v4.types import job
+from google.cloud.talent_v4beta1.types import profile
+
+
+def _messages():
+    return [copy_benchmark.sample_job(3), copy_benchmark.sample_profile(3)]
+
+
+@pytest.mark.parametrize("protocol", range(pickle.HIGHEST_PROTOCOL + 1))
+def test_pickle(protocol):
+    for message in _messages():
+        assert pickle.loads(pickle.dumps(message, protocol)) == message
+
+
+def test_pickle_nested_message():
+    info = job.Job.ApplicationInfo(emails=["jobs@example.com"])
+
+    assert pickle.loads(pickle.dumps(info)) == info
+
+
+@pytest.mark.parametrize("operation", [copy.copy, copy.deepcopy])
+def test_copies_are_independent(operation):
+    original = copy_benchmark.sample_profile(3)
+    clone = operation(original)
+
+    clone.skills[0].display_name = "changed"
+    clone.custom_attributes["attr-0"].string_values.append("c")
+
+    assert original.skills[0].display_name == "skill-0"
+    assert list(original.custom_attributes["attr-0"].string_values) == ["a", "b"]
+    assert clone != original
+
+
+def test_deepcopy_of_container():
+    jobs = {"a": copy_benchmark.sample_job(1)}
+
+    clone = copy.deepcopy(jobs)
+
+    assert clone == jobs
+    assert clone["a"] is not jobs["a"]
+
+
+def test_types_are_installed():
+    for message_class in (
+        job.Job,
+        job.Job.ProcessingOptions,
+        common.CompensationInfo.CompensationEntry,
+        profile.Profile,
+    ):
+        for name in copying.METHODS:
+            assert name in vars(message_class)
+
+
+def test_install_ignores_other_values():
+    class Message(proto.Message):
+        value = proto.Field(proto.STRING, number=1)
+
+    copying.install({"Message": Message, "other": object(), "enum": common.JobCategory})
+
+    assert "__deepcopy__" in vars(Message)
+    assert copy.copy(Message(value="x")) == Message(value="x")
@@ -0,0 +1,182 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import time
+
+import pytest
+
+from google.api_core import exceptions
+from google.cloud.talent_helpers import FakeTalentServer
+from google.cloud.talent_helpers import deep_search
+from google.cloud.talent_v4.services.company_service import CompanyServiceClient
+from google.cloud.talent_v4.services.company_service import (
+    transports as company_transports,
+)
+from google.cloud.talent_v4.services.job_service import JobServiceAsyncClient
+from google.cloud.talent_v4.services.job_service import JobServiceClient
+from google.cloud.talent_v4.services.job_service import transports
+from google.cloud.talent_v4.services.tenant_service import TenantServiceClient
+from google.cloud.talent_v4.services.tenant_service import (
+    transports as tenant_transports,
+)
+from google.cloud.talent_v4.types import job_service
+
+
+@pytest.fixture
+def server():
+    with FakeTalentServer(seed=0) as server:
+        yield server
+
+
+def _seed(server, count):
+    channel = server.channel()
+    tenants = TenantServiceClient(
+        transport=tenant_transports.TenantServiceGrpcTransport(channel=channel)
+    )
+    companies = CompanyServiceClient(
+        transport=company_transports.CompanyServiceGrpcTransport(channel=channel)
+    )
+    jobs = JobServiceClient(
+        transport=transports.JobServiceGrpcTransport(channel=channel)
+    )
+    tenant = tenants.create_tenant(parent="projects/p", tenant={"external_id": "t"})
+    company = companies.create_company(
+        parent=tenant.name, company={"display_name": "Acme", "external_id": "acme"}
+    )
+    created = [
+        jobs.create_job(
+            parent=tenant.name,
+            job={
+                "company": company.name,
+                "requisition_id": "req-{}".format(i),
+                "title": "Engineer {}".format(i),
+                "description": "Write code.",
+            },
+        )
+        for i in range(count)
+    ]
+    return tenant, [j.name for j in created], jobs
+
+
+def test_search_range_stitches_pages_in_order(server):
+    tenant, names, jobs = _seed(server, count=23)
+    request = job_service.SearchJobsRequest(
+        parent=tenant.name,
+        page_token="ignored",
+        histogram_queries=[{"histogram_query": "count(company_display_name)"}],
+    )
+
+    result = deep_search.search_range(jobs, request, start=2, stop=30, page_size=5)
+
+    assert [m.job.name for m in result.response.matching_jobs] == names[2:]
+    assert result.pages == 6
+    assert result.duplicates == 0
+    assert result.response.total_size == 23
+    assert result.response.next_page_token == ""
+    assert dict(result.response.histogram_query_results[0].histogram) == {"Acme": 23}
+    assert server.calls["search_jobs"] == 6
+    assert request.page_token == "ignored"
+
+
+def test_search_range_requests_pages_concurrently(server):
+    tenant, names, jobs = _seed(server, count=40)
+    server.set_latency(0.2, method="search_jobs")
+    request = job_service.SearchJobsRequest(parent=tenant.name)
+
+    started = time.monotonic()
+    result = deep_search.search_range(jobs, request, stop=40, page_size=10)
+    elapsed = time.monotonic() - started
+
+    assert [m.job.name for m in result.response.matching_jobs] == names
+    assert elapsed < 0.6
+
+
+def test_search_range_drops_duplicates_at_page_boundaries():
+    def page(*names):
+        return job_service.SearchJobsResponse(
+            matching_jobs=[{"job": {"name": name}} for name in names], total_size=6
+        )
+
+    # A job inserted at the top between requests shifts "c" onto page two.
+    responses = {0: page("a", "b", "c"), 3: page("c", "d", "e"), 6: page()}
+
+    class Client:
+        def search_jobs(self, request):
+            return responses[request.offset]
+
+    result = deep_search.search_range(
+        Client(), job_service.SearchJobsRequest(), stop=9, page_size=3
+    )
+
+    assert [m.job.name for m in result.response.matching_jobs] == list("abcde")
+    assert result.duplicates == 1
+
+
+def test_search_range_propagates_errors(server):
+    tenant, names, jobs = _seed(server, count=5)
+    server.inject_fault(exceptions.InvalidArgument, method="search_jobs", count=1)
+
+    with pytest.raises(exceptions.InvalidArgument):
+        deep_search.search_range(
+            jobs,
+            job_service.SearchJobsRequest(parent=tenant.name),
+            stop=20,
+            page_size=5,
+        )
+
+
+def test_search_range_caps_at_max_offset():
+    assert deep_search._windows(4900, 10000, 100) == [(4900, 100), (5000, 100)]
+    assert deep_search._windows(4901, 10000, 100) == [(4901, 100)]
+    assert deep_search._windows(1, 10000, 100)[-1] == (4901, 100)
+    assert deep_search._windows(1, 250, 100) == [(1, 100), (101, 100), (201, 49)]
+
+
+@pytest.mark.parametrize(
+    "start,stop,page_size",
+    [(0, 10, 0), (0, 10, 101), (10, 10, 10), (-1, 10, 10), (5001, 6000, 10)],
+)
+def test_search_range_validates(start, stop, page_size):
+    with pytest.raises(ValueError):
+        deep_search.search_range(
+            None,
+            job_service.SearchJobsRequest(),
+            start=start,
+            stop=stop,
+            page_size=page_size,
+        )
+
+
+@pytest.mark.asyncio
+async def test_search_range_async(server):
+    tenant, names, jobs = _seed(server, count=12)
+    client = JobServiceAsyncClient(
+        transport=transports.JobServiceGrpcAsyncIOTransport(
+            channel=server.channel(asyncio=True)
+        )
+    )
+
+    result = await deep_search.search_range_async(
+        client,
+        job_service.SearchJobsRequest(parent=tenant.name),
+        stop=20,
+        page_size=5,
+        max_concurrency=2,
+    )
+
+    assert [m.job.name for m in result.response.matching_jobs] == names
+    assert result.pages == 4
@@ -0,0 +1,201 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import gzip
+import io
+import json
+
+import mock
+import pytest
+
+from google.api_core import exceptions
+from google.cloud.talent_helpers import FakeTalentServer
+from google.cloud.talent_helpers import export
+from google.cloud.talent_v4.services.company_service import CompanyServiceClient
+from google.cloud.talent_v4.services.company_service import (
+    transports as company_transports,
+)
+from google.cloud.talent_v4.services.job_service import JobServiceClient
+from google.cloud.talent_v4.services.job_service import transports
+from google.cloud.talent_v4.services.tenant_service import TenantServiceClient
+from google.cloud.talent_v4.services.tenant_service import (
+    transports as tenant_transports,
+)
+from google.cloud.talent_v4.types import job
+from google.cloud.talent_v4.types import job_service
+from google.cloud.talent_v4beta1.services.profile_service import pagers
+from google.cloud.talent_v4beta1.types import profile
+from google.cloud.talent_v4beta1.types import profile_service
+
+
+@pytest.fixture
+def server():
+    with FakeTalentServer(seed=0) as server:
+        yield server
+
+
+def _seed(server, count):
+    channel = server.channel()
+    tenants = TenantServiceClient(
+        transport=tenant_transports.TenantServiceGrpcTransport(channel=channel)
+    )
+    companies = CompanyServiceClient(
+        transport=company_transports.CompanyServiceGrpcTransport(channel=channel)
+    )
+    jobs = JobServiceClient(
+        transport=transports.JobServiceGrpcTransport(channel=channel)
+    )
+    tenant = tenants.create_tenant(parent="projects/p", tenant={"external_id": "t"})
+    company = companies.create_company(
+        parent=tenant.name, company={"display_name": "Acme", "external_id": "acme"}
+    )
+    created = [
+        jobs.create_job(
+            parent=tenant.name,
+            job={
+                "company": company.name,
+                "requisition_id": "req-{}".format(i),
+                "title": "Ingénieur {}".format(i),
+                "description": "Code.",
+                "employment_types": ["FULL_TIME"],
+            },
+        )
+        for i in range(count)
+    ]
+    return tenant, company, created, jobs, companies
+
+
+def _list_jobs(jobs, tenant, company, page_size=2):
+    return jobs.list_jobs(
+        request={
+            "parent": tenant.name,
+            "filter": 'companyName = "{}"'.format(company.name),
+            "page_size": page_size,
+        }
+    )
+
+
+def test_export_jobs(server, tmp_path):
+    tenant, company, created, jobs, companies = _seed(server, count=5)
+    path = tmp_path / "jobs.ndjson"
+
+    count = export.export_ndjson(_list_jobs(jobs, tenant, company), str(path))
+    lines = path.read_text(encoding="utf-8").splitlines()
+
+    assert count == 5
+    assert server.calls["list_jobs"] == 3
+    assert [json.loads(line)["name"] for line in lines] == [j.name for j in created]
+    assert lines[0] == json.dumps(
+        json.loads(
+            job.Job.to_json(
+                created[0],
+                use_integers_for_enums=False,
+                including_default_value_fields=False,
+            )
+        ),
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+    assert json.loads(lines[0])["employmentTypes"] == ["FULL_TIME"]
+
+
+def test_export_gzip_to_stream(server):
+    tenant, company, created, jobs, companies = _seed(server, count=3)
+    stream = io.BytesIO()
+
+    count = export.export_ndjson(
+        companies.list_companies(parent=tenant.name),
+        stream,
+        compress=True,
+        preserving_proto_field_name=True,
+    )
+    records = [
+        json.loads(line) for line in gzip.decompress(stream.getvalue()).splitlines()
+    ]
+
+    assert not stream.closed
+    assert count == 1
+    assert records == [
+        {"name": company.name, "display_name": "Acme", "external_id": "acme"}
+    ]
+
+
+def test_export_profiles():
+    responses = [
+        profile_service.ListProfilesResponse(
+            profiles=[profile.Profile(name="p1"), profile.Profile(name="p2")],
+            next_page_token="t",
+        ),
+        profile_service.ListProfilesResponse(profiles=[profile.Profile(name="p3")]),
+    ]
+    method = mock.Mock(side_effect=responses[1:])
+    pager = pagers.ListProfilesPager(
+        method, profile_service.ListProfilesRequest(), responses[0]
+    )
+    stream = io.BytesIO()
+
+    assert export.export_ndjson(pager, stream, max_pending_pages=1) == 3
+    assert stream.getvalue() == b'{"name":"p1"}\n{"name":"p2"}\n{"name":"p3"}\n'
+
+
+def test_export_fetch_error_keeps_written_pages(server):
+    tenant, company, created, jobs, companies = _seed(server, count=4)
+    pager = _list_jobs(jobs, tenant, company)
+    server.inject_fault(exceptions.PermissionDenied, method="list_jobs")
+    stream = io.BytesIO()
+
+    with pytest.raises(exceptions.PermissionDenied):
+        export.export_ndjson(pager, stream)
+
+    assert len(stream.getvalue().splitlines()) == 2
+
+
+def test_export_deadline(server):
+    tenant, company, created, jobs, companies = _seed(server, 5)
+    pager = _list_jobs(jobs, tenant, company)
+    server.set_latency(2.0, method="list_jobs")
+    stream = io.BytesIO()
+
+    count = export.export_ndjson(pager, stream, deadline=0.2)
+
+    assert count == 2
+    assert pager.deadline_exceeded
+    assert pager.checkpoint() == (pager.next_page_token, 0)
+    assert len(stream.getvalue().splitlines()) == 2
+
+
+def test_export_write_error():
+    responses = [
+        profile_service.ListProfilesResponse(
+            profiles=[profile.Profile(name="p1")], next_page_token="t"
+        ),
+        profile_service.ListProfilesResponse(profiles=[profile.Profile(name="p2")]),
+    ]
+    method = mock.Mock(side_effect=responses[1:])
+    pager = pagers.ListProfilesPager(
+        method, profile_service.ListProfilesRequest(), responses[0]
+    )
+    stream = mock.Mock(spec=["write", "flush"])
+    stream.write.side_effect = OSError("disk full")
+
+    with pytest.raises(OSError):
+        export.export_ndjson(pager, stream, max_pending_pages=1)
+
+
+def test_items_field_requires_single_repeated_message():
+    with pytest.raises(TypeError):
+        export._items_field(job_service.SearchJobsResponse.pb())
@@ -0,0 +1,192 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import asyncio
+import functools
+
+import pytest
+
+from google.cloud.talent_helpers import FakeTalentServer
+from google.cloud.talent_helpers import fanout
+from google.cloud.talent_v4.services.job_service import JobServiceAsyncClient
+from google.cloud.talent_v4.services.job_service import JobServiceClient
+from google.cloud.talent_v4.services.job_service import transports
+from google.cloud.talent_v4.services.tenant_service import TenantServiceClient
+from google.cloud.talent_v4.services.tenant_service import (
+    transports as tenant_transports,
+)
+
+
+class _Source:
+    """An async iterable that records how far it has been consumed."""
+
+    active = 0
+    peak = 0
+
+    def __init__(self, name, count, delay=0.0, error=None):
+        self.name = name
+        self.count = count
+        self.delay = delay
+        self.error = error
+        self.produced = 0
+
+    async def __aiter__(self):
+        _Source.active += 1
+        _Source.peak = max(_Source.peak, _Source.active)
+        try:
+            for i in range(self.count):
+                await asyncio.sleep(self.delay)
+                self.produced += 1
+                yield "{}{}".format(self.name, i)
+            if self.error is not None:
+                raise self.error
+        finally:
+            _Source.active -= 1
+
+
+@pytest.fixture(autouse=True)
+def reset_counters():
+    _Source.active = _Source.peak = 0
+
+
+async def _collect(iterator):
+    return [entry async for entry in iterator]
+
+
+@pytest.mark.asyncio
+async def test_merges_with_per_source_order():
+    sources = {name: _Source(name, 5, delay=0.001) for name in "abc"}
+
+    entries = await _collect(fanout.fan_out(sources))
+
+    assert len(entries) == 15
+    for name in "abc":
+        assert [item for key, item in entries if key == name] == [
+            "{}{}".format(name, i) for i in range(5)
+        ]
+
+
+@pytest.mark.asyncio
+async def test_accepts_awaitables_and_callables():
+    async def make(name):
+        return _Source(name, 2)
+
+    entries = await _collect(
+        fanout.fan_out([make("a"), functools.partial(make, "b"), _Source("c", 1)])
+    )
+
+    assert sorted(entries) == [(0, "a0"), (0, "a1"), (1, "b0"), (1, "b1"), (2, "c0")]
+
+
+@pytest.mark.asyncio
+async def test_limits_concurrency():
+    sources = [_Source(str(i), 3, delay=0.001) for i in range(10)]
+
+    entries = await _collect(fanout.fan_out(sources, max_concurrency=3))
+
+    assert len(entries) == 30
+    assert _Source.peak == 3
+
+
+@pytest.mark.asyncio
+async def test_backpressure():
+    source = _Source("a", 1000)
+    merged = fanout.fan_out([source], max_buffered=10)
+
+    await merged.__anext__()
+    await asyncio.sleep(0.01)
+
+    assert source.produced <= 12
+    await merged.aclose()
+
+
+@pytest.mark.asyncio
+async def test_error_cancels_other_sources():
+    slow = _Source("slow", 1000, delay=0.001)
+    merged = fanout.fan_out([slow, _Source("bad", 2, error=KeyError("boom"))])
+
+    with pytest.raises(KeyError):
+        await _collect(merged)
+    await asyncio.sleep(0.01)
+
+    assert slow.produced < 1000
+    assert _Source.active == 0
+
+
+@pytest.mark.asyncio
+async def test_early_close_cancels_and_closes_unstarted(recwarn):
+    async def make(name):
+        return _Source(name, 100, delay=0.001)
+
+    merged = fanout.fan_out([make(str(i)) for i in range(5)], max_concurrency=1)
+
+    assert (await merged.__anext__())[0] == 0
+    await merged.aclose()
+
+    assert _Source.active == 0
+    assert not [w for w in recwarn if "never awaited" in str(w.message)]
+
+
+@pytest.mark.asyncio
+async def test_async_pagers():
+    with FakeTalentServer(seed=0) as server:
+        tenants = TenantServiceClient(
+            transport=tenant_transports.TenantServiceGrpcTransport(
+                channel=server.channel()
+            )
+        )
+        jobs = JobServiceClient(
+            transport=transports.JobServiceGrpcTransport(channel=server.channel())
+        )
+        expected = {}
+        for name in ("t1", "t2"):
+            tenant = tenants.create_tenant(
+                parent="projects/p", tenant={"external_id": name}
+            )
+            expected[tenant.name] = [
+                jobs.create_job(
+                    parent=tenant.name,
+                    job={
+                        "company": tenant.name + "/companies/c",
+                        "requisition_id": "req-{}".format(i),
+                        "title": "Engineer",
+                        "description": "Code.",
+                    },
+                ).name
+                for i in range(5)
+            ]
+        client = JobServiceAsyncClient(
+            transport=transports.JobServiceGrpcAsyncIOTransport(
+                channel=server.channel(asyncio=True)
+            )
+        )
+        sources = {
+            parent: functools.partial(
+                client.list_jobs,
+                request={
+                    "parent": parent,
+                    "filter": 'companyName = "{}/companies/c"'.format(parent),
+                    "page_size": 2,
+                },
+            )
+            for parent in expected
+        }
+
+        entries = await _collect(fanout.fan_out(sources, max_buffered=1))
+
+    for parent, names in expected.items():
+        assert [job.name for key, job in entries if key == parent] == names
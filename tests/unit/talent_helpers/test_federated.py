@@ -0,0 +1,222 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import threading
+import time
+
+import pytest
+
+from google.api_core import exceptions
+from google.cloud.talent_helpers import FakeTalentServer
+from google.cloud.talent_helpers import federated
+from google.cloud.talent_v4.services.company_service import CompanyServiceClient
+from google.cloud.talent_v4.services.company_service import (
+    transports as company_transports,
+)
+from google.cloud.talent_v4.services.job_service import JobServiceAsyncClient
+from google.cloud.talent_v4.services.job_service import JobServiceClient
+from google.cloud.talent_v4.services.job_service import transports
+from google.cloud.talent_v4.services.tenant_service import TenantServiceClient
+from google.cloud.talent_v4.services.tenant_service import (
+    transports as tenant_transports,
+)
+from google.cloud.talent_v4.types import job_service
+
+
+# Requisition IDs and titles per brand; "shared" is posted by two brands.
+BRANDS = {
+    "a": [("a1", "Accountant"), ("shared", "Engineer"), ("a2", "Writer")],
+    "b": [("shared", "Baker"), ("b1", "Designer")],
+    "c": [("c1", "Chef"), ("c2", "Courier"), ("c3", "Driver")],
+}
+
+
+@pytest.fixture
+def server():
+    with FakeTalentServer(seed=0) as server:
+        yield server
+
+
+@pytest.fixture
+def parents(server):
+    channel = server.channel()
+    tenants = TenantServiceClient(
+        transport=tenant_transports.TenantServiceGrpcTransport(channel=channel)
+    )
+    companies = CompanyServiceClient(
+        transport=company_transports.CompanyServiceGrpcTransport(channel=channel)
+    )
+    jobs = JobServiceClient(
+        transport=transports.JobServiceGrpcTransport(channel=channel)
+    )
+    parents = []
+    for brand, postings in BRANDS.items():
+        tenant = tenants.create_tenant(
+            parent="projects/p", tenant={"external_id": brand}
+        )
+        company = companies.create_company(
+            parent=tenant.name, company={"display_name": "Acme", "external_id": brand}
+        )
+        for requisition_id, title in postings:
+            jobs.create_job(
+                parent=tenant.name,
+                job={
+                    "company": company.name,
+                    "requisition_id": requisition_id,
+                    "title": title,
+                    "description": "Work.",
+                },
+            )
+        parents.append(tenant.name)
+    return parents
+
+
+@pytest.fixture
+def client(server):
+    return JobServiceClient(
+        transport=transports.JobServiceGrpcTransport(channel=server.channel())
+    )
+
+
+def _request(**fields):
+    return job_service.SearchJobsRequest(
+        histogram_queries=[{"histogram_query": "count(company_display_name)"}], **fields
+    )
+
+
+def _ids(result):
+    return [m.job.requisition_id for m in result.response.matching_jobs]
+
+
+def test_merge_by_rank(client, parents):
+    result = federated.federated_search(client, _request(), parents)
+
+    assert _ids(result) == ["a1", "shared", "c1", "b1", "c2", "a2", "c3"]
+    assert result.parents[:3] == parents
+    assert result.duplicates == 1
+    assert result.response.total_size == 8
+    (histogram,) = result.response.histogram_query_results
+    assert histogram.histogram_query == "count(company_display_name)"
+    assert dict(histogram.histogram) == {"Acme": 8}
+    assert result.next_page_tokens == {}
+    assert result.errors == {}
+
+
+def test_merge_by_rank_ignores_reverse(client, parents):
+    result = federated.federated_search(client, _request(), parents, reverse=True)
+
+    assert _ids(result) == ["a1", "shared", "c1", "b1", "c2", "a2", "c3"]
+
+
+def test_merge_by_key(client, parents):
+    result = federated.federated_search(
+        client,
+        _request(),
+        parents,
+        key=lambda match: match.job.title,
+        dedupe_key=lambda match: match.job.title,
+    )
+
+    assert [m.job.title for m in result.response.matching_jobs] == sorted(
+        title for postings in BRANDS.values() for _, title in postings
+    )
+    assert result.duplicates == 0
+
+
+def test_page_tokens(server, client, parents):
+    first = federated.federated_search(client, _request(max_page_size=2), parents)
+    server.calls.clear()
+    second = federated.federated_search(
+        client, _request(max_page_size=2), parents, page_tokens=first.next_page_tokens,
+    )
+
+    assert set(first.next_page_tokens) == {parents[0], parents[2]}
+    assert server.calls["search_jobs"] == 2
+    assert _ids(second) == ["a2", "c3"]
+    assert second.next_page_tokens == {}
+
+
+def test_partial_results(server, client, parents):
+    server.inject_fault(exceptions.ServiceUnavailable, method="search_jobs", count=1)
+    result = federated.federated_search(
+        client, _request(), parents, allow_partial=True, max_concurrency=1
+    )
+
+    assert list(result.errors) == [parents[0]]
+    assert result.parents[0] == parents[1]
+
+    server.inject_fault(exceptions.ServiceUnavailable, method="search_jobs", count=1)
+    with pytest.raises(exceptions.ServiceUnavailable):
+        federated.federated_search(client, _request(), parents)
+
+
+def test_first_error_does_not_wait_for_other_shards(client, parents):
+    release = threading.Event()
+
+    class Client:
+        def search_jobs(self, request, **kwargs):
+            if request.parent != parents[0]:
+                raise exceptions.ServiceUnavailable("Shard down.")
+            release.wait(5)
+            return client.search_jobs(request=request, **kwargs)
+
+    start = time.perf_counter()
+    try:
+        with pytest.raises(exceptions.ServiceUnavailable):
+            federated.federated_search(Client(), _request(), parents)
+        assert time.perf_counter() - start < 1
+    finally:
+        release.set()
+
+
+def test_latency_bounded_by_slowest_shard(server, client, parents):
+    server.set_latency(0.2, method="search_jobs")
+
+    start = time.perf_counter()
+    federated.federated_search(client, _request(), parents * 3)
+
+    assert time.perf_counter() - start < 0.2 * 3
+
+
+def test_no_shards(client):
+    result = federated.federated_search(client, _request(), ["t"], page_tokens={})
+
+    assert result.response is None
+    assert result.parents == []
+
+
+@pytest.mark.asyncio
+async def test_async(server, parents):
+    client = JobServiceAsyncClient(
+        transport=transports.JobServiceGrpcAsyncIOTransport(
+            channel=server.channel(asyncio=True)
+        )
+    )
+
+    result = await federated.federated_search_async(
+        client, _request(), parents, max_concurrency=2
+    )
+
+    assert _ids(result) == ["a1", "shared", "c1", "b1", "c2", "a2", "c3"]
+    assert result.response.total_size == 8
+
+    server.inject_fault(exceptions.NotFound, method="search_jobs", count=1)
+    partial = await federated.federated_search_async(
+        client, _request(), parents, allow_partial=True
+    )
+    assert len(partial.errors) == 1
+    assert isinstance(list(partial.errors.values())[0], exceptions.NotFound)
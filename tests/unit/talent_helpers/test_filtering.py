@@ -0,0 +1,28 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from google.cloud.talent_helpers import filtering
+
+
+def test_quote():
+    assert filtering.quote("req-1") == '"req-1"'
+    assert filtering.quote('a "b" \\c') == '"a \\"b\\" \\\\c"'
+
+
+def test_unquote_reverses_quote():
+    value = 'a "b" \\c\\'
+    assert filtering.unquote(filtering.quote(value)[1:-1]) == value
@@ -0,0 +1,173 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import pytest
+
+from google.cloud.talent_helpers import FakeTalentServer
+from google.cloud.talent_helpers import geocode
+from google.cloud.talent_v4.services.job_service import JobServiceClient
+from google.cloud.talent_v4.services.job_service import transports
+from google.cloud.talent_v4.types import common
+from google.cloud.talent_v4.types import job_service
+from google.cloud.talent_v4beta1.types import common as common_v4beta1
+from google.cloud.talent_v4beta1.types import job_service as job_service_v4beta1
+
+
+def _request(*filters):
+    return job_service.SearchJobsRequest(
+        parent="projects/p/tenants/t", job_query={"location_filters": list(filters)},
+    )
+
+
+def _location(location_type=common.Location.LocationType.LOCALITY, radius=10.0):
+    return common.Location(
+        location_type=location_type,
+        lat_lng={"latitude": 37.4, "longitude": -122.1},
+        radius_miles=radius,
+    )
+
+
+def test_learn_and_rewrite():
+    cache = geocode.GeocodeCache()
+    request = _request(
+        {"address": "Mountain View, CA", "distance_in_miles": 5},
+        {"address": "California"},
+        {"telecommute_preference": "TELECOMMUTE_ALLOWED"},
+    )
+    response = job_service.SearchJobsResponse(
+        location_filters=[
+            _location(),
+            _location(common.Location.LocationType.ADMINISTRATIVE_AREA, 200.0),
+            common.Location(),
+        ]
+    )
+
+    assert cache.learn(request, response) == 2
+    rewritten = cache.rewrite(request)
+    city, state, telecommute = rewritten.job_query.location_filters
+
+    assert rewritten is not request
+    assert request.job_query.location_filters[0].address == "Mountain View, CA"
+    assert city.address == ""
+    assert (city.lat_lng.latitude, city.lat_lng.longitude) == (37.4, -122.1)
+    assert city.distance_in_miles == 15
+    assert state.address == "California"
+    assert telecommute == request.job_query.location_filters[2]
+
+
+def test_rewrite_without_hits_returns_request():
+    cache = geocode.GeocodeCache()
+    request = _request({"address": "Nowhere"})
+
+    assert cache.rewrite(request) is request
+    assert cache.get("Nowhere") is None
+
+
+def test_keys_ignore_case_and_whitespace():
+    cache = geocode.GeocodeCache()
+    cache.put("Mountain  View, CA ", "us", _location())
+
+    assert cache.get("mountain view, ca", "US") == _location()
+    assert cache.get("Mountain View, CA") is None
+
+
+def test_learn_skips_mismatched_responses():
+    cache = geocode.GeocodeCache()
+    request = _request({"address": "a"}, {"address": "b"})
+
+    assert cache.learn(request, job_service.SearchJobsResponse()) == 0
+    assert len(cache) == 0
+
+
+def test_eviction():
+    cache = geocode.GeocodeCache(max_entries=2)
+    for address in ("a", "b", "c"):
+        cache.put(address, "", _location())
+        cache.get("a")
+
+    assert cache.get("a") is not None
+    assert cache.get("b") is None
+    assert len(cache) == 2
+
+
+def test_save_and_load(tmp_path):
+    path = str(tmp_path / "geocode.bin")
+    cache = geocode.GeocodeCache(path)
+    cache.put("Zürich", "CH", _location(radius=3.25))
+    cache.put("Mountain View", "", _location())
+    cache.save()
+
+    loaded = geocode.GeocodeCache(path)
+
+    assert len(loaded) == 2
+    assert loaded.get("zürich", "ch") == _location(radius=3.25)
+    assert (tmp_path / "geocode.bin").stat().st_size == 5 + 2 * 27 + len(
+        "CH\x1fzürich\x1fmountain view".encode("utf-8")
+    )
+
+
+def test_load_rejects_other_files(tmp_path):
+    path = tmp_path / "other.bin"
+    path.write_bytes(b"not a cache")
+
+    with pytest.raises(ValueError):
+        geocode.GeocodeCache(str(path))
+    with pytest.raises(ValueError):
+        geocode.GeocodeCache().save()
+
+
+def test_v4beta1_request():
+    cache = geocode.GeocodeCache()
+    cache.put(
+        "Paris",
+        "FR",
+        common_v4beta1.Location(
+            location_type=common_v4beta1.Location.LocationType.LOCALITY,
+            lat_lng={"latitude": 48.9, "longitude": 2.4},
+            radius_miles=6.0,
+        ),
+    )
+    request = job_service_v4beta1.SearchJobsRequest(
+        job_query={"location_filters": [{"address": "Paris", "region_code": "FR"}]}
+    )
+
+    rewritten = cache.rewrite(request)
+
+    assert isinstance(rewritten, job_service_v4beta1.SearchJobsRequest)
+    assert rewritten.job_query.location_filters[0].lat_lng.latitude == 48.9
+    assert rewritten.job_query.location_filters[0].distance_in_miles == 6.0
+
+
+def test_search_jobs():
+    with FakeTalentServer(seed=0) as server:
+        client = JobServiceClient(
+            transport=transports.JobServiceGrpcTransport(channel=server.channel())
+        )
+        cache = geocode.GeocodeCache()
+        request = _request({"address": "Mountain View, CA"})
+
+        first = cache.search_jobs(client, request)
+        second = cache.search_jobs(client, request)
+
+    (resolved,) = first.location_filters
+    (applied,) = second.location_filters
+    assert resolved.location_type == common.Location.LocationType.LOCALITY
+    assert applied.lat_lng == resolved.lat_lng
+    assert (
+        applied.location_type == common.Location.LocationType.LOCATION_TYPE_UNSPECIFIED
+    )
+    assert len(cache) == 1
@@ -0,0 +1,177 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+import gzip
+import json
+
+import pytest
+
+from google.cloud.talent_helpers import FakeTalentServer
+from google.cloud.talent_helpers import job_index
+from google.cloud.talent_v4.services.job_service import JobServiceAsyncClient
+from google.cloud.talent_v4.services.job_service import JobServiceClient
+from google.cloud.talent_v4.services.job_service import transports
+from google.cloud.talent_v4.types import job
+
+
+PARENT = "projects/p/tenants/t"
+COMPANY = PARENT + "/companies/c"
+
+
+@pytest.fixture
+def server():
+    with FakeTalentServer(seed=0) as server:
+        yield server
+
+
+@pytest.fixture
+def client(server):
+    return JobServiceClient(
+        transport=transports.JobServiceGrpcTransport(channel=server.channel())
+    )
+
+
+def _job(requisition_id, language_code="", company=COMPANY):
+    return job.Job(
+        company=company,
+        requisition_id=requisition_id,
+        language_code=language_code,
+        title="Engineer",
+        description="Code.",
+    )
+
+
+def _create(client, *jobs):
+    return [client.create_job(parent=PARENT, job=j) for j in jobs]
+
+
+def test_refresh(server, client):
+    created = _create(
+        client,
+        _job("req-0"),
+        _job("req-1", "en-US"),
+        _job("req-1", "fr-FR"),
+        _job("req-2", company=PARENT + "/companies/other"),
+    )
+    index = job_index.JobIndex(PARENT)
+
+    count = index.refresh(client, COMPANY)
+
+    assert count == len(index) == 3
+    assert server.calls["list_jobs"] == 1
+    assert index.name(COMPANY, "req-0") == created[0].name
+    assert index.name(COMPANY, "req-1", "fr-FR") == created[2].name
+    assert index.key(created[1].name) == (COMPANY, "req-1", "en-US")
+    with pytest.raises(KeyError):
+        index.name(COMPANY, "req-1")
+    with pytest.raises(KeyError):
+        index.name(PARENT + "/companies/other", "req-2")
+
+
+def test_refresh_replaces_company(client):
+    first, second = _create(client, _job("req-0"), _job("req-1"))
+    index = job_index.JobIndex(PARENT)
+    index.add((COMPANY, "stale", ""), PARENT + "/jobs/stale")
+    index.add(("other", "kept", ""), PARENT + "/jobs/kept")
+
+    index.refresh(client, COMPANY)
+
+    assert sorted(index) == [
+        ("other", "kept", ""),
+        (COMPANY, "req-0", ""),
+        (COMPANY, "req-1", ""),
+    ]
+    assert index.name(COMPANY, "req-1") == second.name
+
+
+def test_record(client):
+    index = job_index.JobIndex(PARENT)
+    (created,) = _create(client, _job("req-0"))
+
+    index.record(created)
+    operation = client.batch_create_jobs(
+        parent=PARENT, jobs=[_job("req-0"), _job("req-1"), _job("req-2")]
+    )
+    index.record(operation.result())
+
+    names = [index.name(COMPANY, "req-{}".format(i)) for i in range(3)]
+    assert names[0] == created.name
+    assert len(index) == 3
+
+    operation = client.batch_delete_jobs(parent=PARENT, names=names[:2])
+    index.record(operation.result())
+
+    assert list(index) == [(COMPANY, "req-2", "")]
+
+
+def test_record_update_rekeys(client):
+    index = job_index.JobIndex(PARENT)
+    (created,) = _create(client, _job("req-0"))
+    index.record(created)
+
+    updated = client.update_job(
+        job={"name": created.name, "requisition_id": "req-9"},
+        update_mask={"paths": ["requisition_id"]},
+    )
+    index.record(updated)
+
+    assert list(index) == [(COMPANY, "req-9", "")]
+    assert index.name(COMPANY, "req-9") == created.name
+
+
+def test_save_and_load(client, tmp_path):
+    path = str(tmp_path / "jobs.index")
+    index = job_index.JobIndex(PARENT)
+    index.add((COMPANY, "req-0", "en-US"), PARENT + "/jobs/1")
+    index.add(("projects/q/tenants/u/companies/x", "req-1", ""), "elsewhere/jobs/2")
+
+    index.save(path)
+    loaded = job_index.JobIndex.load(path)
+    with gzip.open(path, "rb") as stream:
+        state = json.loads(stream.read().decode("utf-8"))
+
+    assert loaded.parent == PARENT
+    assert sorted(loaded) == sorted(index)
+    assert loaded.name(COMPANY, "req-0") == PARENT + "/jobs/1"
+    assert loaded.key("elsewhere/jobs/2").requisition_id == "req-1"
+    assert state["companies"]["c"] == [["req-0", "en-US", "1"]]
+
+
+def test_load_rejects_unknown_version(tmp_path):
+    path = str(tmp_path / "jobs.index")
+    with gzip.open(path, "wb") as stream:
+        stream.write(b'{"version": 99}')
+
+    with pytest.raises(ValueError):
+        job_index.JobIndex.load(path)
+
+
+@pytest.mark.asyncio
+async def test_refresh_async(server, client):
+    created = _create(client, _job("req-0"), _job("req-1"))
+    async_client = JobServiceAsyncClient(
+        transport=transports.JobServiceGrpcAsyncIOTransport(
+            channel=server.channel(asyncio=True)
+        )
+    )
+    index = job_index.JobIndex(PARENT)
+
+    assert await index.refresh_async(async_client, COMPANY) == 2
+    assert [index.name(COMPANY, j.requisition_id) for j in created] == [
+        j.name for j in created
+    ]
@@ -0,0 +1,236 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import json
+import time
+
+import pytest
+
+from google.api_core import exceptions
+from google.api_core import retry as retries
+from google.api_core import retry_async
+from google.cloud.talent_helpers import FakeTalentServer
+from google.cloud.talent_helpers import method_config
+from google.cloud.talent_helpers import wrapping
+from google.cloud.talent_v4.services.completion import CompletionClient
+from google.cloud.talent_v4.services.completion import (
+    transports as completion_transports,
+)
+from google.cloud.talent_v4.services.job_service import JobServiceAsyncClient
+from google.cloud.talent_v4.services.job_service import JobServiceClient
+from google.cloud.talent_v4.services.job_service import transports
+from google.cloud.talent_v4beta1.services.job_service import (
+    transports as v4beta1_transports,
+)
+
+
+JOBS = "google.cloud.talent.v4.JobService"
+CONFIG = {
+    "methodConfig": [
+        {"name": [{}], "timeout": "10s"},
+        {"name": [{"service": JOBS}], "timeout": 20},
+        {
+            "name": [
+                {"service": JOBS, "method": "GetJob"},
+                {"service": JOBS, "method": "list_jobs"},
+            ],
+            "timeout": "5.5s",
+            "retryPolicy": {
+                "initialBackoff": "0.01s",
+                "maxBackoff": "1s",
+                "backoffMultiplier": 2,
+                "retryableStatusCodes": ["RESOURCE_EXHAUSTED", "unavailable"],
+                "maxAttempts": 3,
+            },
+        },
+        {"name": [{"service": JOBS, "method": "DeleteJob"}], "retryPolicy": None},
+    ]
+}
+DEFAULT_RETRY = retries.Retry()
+
+
+@pytest.fixture
+def server():
+    with FakeTalentServer(seed=0) as server:
+        yield server
+
+
+def _resolve(config, method, service=JOBS, asyncio=False):
+    return config.resolve(
+        wrapping.MethodKey(service, method), DEFAULT_RETRY, 30.0, asyncio
+    )
+
+
+def _deadlines(config, method, service=JOBS):
+    retry, timeout = _resolve(config, method, service)
+    return retry._deadline, timeout
+
+
+def test_precedence():
+    config = method_config.MethodConfig(CONFIG)
+
+    assert _deadlines(config, "create_job") == (20.0, 20.0)
+    assert _deadlines(config, "complete_query", "other.Service") == (10.0, 10.0)
+    assert _resolve(config, "delete_job") == (None, 20.0)
+    assert _deadlines(config, "get_job") == (5.5, 5.5)
+    assert _deadlines(config, "list_jobs") == (5.5, 5.5)
+
+
+def test_retry_policy():
+    config = method_config.MethodConfig(CONFIG)
+
+    retry, _ = _resolve(config, "get_job")
+    async_retry, _ = _resolve(config, "get_job", asyncio=True)
+
+    assert type(retry) is retries.Retry
+    assert isinstance(async_retry, retry_async.AsyncRetry)
+    assert (retry._initial, retry._maximum, retry._multiplier) == (0.01, 1.0, 2.0)
+    assert retry._deadline == 5.5
+    assert retry._predicate(exceptions.ResourceExhausted("busy"))
+    assert retry._predicate(exceptions.ServiceUnavailable("down"))
+    assert not retry._predicate(exceptions.DeadlineExceeded("slow"))
+
+
+def test_empty_config_keeps_defaults():
+    config = method_config.MethodConfig({})
+
+    assert _resolve(config, "get_job") == (DEFAULT_RETRY, 30.0)
+
+
+@pytest.mark.parametrize(
+    "item",
+    [
+        {"name": [{}], "timeout": "soon"},
+        {"name": [{}], "timeout": "-1s"},
+        {"name": [{"method": "GetJob"}]},
+        {"name": [{}], "retryPolicy": {"retryableStatusCodes": ["SLOW"]}},
+        {"name": [{}], "retryPolicy": {"initialBackoff": "1s"}},
+        {
+            "name": [{}],
+            "retryPolicy": {"retryableStatusCodes": ["UNAVAILABLE"], "jitter": 1},
+        },
+    ],
+)
+def test_invalid_config(item):
+    with pytest.raises(ValueError):
+        method_config.MethodConfig({"methodConfig": [item]})
+
+
+def test_from_json_file(tmpdir):
+    path = tmpdir.join("methods.json")
+    path.write(json.dumps(CONFIG))
+
+    config = method_config.MethodConfig.from_file(str(path))
+
+    assert _deadlines(config, "create_job") == (20.0, 20.0)
+
+
+def test_from_yaml_file(tmpdir):
+    pytest.importorskip("yaml")
+    path = tmpdir.join("methods.yaml")
+    path.write(
+        "methodConfig:\n"
+        "- name:\n"
+        "  - service: google.cloud.talent.v4.JobService\n"
+        "    method: CreateJob\n"
+        "  timeout: 2s\n"
+    )
+
+    config = method_config.MethodConfig.from_file(str(path))
+
+    assert _deadlines(config, "create_job") == (2.0, 2.0)
+    assert _resolve(config, "get_job") == (DEFAULT_RETRY, 30.0)
+
+
+def test_transport_timeout(server):
+    server.set_latency(1.0, method="complete_query")
+    config = method_config.MethodConfig(
+        {
+            "methodConfig": [
+                {
+                    "name": [{"service": "google.cloud.talent.v4.Completion"}],
+                    "timeout": "0.1s",
+                }
+            ]
+        }
+    )
+    client = CompletionClient(
+        transport=completion_transports.CompletionGrpcTransport(
+            channel=server.channel(), method_config=config
+        )
+    )
+
+    start = time.monotonic()
+    # The timeout also bounds the default retry of DEADLINE_EXCEEDED.
+    with pytest.raises(exceptions.RetryError) as info:
+        client.complete_query(
+            request={"tenant": "projects/p/tenants/t", "query": "a", "page_size": 1}
+        )
+
+    assert isinstance(info.value.cause, exceptions.DeadlineExceeded)
+    assert time.monotonic() - start < 0.9
+
+
+def test_transport_retry(server):
+    server.inject_fault(exceptions.ResourceExhausted, method="get_job", count=1)
+    client = JobServiceClient(
+        transport=transports.JobServiceGrpcTransport(
+            channel=server.channel(), method_config=method_config.MethodConfig(CONFIG),
+        )
+    )
+
+    with pytest.raises(exceptions.NotFound):
+        client.get_job(name="projects/p/tenants/t/jobs/1")
+
+    assert server.calls["get_job"] == 2
+
+
+def test_v4beta1_transport(server):
+    config = method_config.MethodConfig(
+        {
+            "methodConfig": [
+                {
+                    "name": [{"service": "google.cloud.talent.v4beta1.JobService"}],
+                    "timeout": "3s",
+                    "retryPolicy": None,
+                }
+            ]
+        }
+    )
+    transport = v4beta1_transports.JobServiceGrpcTransport(
+        channel=server.channel(), method_config=config
+    )
+
+    wrapped = transport._wrapped_methods[transport.get_job]
+
+    assert (wrapped._retry, wrapped._timeout) == (None, 3.0)
+
+
+@pytest.mark.asyncio
+async def test_async_transport_retry(server):
+    server.inject_fault(exceptions.ResourceExhausted, method="get_job", count=1)
+    client = JobServiceAsyncClient(
+        transport=transports.JobServiceGrpcAsyncIOTransport(
+            channel=server.channel(asyncio=True),
+            method_config=method_config.MethodConfig(CONFIG),
+        )
+    )
+
+    with pytest.raises(exceptions.NotFound):
+        await client.get_job(name="projects/p/tenants/t/jobs/1")
+
+    assert server.calls["get_job"] == 2
@@ -0,0 +1,181 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import grpc
+import pytest
+
+from google.api_core import exceptions
+from google.cloud.talent_helpers import FakeTalentServer
+from google.cloud.talent_helpers import metrics
+from google.cloud.talent_v4.services.job_service import JobServiceAsyncClient
+from google.cloud.talent_v4.services.job_service import JobServiceClient
+from google.cloud.talent_v4.services.job_service import transports
+from google.cloud.talent_v4.services.tenant_service import TenantServiceClient
+from google.cloud.talent_v4.services.tenant_service import (
+    transports as tenant_transports,
+)
+from google.cloud.talent_v4beta1.services.tenant_service import (
+    TenantServiceClient as TenantServiceClientV4Beta1,
+)
+from google.cloud.talent_v4beta1.services.tenant_service import (
+    transports as tenant_transports_v4beta1,
+)
+
+
+GET_JOB = "google.cloud.talent.v4.JobService/get_job"
+
+
+@pytest.fixture
+def server():
+    with FakeTalentServer(seed=0) as server:
+        yield server
+
+
+def _job(server, recorder):
+    tenants = TenantServiceClient(
+        transport=tenant_transports.TenantServiceGrpcTransport(
+            channel=server.channel(), metrics=recorder
+        )
+    )
+    tenant = tenants.create_tenant(parent="projects/p", tenant={"external_id": "t"})
+    jobs = JobServiceClient(
+        transport=transports.JobServiceGrpcTransport(
+            channel=server.channel(), metrics=recorder
+        )
+    )
+    created = jobs.create_job(
+        parent=tenant.name,
+        job={
+            "company": tenant.name + "/companies/c",
+            "requisition_id": "req",
+            "title": "Engineer",
+            "description": "Code.",
+        },
+    )
+    return jobs, created
+
+
+def test_histogram_quantile():
+    histogram = metrics.Histogram([1, 2, 4])
+    for value in (0.5, 1.5, 1.5, 3, 10):
+        histogram.observe(value)
+
+    snapshot = histogram.snapshot()
+
+    assert snapshot["count"] == 5
+    assert snapshot["sum"] == 16.5
+    assert snapshot["buckets"] == [(1, 1), (2, 3), (4, 4), (float("inf"), 5)]
+    assert histogram.quantile(0.5) == pytest.approx(1.75)
+    assert histogram.quantile(1.0) == 4
+    assert metrics.Histogram([1]).quantile(0.5) == 0.0
+
+
+def test_status_name():
+    assert metrics.status_name(exceptions.NotFound("x")) == "NOT_FOUND"
+    assert metrics.status_name(ValueError()) == "UNKNOWN"
+
+
+def test_records_calls_and_sizes(server):
+    recorder = metrics.MetricsRecorder()
+    jobs, created = _job(server, recorder)
+
+    for _ in range(3):
+        jobs.get_job(name=created.name)
+    entry = recorder.snapshot()[GET_JOB]
+
+    assert entry["calls"] == entry["attempts"] == 3
+    assert entry["retries"] == 0
+    assert entry["in_flight"] == 0
+    assert entry["status_codes"] == {"OK": 3}
+    assert entry["latency"]["count"] == 3
+    assert entry["request_bytes"]["sum"] == 3 * len(created.name) + 6
+    assert entry["response_bytes"]["sum"] == 3 * created._pb.ByteSize()
+    assert "google.cloud.talent.v4.TenantService/create_tenant" in recorder.snapshot()
+
+
+def test_records_retries_and_errors(server):
+    recorder = metrics.MetricsRecorder(record_sizes=False)
+    jobs, created = _job(server, recorder)
+    server.inject_fault(method="get_job", count=2)
+
+    jobs.get_job(name=created.name)
+    with pytest.raises(exceptions.NotFound):
+        jobs.get_job(name=created.name + "-missing")
+    entry = recorder.snapshot()[GET_JOB]
+
+    assert entry["calls"] == 2
+    assert entry["attempts"] == 4
+    assert entry["retries"] == 2
+    assert entry["status_codes"] == {"OK": 1, "NOT_FOUND": 1}
+    assert entry["request_bytes"]["count"] == 0
+
+
+def test_reset(server):
+    recorder = metrics.MetricsRecorder()
+    jobs, created = _job(server, recorder)
+    jobs.get_job(name=created.name)
+
+    recorder.reset()
+    jobs.get_job(name=created.name)
+
+    assert recorder.snapshot()[GET_JOB]["calls"] == 1
+
+
+def test_to_prometheus(server):
+    recorder = metrics.MetricsRecorder()
+    jobs, created = _job(server, recorder)
+    jobs.get_job(name=created.name)
+
+    text = recorder.to_prometheus(prefix="talent")
+    labels = 'service="google.cloud.talent.v4.JobService",method="get_job"'
+
+    assert text.endswith("\n")
+    assert "# TYPE talent_latency_seconds histogram" in text
+    assert 'talent_calls_total{{{},code="OK"}} 1'.format(labels) in text
+    assert "talent_attempts_total{{{}}} 1".format(labels) in text
+    assert "talent_latency_seconds_count{{{}}} 1".format(labels) in text
+    assert 'talent_latency_seconds_bucket{{{},le="+Inf"}} 1'.format(labels) in text
+
+
+def test_v4beta1_transport_accepts_metrics():
+    recorder = metrics.MetricsRecorder()
+    transport = tenant_transports_v4beta1.TenantServiceGrpcTransport(
+        channel=grpc.insecure_channel("localhost:1"), metrics=recorder
+    )
+    client = TenantServiceClientV4Beta1(transport=transport)
+
+    assert client._transport._interceptors == (recorder,)
+
+
+@pytest.mark.asyncio
+async def test_async_transport(server):
+    recorder = metrics.MetricsRecorder()
+    jobs, created = _job(server, None)
+    client = JobServiceAsyncClient(
+        transport=transports.JobServiceGrpcAsyncIOTransport(
+            channel=server.channel(asyncio=True), metrics=recorder
+        )
+    )
+
+    assert await client.get_job(name=created.name) == created
+    with pytest.raises(exceptions.NotFound):
+        await client.get_job(name=created.name + "-missing")
+    entry = recorder.snapshot()[GET_JOB]
+
+    assert entry["calls"] == entry["attempts"] == 2
+    assert entry["status_codes"] == {"OK": 1, "NOT_FOUND": 1}
+    assert entry["response_bytes"]["sum"] == created._pb.ByteSize()
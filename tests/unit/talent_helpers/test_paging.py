@@ -0,0 +1,290 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import time
+
+import mock
+import pytest
+
+from google.api_core import exceptions
+from google.api_core import retry as retries
+from google.cloud.talent_helpers import FakeTalentServer
+from google.cloud.talent_helpers import paging
+from google.cloud.talent_v4.services.job_service import JobServiceAsyncClient
+from google.cloud.talent_v4.services.job_service import JobServiceClient
+from google.cloud.talent_v4.services.job_service import transports
+from google.cloud.talent_v4.services.tenant_service import TenantServiceClient
+from google.cloud.talent_v4.services.tenant_service import (
+    transports as tenant_transports,
+)
+from google.cloud.talent_v4beta1.services.profile_service import pagers
+from google.cloud.talent_v4beta1.types import histogram
+from google.cloud.talent_v4beta1.types import profile_service
+
+
+@pytest.fixture
+def server():
+    with FakeTalentServer(seed=0) as server:
+        yield server
+
+
+@pytest.fixture
+def seeded(server):
+    tenants = TenantServiceClient(
+        transport=tenant_transports.TenantServiceGrpcTransport(channel=server.channel())
+    )
+    tenant = tenants.create_tenant(parent="projects/p", tenant={"external_id": "t"})
+    client = JobServiceClient(
+        transport=transports.JobServiceGrpcTransport(channel=server.channel())
+    )
+    names = [
+        client.create_job(
+            parent=tenant.name,
+            job={
+                "company": tenant.name + "/companies/c",
+                "requisition_id": "req-{}".format(i),
+                "title": "Engineer",
+                "description": "Code.",
+            },
+        ).name
+        for i in range(5)
+    ]
+    request = {
+        "parent": tenant.name,
+        "filter": 'companyName = "{}/companies/c"'.format(tenant.name),
+        "page_size": 2,
+    }
+    return client, request, names
+
+
+def _list(client, request, checkpoint=None):
+    request = dict(request, page_token=checkpoint.page_token if checkpoint else "")
+    pager = client.list_jobs(request=request)
+    if checkpoint:
+        pager.resume(checkpoint)
+    return pager
+
+
+def test_checkpoint_and_resume(server, seeded):
+    client, request, names = seeded
+    pager = _list(client, request)
+    assert pager.checkpoint() == paging.PagerCheckpoint("", 0)
+
+    walk = iter(pager)
+    consumed = [next(walk).name for _ in range(4)]
+    checkpoint = pager.checkpoint()
+    server.calls.clear()
+    resumed = [job.name for job in _list(client, request, checkpoint)]
+
+    assert checkpoint.page_token
+    assert checkpoint.offset == 1
+    assert consumed[:3] + resumed == names
+    assert server.calls["list_jobs"] == 2
+
+
+def test_persist_survives_failed_fetch(server, seeded, tmp_path):
+    client, request, names = seeded
+    path = str(tmp_path / "walk.json")
+    pager = _list(client, request).persist(path)
+    assert paging.PagerCheckpoint.load(path) == ("", 0)
+    consumed = []
+
+    server.inject_fault(exceptions.PermissionDenied, method="list_jobs", count=1)
+    with pytest.raises(exceptions.PermissionDenied):
+        for job in pager:
+            consumed.append(job.name)
+    checkpoint = paging.PagerCheckpoint.load(path)
+    resumed = [job.name for job in _list(client, request, checkpoint)]
+
+    assert checkpoint == ("", 2)
+    assert consumed + resumed == names
+
+
+def test_persist_every(seeded, tmp_path):
+    client, request, names = seeded
+    path = str(tmp_path / "walk.json")
+    pager = _list(client, request).persist(path, every=1)
+
+    walk = iter(pager)
+    next(walk)
+    next(walk)
+    assert paging.PagerCheckpoint.load(path) == ("", 1)
+    assert list(walk)
+    assert paging.PagerCheckpoint.load(path).offset == 1
+
+
+def test_resume_validation(seeded):
+    client, request, names = seeded
+    pager = _list(client, request)
+
+    with pytest.raises(ValueError):
+        pager.resume(paging.PagerCheckpoint("other", 1))
+    next(iter(pager))
+    with pytest.raises(ValueError):
+        pager.resume(paging.PagerCheckpoint("", 1))
+
+
+def test_load_missing(tmp_path):
+    assert paging.PagerCheckpoint.load(str(tmp_path / "missing.json")) is None
+
+
+def test_v4beta1_pager():
+    responses = [
+        profile_service.SearchProfilesResponse(
+            histogram_query_results=[
+                histogram.HistogramQueryResult(histogram_query=q) for q in "ab"
+            ],
+            next_page_token="t1",
+        ),
+        profile_service.SearchProfilesResponse(
+            histogram_query_results=[
+                histogram.HistogramQueryResult(histogram_query=q) for q in "cd"
+            ],
+        ),
+    ]
+    method = mock.Mock(side_effect=[responses[1]])
+    pager = pagers.SearchProfilesPager(
+        method, profile_service.SearchProfilesRequest(page_token="t1"), responses[1]
+    ).resume(paging.PagerCheckpoint("t1", 1))
+
+    assert [r.histogram_query for r in pager] == ["d"]
+    assert pager.checkpoint() == ("t1", 2)
+
+
+def _search_pager(method, **kwargs):
+    responses = [
+        profile_service.SearchProfilesResponse(next_page_token=token)
+        for token in ("t1", "")
+    ]
+    method.side_effect = responses[1:]
+    return pagers.SearchProfilesPager(
+        method, profile_service.SearchProfilesRequest(), responses[0], **kwargs
+    )
+
+
+def test_later_pages_use_call_options():
+    method = mock.Mock(spec=[])
+    retry = retries.Retry()
+    pager = _search_pager(method, retry=retry, timeout=5.0, metadata=[("k", "v")])
+
+    assert len(list(pager.pages)) == 2
+    method.assert_called_once_with(
+        profile_service.SearchProfilesRequest(page_token="t1"),
+        retry=retry,
+        timeout=5.0,
+        metadata=[("k", "v")],
+    )
+
+
+def test_deadline_caps_page_options():
+    method = mock.Mock(spec=[])
+    method.default_retry = retries.Retry(deadline=600.0)
+    pager = _search_pager(method, timeout=30.0).set_deadline(paging.Deadline(10.0))
+
+    list(pager.pages)
+    options = method.call_args[1]
+
+    assert 9.0 < options["timeout"] <= 10.0
+    assert options["retry"].deadline == options["timeout"]
+    assert not pager.deadline_exceeded
+
+
+def test_deadline():
+    deadline = paging.Deadline(0.05)
+
+    assert paging.Deadline.of(deadline) is deadline
+    assert paging.Deadline.of(None) is None
+    assert 0 < deadline.timeout() <= 0.05
+    assert deadline.timeout(0.01) == 0.01
+    time.sleep(0.06)
+    assert deadline.expired
+    assert deadline.remaining() == 0.0
+
+
+def test_deadline_stops_walk(server, seeded, tmp_path):
+    client, request, names = seeded
+    path = str(tmp_path / "walk.json")
+    pager = _list(client, request).persist(path)
+    server.set_latency(2.0, method="list_jobs")
+
+    started = time.monotonic()
+    consumed = [job.name for job in pager.set_deadline(0.2)]
+    elapsed = time.monotonic() - started
+    checkpoint = paging.PagerCheckpoint.load(path)
+    server.set_latency(0.0, method="list_jobs")
+    resumed = [job.name for job in _list(client, request, checkpoint)]
+
+    assert elapsed < 1.0
+    assert pager.deadline_exceeded
+    assert checkpoint == pager.checkpoint()
+    assert checkpoint.page_token and checkpoint.offset == 0
+    assert consumed + resumed == names
+
+
+def test_page_timeout_within_deadline_raises(server, seeded):
+    client, request, names = seeded
+    pager = _list(client, request).set_deadline(60.0)
+    pager._timeout = 0.1
+    pager._retry = None
+    server.set_latency(2.0, method="list_jobs")
+
+    with pytest.raises(exceptions.DeadlineExceeded):
+        list(pager)
+    assert not pager.deadline_exceeded
+
+
+@pytest.mark.asyncio
+async def test_async_pager(server, seeded):
+    client, request, names = seeded
+    async_client = JobServiceAsyncClient(
+        transport=transports.JobServiceGrpcAsyncIOTransport(
+            channel=server.channel(asyncio=True)
+        )
+    )
+    pager = await async_client.list_jobs(request=request)
+    consumed = []
+    async for job in pager:
+        consumed.append(job.name)
+        if len(consumed) == 3:
+            break
+    checkpoint = pager.checkpoint()
+
+    resumed = await async_client.list_jobs(
+        request=dict(request, page_token=checkpoint.page_token)
+    )
+    resumed.resume(checkpoint)
+
+    assert checkpoint.offset == 0
+    assert consumed + [job.name async for job in resumed] == names[:3] + names[2:]
+
+
+@pytest.mark.asyncio
+async def test_async_pager_deadline(server, seeded):
+    client, request, names = seeded
+    async_client = JobServiceAsyncClient(
+        transport=transports.JobServiceGrpcAsyncIOTransport(
+            channel=server.channel(asyncio=True)
+        )
+    )
+    pager = await async_client.list_jobs(request=request)
+    server.set_latency(2.0, method="list_jobs")
+
+    consumed = [job.name async for job in pager.set_deadline(0.2)]
+
+    assert pager.deadline_exceeded
+    assert consumed == names[:2]
+    assert pager.checkpoint() == (pager.next_page_token, 0)
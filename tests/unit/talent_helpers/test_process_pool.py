@@ -0,0 +1,191 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import json
+import pickle
+
+import pytest
+
+from google.api_core import exceptions
+from google.cloud.talent_helpers import FakeTalentServer
+from google.cloud.talent_helpers import bulk_import
+from google.cloud.talent_helpers import process_pool
+from google.cloud.talent_helpers import profile_loader
+from google.cloud.talent_v4.services.job_service import JobServiceClient
+from google.cloud.talent_v4.services.tenant_service import TenantServiceClient
+from google.cloud.talent_v4.types import job_service
+from google.cloud.talent_v4beta1.services.profile_service import (
+    ProfileServiceAsyncClient,
+)
+
+
+@pytest.fixture
+def server():
+    with FakeTalentServer(seed=0) as server:
+        yield server
+
+
+@pytest.fixture
+def tenant(server):
+    tenants = process_pool.ClientConfig(
+        TenantServiceClient, emulator_host=server.endpoint
+    ).build()
+    return tenants.create_tenant(parent="projects/p", tenant={"external_id": "t"})
+
+
+@pytest.fixture(params=[True, False], ids=["executor", "spawn_pool"])
+def pool(request, server, monkeypatch):
+    monkeypatch.setattr(process_pool, "_EXECUTOR_OPTIONS", request.param)
+    config = process_pool.ClientConfig(JobServiceClient, emulator_host=server.endpoint)
+    with process_pool.ClientPool(config, processes=2) as pool:
+        yield pool
+
+
+def _create_requests(tenant, count):
+    return [
+        job_service.CreateJobRequest(
+            parent=tenant.name,
+            job={
+                "company": tenant.name + "/companies/c",
+                "requisition_id": "req-{}".format(i),
+                "title": "Engineer {}".format(i),
+                "description": "Code.",
+            },
+        )
+        for i in range(count)
+    ]
+
+
+def test_client_config_is_picklable(server):
+    config = process_pool.ClientConfig(JobServiceClient, emulator_host=server.endpoint)
+
+    copy = pickle.loads(pickle.dumps(config))
+
+    assert copy.client_class is JobServiceClient
+    assert not copy.asyncio
+    assert process_pool.ClientConfig(ProfileServiceAsyncClient).asyncio
+
+
+def test_map_and_submit(pool, tenant):
+    created = list(pool.map("create_job", _create_requests(tenant, 5)))
+    fetched = pool.submit(
+        "get_job", job_service.GetJobRequest(name=created[3].name)
+    ).result()
+
+    assert [j.requisition_id for j in created] == ["req-{}".format(i) for i in range(5)]
+    assert fetched == created[3]
+
+
+def test_errors_are_raised(pool, tenant):
+    future = pool.submit("get_job", job_service.GetJobRequest(name="missing"))
+
+    with pytest.raises(exceptions.NotFound):
+        future.result()
+
+
+def test_paged_methods_are_rejected(pool, tenant):
+    request = job_service.ListJobsRequest(
+        parent=tenant.name, filter='companyName = "{}/companies/c"'.format(tenant.name),
+    )
+
+    with pytest.raises(TypeError):
+        pool.submit("list_jobs", request).result()
+
+
+def test_import_jobs(pool, server, tenant, tmp_path):
+    path = str(tmp_path / "jobs.ndjson")
+    offsets = []
+    with open(path, "w") as stream:
+        for i in range(7):
+            offsets.append(stream.tell())
+            record = {"company": tenant.name + "/companies/c", "title": "Engineer"}
+            if i != 4:
+                record["requisitionId"] = "req-{}".format(i)
+            record["description"] = "Code." if i != 5 else 1
+            stream.write(json.dumps(record) + "\n")
+    checkpoint = str(tmp_path / "jobs.checkpoint")
+
+    result = bulk_import.import_jobs(
+        None,
+        tenant.name,
+        path,
+        batch_size=2,
+        max_in_flight=2,
+        checkpoint_path=checkpoint,
+        pool=pool,
+    )
+    rerun = bulk_import.import_jobs(
+        None, tenant.name, path, checkpoint_path=checkpoint, pool=pool
+    )
+
+    assert result.succeeded == 5
+    assert [(f.offset, f.code) for f in result.failures] == [
+        (offsets[4], 3),
+        (offsets[5], 3),
+    ]
+    assert rerun.skipped == 7 and rerun.succeeded == 0
+
+
+def test_import_jobs_deadline(pool, server, tenant, tmp_path):
+    path = str(tmp_path / "jobs.ndjson")
+    with open(path, "w") as stream:
+        for i in range(4):
+            record = {
+                "company": tenant.name + "/companies/c",
+                "requisitionId": "req-{}".format(i),
+                "title": "Engineer",
+                "description": "Code.",
+            }
+            stream.write(json.dumps(record) + "\n")
+    server.set_latency(2.0, method="batch_create_jobs")
+
+    result = bulk_import.import_jobs(
+        None, tenant.name, path, batch_size=2, pool=pool, deadline=0.3
+    )
+
+    assert result.deadline_exceeded
+    assert result.succeeded == result.failed == 0
+
+
+@pytest.mark.asyncio
+async def test_load_profiles(server):
+    config = process_pool.ClientConfig(
+        ProfileServiceAsyncClient, emulator_host=server.endpoint
+    )
+    profiles = [{"external_id": "cand-{}".format(i)} for i in range(25)]
+
+    with process_pool.ClientPool(config, processes=2) as pool:
+        results = [
+            r
+            async for r in profile_loader.load_profiles(
+                None, "projects/p/tenants/t", profiles, batch_size=4, pool=pool
+            )
+        ]
+        again = [
+            r
+            async for r in profile_loader.load_profiles(
+                None, "projects/p/tenants/t", profiles[:3], pool=pool
+            )
+        ]
+
+    assert sorted(r.index for r in results) == list(range(25))
+    assert {r.action for r in results} == {"created"}
+    assert all(
+        r.profile.external_id == profiles[r.index]["external_id"] for r in results
+    )
+    assert {r.action for r in again} == {"updated"}
+    assert server.calls["create_profile"] == 28
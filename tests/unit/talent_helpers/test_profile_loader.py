@@ -0,0 +1,189 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import time
+
+import pytest
+
+from google.api_core import exceptions
+from google.cloud.talent_helpers import FakeTalentServer
+from google.cloud.talent_helpers import profile_loader
+from google.cloud.talent_v4beta1.services.profile_service import (
+    ProfileServiceAsyncClient,
+)
+from google.cloud.talent_v4beta1.services.profile_service import transports
+from google.cloud.talent_v4beta1.types import profile
+
+
+TENANT = "projects/p/tenants/t"
+
+
+@pytest.fixture
+def server():
+    with FakeTalentServer(seed=0) as server:
+        yield server
+
+
+def _client(server):
+    return ProfileServiceAsyncClient(
+        transport=transports.ProfileServiceGrpcAsyncIOTransport(
+            channel=server.channel(asyncio=True)
+        )
+    )
+
+
+def _profiles(count, group="g"):
+    return [
+        {"external_id": "cand-{}".format(i), "group_id": group} for i in range(count)
+    ]
+
+
+async def _load(client, profiles, **kwargs):
+    kwargs.setdefault("limiter", profile_loader.AdaptiveRateLimiter(1000.0))
+    results = [
+        r
+        async for r in profile_loader.load_profiles(client, TENANT, profiles, **kwargs)
+    ]
+    return sorted(results, key=lambda r: r.index)
+
+
+@pytest.mark.asyncio
+async def test_load_profiles_creates(server):
+    results = await _load(_client(server), _profiles(25), max_concurrency=4)
+
+    assert [r.index for r in results] == list(range(25))
+    assert {r.action for r in results} == {"created"}
+    assert results[3].profile.external_id == "cand-3"
+    assert results[3].profile.name.startswith(TENANT + "/profiles/")
+    assert server.calls["create_profile"] == 25
+
+
+@pytest.mark.asyncio
+async def test_load_profiles_is_idempotent(server):
+    client = _client(server)
+    created = await _load(client, _profiles(5))
+
+    updated = await _load(client, _profiles(5, group="h"))
+    skipped = await _load(client, _profiles(5, group="i"), update_existing=False)
+
+    assert {r.action for r in updated} == {"updated"}
+    assert [r.profile.name for r in updated] == [r.profile.name for r in created]
+    assert {r.profile.group_id for r in updated} == {"h"}
+    assert {r.action for r in skipped} == {"skipped"}
+    assert {r.profile.group_id for r in skipped} == {"h"}
+    assert server.calls["list_profiles"] == 10
+
+
+@pytest.mark.asyncio
+async def test_load_profiles_escapes_external_ids(server):
+    client = _client(server)
+    ids = ['say "hi"', "back\\slash"]
+    created = await _load(client, [{"external_id": i} for i in ids])
+
+    updated = await _load(client, [{"external_id": i, "group_id": "h"} for i in ids])
+
+    assert {r.action for r in updated} == {"updated"}
+    assert [r.profile.name for r in updated] == [r.profile.name for r in created]
+    assert [r.profile.external_id for r in updated] == ids
+
+
+@pytest.mark.asyncio
+async def test_load_profiles_retries_transient_errors(server):
+    server.inject_fault(exceptions.ResourceExhausted, method="create_profile", count=2)
+    limiter = profile_loader.AdaptiveRateLimiter(1000.0, max_rate=1000.0)
+
+    results = await _load(
+        _client(server), _profiles(3), limiter=limiter, initial_backoff=0.01
+    )
+
+    assert {r.action for r in results} == {"created"}
+    assert server.calls["create_profile"] == 5
+    assert limiter.rate < 1000.0
+
+
+@pytest.mark.asyncio
+async def test_load_profiles_reports_failures(server):
+    server.inject_fault(exceptions.InvalidArgument, method="create_profile", count=1)
+
+    results = await _load(_client(server), _profiles(3), max_concurrency=1)
+
+    assert [r.action for r in results] == ["failed", "created", "created"]
+    assert isinstance(results[0].error, exceptions.InvalidArgument)
+    assert results[0].profile.external_id == "cand-0"
+
+
+@pytest.mark.asyncio
+async def test_load_profiles_gives_up_after_max_attempts(server):
+    server.inject_fault(exceptions.ServiceUnavailable, method="create_profile")
+
+    results = await _load(
+        _client(server), _profiles(1), max_attempts=3, initial_backoff=0.001
+    )
+
+    assert isinstance(results[0].error, exceptions.ServiceUnavailable)
+    assert server.calls["create_profile"] == 3
+
+
+@pytest.mark.asyncio
+async def test_load_profiles_runs_concurrently(server):
+    server.set_latency(0.1, method="create_profile")
+
+    started = time.monotonic()
+    await _load(_client(server), _profiles(20), max_concurrency=10)
+
+    assert time.monotonic() - started < 0.6
+
+
+@pytest.mark.asyncio
+async def test_load_profiles_raises_input_errors(server):
+    def profiles():
+        yield profile.Profile(external_id="ok")
+        raise OSError("disk")
+
+    with pytest.raises(OSError):
+        await _load(_client(server), profiles())
+
+
+def test_rate_limiter_adapts():
+    limiter = profile_loader.AdaptiveRateLimiter(10.0, min_rate=4.0, cooldown=60.0)
+
+    limiter.succeeded()
+    assert limiter.rate == pytest.approx(10.5)
+    limiter.throttled()
+    limiter.throttled()
+    assert limiter.rate == pytest.approx(5.25)
+
+    limiter = profile_loader.AdaptiveRateLimiter(10.0, min_rate=4.0, cooldown=0.0)
+    limiter.throttled()
+    limiter.throttled()
+    assert limiter.rate == 4.0
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_paces():
+    limiter = profile_loader.AdaptiveRateLimiter(50.0)
+
+    started = time.monotonic()
+    for _ in range(6):
+        await limiter.acquire()
+
+    assert time.monotonic() - started >= 0.09
+
+
+def test_rate_limiter_validates():
+    with pytest.raises(ValueError):
+        profile_loader.AdaptiveRateLimiter(0.5, min_rate=1.0)
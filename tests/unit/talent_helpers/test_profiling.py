@@ -0,0 +1,205 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import threading
+
+import pytest
+
+from google.api_core import exceptions
+from google.cloud.talent_helpers import FakeTalentServer
+from google.cloud.talent_helpers import profiling
+from google.cloud.talent_helpers import wrapping
+from google.cloud.talent_v4.services.job_service import JobServiceAsyncClient
+from google.cloud.talent_v4.services.job_service import JobServiceClient
+from google.cloud.talent_v4.services.job_service import pagers
+from google.cloud.talent_v4.services.job_service import transports
+from google.cloud.talent_v4.services.tenant_service import TenantServiceClient
+from google.cloud.talent_v4.services.tenant_service import (
+    transports as tenant_transports,
+)
+
+
+@pytest.fixture
+def server():
+    with FakeTalentServer(seed=0) as server:
+        yield server
+
+
+def _seed(server, count=1):
+    tenants = TenantServiceClient(
+        transport=tenant_transports.TenantServiceGrpcTransport(channel=server.channel())
+    )
+    tenant = tenants.create_tenant(parent="projects/p", tenant={"external_id": "t"})
+    jobs = JobServiceClient(
+        transport=transports.JobServiceGrpcTransport(channel=server.channel())
+    )
+    created = [
+        jobs.create_job(
+            parent=tenant.name,
+            job={
+                "company": tenant.name + "/companies/c",
+                "requisition_id": "req-{}".format(i),
+                "title": "Engineer",
+                "description": "Code.",
+            },
+        )
+        for i in range(count)
+    ]
+    return tenant, created
+
+
+def _client(server, profiler):
+    return JobServiceClient(
+        transport=transports.JobServiceGrpcTransport(
+            channel=server.channel(), profiler=profiler
+        )
+    )
+
+
+def test_transport_profile(server):
+    tenant, created = _seed(server)
+    profiles = []
+    client = _client(server, profiling.CallProfiler(profiles.append))
+
+    client.get_job(name=created[0].name)
+    (profile,) = profiles
+
+    assert profile.service == "google.cloud.talent.v4.JobService"
+    assert profile.method == "get_job"
+    assert profile.status == "OK"
+    assert profile.attempts == 1
+    assert profile.request_build is None
+    assert profile.response_wrap is None
+    assert profile.serialization > 0
+    assert profile.deserialization > 0
+    assert profile.network > 0
+    assert list(profile.phases) == list(profiling.PHASES)
+    assert (
+        profile.total
+        >= (
+            profile.serialization
+            + profile.network
+            + profile.deserialization
+            + profile.retry_sleep
+        )
+        - 1e-9
+    )
+    assert "get_job OK" in repr(profile)
+
+
+def test_instrumented_client(server):
+    tenant, created = _seed(server, count=3)
+    profiles = []
+    profiler = profiling.CallProfiler(profiles.append)
+    client = profiler.instrument(_client(server, profiler))
+
+    pager = client.list_jobs(
+        request={
+            "parent": tenant.name,
+            "filter": 'companyName = "{}/companies/c"'.format(tenant.name),
+            "page_size": 2,
+        }
+    )
+    assert isinstance(pager, pagers.ListJobsPager)
+    assert len(profiles) == 1
+    assert len(list(pager)) == 3
+    first, second = profiles
+
+    assert first.method == second.method == "list_jobs"
+    assert first.service == "google.cloud.talent.v4.JobService"
+    assert first.request_build > 0
+    assert first.response_wrap > 0
+    assert first.total >= sum(v for v in first.phases.values()) - 1e-9
+    assert second.request_build is None
+
+
+def test_retry_sleep_and_errors(server):
+    tenant, created = _seed(server)
+    profiles = []
+    profiler = profiling.CallProfiler(profiles.append)
+    client = profiler.instrument(_client(server, profiler))
+    server.inject_fault(method="get_job", count=2)
+
+    client.get_job(name=created[0].name)
+    with pytest.raises(exceptions.NotFound):
+        client.get_job(name=created[0].name + "-missing")
+    with pytest.raises(ValueError):
+        client.get_job(request={"name": created[0].name}, name=created[0].name)
+    retried, missing, invalid = profiles
+
+    assert retried.attempts == 3
+    assert retried.retry_sleep > 0
+    assert missing.status == "NOT_FOUND"
+    assert missing.attempts == 1
+    assert invalid.status == "UNKNOWN"
+    assert invalid.attempts == 0
+    assert invalid.request_build == invalid.total
+
+
+def test_instrument_requires_profiler_on_transport(server):
+    profiler = profiling.CallProfiler(lambda profile: None)
+
+    with pytest.raises(ValueError):
+        profiler.instrument(_client(server, None))
+
+
+def test_unprofiled_transport_keeps_stock_serializers(server):
+    transport = transports.JobServiceGrpcTransport(channel=server.channel())
+
+    assert transport._wrap_serializer(len) is len
+    assert transport._wrap_deserializer(len) is len
+
+
+@pytest.mark.asyncio
+async def test_async_client(server):
+    tenant, created = _seed(server)
+    profiles = []
+    profiler = profiling.CallProfiler(profiles.append)
+    client = profiler.instrument(
+        JobServiceAsyncClient(
+            transport=transports.JobServiceGrpcAsyncIOTransport(
+                channel=server.channel(asyncio=True), profiler=profiler
+            )
+        )
+    )
+
+    assert await client.get_job(name=created[0].name) == created[0]
+    (profile,) = profiles
+
+    assert profile.method == "get_job"
+    assert profile.attempts == 1
+    assert profile.request_build > 0
+    assert profile.serialization > 0
+    assert profile.deserialization > 0
+    assert profile.network > 0
+
+
+def test_context_var_without_contextvars(monkeypatch):
+    monkeypatch.setattr(wrapping, "contextvars", None)
+    var = wrapping.context_var("test")
+    assert var.get() is None
+    token = var.set("outer")
+    inner = var.set("inner")
+    seen = []
+    thread = threading.Thread(target=lambda: seen.append(var.get()))
+    thread.start()
+    thread.join()
+    assert seen == [None]
+    var.reset(inner)
+    assert var.get() == "outer"
+    var.reset(token)
+    assert var.get() is None
@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import pytest
+
+from google.cloud.talent_v4.types import job_service
+
+numpy = pytest.importorskip("numpy")
+ranking = pytest.importorskip("google.cloud.talent_helpers.ranking")
+
+ImportanceLevel = job_service.SearchJobsRequest.CustomRankingInfo.ImportanceLevel
+
+
+def _response(*attributes):
+    return job_service.SearchJobsResponse(
+        matching_jobs=[
+            {
+                "job": {
+                    "name": "jobs/{}".format(i),
+                    "custom_attributes": {
+                        key: {"long_values": [value]} for key, value in values.items()
+                    },
+                }
+            }
+            for i, values in enumerate(attributes)
+        ],
+        total_size=len(attributes),
+    )
+
+
+@pytest.mark.parametrize(
+    "expression,expected",
+    [
+        ("1 + 2 * 3", 7.0),
+        ("(1 + 2) * 3", 9.0),
+        ("10 - 4 - 3", 3.0),
+        ("12 / 3 / 2", 2.0),
+        ("-(2 + 1) * +2", -6.0),
+        ("1.5e1 + .5", 15.5),
+        ("(year + 25) * 0.25 - (freshness / 0.5)", (2000 + 25) * 0.25 - 4 / 0.5),
+    ],
+)
+def test_compile_expression(expression, expected):
+    compiled = ranking.compile_expression(expression)
+    attributes = {"year": numpy.array([2000.0]), "freshness": numpy.array([4.0])}
+
+    assert compiled.evaluate(attributes, 1)[0] == pytest.approx(expected)
+
+
+@pytest.mark.parametrize(
+    "expression", ["", "1 +", "(1 + 2", "1 2", "a % b", "()", "x" * 100]
+)
+def test_compile_expression_rejects_invalid(expression):
+    with pytest.raises(ValueError):
+        ranking.compile_expression(expression)
+
+
+def test_expression_attributes():
+    compiled = ranking.compile_expression("(year + 25) * 0.25 - freshness / year")
+
+    assert compiled.attributes == {"year", "freshness"}
+    assert ranking.compile_expression("(year + 25) * 0.25 - freshness / year") is (
+        compiled
+    )
+
+
+def test_scores_mark_invalid_jobs():
+    reranker = ranking.Reranker(
+        _response({"a": 4, "b": 2}, {"a": 1}, {"a": 3, "b": 0}, {"b": 1})
+    )
+
+    scores = reranker.scores("a / b")
+
+    assert scores[0] == 2.0
+    assert numpy.isnan(scores[1:]).all()
+
+
+def test_rerank():
+    response = _response({"pay": 1}, {"pay": 3}, {}, {"pay": 2}, {"pay": 3})
+    reranker = ranking.Reranker(response)
+
+    reranked = reranker.rerank("pay * 2")
+
+    assert [m.job.name for m in reranked.matching_jobs] == [
+        "jobs/1",
+        "jobs/4",
+        "jobs/3",
+        "jobs/0",
+        "jobs/2",
+    ]
+    assert reranked.total_size == 5
+    assert isinstance(reranked, job_service.SearchJobsResponse)
+    assert [m.job.name for m in response.matching_jobs][0] == "jobs/0"
+
+
+def test_importance_level_blends_with_original_rank():
+    reranker = ranking.Reranker(
+        _response({"pay": 1}, {"pay": 2}, {"pay": 3}, {"pay": 4})
+    )
+
+    assert list(reranker.order("pay", importance_level=ImportanceLevel.NONE)) == [
+        0,
+        1,
+        2,
+        3,
+    ]
+    assert list(reranker.order("pay", importance_level=ImportanceLevel.EXTREME)) == [
+        3,
+        2,
+        1,
+        0,
+    ]
+
+
+def test_rerank_protobuf_and_empty():
+    pb = job_service.SearchJobsResponse.pb(_response({"x": 1}, {"x": 2}))
+
+    reranked = ranking.Reranker(pb).rerank("x")
+
+    assert [m.job.name for m in reranked.matching_jobs] == ["jobs/1", "jobs/0"]
+    assert len(ranking.Reranker(_response()).rerank("x").matching_jobs) == 0
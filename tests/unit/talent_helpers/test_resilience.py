@@ -0,0 +1,263 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import functools
+import time
+
+import pytest
+
+from google.api_core import exceptions
+from google.api_core import retry_async
+from google.cloud.talent_helpers import FakeTalentServer
+from google.cloud.talent_helpers import resilience
+from google.cloud.talent_helpers import wrapping
+from google.cloud.talent_v4.services.job_service import JobServiceAsyncClient
+from google.cloud.talent_v4.services.job_service import JobServiceClient
+from google.cloud.talent_v4.services.job_service import transports
+from google.cloud.talent_v4beta1.services.profile_service import ProfileServiceClient
+from google.cloud.talent_v4beta1.services.profile_service import (
+    transports as profile_transports,
+)
+
+
+RETRY = retry_async.AsyncRetry(
+    predicate=retry_async.if_exception_type(exceptions.ServiceUnavailable),
+    initial=0.01,
+)
+KEY = wrapping.MethodKey("google.cloud.talent.v4.JobService", "get_job")
+
+
+@pytest.fixture
+def server():
+    with FakeTalentServer(seed=0) as server:
+        yield server
+
+
+def _client(server, policy):
+    return JobServiceClient(
+        transport=transports.JobServiceGrpcTransport(
+            channel=server.channel(), resilience=policy
+        )
+    )
+
+
+def _breakers(**kwargs):
+    kwargs.setdefault("failure_threshold", 3)
+    kwargs.setdefault("reset_timeout", 0.1)
+    return functools.partial(resilience.CircuitBreaker, **kwargs)
+
+
+def test_retry_budget():
+    budget = resilience.RetryBudget(0.5, min_per_second=0.0)
+
+    assert not budget.try_retry()
+    budget.record_original()
+    budget.record_original()
+    assert budget.available == 1.0
+    assert budget.try_retry()
+    assert not budget.try_retry()
+
+
+def test_retry_budget_window():
+    budget = resilience.RetryBudget(1.0, min_per_second=0.0, window=0.1)
+    budget.record_original()
+    assert budget.try_retry()
+
+    time.sleep(0.15)
+
+    assert budget.available == 0.0
+    budget.record_original()
+    assert budget.try_retry()
+
+
+def test_retry_budget_reserve():
+    budget = resilience.RetryBudget(0.0, min_per_second=10.0, window=0.2)
+
+    assert [budget.try_retry() for _ in range(3)] == [True, True, False]
+
+
+def test_retry_budget_invalid():
+    with pytest.raises(ValueError):
+        resilience.RetryBudget(window=0)
+
+
+def test_circuit_breaker_opens_and_recovers():
+    breaker = resilience.CircuitBreaker(failure_threshold=2, reset_timeout=0.05)
+
+    breaker.record(breaker.admit(), True)
+    breaker.record(breaker.admit(), False)
+    breaker.record(breaker.admit(), True)
+    assert breaker.state == resilience.CLOSED
+    breaker.record(breaker.admit(), True)
+    assert breaker.state == resilience.OPEN
+    assert breaker.admit() is None
+
+    time.sleep(0.06)
+    assert breaker.state == resilience.HALF_OPEN
+    probe = breaker.admit()
+    assert probe == resilience.HALF_OPEN
+    assert breaker.admit() is None  # one probe at a time
+    breaker.record(probe, False)
+    assert breaker.state == resilience.CLOSED
+
+
+def test_circuit_breaker_failed_probe_reopens():
+    breaker = resilience.CircuitBreaker(failure_threshold=1, reset_timeout=0.05)
+    in_flight = breaker.admit()
+    breaker.record(breaker.admit(), True)
+
+    # An attempt admitted before the breaker opened does not close it.
+    breaker.record(in_flight, False)
+    assert breaker.state == resilience.OPEN
+
+    time.sleep(0.06)
+    probe = breaker.admit()
+    breaker.record(probe, None)
+    assert breaker.state == resilience.HALF_OPEN
+    breaker.record(breaker.admit(), True)
+    assert breaker.state == resilience.OPEN
+
+
+def test_circuit_breaker_failure_codes():
+    breaker = resilience.CircuitBreaker()
+
+    assert breaker.is_failure(exceptions.ServiceUnavailable("down"))
+    assert breaker.is_failure(exceptions.DeadlineExceeded("slow"))
+    assert not breaker.is_failure(exceptions.NotFound("missing"))
+
+
+def test_circuit_opens_without_retrying(server):
+    server.inject_fault(method="get_job")
+    policy = resilience.ResiliencePolicy(
+        retry_budget=None, circuit_breaker=_breakers(reset_timeout=60.0)
+    )
+    client = _client(server, policy)
+
+    with pytest.raises(resilience.CircuitOpenError) as info:
+        client.get_job(name="projects/p/tenants/t/jobs/1")
+    with pytest.raises(resilience.CircuitOpenError):
+        client.get_job(name="projects/p/tenants/t/jobs/1")
+
+    assert info.value.grpc_status_code.name == "UNAVAILABLE"
+    assert server.calls["get_job"] == 3
+    assert policy.breaker(KEY).state == resilience.OPEN
+    # Other methods have their own breaker.
+    with pytest.raises(exceptions.InvalidArgument):
+        list(client.list_jobs(parent="projects/p/tenants/t", filter=""))
+
+
+def test_circuit_recovers_after_probe(server):
+    server.inject_fault(method="get_job", count=3)
+    policy = resilience.ResiliencePolicy(retry_budget=None, circuit_breaker=_breakers())
+    client = _client(server, policy)
+    for _ in range(3):
+        with pytest.raises(exceptions.ServiceUnavailable):
+            client.get_job(name="projects/p/tenants/t/jobs/1", retry=None)
+    with pytest.raises(resilience.CircuitOpenError):
+        client.get_job(name="projects/p/tenants/t/jobs/1", retry=None)
+
+    time.sleep(0.15)
+
+    with pytest.raises(exceptions.NotFound):
+        client.get_job(name="projects/p/tenants/t/jobs/1")
+    assert policy.breaker(KEY).state == resilience.CLOSED
+
+
+def test_retry_budget_stops_retries(server):
+    server.inject_fault(method="get_job", count=1)
+    policy = resilience.ResiliencePolicy(
+        retry_budget=resilience.RetryBudget(0.0, min_per_second=0.0),
+        circuit_breaker=None,
+    )
+    client = _client(server, policy)
+
+    with pytest.raises(resilience.RetryBudgetExhausted) as info:
+        client.get_job(name="projects/p/tenants/t/jobs/1")
+
+    assert server.calls["get_job"] == 1
+    assert isinstance(info.value.errors[0], exceptions.ServiceUnavailable)
+    with pytest.raises(exceptions.NotFound):
+        client.get_job(name="projects/p/tenants/t/jobs/1")
+
+
+def test_retry_budget_allows_retries(server):
+    server.inject_fault(method="get_job", count=2)
+    budget = resilience.RetryBudget(0.0, min_per_second=1.0)
+    client = _client(server, resilience.ResiliencePolicy(retry_budget=budget))
+
+    with pytest.raises(exceptions.NotFound):
+        client.get_job(name="projects/p/tenants/t/jobs/1")
+
+    assert server.calls["get_job"] == 3
+    assert budget.available == 8.0
+
+
+def test_process_budget_is_shared():
+    first, second = resilience.ResiliencePolicy(), resilience.ResiliencePolicy()
+
+    assert first.retry_budget is second.retry_budget is resilience.PROCESS_RETRY_BUDGET
+
+
+def test_v4beta1_transport(server):
+    server.inject_fault(method="get_profile")
+    policy = resilience.ResiliencePolicy(circuit_breaker=_breakers(failure_threshold=1))
+    client = ProfileServiceClient(
+        transport=profile_transports.ProfileServiceGrpcTransport(
+            channel=server.channel(), resilience=policy
+        )
+    )
+
+    with pytest.raises(resilience.CircuitOpenError):
+        client.get_profile(name="projects/p/tenants/t/profiles/1")
+
+    assert server.calls["get_profile"] == 1
+
+
+@pytest.mark.asyncio
+async def test_async_circuit_opens(server):
+    server.inject_fault(method="get_job")
+    policy = resilience.ResiliencePolicy(
+        retry_budget=None, circuit_breaker=_breakers(reset_timeout=60.0)
+    )
+    client = JobServiceAsyncClient(
+        transport=transports.JobServiceGrpcAsyncIOTransport(
+            channel=server.channel(asyncio=True), resilience=policy
+        )
+    )
+
+    with pytest.raises(resilience.CircuitOpenError):
+        await client.get_job(name="projects/p/tenants/t/jobs/1", retry=RETRY)
+
+    assert server.calls["get_job"] == 3
+
+
+@pytest.mark.asyncio
+async def test_async_retry_budget(server):
+    server.inject_fault(method="get_job", count=1)
+    policy = resilience.ResiliencePolicy(
+        retry_budget=resilience.RetryBudget(0.0, min_per_second=0.0)
+    )
+    client = JobServiceAsyncClient(
+        transport=transports.JobServiceGrpcAsyncIOTransport(
+            channel=server.channel(asyncio=True), resilience=policy
+        )
+    )
+
+    with pytest.raises(resilience.RetryBudgetExhausted):
+        await client.get_job(name="projects/p/tenants/t/jobs/1", retry=RETRY)
+
+    assert server.calls["get_job"] == 1
@@ -0,0 +1,274 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import json
+
+import pytest
+
+from google.cloud.talent_helpers import serializer
+from google.cloud.talent_v4.types import job
+from google.cloud.talent_v4.types import job_service
+from google.cloud.talent_v4beta1.types import profile
+from google.cloud.talent_v4beta1.types import profile_service
+from google.protobuf import any_pb2
+from google.protobuf import duration_pb2
+from google.protobuf import json_format
+from google.protobuf import struct_pb2
+from google.protobuf import wrappers_pb2
+
+
+def _job(**overrides):
+    fields = dict(
+        name="projects/p/tenants/t/jobs/1",
+        company="projects/p/tenants/t/companies/c",
+        requisition_id="req-1",
+        title="Ingénieur logiciel",
+        description='<p>Write code & "ship" it.</p>',
+        addresses=["1600 Amphitheatre Pkwy", "Zürich"],
+        job_benefits=[1, 5],
+        employment_types=[1, 3],
+        degree_types=[6],
+        job_level=2,
+        promotion_value=-3,
+        custom_attributes={
+            "year": {"long_values": [2020], "filterable": True},
+            "tags": {"string_values": ["a", "b"]},
+        },
+        compensation_info={
+            "entries": [
+                {
+                    "type_": 1,
+                    "unit": 1,
+                    "range_": {
+                        "min_compensation": {"currency_code": "USD", "units": 20},
+                        "max_compensation": {
+                            "currency_code": "USD",
+                            "units": 30,
+                            "nanos": 500000000,
+                        },
+                    },
+                    "expected_units_per_year": {"value": 2080.5},
+                }
+            ]
+        },
+        posting_publish_time={"seconds": 1600000000, "nanos": 120000000},
+        derived_info={
+            "locations": [
+                {
+                    "location_type": 4,
+                    "lat_lng": {"latitude": 37.42, "longitude": -122.08},
+                    "radius_miles": float("inf"),
+                    "postal_address": {"region_code": "US", "address_lines": ["x"]},
+                }
+            ],
+            "job_categories": [4, 22],
+        },
+        processing_options={"disable_street_address_resolution": True},
+    )
+    fields.update(overrides)
+    return job.Job(**fields)
+
+
+def _response():
+    return job_service.SearchJobsResponse(
+        matching_jobs=[
+            {
+                "job": _job(),
+                "job_title_snippet": "<b>Ingénieur</b>",
+                "commute_info": {"travel_duration": {"seconds": 90, "nanos": 5}},
+            },
+            {"job": _job(name="projects/p/tenants/t/jobs/2", job_level=0)},
+        ],
+        histogram_query_results=[
+            {"histogram_query": "count(x)", "histogram": {"a": 2 ** 40, "b": 1}}
+        ],
+        next_page_token="10",
+        total_size=2,
+        spell_correction={"corrected": True, "corrected_text": "engineer"},
+    )
+
+
+def _canonical(message, **options):
+    pb = type(message).pb(message) if hasattr(type(message), "pb") else message
+    return json.dumps(
+        json_format.MessageToDict(pb, **options),
+        separators=(",", ":"),
+        ensure_ascii=False,
+    )
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        {},
+        {"preserving_proto_field_name": True},
+        {"use_integers_for_enums": True},
+        {"preserving_proto_field_name": True, "use_integers_for_enums": True},
+    ],
+)
+@pytest.mark.parametrize(
+    "message",
+    [
+        _job(),
+        _response(),
+        job.Job(),
+        profile_service.UpdateProfileRequest(
+            profile=profile.Profile(
+                name="p",
+                group_id="g",
+                person_names=[{"formatted_name": "Ada"}],
+                employment_records=[
+                    {"start_date": {"year": 2019, "month": 2}, "is_current": True}
+                ],
+                custom_attributes={"x": {"long_values": [-1]}},
+            ),
+            update_mask={"paths": ["group_id", "person_names"]},
+        ),
+    ],
+)
+def test_matches_canonical_encoding(message, options):
+    assert serializer.JsonSerializer(type(message), **options).to_json(
+        message
+    ) == _canonical(message, **options)
+    assert serializer.to_json(message, **options) == _canonical(message, **options)
+
+
+def test_accepts_protobufs_and_unknown_enum_values():
+    pb = job.Job.pb(_job())
+    pb.job_level = 42
+
+    encoded = serializer.JsonSerializer(job.Job).to_json(pb)
+
+    assert encoded == _canonical(pb)
+    assert json.loads(encoded)["jobLevel"] == 42
+
+
+def test_wrapper_messages():
+    for message in (
+        wrappers_pb2.FloatValue(value=0.1),
+        wrappers_pb2.DoubleValue(value=float("nan")),
+        wrappers_pb2.Int64Value(value=7),
+        wrappers_pb2.BytesValue(value=b"\x00\xff"),
+    ):
+        assert serializer.JsonSerializer(type(message)).to_json(message) == (
+            _canonical(message)
+        )
+
+
+def test_floats():
+    for value in (0.1, 1.0 / 3, 3.4e38, 1e-45, 123456.789, -2.5e-10):
+        message = wrappers_pb2.FloatValue(value=value)
+        assert serializer.JsonSerializer(type(message)).to_json(message) == (
+            _canonical(message)
+        )
+
+
+def test_struct_and_any_messages():
+    value = struct_pb2.Value()
+    value.struct_value.update({"a": [1, "b", None, True]})
+    packed = any_pb2.Any()
+    packed.Pack(duration_pb2.Duration(seconds=90))
+    for message in (
+        value,
+        value.struct_value,
+        value.struct_value["a"],
+        struct_pb2.Value(null_value=0),
+        packed,
+    ):
+        assert serializer.JsonSerializer(type(message)).to_json(message) == (
+            _canonical(message)
+        )
+
+
+def test_field_subsets():
+    encoder = serializer.JsonSerializer(
+        job_service.SearchJobsResponse,
+        fields=[
+            "total_size",
+            "matching_jobs.job.title",
+            "matching_jobs.job.derived_info.locations.lat_lng",
+            "histogram_query_results",
+            "matching_jobs.job.title",
+        ],
+        preserving_proto_field_name=True,
+    )
+
+    assert encoder.to_dict(_response()) == {
+        "matching_jobs": [
+            {
+                "job": {
+                    "title": "Ingénieur logiciel",
+                    "derived_info": {
+                        "locations": [
+                            {"lat_lng": {"latitude": 37.42, "longitude": -122.08}}
+                        ]
+                    },
+                }
+            },
+            {
+                "job": {
+                    "title": "Ingénieur logiciel",
+                    "derived_info": {
+                        "locations": [
+                            {"lat_lng": {"latitude": 37.42, "longitude": -122.08}}
+                        ]
+                    },
+                }
+            },
+        ],
+        "histogram_query_results": [
+            {
+                "histogram_query": "count(x)",
+                "histogram": {"a": "1099511627776", "b": "1"},
+            }
+        ],
+        "total_size": 2,
+    }
+
+
+def test_field_subsets_through_maps():
+    encoder = serializer.JsonSerializer(
+        job.Job, fields=["custom_attributes.long_values"]
+    )
+
+    assert encoder.to_dict(_job()) == {
+        "customAttributes": {"year": {"longValues": ["2020"]}, "tags": {}}
+    }
+
+
+@pytest.mark.parametrize("fields", [["nope"], ["title.x"], ["derived_info.nope"]])
+def test_field_subsets_are_validated(fields):
+    with pytest.raises(ValueError):
+        serializer.JsonSerializer(job.Job, fields=fields)
+
+
+def test_orjson_backend():
+    orjson = pytest.importorskip("orjson")
+    encoder = serializer.JsonSerializer(
+        job_service.SearchJobsResponse, backend="orjson"
+    )
+
+    encoded = encoder.to_json_bytes(_response())
+
+    assert isinstance(encoded, bytes)
+    assert orjson.loads(encoded) == json.loads(_canonical(_response()))
+    assert encoder.to_json(_response()) == encoded.decode("utf-8")
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError):
+        serializer.JsonSerializer(job.Job, backend="simplejson")
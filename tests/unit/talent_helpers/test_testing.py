@@ -0,0 +1,317 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import pytest
+
+from google.api_core import exceptions
+from google.cloud.talent_helpers import FakeTalentServer
+from google.cloud.talent_v4.services.company_service import CompanyServiceClient
+from google.cloud.talent_v4.services.company_service import (
+    transports as company_transports,
+)
+from google.cloud.talent_v4.services.completion import CompletionClient
+from google.cloud.talent_v4.services.completion import (
+    transports as completion_transports,
+)
+from google.cloud.talent_v4.services.event_service import EventServiceClient
+from google.cloud.talent_v4.services.event_service import transports as event_transports
+from google.cloud.talent_v4.services.job_service import JobServiceAsyncClient
+from google.cloud.talent_v4.services.job_service import JobServiceClient
+from google.cloud.talent_v4.services.job_service import transports
+from google.cloud.talent_v4.services.tenant_service import TenantServiceClient
+from google.cloud.talent_v4.services.tenant_service import (
+    transports as tenant_transports,
+)
+from google.cloud.talent_v4.types import job
+from google.cloud.talent_v4.types import job_service
+from google.cloud.talent_v4beta1.services.profile_service import ProfileServiceClient
+from google.cloud.talent_v4beta1.services.profile_service import (
+    transports as profile_transports,
+)
+
+
+@pytest.fixture
+def server():
+    with FakeTalentServer(seed=0) as server:
+        yield server
+
+
+def _clients(server):
+    channel = server.channel()
+    return (
+        TenantServiceClient(
+            transport=tenant_transports.TenantServiceGrpcTransport(channel=channel)
+        ),
+        CompanyServiceClient(
+            transport=company_transports.CompanyServiceGrpcTransport(channel=channel)
+        ),
+        JobServiceClient(transport=transports.JobServiceGrpcTransport(channel=channel)),
+    )
+
+
+def _seed(server, count=3):
+    tenants, companies, jobs = _clients(server)
+    tenant = tenants.create_tenant(parent="projects/p", tenant={"external_id": "brand"})
+    company = companies.create_company(
+        parent=tenant.name, company={"display_name": "Acme", "external_id": "acme"}
+    )
+    created = [
+        jobs.create_job(
+            parent=tenant.name,
+            job={
+                "company": company.name,
+                "requisition_id": "req-{}".format(i),
+                "title": "Software Engineer {}".format(i),
+                "description": "Write code.",
+                "addresses": ["Mountain View, CA"],
+            },
+        )
+        for i in range(count)
+    ]
+    return tenant, company, created, jobs
+
+
+def test_create_and_get_job(server):
+    tenant, company, created, jobs = _seed(server, count=1)
+
+    assert created[0].name.startswith(tenant.name + "/jobs/")
+    assert created[0].company_display_name == "Acme"
+    assert len(created[0].derived_info.locations) == 1
+    assert jobs.get_job(name=created[0].name) == created[0]
+
+
+def test_create_job_conflict(server):
+    tenant, company, created, jobs = _seed(server, count=1)
+
+    with pytest.raises(exceptions.AlreadyExists):
+        jobs.create_job(
+            parent=tenant.name,
+            job={
+                "company": company.name,
+                "requisition_id": "req-0",
+                "title": "Duplicate",
+                "description": "Duplicate.",
+            },
+        )
+
+
+def test_list_jobs_pages(server):
+    tenant, company, created, jobs = _seed(server, count=5)
+
+    pager = jobs.list_jobs(
+        request={
+            "parent": tenant.name,
+            "filter": 'companyName = "{}"'.format(company.name),
+            "page_size": 2,
+            "job_view": job_service.JobView.JOB_VIEW_ID_ONLY,
+        }
+    )
+    listed = list(pager)
+
+    assert [j.name for j in listed] == [j.name for j in created]
+    assert all(not j.title for j in listed)
+    assert server.calls["list_jobs"] == 3
+
+
+def test_list_jobs_requires_company(server):
+    tenant, company, created, jobs = _seed(server, count=1)
+
+    with pytest.raises(exceptions.InvalidArgument):
+        list(jobs.list_jobs(parent=tenant.name, filter=""))
+
+
+def test_search_jobs(server):
+    tenant, company, created, jobs = _seed(server, count=3)
+
+    response = jobs.search_jobs(
+        request={
+            "parent": tenant.name,
+            "job_query": {
+                "query": "engineer 1",
+                "location_filters": [{"address": "Mountain View, CA"}],
+            },
+            "histogram_queries": [{"histogram_query": "count(company_display_name)"}],
+        }
+    )
+
+    assert response.total_size == 1
+    assert response.matching_jobs[0].job.name == created[1].name
+    assert response.location_filters[0] == created[0].derived_info.locations[0]
+    assert dict(response.histogram_query_results[0].histogram) == {"Acme": 1}
+
+
+def test_search_jobs_offset(server):
+    tenant, company, created, jobs = _seed(server, count=5)
+
+    response = jobs.search_jobs(
+        request={"parent": tenant.name, "offset": 3, "max_page_size": 5}
+    )
+
+    assert [m.job.name for m in response.matching_jobs] == [j.name for j in created[3:]]
+    assert response.next_page_token == ""
+
+
+def test_batch_create_jobs(server):
+    tenant, company, created, jobs = _seed(server, count=1)
+
+    operation = jobs.batch_create_jobs(
+        parent=tenant.name,
+        jobs=[
+            job.Job(
+                company=company.name,
+                requisition_id=requisition_id,
+                title="Engineer",
+                description="Code.",
+            )
+            for requisition_id in ("req-0", "req-new")
+        ],
+    )
+    results = operation.result().job_results
+
+    assert results[0].status.code == 6  # ALREADY_EXISTS
+    assert results[1].status.code == 0
+    assert results[1].job.name.startswith(tenant.name + "/jobs/")
+
+
+def test_completion_and_events(server):
+    tenant, company, created, jobs = _seed(server, count=2)
+    channel = server.channel()
+    completion = CompletionClient(
+        transport=completion_transports.CompletionGrpcTransport(channel=channel)
+    )
+    events = EventServiceClient(
+        transport=event_transports.EventServiceGrpcTransport(channel=channel)
+    )
+
+    response = completion.complete_query(
+        request={"tenant": tenant.name, "query": "soft", "page_size": 1}
+    )
+    event = events.create_client_event(
+        parent=tenant.name,
+        client_event={"request_id": "r", "event_id": "e", "job_event": {"type_": 1}},
+    )
+
+    assert [r.suggestion for r in response.completion_results] == [
+        "Software Engineer 0"
+    ]
+    assert event.create_time
+    assert [e.event_id for e in server.events] == ["e"]
+
+
+def test_inject_fault(server):
+    tenant, company, created, jobs = _seed(server, count=1)
+    server.inject_fault(exceptions.ResourceExhausted, method="get_job", count=1)
+
+    with pytest.raises(exceptions.ResourceExhausted):
+        jobs.get_job(name=created[0].name, retry=None)
+    assert jobs.get_job(name=created[0].name, retry=None) == created[0]
+
+
+def test_inject_fault_is_retried(server):
+    tenant, company, created, jobs = _seed(server, count=1)
+    server.inject_fault(method="get_job", count=2)
+
+    assert jobs.get_job(name=created[0].name) == created[0]
+    assert server.calls["get_job"] == 3
+
+
+def test_set_latency(server):
+    server.set_latency(5.0, method="get_job")
+    tenant, company, created, jobs = _seed(server, count=1)
+
+    with pytest.raises(exceptions.DeadlineExceeded):
+        jobs.get_job(name=created[0].name, retry=None, timeout=0.05)
+
+
+def test_reads_do_not_wait_for_writes(server):
+    tenant, company, created, jobs = _seed(server, count=1)
+
+    # Stand in for a long-running write holding the server lock.
+    with server._lock:
+        fetched = jobs.get_job(name=created[0].name, retry=None, timeout=5.0)
+        listed = list(
+            jobs.list_jobs(
+                parent=tenant.name,
+                filter='companyName = "{}"'.format(company.name),
+                retry=None,
+                timeout=5.0,
+            )
+        )
+
+    assert fetched == created[0]
+    assert listed == created
+
+
+def test_update_does_not_change_earlier_reads(server):
+    tenant, company, created, jobs = _seed(server, count=1)
+    stored = server._state.jobs[created[0].name]
+
+    jobs.update_job(
+        job={"name": created[0].name, "title": "Lead"},
+        update_mask={"paths": ["title"]},
+    )
+
+    assert stored.title == "Software Engineer 0"
+    assert jobs.get_job(name=created[0].name).title == "Lead"
+
+
+def test_profiles(server):
+    profiles = ProfileServiceClient(
+        transport=profile_transports.ProfileServiceGrpcTransport(
+            channel=server.channel()
+        )
+    )
+    parent = "projects/p/tenants/t"
+    created = profiles.create_profile(
+        parent=parent, profile={"external_id": "c1", "group_id": "g"}
+    )
+    profiles.create_profile(parent=parent, profile={"external_id": "c2"})
+
+    with pytest.raises(exceptions.AlreadyExists):
+        profiles.create_profile(parent=parent, profile={"external_id": "c1"})
+    listed = list(
+        profiles.list_profiles(
+            request={"parent": parent, "filter": 'externalId = "c1"'}
+        )
+    )
+    updated = profiles.update_profile(
+        profile={"name": created.name, "external_id": "c1", "group_id": "h"}
+    )
+
+    assert [p.name for p in listed] == [created.name]
+    assert updated.group_id == "h"
+    assert updated.create_time == created.create_time
+    assert profiles.get_profile(name=created.name) == updated
+
+
+def test_endpoint_requires_start():
+    with pytest.raises(RuntimeError):
+        FakeTalentServer().endpoint
+
+
+@pytest.mark.asyncio
+async def test_async_client(server):
+    tenant, company, created, jobs = _seed(server, count=1)
+    client = JobServiceAsyncClient(
+        transport=transports.JobServiceGrpcAsyncIOTransport(
+            channel=server.channel(asyncio=True)
+        )
+    )
+
+    response = await client.get_job(name=created[0].name)
+
+    assert response == created[0]
@@ -0,0 +1,201 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+import time
+
+import mock
+import pytest
+
+from google.api_core import exceptions
+from google.api_core import retry as retries
+from google.api_core import retry_async
+from google.cloud.talent_helpers import FakeTalentServer
+from google.cloud.talent_helpers import upsert
+from google.cloud.talent_v4.services.job_service import JobServiceAsyncClient
+from google.cloud.talent_v4.services.job_service import JobServiceClient
+from google.cloud.talent_v4.services.job_service import transports
+from google.protobuf import field_mask_pb2 as field_mask  # type: ignore
+
+
+PARENT = "projects/p/tenants/t"
+
+
+@pytest.fixture
+def server():
+    with FakeTalentServer(seed=0) as server:
+        yield server
+
+
+@pytest.fixture
+def client(server):
+    return JobServiceClient(
+        transport=transports.JobServiceGrpcTransport(channel=server.channel())
+    )
+
+
+def _job(**fields):
+    return dict(
+        {
+            "company": PARENT + "/companies/c",
+            "requisition_id": "req-1",
+            "title": "Engineer",
+            "description": "Code.",
+        },
+        **fields
+    )
+
+
+def test_upsert_job(server, client):
+    created = upsert.upsert_job(client, PARENT, _job())
+    unchanged = upsert.upsert_job(client, PARENT, _job())
+    updated = upsert.upsert_job(client, PARENT, _job(title="Senior Engineer"))
+
+    assert created.action == "created"
+    assert unchanged == (created.job, "unchanged")
+    assert updated.action == "updated"
+    assert updated.job.name == created.job.name
+    assert updated.job.title == "Senior Engineer"
+    assert updated.job.posting_create_time == created.job.posting_create_time
+    assert server.calls["create_job"] == 3
+    assert server.calls["update_job"] == 1
+
+
+def test_upsert_job_keeps_service_filled_fields(client):
+    created = upsert.upsert_job(client, PARENT, _job())
+
+    unchanged = upsert.upsert_job(client, PARENT, _job())
+    updated = upsert.upsert_job(client, PARENT, _job(title="Lead"))
+
+    assert created.job.posting_expire_time
+    assert unchanged.action == "unchanged"
+    assert updated.action == "updated"
+    assert updated.job.posting_expire_time == created.job.posting_expire_time
+
+
+def test_upsert_job_clears_masked_fields(client):
+    upsert.upsert_job(client, PARENT, _job(addresses=["Mountain View, CA"]))
+    mask = field_mask.FieldMask(paths=["title", "addresses"])
+
+    unchanged = upsert.upsert_job(client, PARENT, _job())
+    result = upsert.upsert_job(client, PARENT, _job(), update_mask=mask)
+
+    assert unchanged.action == "unchanged"
+    assert list(unchanged.job.addresses) == ["Mountain View, CA"]
+    assert result.action == "updated"
+    assert not result.job.addresses
+
+
+def test_upsert_job_escapes_requisition_id(client):
+    requisition_id = 'req "1" \\ a'
+    created = upsert.upsert_job(client, PARENT, _job(requisition_id=requisition_id))
+
+    updated = upsert.upsert_job(
+        client, PARENT, _job(requisition_id=requisition_id, title="Lead")
+    )
+
+    assert updated.action == "updated"
+    assert updated.job.name == created.job.name
+
+
+def test_upsert_job_update_mask(server, client):
+    created = upsert.upsert_job(client, PARENT, _job(description="Old."))
+    mask = field_mask.FieldMask(paths=["title"])
+
+    unchanged = upsert.upsert_job(client, PARENT, _job(), update_mask=mask)
+    updated = upsert.upsert_job(client, PARENT, _job(title="Lead"), update_mask=mask)
+
+    assert unchanged.action == "unchanged"
+    assert updated.action == "updated"
+    assert updated.job.title == "Lead"
+    assert updated.job.description == created.job.description == "Old."
+
+
+def test_upsert_job_language_code(client):
+    english = upsert.upsert_job(client, PARENT, _job(language_code="en-US"))
+    french = upsert.upsert_job(client, PARENT, _job(language_code="fr-FR"))
+
+    result = upsert.upsert_job(
+        client, PARENT, _job(language_code="fr-FR", title="Ingénieur")
+    )
+
+    assert result.action == "updated"
+    assert result.job.name == french.job.name != english.job.name
+    assert client.get_job(name=english.job.name).title == "Engineer"
+
+
+def test_upsert_job_retries_create(server, client):
+    server.inject_fault(method="create_job", count=1)
+
+    result = upsert.upsert_job(client, PARENT, _job())
+
+    assert result.action == "created"
+    assert server.calls["create_job"] == 2
+
+
+def test_upsert_job_after_timed_out_create(server, client):
+    server.set_latency(0.3, method="create_job")
+
+    def on_error(exc):
+        # Let the abandoned attempt land before the retry is sent.
+        time.sleep(0.4)
+        server.set_latency(0.0, method="create_job")
+
+    retry = retries.Retry(
+        predicate=retries.if_exception_type(exceptions.DeadlineExceeded),
+        on_error=on_error,
+    )
+    result = upsert.upsert_job(client, PARENT, _job(), retry=retry, timeout=0.1)
+
+    stored = client.list_jobs(
+        parent=PARENT, filter='companyName = "{}/companies/c"'.format(PARENT)
+    )
+
+    assert result.action == "unchanged"
+    assert [job.name for job in stored] == [result.job.name]
+    assert server.calls["create_job"] >= 2
+
+
+def test_upsert_job_conflict_not_found():
+    client = mock.Mock(spec=["create_job", "list_jobs"])
+    client.create_job.side_effect = exceptions.AlreadyExists("exists")
+    client.list_jobs.return_value = iter([])
+
+    with pytest.raises(exceptions.NotFound):
+        upsert.upsert_job(client, PARENT, _job())
+
+
+@pytest.mark.asyncio
+async def test_upsert_job_async(server, client):
+    async_client = JobServiceAsyncClient(
+        transport=transports.JobServiceGrpcAsyncIOTransport(
+            channel=server.channel(asyncio=True)
+        )
+    )
+    server.inject_fault(method="create_job", count=1)
+
+    created = await upsert.upsert_job_async(async_client, PARENT, _job())
+    unchanged = await upsert.upsert_job_async(async_client, PARENT, _job())
+    updated = await upsert.upsert_job_async(
+        async_client, PARENT, _job(title="Lead"), retry=retry_async.AsyncRetry(),
+    )
+
+    assert created.action == "created"
+    assert unchanged.action == "unchanged"
+    assert updated.action == "updated"
+    assert client.get_job(name=created.job.name).title == "Lead"
+    assert server.calls["create_job"] == 4